@@ -0,0 +1,169 @@
+"""
+Display presenter shared by the games.
+
+Every game draws into a fixed-size viewport surface and shows it on a display
+of whatever size the player has.  Presenter owns that mapping — scale factor,
+letterbox offset, mouse position back to viewport coordinates — and the
+per-frame copy to the screen.
+
+Modes
+-----
+``fit``      largest scale that fits the display (the default).  The viewport
+             is scaled straight into a subsurface of the display, so a frame
+             costs one scale and no intermediate surface or extra blit.
+``integer``  largest whole-number scale that fits: crisp pixels and a cheaper
+             scale; at 1x the frame is a single blit.  Displays smaller than
+             the viewport fall back to ``fit``.
+``scaled``   switch the display to the viewport size with SDL2's ``SCALED``
+             flag and let SDL's renderer stretch it, so a frame is one 1:1
+             blit.  Drivers without a renderer fall back to ``fit``.  ``close()``
+             puts the display mode back.
+
+The mode comes from the constructor, else the ``POWER50_PRESENT`` environment
+variable, else ``fit``.  Nothing is allocated per frame, and the letterbox
+bars are filled only on the first frame, after the display changes size, or
+after ``invalidate()`` (call it when something has drawn over the whole
+display, such as a pause overlay).
+
+Usage::
+
+    from Utils.display import Presenter
+
+    presenter = Presenter(display, (1600, 900))
+    view = presenter.surface()
+    ...draw into view...
+    presenter.present(view)
+    vx, vy = presenter.to_viewport(pygame.mouse.get_pos())
+    presenter.close()
+"""
+from __future__ import annotations
+
+import os
+
+import pygame
+
+
+PRESENT_ENV = 'POWER50_PRESENT'
+MODES       = ('fit', 'integer', 'scaled')
+
+
+class Presenter:
+    """Viewport-to-display mapping and present for one game or menu.
+
+    display   — the display surface (``pygame.display.set_mode`` result)
+    size      — viewport size in pixels
+    mode      — 'fit', 'integer' or 'scaled'; None reads POWER50_PRESENT
+    smooth    — bilinear scaling instead of nearest-neighbour
+    bar_color — letterbox colour
+    """
+
+    def __init__(self, display: pygame.Surface, size: tuple, mode: str | None = None,
+                 smooth: bool = False, bar_color=(0, 0, 0)) -> None:
+        if mode is None:
+            mode = os.environ.get(PRESENT_ENV, '').strip().lower() or 'fit'
+        if mode not in MODES:
+            raise ValueError(f'unknown present mode {mode!r}; expected one of {MODES}')
+        self.display   = display
+        self.size      = (int(size[0]), int(size[1]))
+        self.mode      = mode
+        self.smooth    = smooth
+        self.bar_color = bar_color
+        self.presents  = 0          # frames presented
+        self.bar_fills = 0          # frames that also filled the letterbox
+        self._restore  = None       # (size, flags) to put back on close()
+        if mode == 'scaled':
+            self._open_scaled()
+        self._layout()
+
+    def _open_scaled(self) -> None:
+        size  = self.display.get_size()
+        flags = self.display.get_flags() & (pygame.FULLSCREEN | pygame.NOFRAME | pygame.RESIZABLE)
+        try:
+            self.display = pygame.display.set_mode(self.size, pygame.SCALED | flags)
+        except pygame.error:
+            # No renderer (dummy driver, some remote sessions): scale ourselves
+            self.display = pygame.display.set_mode(size, flags)
+            self.mode = 'fit'
+            return
+        self._restore = (size, flags)
+
+    def _layout(self) -> None:
+        vw, vh = self.size
+        dw, dh = self._disp_size = self.display.get_size()
+        scale = min(dw / vw, dh / vh)
+        if self.mode == 'integer' and scale >= 1:
+            scale = float(int(scale))
+        sw, sh = int(vw * scale), int(vh * scale)
+        self.scale    = scale
+        self.offset_x = (dw - sw) // 2
+        self.offset_y = (dh - sh) // 2
+        self.rect     = pygame.Rect(self.offset_x, self.offset_y, sw, sh)
+        self._copy    = (sw, sh) == self.size
+        # Scale target: the display's own pixels where the formats allow,
+        # otherwise a surface of our own that is blitted across
+        self._dest    = None if self._copy else self.display.subsurface(self.rect)
+        self._own     = None
+        self._bars    = True
+
+    # ------------------------------------------------------------------
+    # Per frame
+    # ------------------------------------------------------------------
+
+    def surface(self) -> pygame.Surface:
+        """New viewport-sized surface in the display's pixel format."""
+        return pygame.Surface(self.size).convert(self.display)
+
+    def invalidate(self) -> None:
+        """Refill the letterbox on the next present."""
+        self._bars = True
+
+    def present(self, src: pygame.Surface, flip: bool = True) -> None:
+        """Show viewport surface *src* on the display, then flip."""
+        disp = self.display
+        if disp.get_size() != self._disp_size:
+            self._layout()
+        if self._bars:
+            if self.rect.size != self._disp_size:
+                disp.fill(self.bar_color)
+                self.bar_fills += 1
+            self._bars = False
+        if self._copy:
+            disp.blit(src, self.rect)
+        else:
+            scale = pygame.transform.smoothscale if self.smooth else pygame.transform.scale
+            if self._own is None:
+                try:
+                    scale(src, self.rect.size, self._dest)
+                except ValueError:
+                    # Source format differs from the display's
+                    self._own = pygame.Surface(self.rect.size, 0, src)
+            if self._own is not None:
+                scale(src, self.rect.size, self._own)
+                disp.blit(self._own, self.rect)
+        self.presents += 1
+        if flip:
+            pygame.display.flip()
+
+    def flip(self) -> None:
+        """Show what was drawn straight onto the display (menus at display size)."""
+        pygame.display.flip()
+
+    def snapshot(self) -> pygame.Surface:
+        """Copy of the display as last presented."""
+        return self.display.copy()
+
+    # ------------------------------------------------------------------
+    # Coordinates and teardown
+    # ------------------------------------------------------------------
+
+    def to_viewport(self, pos) -> tuple:
+        """Display position (a mouse event's ``pos``) in viewport coordinates."""
+        return (pos[0] - self.offset_x) / self.scale, (pos[1] - self.offset_y) / self.scale
+
+    def close(self) -> None:
+        """Put back the display mode replaced by the ``scaled`` mode."""
+        if self._restore is None:
+            return
+        size, flags = self._restore
+        self._restore = None
+        self.display = pygame.display.set_mode(size, flags)
@@ -0,0 +1,63 @@
+"""
+Fixed-timestep accumulator shared by the game loops.
+
+Game logic is written per tick (speeds in pixels per tick, cooldowns in
+ticks), so it has to run at a constant rate no matter how long a frame takes
+to render.  Each frame the loop asks how many ticks are due, runs them, and
+renders with ``alpha`` — the fraction of a tick left over — to interpolate
+between the previous and current tick.
+
+Usage::
+
+    stepper = FixedStep(hz=60)
+    while running:
+        for _ in range(stepper.advance()):
+            update()
+        draw(stepper.alpha)
+"""
+from __future__ import annotations
+
+import time
+
+
+class FixedStep:
+    """Converts wall-clock time into a whole number of fixed ticks.
+
+    max_steps caps the ticks run in one frame; time beyond that is dropped
+    (and counted in ``dropped``) so one very long frame — a hitch, a window
+    drag — cannot push the loop into a spiral of catch-up ticks.
+    """
+
+    def __init__(self, hz: int = 60, max_steps: int = 5, clock=time.perf_counter) -> None:
+        self.hz        = hz
+        self.dt        = 1.0 / hz
+        self.max_steps = max_steps
+        self._clock    = clock
+        self.acc       = 0.0
+        self.ticks     = 0      # total ticks handed out
+        self.dropped   = 0.0    # seconds discarded by the catch-up cap
+        self._last     = clock()
+
+    def reset(self) -> None:
+        """Forget time spent outside the loop (pause menus, loading)."""
+        self.acc   = 0.0
+        self._last = self._clock()
+
+    def advance(self) -> int:
+        """Number of ticks to run this frame."""
+        now = self._clock()
+        self.acc += now - self._last
+        self._last = now
+        limit = self.max_steps * self.dt
+        if self.acc > limit:
+            self.dropped += self.acc - limit
+            self.acc = limit
+        steps = int(self.acc * self.hz)
+        self.acc -= steps * self.dt
+        self.ticks += steps
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """Progress from the last tick toward the next one, in [0, 1)."""
+        return min(self.acc * self.hz, 1.0)
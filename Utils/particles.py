@@ -0,0 +1,359 @@
+"""
+Particle engine shared by the games.
+
+Particles live in preallocated parallel arrays (NumPy), are stepped in one
+vectorised pass and drawn with a single ``Surface.blits`` call.  Every
+particle is a filled circle that shrinks and darkens over its life; the
+circles come from sprite ramps baked on first use, one sprite per
+(colour, radius, brightness step), so drawing never calls pygame.draw.
+
+Each tick a particle moves by its velocity, then gravity is added to its
+vertical speed and drag scales both speeds; it dies when its life runs out.
+Gravity and drag are set per system and can be overridden per emitter.
+
+Without NumPy the same API runs on plain lists, one particle at a time.
+
+Usage::
+
+    parts = ParticleSystem(capacity=4096, drag=0.88, fade=0.45)
+    parts.burst(x, y, 14, speed=(1.6, 4.0), color=(255, 80, 40), size=4, life=35)
+    ...
+    parts.update()                      # once per tick
+    parts.draw(screen, cam_x, cam_y)    # once per frame
+"""
+from __future__ import annotations
+
+import math
+import random
+
+import pygame
+
+try:
+    import numpy as _np
+    _NUMPY = True
+except ImportError:
+    _NUMPY = False
+
+
+MAX_RADIUS = 16         # sizes above this are drawn at this radius
+LEVELS     = 32         # brightness steps per ramp
+COLORKEY   = (255, 0, 255)
+
+_COLS = ('x', 'y', 'vx', 'vy', 'life', 'max_life', 'size', 'cid', 'gravity', 'drag_x', 'drag_y')
+
+
+def _pick(spec, count: int, rng, integer: bool = False):
+    """A value, or a (low, high) range sampled per particle (inclusive for ints)."""
+    if not isinstance(spec, tuple):
+        return spec
+    lo, hi = spec
+    if integer:
+        return rng.integers(lo, hi + 1, count)
+    return rng.uniform(lo, hi, count)
+
+
+class ParticleSystem:
+    """A pool of up to *capacity* particles.
+
+    gravity — added to vy every tick
+    drag    — velocity multiplier per tick; a float, or (x, y) per axis
+    fade    — brightness is (life / max_life) ** fade; below 1 keeps the
+              particle vivid for longer, then fades sharply at the end
+    seed    — for the emitters' random directions, speeds, sizes and lives
+
+    When full, new particles replace the oldest.
+    """
+
+    def __init__(self, capacity: int = 4096, gravity: float = 0.0, drag=1.0,
+                 fade: float = 1.0, seed: int | None = None) -> None:
+        self.capacity = capacity
+        self.gravity  = gravity
+        self.drag     = drag if isinstance(drag, tuple) else (drag, drag)
+        self.fade     = fade
+        self.n        = 0
+        self._palette: dict[tuple, int] = {}
+        self._colors: list[tuple] = []
+        self._sprites: list = []        # flat (cid, radius, level) -> Surface or None
+        self.sprites_built = 0
+        if _NUMPY:
+            self._rng = _np.random.default_rng(seed)
+            self._a = {c: _np.zeros(capacity, _np.int64 if c in ('life', 'max_life', 'size', 'cid')
+                                    else _np.float64) for c in _COLS}
+        else:
+            self._rng = random.Random(seed)
+            self._rows: list[list] = []
+
+    def __len__(self) -> int:
+        return self.n
+
+    def col(self, name: str):
+        """Live view of one column (NumPy only)."""
+        return self._a[name][:self.n]
+
+    def clear(self) -> None:
+        self.n = 0
+        if not _NUMPY:
+            self._rows.clear()
+
+    # ------------------------------------------------------------------
+    # Emitters
+    # ------------------------------------------------------------------
+
+    def burst(self, x, y, count: int, speed, color, size=3, life=30, *,
+              gravity: float | None = None, drag=None) -> None:
+        """count particles from (x, y) in random directions.
+
+        speed, size and life take a value or a (low, high) range; x and y
+        may be arrays of count positions; color is one (r, g, b) or a list
+        to choose from per particle.
+        """
+        if count <= 0:
+            return
+        if _NUMPY:
+            a = self._rng.uniform(0.0, math.tau, count)
+        else:
+            a = [self._rng.uniform(0.0, math.tau) for _ in range(count)]
+        self._emit_angles(x, y, count, a, speed, color, size, life, gravity, drag)
+
+    def ring(self, x, y, count: int, speed, color, size=3, life=30, *, phase: float = 0.0,
+             gravity: float | None = None, drag=None) -> None:
+        """count particles from (x, y), evenly spaced around the circle."""
+        if count <= 0:
+            return
+        step = math.tau / count
+        if _NUMPY:
+            a = phase + _np.arange(count) * step
+        else:
+            a = [phase + i * step for i in range(count)]
+        self._emit_angles(x, y, count, a, speed, color, size, life, gravity, drag)
+
+    def _emit_angles(self, x, y, count, angles, speed, color, size, life, gravity, drag) -> None:
+        rng = self._rng
+        if not _NUMPY:
+            for i, ang in enumerate(angles):
+                sp = rng.uniform(*speed) if isinstance(speed, tuple) else speed
+                self._add_row(x[i] if isinstance(x, (list, tuple)) else x,
+                              y[i] if isinstance(y, (list, tuple)) else y,
+                              math.cos(ang) * sp, math.sin(ang) * sp,
+                              rng.randint(*life) if isinstance(life, tuple) else life,
+                              rng.randint(*size) if isinstance(size, tuple) else size,
+                              rng.choice(color) if isinstance(color, list) else color,
+                              gravity, drag)
+            return
+        sp = _pick(speed, count, rng)
+        if isinstance(color, list):
+            cids = _np.array([self._cid(c) for c in color])[rng.integers(0, len(color), count)]
+        else:
+            cids = self._cid(color)
+        self.emit(x, y, _np.cos(angles) * sp, _np.sin(angles) * sp,
+                  _pick(life, count, rng, True), _pick(size, count, rng, True),
+                  cids=cids, count=count, gravity=gravity, drag=drag)
+
+    def emit(self, x, y, vx, vy, life, size, color=None, *, cids=None, max_life=None,
+             count: int | None = None, gravity: float | None = None, drag=None) -> None:
+        """Raw emitter: append particles from values or arrays (NumPy only).
+
+        Give either one *color* or colour ids *cids*; *max_life* defaults to
+        *life*.  Overflow past capacity drops the oldest particles.
+        """
+        if count is None:
+            count = len(x)
+        if count <= 0:
+            return
+        if cids is None:
+            cids = self._cid(color)
+        gravity = self.gravity if gravity is None else gravity
+        dx, dy  = self.drag if drag is None else drag if isinstance(drag, tuple) else (drag, drag)
+        count = min(count, self.capacity)
+        over  = self.n + count - self.capacity
+        if over > 0:
+            self._drop_oldest(over)
+        lo, hi = self.n, self.n + count
+        a = self._a
+        for name, v in (('x', x), ('y', y), ('vx', vx), ('vy', vy), ('life', life),
+                        ('max_life', life if max_life is None else max_life), ('size', size),
+                        ('cid', cids), ('gravity', gravity), ('drag_x', dx), ('drag_y', dy)):
+            a[name][lo:hi] = v[-count:] if isinstance(v, _np.ndarray) and v.ndim else v
+        self.n = hi
+
+    def _add_row(self, x, y, vx, vy, life, size, color, gravity, drag) -> None:
+        dx, dy = self.drag if drag is None else drag if isinstance(drag, tuple) else (drag, drag)
+        self._rows.append([float(x), float(y), float(vx), float(vy), int(life), int(life),
+                           int(size), self._cid(color),
+                           self.gravity if gravity is None else gravity, dx, dy])
+        if len(self._rows) > self.capacity:
+            del self._rows[0]
+        self.n = len(self._rows)
+
+    def _drop_oldest(self, k: int) -> None:
+        k = min(k, self.n)
+        keep = self.n - k
+        for arr in self._a.values():
+            arr[:keep] = arr[k:self.n]
+        self.n = keep
+
+    def trim(self, limit: int) -> None:
+        """Keep only the newest *limit* particles."""
+        if self.n > limit:
+            if _NUMPY:
+                self._drop_oldest(self.n - limit)
+            else:
+                del self._rows[:self.n - limit]
+                self.n = limit
+
+    # ------------------------------------------------------------------
+    # Stepping
+    # ------------------------------------------------------------------
+
+    def update(self) -> None:
+        """Advance every particle one tick and drop the dead ones."""
+        n = self.n
+        if not n:
+            return
+        if not _NUMPY:
+            rows = self._rows
+            for r in rows:
+                r[0] += r[2]
+                r[1] += r[3]
+                r[3] += r[8]
+                r[2] *= r[9]
+                r[3] *= r[10]
+                r[4] -= 1
+            self._rows = [r for r in rows if r[4] > 0]
+            self.n = len(self._rows)
+            return
+        a = self._a
+        x, y, vx, vy = a['x'][:n], a['y'][:n], a['vx'][:n], a['vy'][:n]
+        x += vx
+        y += vy
+        vy += a['gravity'][:n]
+        vx *= a['drag_x'][:n]
+        vy *= a['drag_y'][:n]
+        life = a['life'][:n]
+        life -= 1
+        if life.min() <= 0:
+            alive = _np.flatnonzero(life > 0)
+            for arr in a.values():
+                arr[:len(alive)] = arr[alive]
+            self.n = len(alive)
+
+    # ------------------------------------------------------------------
+    # Drawing
+    # ------------------------------------------------------------------
+
+    def _cid(self, color) -> int:
+        color = tuple(int(c) for c in color)
+        cid = self._palette.get(color)
+        if cid is None:
+            cid = self._palette[color] = len(self._colors)
+            self._colors.append(color)
+            self._sprites.extend([None] * ((MAX_RADIUS + 1) * LEVELS))
+        return cid
+
+    def _sprite(self, key: int):
+        cid, rest = divmod(key, (MAX_RADIUS + 1) * LEVELS)
+        r, level = divmod(rest, LEVELS)
+        k = level / (LEVELS - 1)
+        c = tuple(int(ch * k) for ch in self._colors[cid])
+        if c == COLORKEY:
+            c = (254, 0, 255)
+        surf = pygame.Surface((2*r + 2, 2*r + 2))
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        surf.fill(COLORKEY)
+        pygame.draw.circle(surf, c, (r + 1, r + 1), r)
+        surf.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        self._sprites[key] = surf
+        self.sprites_built += 1
+        return surf
+
+    def draw(self, surface: pygame.Surface, cam_x: float = 0.0, cam_y: float = 0.0,
+             t: float = 0.0, limit: int | None = None) -> int:
+        """Draw the newest *limit* particles (all if None), advanced t of a tick
+        along their velocity, culled to *surface*.  Returns how many were drawn.
+
+        A negative t moves them back along the last update's step instead, so
+        -(1 - alpha) draws them interpolated between the previous tick and
+        this one, like everything else in a fixed-step render.
+        """
+        n = self.n
+        lo = max(0, n - limit) if limit is not None else 0
+        if lo >= n:
+            return 0
+        w, h = surface.get_size()
+        if not _NUMPY:
+            return self._draw_rows(surface, cam_x, cam_y, t, lo, w, h)
+        a = self._a
+        life = a['life'][lo:n]
+        frac = life / a['max_life'][lo:n]
+        r  = _np.clip((a['size'][lo:n] * frac).astype(_np.int64), 1, MAX_RADIUS)
+        vx, vy = a['vx'][lo:n], a['vy'][lo:n]
+        if t < 0.0:
+            # update() moved by the velocity before drag and gravity changed it
+            dx, dy = a['drag_x'][lo:n], a['drag_y'][lo:n]
+            vx = _np.divide(vx, dx, out=_np.zeros_like(vx), where=dx > 0)
+            vy = _np.divide(vy, dy, out=_np.zeros_like(vy), where=dy > 0) - a['gravity'][lo:n]
+        sx = (a['x'][lo:n] + vx * t - cam_x).astype(_np.int64)
+        sy = (a['y'][lo:n] + vy * t - cam_y).astype(_np.int64)
+        vis = (sx > -r) & (sx < w + r) & (sy > -r) & (sy < h + r)
+        if not vis.all():
+            frac, r, sx, sy = frac[vis], r[vis], sx[vis], sy[vis]
+            cid = a['cid'][lo:n][vis]
+        else:
+            cid = a['cid'][lo:n]
+        level = (frac ** self.fade * (LEVELS - 1) + 0.5).astype(_np.int64)
+        keys  = (cid * (MAX_RADIUS + 1) + r) * LEVELS + level
+        sprites = self._sprites
+        for k in _np.unique(keys).tolist():
+            if sprites[k] is None:
+                self._sprite(k)
+        surface.blits(list(zip(map(sprites.__getitem__, keys.tolist()),
+                               zip((sx - r - 1).tolist(), (sy - r - 1).tolist()))),
+                      doreturn=False)
+        return len(keys)
+
+    def _draw_rows(self, surface, cam_x, cam_y, t, lo, w, h) -> int:
+        sprites, seq = self._sprites, []
+        for x, y, vx, vy, life, max_life, size, cid, gravity, drag_x, drag_y in self._rows[lo:]:
+            if t < 0.0:
+                vx = vx / drag_x if drag_x > 0 else 0.0
+                vy = (vy / drag_y if drag_y > 0 else 0.0) - gravity
+            frac = life / max_life
+            r  = min(MAX_RADIUS, max(1, int(size * frac)))
+            sx = int(x + vx * t - cam_x)
+            sy = int(y + vy * t - cam_y)
+            if -r < sx < w + r and -r < sy < h + r:
+                key = (cid * (MAX_RADIUS + 1) + r) * LEVELS + int(frac ** self.fade * (LEVELS - 1) + 0.5)
+                seq.append((sprites[key] or self._sprite(key), (sx - r - 1, sy - r - 1)))
+        surface.blits(seq, doreturn=False)
+        return len(seq)
+
+    # ------------------------------------------------------------------
+    # Bulk state, for shipping particles between processes
+    # ------------------------------------------------------------------
+
+    def snapshot(self, limit: int | None = None):
+        """(n, 10) array of the newest *limit* particles:
+        x, y, vx, vy, life, max_life, r, g, b, size (NumPy only)."""
+        n = self.n
+        lo = max(0, n - limit) if limit is not None else 0
+        a = self._a
+        out = _np.empty((n - lo, 10))
+        for i, name in enumerate(('x', 'y', 'vx', 'vy', 'life', 'max_life')):
+            out[:, i] = a[name][lo:n]
+        if n > lo:
+            out[:, 6:9] = _np.array(self._colors, dtype=_np.float64)[a['cid'][lo:n]]
+        out[:, 9] = a['size'][lo:n]
+        return out
+
+    def load(self, rows) -> None:
+        """Replace the pool with the particles of a snapshot() array."""
+        self.clear()
+        if not len(rows):
+            return
+        rgb = rows[:, 6:9].astype(_np.int64)
+        uniq, inv = _np.unique(rgb, axis=0, return_inverse=True)
+        cids = _np.array([self._cid(c) for c in uniq.tolist()])[inv.reshape(-1)]
+        self.emit(rows[:, 0], rows[:, 1], rows[:, 2], rows[:, 3],
+                  rows[:, 4].astype(_np.int64), rows[:, 9].astype(_np.int64),
+                  cids=cids, max_life=rows[:, 5].astype(_np.int64), count=len(rows))
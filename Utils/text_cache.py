@@ -0,0 +1,123 @@
+"""
+Text surface cache shared by the games.
+
+``font.render`` lays out and rasterises the string on every call, which adds
+up when a HUD redraws the same labels every frame.  TextCache keeps the
+rendered surfaces keyed by (font, text, colour, shadow), evicting the least
+recently used once it holds ``capacity`` of them.
+
+A shadowed entry is one surface: the shadow sits ``offset`` pixels right of
+and below the text, which stays at (0, 0), so the surface is ``offset``
+wider and taller than the text itself.  A shadow colour may carry an alpha
+as a fourth component.
+
+Surfaces are shared between callers and must not be changed.  Fading text
+asks for an ``alpha``: it is rounded to one of ``ALPHA_LEVELS`` steps and each
+step is its own cached copy with that surface alpha, so one caller's fade
+never leaks into another's blit.
+
+Usage::
+
+    from Utils.text_cache import TEXT_CACHE
+
+    surf = TEXT_CACHE.render(font, f'{kills}  KILLS', (255, 230, 80), shadow=(0, 0, 0))
+    screen.blit(surf, (x, y))
+    faded = TEXT_CACHE.render(font, '+1 KILL', (255, 220, 60), alpha=120)
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pygame
+
+try:
+    import numpy as _np
+    _NUMPY = True
+except ImportError:
+    _NUMPY = False
+
+
+ALPHA_LEVELS = 32       # distinct fade steps cached per text
+_ALPHA_STEP  = 255 / (ALPHA_LEVELS - 1)
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces, with hit / miss counters."""
+
+    def __init__(self, capacity: int = 512) -> None:
+        self.capacity  = capacity
+        self.hits      = 0
+        self.misses    = 0
+        self.evictions = 0
+        self._surfs: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._surfs)
+
+    def render(self, font: pygame.font.Font, text: str, color, shadow=None,
+               offset: int = 2, alpha: int = 255) -> pygame.Surface:
+        """Anti-aliased *text* in *color*, with an optional drop *shadow* colour,
+        faded to *alpha* (rounded to one of ALPHA_LEVELS steps).  The surface
+        is shared: blit it, never modify it."""
+        alpha = round(round(max(0, min(255, alpha)) / _ALPHA_STEP) * _ALPHA_STEP)
+        key = (font, text, color, shadow, offset if shadow is not None else 0, alpha)
+        surfs = self._surfs
+        surf = surfs.get(key)
+        if surf is not None:
+            self.hits += 1
+            surfs.move_to_end(key)
+            return surf
+        if alpha < 255:
+            # A faded copy of the opaque entry, which is cached on the way
+            surf = self.render(font, text, color, shadow, offset).copy()
+            surf.set_alpha(alpha)
+        else:
+            surf = font.render(text, True, color)
+            if shadow is not None:
+                surf = self._with_shadow(font, text, surf, color, shadow, offset)
+        self.misses += 1
+        surfs[key] = surf
+        if len(surfs) > self.capacity:
+            surfs.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    @staticmethod
+    def _with_shadow(font, text, surf, color, shadow, offset) -> pygame.Surface:
+        w, h = surf.get_size()
+        out = pygame.Surface((w + offset, h + offset), pygame.SRCALPHA)
+        sh = font.render(text, True, shadow[:3])
+        if not _NUMPY:
+            # Transparent pixels take the text colour, so the anti-aliased
+            # edges blend toward it rather than toward black
+            out.fill((*color[:3], 0))
+            if len(shadow) > 3:
+                sh.set_alpha(shadow[3])
+            out.blit(sh, (offset, offset))
+            out.blit(surf, (0, 0))
+            return out
+        # Exact "text over shadow", so blitting the result matches blitting
+        # the shadow and then the text
+        sa = _np.zeros((w + offset, h + offset))
+        sa[offset:, offset:] = pygame.surfarray.pixels_alpha(sh) / 255.0
+        if len(shadow) > 3:
+            sa *= shadow[3] / 255.0
+        ta = _np.zeros_like(sa)
+        ta[:w, :h] = pygame.surfarray.pixels_alpha(surf) / 255.0
+        a = ta + sa * (1.0 - ta)
+        wt = _np.divide(ta, a, out=_np.zeros_like(a), where=a > 0)[..., None]
+        rgb = _np.asarray(color[:3], float) * wt + _np.asarray(shadow[:3], float) * (1.0 - wt)
+        pygame.surfarray.pixels3d(out)[...] = (rgb + 0.5).astype(_np.uint8)
+        pygame.surfarray.pixels_alpha(out)[...] = (a * 255.0 + 0.5).astype(_np.uint8)
+        return out
+
+    def clear(self) -> None:
+        self._surfs.clear()
+
+    def stats(self) -> tuple[int, int, int]:
+        """(hits, misses, entries held)."""
+        return self.hits, self.misses, len(self._surfs)
+
+
+# The cache the games share
+TEXT_CACHE = TextCache()
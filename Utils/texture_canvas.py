@@ -0,0 +1,279 @@
+"""
+SDL2 renderer drawing target for the games.
+
+TextureCanvas stands in for a game's viewport surface when drawing goes
+through ``pygame._sdl2.video`` instead of software blits.  It answers the
+part of the ``pygame.Surface`` API the game draws with — ``blit``,
+``blits``, ``fill`` and the size getters — but every source surface is
+uploaded once as a ``Texture`` and each blit becomes a renderer copy.  The
+renderer scales the viewport to the window, so there is no software scale
+and no viewport-sized surface at all.
+
+It is also the game's presenter: ``present``, ``flip``, ``snapshot``,
+``to_viewport``, ``invalidate`` and ``close`` match ``Utils.display.Presenter``,
+so menus and loops do not care which one they hold.  ``display`` is an
+offscreen window-sized surface for menus drawn at display resolution;
+``flip()`` shows it.
+
+Rules for code drawing onto a canvas:
+
+* Sources are cached as textures by surface.  A surface repainted in place
+  must be passed to ``refresh()``; per-surface alpha (``set_alpha``) is
+  picked up on every blit.  Sources with neither an alpha channel nor a
+  colorkey are copied without blending.
+* Special flags: 0, ``BLEND_ADD`` and ``BLEND_MULT`` (a renderer ``MOD``).
+* ``pygame.draw`` needs a real surface: paint into ``scratch(w, h)`` and blit
+  that; scratch surfaces are re-uploaded on every blit.
+
+The renderer is whatever SDL picks first — hardware where there is one.
+Pass ``software=True``, or set SDL's own ``SDL_RENDER_DRIVER=software``,
+to use SDL's software renderer, which also runs under the dummy video
+driver.  ``pygame.display``'s window cannot take a renderer, so the canvas
+opens its own window of the same size and hides the display's until
+``close()``.
+
+Usage::
+
+    from Utils.texture_canvas import TextureCanvas, available
+
+    canvas = TextureCanvas(display, (1600, 900))
+    canvas.fill((0, 0, 0))
+    canvas.blits(seq, doreturn=False)
+    canvas.present()
+    canvas.close()
+"""
+from __future__ import annotations
+
+import weakref
+
+import pygame
+
+try:
+    from pygame._sdl2 import video as _video
+    _SDL2 = True
+except ImportError:
+    _SDL2 = False
+
+
+# SDL_BlendMode values
+_SDL_NONE  = 0
+_SDL_BLEND = 1
+_SDL_ADD   = 2
+_SDL_MOD   = 4
+
+_BLEND_MODES = {
+    0:                      _SDL_BLEND,
+    pygame.BLEND_RGB_ADD:   _SDL_ADD,
+    pygame.BLEND_RGB_MULT:  _SDL_MOD,
+}
+
+
+def available() -> bool:
+    """True when this pygame build has the SDL2 video module."""
+    return _SDL2
+
+
+class TextureCanvas:
+    """Viewport-sized drawing target and presenter on an SDL2 Renderer.
+
+    display  — the display surface the game was given
+    size     — viewport size in pixels
+    software — force SDL's software renderer
+    """
+
+    def __init__(self, display: pygame.Surface, size: tuple, software: bool = False,
+                 vsync: bool = False) -> None:
+        if not _SDL2:
+            raise RuntimeError('pygame._sdl2.video is not available in this pygame build')
+        self.size = (int(size[0]), int(size[1]))
+        dw, dh = display.get_size()
+        self._display_window = _video.Window.from_display_module()
+        self.window = _video.Window(pygame.display.get_caption()[0] or 'pygame', (dw, dh),
+                                    fullscreen_desktop=bool(display.get_flags() & pygame.FULLSCREEN))
+        self._display_window.hide()
+        self.renderer = _video.Renderer(self.window, accelerated=0 if software else -1, vsync=vsync)
+        self.display  = pygame.Surface((dw, dh)).convert(display)
+        self.bar_color = (0, 0, 0)
+        self.uploads  = 0           # textures created or refreshed
+        self.copies   = 0           # renderer copies this frame
+        self.presents = 0
+        self._textures: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._opaque: weakref.WeakSet = weakref.WeakSet()     # no alpha channel or colorkey
+        self._scratch: dict = {}            # (w, h) -> surface
+        self._dynamic: set = set()          # id() of scratch surfaces
+        self._frame_tex = None              # streaming upload of a presented Surface
+        self._display_tex = None            # streaming upload of self.display
+        self._fresh   = True                # nothing drawn since the last present
+        self._layout()
+
+    # ------------------------------------------------------------------
+    # Surface-like target
+    # ------------------------------------------------------------------
+
+    def _layout(self) -> None:
+        vw, vh = self.size
+        dw, dh = self.window.size
+        scale = min(dw / vw, dh / vh)
+        self.scale    = scale
+        self.offset_x = (dw - int(vw * scale)) // 2
+        self.offset_y = (dh - int(vh * scale)) // 2
+        self.rect     = pygame.Rect(self.offset_x, self.offset_y, int(vw * scale), int(vh * scale))
+        self._view    = pygame.Rect(round(self.offset_x / scale), round(self.offset_y / scale), vw, vh)
+        self._set_view()
+
+    def _set_view(self) -> None:
+        # Scale in the renderer; the viewport clips to the letterboxed area
+        self.renderer.scale = (self.scale, self.scale)
+        self.renderer.set_viewport(self._view)
+
+    def _begin(self) -> None:
+        self._fresh = False
+        self.copies = 0
+        self.renderer.draw_color = pygame.Color(self.bar_color)
+        self.renderer.clear()
+
+    def get_size(self) -> tuple:
+        return self.size
+
+    def get_width(self) -> int:
+        return self.size[0]
+
+    def get_height(self) -> int:
+        return self.size[1]
+
+    def get_rect(self, **kw) -> pygame.Rect:
+        rect = pygame.Rect((0, 0), self.size)
+        for name, value in kw.items():
+            setattr(rect, name, value)
+        return rect
+
+    def texture(self, surf: pygame.Surface):
+        """The texture for *surf*, uploading it the first time it is seen."""
+        tex = self._textures.get(surf)
+        if tex is None:
+            tex = self._textures[surf] = _video.Texture.from_surface(self.renderer, surf)
+            if not surf.get_flags() & pygame.SRCALPHA and surf.get_colorkey() is None:
+                self._opaque.add(surf)
+            self.uploads += 1
+        elif id(surf) in self._dynamic:
+            tex.update(surf)
+            self.uploads += 1
+        return tex
+
+    def refresh(self, surf: pygame.Surface) -> None:
+        """Re-upload *surf*, which was repainted in place, on its next blit."""
+        self._textures.pop(surf, None)
+        self._opaque.discard(surf)
+
+    def scratch(self, w: int, h: int) -> pygame.Surface:
+        """Cleared per-pixel-alpha surface for art drawn with ``pygame.draw``."""
+        surf = self._scratch.get((w, h))
+        if surf is None:
+            surf = self._scratch[(w, h)] = pygame.Surface((w, h), pygame.SRCALPHA)
+            self._dynamic.add(id(surf))
+        surf.fill((0, 0, 0, 0))
+        return surf
+
+    def fill(self, color, rect=None, special_flags: int = 0) -> None:
+        if self._fresh:
+            self._begin()
+        r = self.renderer
+        r.draw_color = pygame.Color(color)
+        r.fill_rect(rect if rect is not None else ((0, 0), self.size))
+        self.copies += 1
+
+    def blit(self, source: pygame.Surface, dest, area=None, special_flags: int = 0) -> None:
+        if self._fresh:
+            self._begin()
+        self._copy(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=True) -> None:
+        if self._fresh:
+            self._begin()
+        copy = self._copy
+        for item in blit_sequence:
+            copy(*item)
+
+    def _copy(self, source, dest, area=None, special_flags=0) -> None:
+        tex = self._textures.get(source)
+        if tex is None or id(source) in self._dynamic:
+            tex = self.texture(source)
+        alpha = source.get_alpha()
+        alpha = 255 if alpha is None else alpha
+        mode = _BLEND_MODES[special_flags]
+        if mode == _SDL_BLEND and alpha == 255 and source in self._opaque:
+            mode = _SDL_NONE        # a straight copy, far cheaper on software renderers
+        if tex.blend_mode != mode:
+            tex.blend_mode = mode
+        if tex.alpha != alpha:
+            tex.alpha = alpha
+        if area is None:
+            tex.draw(None, (dest[0], dest[1], source.get_width(), source.get_height()))
+        else:
+            area = pygame.Rect(area)
+            tex.draw(area, (dest[0], dest[1], area.width, area.height))
+        self.copies += 1
+
+    # ------------------------------------------------------------------
+    # Presenter
+    # ------------------------------------------------------------------
+
+    def present(self, src=None, flip: bool = True) -> None:
+        """Show the frame drawn on the canvas; a plain viewport Surface
+        passed as *src* is uploaded and shown instead."""
+        if src is not None and src is not self:
+            if self._fresh:
+                self._begin()
+            if self._frame_tex is None:
+                self._frame_tex = _video.Texture(self.renderer, self.size, streaming=True)
+            self._frame_tex.update(src)
+            self._frame_tex.draw(None, ((0, 0), self.size))
+        elif self._fresh:
+            self._begin()
+        self.presents += 1
+        if flip:
+            self.renderer.present()
+            self._fresh = True
+
+    def flip(self) -> None:
+        """Show ``display``, the window-sized surface menus draw on."""
+        r = self.renderer
+        if self._display_tex is None:
+            self._display_tex = _video.Texture(r, self.display.get_size(), streaming=True)
+        self._display_tex.update(self.display)
+        r.scale = (1.0, 1.0)
+        r.set_viewport(None)
+        self._display_tex.draw()
+        r.present()
+        self._set_view()
+        self._fresh = True
+
+    def snapshot(self) -> pygame.Surface:
+        """The window's current pixels as a window-sized surface.
+
+        Right after a present this is the frame just shown on renderers that
+        keep their back buffer, as SDL's software renderer does.
+        """
+        r = self.renderer
+        r.scale = (1.0, 1.0)
+        r.set_viewport(None)
+        surf = r.to_surface()
+        self._set_view()
+        return surf
+
+    def invalidate(self) -> None:
+        """Nothing to do: the letterbox is cleared with every frame."""
+
+    def to_viewport(self, pos) -> tuple:
+        return (pos[0] - self.offset_x) / self.scale, (pos[1] - self.offset_y) / self.scale
+
+    def close(self) -> None:
+        """Drop the renderer and its window and show the display's window again."""
+        if self.window is None:
+            return
+        self._textures.clear()
+        self._frame_tex = self._display_tex = None
+        self.renderer = None
+        self.window.destroy()
+        self.window = None
+        self._display_window.show()
@@ -31,8 +31,15 @@ hidden_imports = [
     "pygame.time", "pygame.transform", "pygame.sprite", "pygame.pkgdata",
     "games.snake", "games.snake.snake_game",
     "games.shooter", "games.shooter.shooter_game", "games.shooter.tilemap",
-    "games.shooter.wall_renderer", "games.shooter.helpers",
-    "Utils", "Utils.textbox", "Utils.save_manager",
+    "games.shooter.wall_renderer", "games.shooter.helpers", "games.shooter.spatial",
+    "games.shooter.jobs", "games.shooter.sim_process", "games.shooter.quality",
+    "games.shooter.horde", "games.shooter.enemy_sprites", "games.shooter.patterns",
+    "games.shooter.hud", "games.shooter.item_sprites",
+    "games.shooter.crates", "games.shooter.ship_sprites", "games.shooter.vignette",
+    "games.shooter.draw_buffer",
+    "Utils", "Utils.textbox", "Utils.save_manager", "Utils.fixed_step",
+    "Utils.particles", "Utils.text_cache", "Utils.display",
+    "Utils.texture_canvas",
     "math", "random", "sys", "os", "pathlib",
 ]
 
@@ -0,0 +1,1319 @@
+"""
+bench_shooter.py — Micro-benchmarks and parity checks for the shooter hot paths.
+
+Runs headless (SDL dummy video driver), so it works on CI boxes and over SSH.
+
+Usage:
+    python dev/bench_shooter.py            # run every case
+    python dev/bench_shooter.py homing     # run a single case
+    python dev/bench_shooter.py --list     # list available cases
+"""
+from __future__ import annotations
+import importlib.util
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+
+def _load_mod(name: str, rel_path: str):
+    """Load a module from a file path, caching it in sys.modules."""
+    if name in sys.modules:
+        return sys.modules[name]
+    path = os.path.join(ROOT_DIR, rel_path.replace('/', os.sep))
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+pygame.init()
+pygame.display.set_mode((1280, 720))
+sg = _load_mod('shooter_game', 'games/shooter/shooter_game.py')
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _timeit(fn, repeat: int = 5) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000.0
+
+
+def _report(name: str, rows: list[tuple[str, float]]) -> None:
+    print(f'\n== {name} ==')
+    for label, ms in rows:
+        print(f'  {label:<36} {ms:9.3f} ms')
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+
+def bench_homing(n: int = 2000, frames: int = 120) -> None:
+    """Homing steering: scalar EnemyBullet.update vs steer_homing_batch (+ parity)."""
+    rng = random.Random(1234)
+    px, py = 9000.0, 9000.0
+
+    def make():
+        out = []
+        for _ in range(n):
+            a = rng.uniform(0, math.tau)
+            out.append(sg.EnemyBullet(px + rng.uniform(-800, 800), py + rng.uniform(-450, 450),
+                                      (math.cos(a), math.sin(a)), bullet_type='homing',
+                                      lifetime=10_000))
+        return out
+
+    scalar = make()
+    rng.seed(1234)
+    batch = make()
+    xs  = np.array([b.x for b in batch])
+    ys  = np.array([b.y for b in batch])
+    dxs = np.array([b.dir[0] for b in batch])
+    dys = np.array([b.dir[1] for b in batch])
+    spd = np.array([b.speed for b in batch], dtype=np.float64)
+
+    for _ in range(frames):
+        for b in scalar:
+            b.update(px, py)
+        sg.steer_homing_batch(xs, ys, dxs, dys, px, py)
+        xs += dxs * spd
+        ys += dys * spd
+
+    err = max(
+        float(np.max(np.abs(xs  - [b.x for b in scalar]))),
+        float(np.max(np.abs(ys  - [b.y for b in scalar]))),
+        float(np.max(np.abs(dxs - [b.dir[0] for b in scalar]))),
+        float(np.max(np.abs(dys - [b.dir[1] for b in scalar]))),
+    )
+    assert err < 1e-6, f'homing parity drift {err:g}'
+
+    # Homing bullets test the player before walls, other bullets walls first
+    game = sg.ShooterGame(pygame.display.get_surface(), seed='BENCH1', sim_process=False)
+    p = game.player
+    game.chunk_manager.tilemap.check_collision_batch = lambda bx, by, bs: np.ones(len(bx), bool)
+    game.enemy_bullets = [sg.EnemyBullet(p.x, p.y, (1.0, 0.0), bullet_type=kind)
+                          for kind in ('homing', 'normal')]
+    for b in game.enemy_bullets:
+        b.speed = 0.0
+    assert game._update_enemy_bullets() == [2], 'homing bullet on a wall tile missed the player'
+    game._frame_jobs.shutdown()
+
+    def run_scalar():
+        for b in scalar:
+            b.update(px, py)
+
+    def run_batch():
+        sg.steer_homing_batch(xs, ys, dxs, dys, px, py)
+        np.add(xs, dxs * spd, out=xs)
+        np.add(ys, dys * spd, out=ys)
+
+    _report(f'homing steer, {n} bullets (parity ok, max err {err:.2e})', [
+        ('scalar EnemyBullet.update', _timeit(run_scalar)),
+        ('steer_homing_batch',        _timeit(run_batch)),
+    ])
+
+
+def bench_broadphase(n_bullets: int = 2000, n_enemies: int = 30) -> None:
+    """Bullet-vs-enemy broad-phase: per-enemy O(E x B) scan vs sorted UniformGrid."""
+    rng = np.random.default_rng(7)
+    bx = rng.uniform(8200, 9800, n_bullets)
+    by = rng.uniform(8550, 9450, n_bullets)
+    ex = rng.uniform(8200, 9800, n_enemies)
+    ey = rng.uniform(8550, 9450, n_enemies)
+    er = rng.choice([11.0, 14.0, 15.0, 22.0, 48.0], n_enemies) + 20.0
+
+    def brute():
+        out = []
+        for j in range(n_enemies):
+            dx, dy = bx - ex[j], by - ey[j]
+            out.append(np.where(dx * dx + dy * dy < er[j] * er[j])[0])
+        return out
+
+    grid = sg.UniformGrid(cell=80)
+
+    def gridded():
+        grid.build(bx, by)
+        return grid.query_pairs(ex, ey, er)
+
+    ref = brute()
+    pb, pe = gridded()
+    for j in range(n_enemies):
+        assert sorted(pb[pe == j].tolist()) == ref[j].tolist(), f'broad-phase mismatch for enemy {j}'
+
+    # Same crowd with one boss-sized query: only the boss scans the wide block
+    big = er.copy()
+    big[0] = 400.0
+    ex_big = ex.copy()
+    grid.build(bx, by)
+    pb, pe = grid.query_pairs(ex_big, ey, big)
+    for j in (0, 1):
+        dx, dy = bx - ex_big[j], by - ey[j]
+        ref_j = np.where(dx * dx + dy * dy < big[j] * big[j])[0].tolist()
+        assert sorted(pb[pe == j].tolist()) == ref_j, f'mixed-radius mismatch for enemy {j}'
+    assert (np.diff(pe) >= 0).all(), 'query_pairs result not grouped by query'
+
+    _report(f'broad-phase, {n_bullets} bullets x {n_enemies} enemies ({len(pb)} pairs, parity ok)', [
+        ('per-enemy full scan', _timeit(brute)),
+        ('UniformGrid build + query_pairs', _timeit(gridded)),
+        ('  same, one query of radius 400', _timeit(lambda: (grid.build(bx, by),
+                                                             grid.query_pairs(ex, ey, big)))),
+    ])
+
+
+def bench_hits(n_bullets: int = 2000, n_enemies: int = 30) -> None:
+    """Bullet-hit resolution: scalar per-hit loop vs vectorised pairs (+ kill parity)."""
+    def scenario():
+        rng = random.Random(11)
+        enemies = [sg.Enemy(rng.uniform(8200, 9800), rng.uniform(8550, 9450), 200,
+                            enemy_type=rng.choice(['normal', 'fast', 'tank', 'shooter']))
+                   for _ in range(n_enemies)]
+        bullets = [sg.Bullet(rng.uniform(8200, 9800), rng.uniform(8550, 9450), (1.0, 0.0),
+                             damage=rng.choice([5, 10, 50]), pierce=rng.choice([0, 0, 1, 2]),
+                             inaccuracy=0)
+                   for _ in range(n_bullets)]
+        game = object.__new__(sg.ShooterGame)
+        game.bullets = bullets
+        game._bullet_grid = sg.UniformGrid(cell=80)
+        game._enemy_slots = sg.SlotAllocator()
+        for e in enemies:
+            e.slot = game._enemy_slots.acquire()
+        return game, enemies
+
+    def run(method):
+        game, enemies = scenario()
+        killed = getattr(game, method)(enemies)
+        alive_hp = [e.health for i, e in enumerate(enemies) if i not in killed]
+        return killed, alive_hp
+
+    assert run('_resolve_bullet_hits_py') == run('_resolve_bullet_hits_np'), 'hit resolution mismatch'
+
+    # A pierce-0 bullet over two enemies, the first of which dies to an earlier
+    # bullet: the wasted hit must not spend its budget, so it lands on the second
+    def overlap_case(method):
+        a = sg.Enemy(9000, 9000, 10, enemy_type='normal')
+        b = sg.Enemy(9010, 9000, 100, enemy_type='normal')
+        game = object.__new__(sg.ShooterGame)
+        game.bullets = [sg.Bullet(8998, 9000, (1.0, 0.0), damage=10, pierce=0, inaccuracy=0),
+                        sg.Bullet(9005, 9000, (1.0, 0.0), damage=5, pierce=0, inaccuracy=0)]
+        game._bullet_grid = sg.UniformGrid(cell=80)
+        game._enemy_slots = sg.SlotAllocator()
+        for e in (a, b):
+            e.slot = game._enemy_slots.acquire()
+        killed = getattr(game, method)([a, b])
+        return killed, a.health, b.health, len(game.bullets)
+
+    ref = overlap_case('_resolve_bullet_hits_py')
+    assert ref[2] == 95, 'overlap case no longer exercises the cut-off'
+    assert overlap_case('_resolve_bullet_hits_np') == ref, 'cut-off / budget mismatch'
+
+    # Dense crowds inside one grid cell, where both resolvers visit bullets in
+    # the same order: every kill, health and surviving bullet must agree
+    def dense_case(method, seed):
+        rng = random.Random(seed)
+        enemies = [sg.Enemy(rng.uniform(9041, 9118), rng.uniform(9041, 9118),
+                            rng.choice([10, 30, 60]), enemy_type='normal') for _ in range(12)]
+        game = object.__new__(sg.ShooterGame)
+        game.bullets = [sg.Bullet(rng.uniform(9041, 9118), rng.uniform(9041, 9118), (1.0, 0.0),
+                                  damage=rng.choice([5, 10, 50]), pierce=rng.choice([0, 0, 1, 2]),
+                                  inaccuracy=0)
+                        for _ in range(60)]
+        game._bullet_grid = sg.UniformGrid(cell=80)
+        game._enemy_slots = sg.SlotAllocator()
+        for e in enemies:
+            e.slot = game._enemy_slots.acquire()
+        killed = getattr(game, method)(enemies)
+        return killed, [e.health for e in enemies], [b.pierce_left for b in game.bullets]
+
+    for seed in range(20):
+        assert dense_case('_resolve_bullet_hits_py', seed) == dense_case('_resolve_bullet_hits_np', seed), \
+            f'dense hit resolution mismatch (seed {seed})'
+
+    def timed(method):
+        game, enemies = scenario()
+        t0 = time.perf_counter()
+        getattr(game, method)(enemies)
+        return (time.perf_counter() - t0) * 1000.0
+
+    _report(f'hit resolution, {n_bullets} bullets x {n_enemies} enemies (kills match)', [
+        ('scalar dict grid + per-hit loop', min(timed('_resolve_bullet_hits_py') for _ in range(5))),
+        ('vectorised pair resolution',      min(timed('_resolve_bullet_hits_np') for _ in range(5))),
+    ])
+
+
+def bench_bulletdraw(n: int = 3000) -> None:
+    """Player bullet draw: per-bullet circles in the fade window vs fade-ramp blits()."""
+    rng = random.Random(5)
+    game = object.__new__(sg.ShooterGame)
+    game.bullets = [sg.Bullet(rng.uniform(0, 1280), rng.uniform(0, 720), (1.0, 0.0),
+                              pierce=rng.choice([0, 0, 1]), bounces=rng.choice([0, 0, 1]),
+                              inaccuracy=0)
+                    for _ in range(n)]
+    for b in game.bullets:
+        b.lifetime = rng.randint(0, 240)
+    half = sg.Bullet.SIZE + 1
+    surf = pygame.Surface((2 * half, 2 * half), pygame.SRCALPHA)
+    pygame.draw.circle(surf, sg.C_BULLET, (half, half), sg.Bullet.SIZE)
+    surf = surf.convert_alpha()
+    game._bullet_ramp = [surf] * (3 * sg.BULLET_FADE_LEVELS)
+    scr = pygame.Surface((1280, 720)).convert()
+
+    def legacy():
+        batch = []
+        for b in game.bullets:
+            sx, sy = int(b.x), int(b.y)
+            if -half < sx < 1280 + half and -half < sy < 720 + half:
+                if b.lifetime <= sg.BULLET_FADE:
+                    f = b.lifetime / sg.BULLET_FADE
+                    pygame.draw.circle(scr, (int(255 * f), int(230 * f), int(80 * f)),
+                                       (sx, sy), sg.Bullet.SIZE)
+                else:
+                    batch.append((surf, (sx - half, sy - half)))
+        scr.blits(batch)
+
+    def ramped():
+        scr.blits(game._player_bullet_blits(0.0, 0.0, 1280, 720, half), doreturn=False)
+
+    fading = sum(b.lifetime <= sg.BULLET_FADE for b in game.bullets)
+    _report(f'bullet draw, {n} bullets ({fading} fading)', [
+        ('draw.circle for fading + blits', _timeit(legacy)),
+        ('fade ramp, single blits()',       _timeit(ramped)),
+    ])
+
+
+def _jobs_state(game) -> tuple:
+    """Everything the frame job graph writes, rounded for comparison."""
+    p = game.player
+    return (game.kills, p.health, game.shoot_cd, game.boss_active,
+            [(e.enemy_type, e.is_boss, round(e.x, 6), round(e.y, 6), e.health) for e in game.enemies],
+            [(round(b.x, 6), round(b.y, 6), b.pierce_left) for b in game.bullets],
+            [(round(b.x, 6), round(b.y, 6), b.lifetime) for b in game.enemy_bullets],
+            [list(game.items.col(name)) for name in ('x', 'y', 'kind', 'stack')],
+            [(pop.text, pop.lifetime) for pop in game.popups])
+
+
+def _run_latest_first(graph) -> None:
+    """JobGraph.run with every phase in the latest-declared-first order its
+    declared dependencies allow: a legal schedule the pool could pick, made
+    deterministic so that an undeclared read or write shows up on one core."""
+    for phase in graph._phases:
+        done: set[int] = set()
+        while len(done) < len(phase):
+            i = max(i for i, job in enumerate(phase) if i not in done and done.issuperset(job.deps))
+            graph._call(phase[i])
+            done.add(i)
+        for job in phase:
+            if job.merge is not None:
+                job.merge(job.result)
+            job.result = None
+
+
+def bench_jobs(ticks: int = 240, boss_at: int = 120) -> None:
+    """Frame job graph: ShooterGame's own graph, serial vs pooled vs reordered (+ parity).
+
+    Every run starts from the same random state and forces a mini boss spawn
+    mid-run, whose clear of both bullet lists must not cross the bullet jobs.
+    """
+    screen  = pygame.display.get_surface()
+    keys    = sg._sim_module().InputKeys()
+    workers = max(4, os.cpu_count() or 1)
+
+    def play(mode: str) -> tuple:
+        game  = sg.ShooterGame(screen, seed='BENCH1', sim_process=False)
+        graph = game._frame_jobs
+        graph.workers = 1 if mode == 'serial' else workers
+        if mode == 'latest-first':
+            graph.run = lambda: _run_latest_first(graph)
+        random.seed(31)             # the game reseeds from the clock after map generation
+        p, ticked = game.player, []
+        t0 = time.perf_counter()
+        for tick in range(ticks):
+            game.frame += 1
+            if tick == boss_at:
+                # The boss spawn clears this volley and the bullet sitting on the player
+                game.kills, game._init_spawns_left, game._init_spawn_timer = sg.MINI_BOSS_INTERVAL, 1, 11
+                game.shoot_cd, p.invincible = 0, 0
+                game.enemy_bullets.append(sg.EnemyBullet(p.x, p.y, (1.0, 0.0)))
+            game._update(keys)
+            ticked.append((p.health, len(game.bullets), len(game.enemy_bullets), game.boss_active))
+            _stress_step(game)
+        ms = (time.perf_counter() - t0) * 1000.0 / ticks
+        state = (ticked, *_jobs_state(game))
+        graph.shutdown()
+        return state, ms, graph.timings()
+
+    s_state, s_ms, _       = play('serial')
+    p_state, p_ms, timings = play('pooled')
+    r_state, r_ms, _       = play('latest-first')
+    assert s_state[0][boss_at][3], 'forced boss spawn did not happen'
+    assert s_state == p_state, 'frame state differs between serial and pooled job graph runs'
+    assert s_state == r_state, 'frame state depends on job order: a job under-declares its reads/writes'
+
+    rows = [('serial (workers=1), per tick',           s_ms),
+            (f'pooled (workers={workers}), per tick',  p_ms),
+            ('serial, latest-first order, per tick',   r_ms)]
+    rows += [(f'  job {name}', ms) for name, ms in timings]
+    _report(f'ShooterGame job graph, {ticks} ticks, boss at tick {boss_at}, '
+            f'{os.cpu_count()} core(s) (states match)', rows)
+
+
+def _stress_step(game) -> None:
+    """Per-step hook for the split-mode bench: immortal, fast-firing player in a crowd."""
+    p = game.player
+    p.health, p.multi_shot, p.fire_rate, p.bullet_pierce = p.MAX_HEALTH, 6, 2, 1
+    while len(game.enemies) < 40:
+        a = random.uniform(0, math.tau)
+        r = random.uniform(250, 600)
+        game.enemies.append(sg.Enemy(p.x + r * math.cos(a), p.y + r * math.sin(a), 200,
+                                     enemy_type=random.choice(['normal', 'fast', 'tank', 'shooter'])))
+
+
+def bench_simproc(seconds: float = 6.0) -> None:
+    """Throughput: update+draw in one process vs simulation in a child process."""
+    sim    = sg._sim_module()
+    screen = pygame.display.get_surface()
+    keys   = sim.InputKeys()
+
+    game = sg.ShooterGame(screen, seed='BENCH1', sim_process=False)
+    frames, t0 = 0, time.perf_counter()
+    while time.perf_counter() - t0 < seconds:
+        game.frame += 1
+        game._update(keys)
+        _stress_step(game)
+        game._draw()
+        frames += 1
+    single_ms = (time.perf_counter() - t0) * 1000.0 / frames
+    game._frame_jobs.shutdown()
+
+    rows = [('single process, per update+draw', single_ms)]
+    title = f'split simulation, {os.cpu_count()} core(s), 40 enemies, 6-way fire ({frames / seconds:.0f} fps single'
+    for throttle in (False, True):
+        renders, steps, elapsed = _run_split(sim, screen, seconds, throttle)
+        tag = f'{sim.SIM_HZ} Hz sim' if throttle else 'free-running sim'
+        title += f'; {tag}: {renders / elapsed:.0f} fps + {steps / elapsed:.0f} steps/s'
+        rows += [(f'split ({tag}), per render frame', elapsed * 1000.0 / max(1, renders)),
+                 (f'split ({tag}), per sim step',     elapsed * 1000.0 / max(1, steps))]
+    _report(title + ')', rows)
+
+
+def _run_split(sim, screen, seconds: float, throttle: bool) -> tuple[int, int, float]:
+    """Render split-mode snapshots for `seconds`; returns (renders, sim steps, elapsed)."""
+    view   = sg.ShooterGame(screen, seed='BENCH1', sim_process=False)
+    client = sim.SimClient('BENCH1', throttle=throttle, on_step=_stress_step)
+    try:
+        cur = None
+        deadline = time.perf_counter() + 60.0
+        while cur is None and time.perf_counter() < deadline:
+            cur = client.state.read()
+            time.sleep(0.01)
+        assert cur is not None, 'simulation process never published a snapshot'
+        prev, cur_t = cur, time.perf_counter()
+        view._step_mirror(prev, cur)
+        renders, s0, t0 = 0, client.steps, time.perf_counter()
+        while time.perf_counter() - t0 < seconds:
+            snap = client.state.read(cur.frame)
+            if snap is not None:
+                prev, cur, cur_t = cur, snap, time.perf_counter()
+                view._step_mirror(prev, cur)
+            client.events()
+            view._apply_snapshot(prev, cur, min(1.0, (time.perf_counter() - cur_t) * sim.SIM_HZ))
+            view._draw()
+            renders += 1
+        return renders, client.steps - s0, time.perf_counter() - t0
+    finally:
+        client.stop()
+        view._frame_jobs.shutdown()
+
+
+def _paced_run(game, run, seconds: float, render_ms: float) -> tuple[float, float]:
+    """Run a game's real loop for `seconds` with `render_ms` of extra work per draw.
+
+    Returns (logic ticks per second, rendered frames per second).
+    """
+    draws = [0]
+    draw  = game._draw
+
+    def slow_draw(*args):
+        draw(*args)
+        draws[0] += 1
+        if render_ms:
+            time.sleep(render_ms / 1000.0)
+
+    game._draw = slow_draw
+    pygame.event.clear()
+    pygame.time.set_timer(pygame.QUIT, int(seconds * 1000), 1)
+    t0 = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - t0
+    return game.frame / elapsed, draws[0] / elapsed
+
+
+def bench_fixedstep(seconds: float = 3.0) -> None:
+    """Stress: logic tick rate of both game loops as render cost grows."""
+    snake  = _load_mod('snake_game', 'games/snake/snake_game.py')
+    screen = pygame.display.get_surface()
+    best_kills = sg._save_mod.update_best_kills
+    sg._save_mod.update_best_kills = lambda kills: None    # keep the bench out of the save file
+    try:
+        for render_ms in (0, 10, 25, 40):
+            rows = []
+            game = sg.ShooterGame(screen, seed='BENCH1', sim_process=False)
+            update = game._update
+
+            def immortal(keys, game=game, update=update):
+                update(keys)
+                game.player.health = game.player.MAX_HEALTH
+
+            game._update = immortal
+            ticks, fps = _paced_run(game, game._run_loop, seconds, render_ms)
+            game._frame_jobs.shutdown()
+            rows.append((f'shooter: {ticks:5.1f} ticks/s at {fps:5.1f} fps, ms per tick', 1000.0 / ticks))
+            game = snake.SnakeGame(screen, seed='BENCH1')
+            ticks, fps = _paced_run(game, game.run, seconds, render_ms)
+            rows.append((f'snake:   {ticks:5.1f} ticks/s at {fps:5.1f} fps, ms per tick', 1000.0 / ticks))
+            _report(f'fixed timestep ({sg.TICK_HZ} Hz target), +{render_ms} ms render load', rows)
+    finally:
+        sg._save_mod.update_best_kills = best_kills
+
+
+def bench_horde(frames: int = 30) -> None:
+    """Stress: regular enemies as objects vs the structure-of-arrays store."""
+    screen = pygame.display.get_surface()
+    horde  = sg._horde_mod
+
+    # HordeEnemy skips Enemy.__init__: every attribute that sets must resolve on a store row
+    store = horde.EnemyStore(len(horde.KINDS))
+    for kind in horde.KINDS:
+        plain = sg.Enemy(0, 0, 10, enemy_type=kind)
+        row = sg.HordeEnemy(store, plain)
+        missing = [name for name in vars(plain) if not hasattr(row, name)]
+        assert not missing, f'HordeEnemy lacks Enemy attributes: {missing}'
+        shared = [name for name, v in vars(plain).items()
+                  if isinstance(v, (list, dict, set)) and name not in vars(row)
+                  and not isinstance(getattr(type(row), name, None), property)]
+        assert not shared, f'HordeEnemy shares mutable class attributes: {shared}'
+    for n in (500, 1000, 3000):
+        game = sg.ShooterGame(screen, seed='BENCH1', sim_process=False, horde=n)
+        p, cm = game.player, game.chunk_manager
+        keys = sg._sim_module().InputKeys()
+        while len(game.enemies) < n * 0.95 and game.frame < 400:
+            game.frame += 1
+            game._update(keys)
+            p.health = p.MAX_HEALTH
+
+        # Same crowd both ways: plain Enemy objects, and a store built from copies of them
+        objs = [sg.Enemy(e.x, e.y, e.health, enemy_type=e.enemy_type) for e in game.enemies]
+        store = horde.EnemyStore()
+        for e in objs:
+            sg.HordeEnemy(store, sg.Enemy(e.x, e.y, e.health, enemy_type=e.enemy_type))
+        tm = cm.tilemap
+
+        def run_objects():
+            for _ in range(frames):
+                for e in objs:
+                    e.update(p.x, p.y, cm, True)
+
+        def run_store():
+            for _ in range(frames):
+                store.step(p.x, p.y, tm.check_collision_batch)
+
+        def run_game():
+            for _ in range(frames):
+                game.frame += 1
+                game._update(keys)
+                p.health = p.MAX_HEALTH
+
+        # Split mode sizes its shared block from the horde cap: the whole crowd is published
+        sim   = sg._sim_module()
+        state = sim.SharedState(caps=sim.block_caps(game._horde_cap))
+        try:
+            game._pack_snapshot(state)
+            snap = state.read()
+            assert len(snap.enemies) == snap.enemies_total == len(game.enemies), \
+                f'split snapshot holds {len(snap.enemies)} of {len(game.enemies)} enemies'
+        finally:
+            state.close()
+
+        rows = [('Enemy.update loop, per tick',       _timeit(run_objects, 3) / frames),
+                ('EnemyStore.step, per tick',          _timeit(run_store, 3) / frames),
+                ('ShooterGame._update, per tick',         _timeit(run_game, 3) / frames)]
+        game._frame_jobs.shutdown()
+        _report(f'horde movement, {len(objs)} regular enemies', rows)
+
+
+def bench_separation() -> None:
+    """Scaling: enemy separation (grid rebuild + pair query) vs a pairwise scan."""
+    horde = sg._horde_mod
+    grid  = sg.UniformGrid(cell=horde.SEP_CELL)
+    rng   = np.random.default_rng(7)
+    for n in (500, 1000, 2000, 4000, 8000):
+        # A crowd packed at roughly one enemy per 30 x 30 px, as around the player
+        r = math.sqrt(n * 900 / math.pi)
+        a = rng.uniform(0, math.tau, n)
+        d = r * np.sqrt(rng.uniform(0, 1, n))
+        sizes = rng.choice((11.0, 14.0, 15.0, 22.0), n)
+        store = horde.EnemyStore(n)
+        for i in range(n):
+            store.add(sg.Enemy(0, 0, 1), x=5000 + d[i] * math.cos(a[i]),
+                      y=5000 + d[i] * math.sin(a[i]), size=sizes[i], speed=1.0)
+        x, y, size = store.col('x'), store.col('y'), store.col('size')
+        qr = 2.0 * size * horde.SEP_GAP
+        grid.build(x, y)
+        pairs = len(grid.query_pairs(x, y, qr)[0])
+
+        def naive():
+            dx = x[:, None] - x[None, :]
+            dy = y[:, None] - y[None, :]
+            reach = (size[:, None] + size[None, :]) * horde.SEP_GAP
+            return (dx * dx + dy * dy < reach * reach).sum()
+
+        if n <= 2000:
+            # Parity with the pairwise definition of the push
+            dx = x[:, None] - x[None, :]
+            dy = y[:, None] - y[None, :]
+            d  = np.sqrt(dx * dx + dy * dy)
+            reach = (size[:, None] + size[None, :]) * horde.SEP_GAP
+            near = (d < reach) & (d > 0)
+            w = np.where(near, (reach - d) / (reach * np.where(d > 0, d, 1.0)), 0.0)
+            ref_x, ref_y = (dx * w).sum(1), (dy * w).sum(1)
+            mag = np.sqrt(ref_x * ref_x + ref_y * ref_y)
+            over = mag > 1.0
+            ref_x[over] /= mag[over]
+            ref_y[over] /= mag[over]
+            got_x, got_y = store.separation(grid)
+            assert np.allclose(got_x, ref_x * horde.SEP_PUSH) and \
+                np.allclose(got_y, ref_y * horde.SEP_PUSH), 'separation mismatch'
+
+        rows = [('grid rebuild',                 _timeit(lambda: grid.build(x, y))),
+                ('grid rebuild + query_pairs',   _timeit(lambda: (grid.build(x, y), grid.query_pairs(x, y, qr)))),
+                ('EnemyStore.separation (all)',  _timeit(lambda: store.separation(grid)))]
+        if n <= 2000:
+            rows.append(('pairwise O(n^2) overlap test', _timeit(naive, 3)))
+        _report(f'enemy separation, {n} enemies ({pairs} candidate pairs)', rows)
+
+
+def bench_enemyindex(queries: int = 200) -> None:
+    """Scaling: per-tick enemy index queries vs scanning the enemy list."""
+    rng = np.random.default_rng(11)
+    index = sg.CircleIndex(cell=64)
+    for n in (100, 1000, 5000, 20000):
+        # Spread like a horde: about one enemy per 40 x 40 px around the player
+        half = math.sqrt(n) * 20
+        enemies = [sg.Enemy(float(x), float(y), 1)
+                   for x, y in rng.uniform(5000 - half, 5000 + half, (n, 2))]
+        xs = np.array([e.x for e in enemies])
+        ys = np.array([e.y for e in enemies])
+        rs = np.array([e.size for e in enemies], dtype=float)
+        px, py = 5000.0, 5000.0
+        index.build(enemies, xs, ys, rs)
+        assert index.nearest(px, py) is min(enemies, key=lambda e: (e.x - px) ** 2 + (e.y - py) ** 2)
+
+        def linear_nearest():
+            for _ in range(queries):
+                min(enemies, key=lambda e: (e.x - px) ** 2 + (e.y - py) ** 2)
+
+        def linear_overlap():
+            for _ in range(queries):
+                [e for e in enemies if (e.x - px) ** 2 + (e.y - py) ** 2 < (30 + e.size) ** 2]
+
+        def indexed_nearest():
+            for _ in range(queries):
+                index.nearest(px, py)
+
+        def indexed_overlap():
+            for _ in range(queries):
+                index.overlapping(px, py, 30)
+
+        rows = [('CircleIndex.build',              _timeit(lambda: index.build(enemies, xs, ys, rs))),
+                ('nearest: min() over the list',   _timeit(linear_nearest, 3) / queries),
+                ('nearest: CircleIndex',           _timeit(indexed_nearest, 3) / queries),
+                ('overlap r=30: list scan',        _timeit(linear_overlap, 3) / queries),
+                ('overlap r=30: CircleIndex',      _timeit(indexed_overlap, 3) / queries)]
+        _report(f'enemy index, {n} enemies (per query; nearest matches a full scan)', rows)
+
+
+def bench_enemydraw(frames: int = 10) -> None:
+    """Render: enemies drawn one by one vs atlas sprites batched into one blits()."""
+    screen = pygame.display.get_surface()
+    target = pygame.Surface(screen.get_size()).convert()
+    horde  = sg._horde_mod
+    atlas  = sg.ENEMY_ATLAS
+    rng    = random.Random(5)
+    for n in (200, 1000, 3000):
+        store = horde.EnemyStore(n)
+        for _ in range(n):
+            e = sg.Enemy(rng.uniform(0, sg.VIEWPORT_W), rng.uniform(0, sg.VIEWPORT_H), 100,
+                         enemy_type=rng.choice(['normal', 'fast', 'tank', 'shooter']))
+            sg.HordeEnemy(store, e)
+        rows = np.arange(n)
+        handles = store.handles
+
+        def one_by_one():
+            for _ in range(frames):
+                store.anim_angle[:n] += 0.05
+                for h in handles:
+                    h.draw(target, 0, 0)
+
+        def batched():
+            for _ in range(frames):
+                store.anim_angle[:n] += 0.05
+                seq = []
+                atlas.add_rows(store, rows, 0, 0, seq)
+                target.blits(seq, doreturn=False)
+
+        def lod():
+            for _ in range(frames):
+                seq = []
+                atlas.add_rows(store, rows, 0, 0, seq, lod_size=horde_lod)
+                target.blits(seq, doreturn=False)
+
+        def bars():
+            for _ in range(frames):
+                for h in handles:
+                    h._draw_healthbar(target, int(h.x), int(h.y))
+
+        def bars_batched():
+            for _ in range(frames):
+                seq = []
+                atlas.add_bars(store, rows, 0, 0, seq)
+                target.blits(seq, doreturn=False)
+
+        horde_lod = sg._sprites_mod.LOD_SIZE
+        result = [('Enemy.draw per enemy (sprite + bar)', _timeit(one_by_one, 3) / frames),
+                  ('atlas add_rows + one blits()',        _timeit(batched, 3) / frames),
+                  ('  LOD: small types as plain discs',   _timeit(lod, 3) / frames),
+                  ('health bars one by one',              _timeit(bars, 3) / frames),
+                  ('  add_bars + one blits()',            _timeit(bars_batched, 3) / frames)]
+        _report(f'enemy draw, {n} enemies on screen ({atlas.frames_built} atlas frames)', result)
+
+
+def bench_enemycull(frames: int = 10) -> None:
+    """Render: a horde spread over 5x5 screens, drawn whole vs culled to the viewport."""
+    screen = pygame.display.get_surface()
+    target = pygame.Surface(screen.get_size()).convert()
+    vw, vh = target.get_size()
+    horde  = sg._horde_mod
+    atlas  = sg.ENEMY_ATLAS
+    reach  = sg._sprites_mod.reach
+    rng    = random.Random(6)
+    for n in (1000, 3000):
+        store = horde.EnemyStore(n)
+        for _ in range(n):
+            e = sg.Enemy(rng.uniform(-2 * vw, 3 * vw), rng.uniform(-2 * vh, 3 * vh), 100,
+                         enemy_type=rng.choice(['normal', 'fast', 'tank', 'shooter']))
+            sg.HordeEnemy(store, e)
+        every = np.arange(n)
+
+        def draw(rows):
+            seq = []
+            atlas.add_rows(store, rows, 0, 0, seq)
+            atlas.add_bars(store, rows, 0, 0, seq)
+            target.blits(seq, doreturn=False)
+
+        def whole():
+            for _ in range(frames):
+                draw(every)
+
+        def culled():
+            for _ in range(frames):
+                x, y = store.col('x'), store.col('y')
+                m = reach(store.col('size'))
+                draw(np.flatnonzero((x > -m) & (x < vw + m) & (y > -m) & (y < vh + m)))
+
+        x, y, m = store.col('x'), store.col('y'), reach(store.col('size'))
+        seen = int(((x > -m) & (x < vw + m) & (y > -m) & (y < vh + m)).sum())
+        _report(f'enemy cull, {n} enemies, {seen} near the screen',
+                [('every row drawn (clipped by SDL)', _timeit(whole, 3) / frames),
+                 ('rows culled by reach, then drawn', _timeit(culled, 3) / frames)])
+
+
+def _omega_volley_per_call(boss, px: float, py: float) -> list:
+    """OMEGA PRIME's volley the way Enemy.shoot built it before the pattern
+    tables: five lambdas rebuilt per call, trig per bullet."""
+    helpers = sg._helpers_mod
+    spread, ring = helpers.spread_directions, helpers.ring_directions
+    dx, dy = px - boss.x, py - boss.y
+    dist = math.sqrt(dx*dx + dy*dy)
+    base = [dx/dist, dy/dist]
+    pt = boss.pattern_timer
+
+    def B(direction, btype='normal'):
+        return sg.EnemyBullet(boss.x, boss.y, list(direction), bullet_type=btype)
+
+    final = [
+        lambda: [B(d) for d in spread(*base, 14, 1.8)] + [B(d, 'homing') for d in ring(6, pt*0.05)],
+        lambda: [B(d) for d in ring(8, pt*0.1)] + [B(d) for d in ring(8, pt*0.1+math.pi/8)],
+        lambda: [B(d, 'snipe') for d in ring(4)] + [B(d) for d in spread(*base, 18, 1.9)],
+        lambda: [B(d, 'homing') for d in ring(10, pt*0.08)] + [B(d, 'mortar') for d in ring(5)],
+        lambda: [B(d, 'laser') for d in ring(4)] + [B(d) for d in spread(*base, 20, 2.0)],
+    ]
+    return final[boss.attack_pattern % len(final)]()
+
+
+def bench_patterns(cycles: int = 3) -> None:
+    """Boss bullets: a full OMEGA PRIME attack cycle, per-call lambdas vs compiled patterns (+ parity)."""
+    boss = sg.Enemy(5000.0, 5000.0, 1, is_boss=True, is_final=True)
+    n_patterns = len(sg._patterns_mod.FINAL_PATTERNS)
+    px, py = 5300.0, 4800.0
+
+    def cycle(shoot):
+        """One volley on every frame of every pattern phase; returns the bullet count."""
+        fired = 0
+        for pattern in range(n_patterns):
+            boss.attack_pattern = pattern
+            for t in range(boss.phase_len):
+                boss.pattern_timer = t
+                fired += len(shoot())
+        return fired
+
+    err = 0.0
+    for pattern in range(n_patterns):
+        boss.attack_pattern, boss.pattern_timer = pattern, 77
+        ref, new = _omega_volley_per_call(boss, px, py), boss.shoot(px, py)
+        assert [(b.bullet_type, b.speed, b.size) for b in ref] == \
+               [(b.bullet_type, b.speed, b.size) for b in new], 'pattern mismatch'
+        err = max([err] + [abs(a.dir[i] - b.dir[i]) for a, b in zip(ref, new) for i in (0, 1)])
+    assert err < 1e-9, f'pattern direction drift {err:g}'
+
+    volleys = n_patterns * boss.phase_len
+    bullets = cycle(lambda: boss.shoot(px, py))
+    rows = [('per-call lambdas, trig per bullet',
+             _timeit(lambda: cycle(lambda: _omega_volley_per_call(boss, px, py)), cycles)),
+            ('compiled tables + bulk volley',
+             _timeit(lambda: cycle(lambda: boss.shoot(px, py)), cycles))]
+    _report(f'OMEGA PRIME cycle, {volleys} volleys / {bullets} bullets (parity ok, max err {err:.1e})', rows)
+
+
+class _ObjParticle:
+    """The shooter's per-object particle before Utils.particles, for comparison."""
+    __slots__ = ('x', 'y', 'vx', 'vy', 'life', 'max_life', 'color', 'size')
+
+    def __init__(self, x, y, vx, vy, color, size, life):
+        self.x, self.y, self.vx, self.vy = x, y, vx, vy
+        self.color, self.size, self.life, self.max_life = color, size, life, life
+
+    def update(self):
+        self.x += self.vx
+        self.y += self.vy
+        self.vx *= 0.88
+        self.vy *= 0.88
+        self.life -= 1
+
+    def draw(self, screen, cam_x, cam_y):
+        frac = self.life / self.max_life
+        bright = frac ** 0.45
+        c = self.color
+        pygame.draw.circle(screen, (int(c[0]*bright), int(c[1]*bright), int(c[2]*bright)),
+                           (int(self.x - cam_x), int(self.y - cam_y)), max(1, int(self.size * frac)))
+
+
+def bench_particles(frames: int = 20) -> None:
+    """Particles: per-object update + draw.circle vs the shared array engine + one blits()."""
+    target = pygame.Surface(pygame.display.get_surface().get_size()).convert()
+    w, h = target.get_size()
+    colors = [(255, 80, 40), (120, 200, 255), (255, 255, 100), (180, 60, 255)]
+    for n in (120, 1000, 4000):
+        rng = random.Random(7)
+        objs = []
+        for _ in range(n):
+            a, sp = rng.uniform(0, math.tau), rng.uniform(1.0, 6.0)
+            objs.append(_ObjParticle(rng.uniform(0, w), rng.uniform(0, h), math.cos(a)*sp,
+                                     math.sin(a)*sp, rng.choice(colors), rng.randint(3, 7), 10_000))
+        parts = sg.ParticleSystem(n, drag=sg.PARTICLE_DRAG, fade=sg.PARTICLE_FADE, seed=7)
+        parts.burst(np.array([q.x for q in objs]), np.array([q.y for q in objs]), n,
+                    speed=(1.0, 6.0), color=colors, size=(3, 7), life=10_000)
+
+        def per_object():
+            for _ in range(frames):
+                for q in objs:
+                    q.update()
+                for q in objs:
+                    q.draw(target, 0, 0)
+
+        def engine():
+            for _ in range(frames):
+                parts.update()
+                parts.draw(target)
+
+        _report(f'particles, {n} live', [
+            ('Particle objects + draw.circle', _timeit(per_object, 3) / frames),
+            ('ParticleSystem + one blits()',   _timeit(engine, 3) / frames),
+        ])
+
+    # Drawn a whole tick back (t=-1), the engine lands on the previous tick's positions
+    class _Spy:
+        def __init__(self):
+            self.dest = []
+
+        def get_size(self):
+            return 10**6, 10**6
+
+        def blits(self, seq, doreturn=True):
+            self.dest = sorted(pos for _, pos in seq)
+
+    parts = sg.ParticleSystem(500, gravity=0.3, drag=(0.9, 0.8), seed=7)
+    parts.burst(5000.0, 5000.0, 500, speed=(1.0, 6.0), color=(255, 80, 40), size=4, life=10_000)
+    parts.update()
+    before, after = _Spy(), _Spy()
+    parts.draw(before)
+    parts.update()
+    parts.draw(after, t=-1.0)
+    moved = sum(abs(a[0] - b[0]) + abs(a[1] - b[1]) for a, b in zip(before.dest, after.dest))
+    assert moved <= len(before.dest), f'particles drawn a tick back are off by {moved} px in total'
+
+
+def bench_text(popups: int = 40, frames: int = 60) -> None:
+    """Text: popups and HUD strings rendered every frame vs the shared text cache."""
+    target = pygame.Surface(pygame.display.get_surface().get_size()).convert()
+    cache  = sg.TEXT_CACHE
+    font   = sg.Popup.get_font()
+    hud    = sg._get_font(14)
+    rng    = random.Random(8)
+    pops = [sg.Popup(f'+{rng.randint(1, 40)}', rng.uniform(0, 1200), rng.uniform(0, 700),
+                     rng.choice([(255, 230, 80), (100, 255, 120), (255, 120, 80)]))
+            for _ in range(popups)]
+    labels = [(f'Label {i}', f'{i * 7}%') for i in range(20)]
+
+    def per_frame():
+        for _ in range(frames):
+            for p in pops:
+                s = font.render(p.text, True, p.color)
+                s.set_alpha(p.alpha)
+                sh = font.render(p.text, True, (0, 0, 0))
+                sh.set_alpha(p.alpha // 2)
+                target.blit(sh, (int(p.x) + 2, int(p.y) + 2))
+                target.blit(s, (int(p.x), int(p.y)))
+            for y, (a, b) in enumerate(labels):
+                for text in (a, b):
+                    target.blit(hud.render(text, True, (0, 0, 0)), (11, y * 20 + 1))
+                    target.blit(hud.render(text, True, (200, 195, 185)), (10, y * 20))
+
+    def cached():
+        for _ in range(frames):
+            for p in pops:
+                p.draw(target, 0, 0)
+            for y, (a, b) in enumerate(labels):
+                for text in (a, b):
+                    target.blit(cache.render(hud, text, (200, 195, 185), shadow=(0, 0, 0), offset=1),
+                                (10, y * 20))
+
+    hits, misses, _ = cache.stats()
+    rows = [('font.render every frame', _timeit(per_frame, 3) / frames),
+            ('TEXT_CACHE, alpha cached per step', _timeit(cached, 3) / frames)]
+    h2, m2, held = cache.stats()
+    _report(f'text, {popups} popups + {2 * len(labels)} HUD strings '
+            f'({h2 - hits} hits, {m2 - misses} misses, {held} held)', rows)
+
+
+def bench_hud(frames: int = 60) -> None:
+    """HUD: every widget repainted each frame vs the retained layer's cached widgets."""
+    screen = pygame.display.get_surface()
+    game   = sg.ShooterGame(screen, seed='BENCH1', sim_process=False)
+    target = game.screen
+    boss   = sg.Enemy(game.player.x + 200, game.player.y, 5000, is_boss=True, boss_id=3)
+    game.current_boss, game.boss_active = boss, True
+    hud    = game._hud
+
+    def repaint_all():
+        for _ in range(frames):
+            hud.invalidate()
+            hud.draw(target)
+
+    def retained():
+        for _ in range(frames):
+            hud.draw(target)
+
+    def kill_each_frame():
+        for _ in range(frames):
+            game.kills += 1
+            boss.health -= 7
+            hud.draw(target)
+
+    before = hud.renders
+    rows = [('repaint every widget', _timeit(repaint_all, 3) / frames),
+            ('retained, nothing changed', _timeit(retained, 3) / frames)]
+    mark = hud.renders
+    rows.append(('retained, kill + boss hit', _timeit(kill_each_frame, 3) / frames))
+    _report(f'hud, {len(hud.names())} widgets, boss bar up '
+            f'({(hud.renders - mark) / (3 * frames):.1f} re-rendered per frame on hits, '
+            f'{hud.renders - before} paints total)', rows)
+
+
+def _item_layers_per_call(surf, item, cam_x: float, cam_y: float, layers: dict) -> None:
+    """The old Item.draw: glow, body, border, two lines, icon and label per item,
+    from per-type cached layers (the best case of per-instance surfaces)."""
+    glow, border, icon, lbl, lbg = layers[item.type]
+    item.bob += 0.04
+    s, c = item.size, item.color
+    sx = int(item.x - cam_x)
+    sy = int(item.y - cam_y + math.sin(item.bob) * 4)
+    surf.blit(glow, (sx - s - 12, sy - s - 12))
+    pygame.draw.rect(surf, (20, 22, 38), (sx - s, sy - s, s*2, s*2), border_radius=7)
+    surf.blit(border, (sx - s - 2, sy - s - 2))
+    pygame.draw.line(surf, c, (sx-s+4, sy-s+2), (sx+s-4, sy-s+2), 1)
+    pygame.draw.line(surf, c, (sx-s+2, sy-s+4), (sx-s+2, sy+s-4), 1)
+    surf.blit(icon, (sx - s, sy - s))
+    surf.blit(lbg, (sx - lbg.get_width()//2, sy + s + 4))
+    surf.blit(lbl, (sx - lbl.get_width()//2, sy + s + 5))
+
+
+def bench_items(frames: int = 30) -> None:
+    """Items: crates drawn layer by layer vs baked atlas sprites in one blits()."""
+    target = pygame.Surface(pygame.display.get_surface().get_size()).convert()
+    atlas  = sg.ITEM_ATLAS
+    atlas.bake()
+    layers = {}
+    for kind, cfg in sg.ITEM_CONFIG.items():
+        s, c = sg.Item.CRATE_SIZE, cfg['color']
+        glow = pygame.Surface((s*2 + 24, s*2 + 24), pygame.SRCALPHA)
+        pygame.draw.rect(glow, (*c, 28), (2, 2, s*2 + 20, s*2 + 20), border_radius=8)
+        border = pygame.Surface((s*2 + 4, s*2 + 4), pygame.SRCALPHA)
+        pygame.draw.rect(border, (*c, 200), border.get_rect(), 2, border_radius=8)
+        icon = pygame.Surface((s*2, s*2), pygame.SRCALPHA)
+        sg._ICON_DRAW[kind](icon, s, s, c, int(s*0.6))
+        lbl = sg.TEXT_CACHE.render(sg._label_font(), cfg['name'], c)
+        lbg = pygame.Surface((lbl.get_width() + 6, lbl.get_height() + 2), pygame.SRCALPHA)
+        pygame.draw.rect(lbg, (0, 0, 0, 160), lbg.get_rect(), border_radius=3)
+        layers[kind] = glow, border, icon, lbl, lbg
+    rng = random.Random(9)
+    for n in (50, 200, 800):
+        items = [sg.Item(rng.uniform(0, sg.VIEWPORT_W), rng.uniform(0, sg.VIEWPORT_H),
+                         rng.choice(sg._ITEM_TYPES)) for _ in range(n)]
+
+        def layered():
+            for _ in range(frames):
+                for it in items:
+                    _item_layers_per_call(target, it, 0, 0, layers)
+
+        def batched():
+            for _ in range(frames):
+                seq = []
+                for it in items:
+                    atlas.add(it, 0, 0, seq)
+                target.blits(seq, doreturn=False)
+
+        _report(f'items, {n} crates with glow and labels',
+                [('layer by layer', _timeit(layered, 3) / frames),
+                 ('atlas + blits()', _timeit(batched, 3) / frames)])
+
+
+def bench_crates(ticks: int = 60) -> None:
+    """Items: per-crate magnet, pickup and cull loops vs one CrateStore pass."""
+    crates = sg._crates_mod
+    rng = random.Random(10)
+    pull_range, pull_speed = 700.0, 4.5
+    reach = sg.Item.CRATE_SIZE + sg.Player.SIZE + 8
+    vw, vh = sg.VIEWPORT_W, sg.VIEWPORT_H
+    for n in (100, 500, 2000):
+        spots = [(rng.uniform(-3000, 3000), rng.uniform(-3000, 3000), rng.choice(sg._ITEM_TYPES))
+                 for _ in range(n)]
+
+        def per_item():
+            items = [sg.Item(x, y, t) for x, y, t in spots]
+            for _ in range(ticks):
+                for it in items:    # Player.update_magnet
+                    dx, dy = it.x, it.y
+                    d = math.sqrt(dx*dx + dy*dy)
+                    if 0 < d < pull_range:
+                        it.x -= dx / d * pull_speed
+                        it.y -= dy / d * pull_speed
+                items = [it for it in items    # _pickup_items
+                         if it.x*it.x + it.y*it.y >= reach*reach]
+                [it for it in items if -60 < it.x + vw/2 < vw + 60 and -60 < it.y + vh/2 < vh + 60]
+
+        def store():
+            st = crates.CrateStore(sg._ITEM_TYPES, cap=10**6)
+            for x, y, t in spots:
+                st.add(x, y, t)
+            for _ in range(ticks):
+                st.step(0.0, 0.0, pull_range, pull_speed, reach)
+                st.visible(-vw/2, -vh/2, vw, vh, 60)
+
+        _report(f'crates, {n} on the floor (magnet on)',
+                [('per-crate loops', _timeit(per_item, 3) / ticks),
+                 ('CrateStore.step + visible', _timeit(store, 3) / ticks)])
+
+    st = crates.CrateStore(sg._ITEM_TYPES, cap=256)
+    for x, y, t in ((rng.uniform(-5000, 5000), rng.uniform(-5000, 5000), rng.choice(sg._ITEM_TYPES))
+                    for _ in range(5000)):
+        st.add(x, y, t)
+    print(f'  5000 drops, cap 256: {len(st)} crates left, {st.merged} merged into stacks')
+
+    # Crates near the player never merge; split mode keeps the nearest when they overflow its block
+    st = crates.CrateStore(sg._ITEM_TYPES, cap=256)
+    for _ in range(900):
+        st.add(rng.uniform(-800, 800), rng.uniform(-800, 800), rng.choice(sg._ITEM_TYPES))
+    sim  = sg._sim_module()
+    rows = sim.block_caps(0, st.cap)[1]
+    snap = st.snapshot(rows)
+    d    = np.hypot(st.col('x'), st.col('y'))
+    assert len(st) > rows and len(snap) == rows
+    assert np.hypot(snap[:, 1], snap[:, 2]).max() <= np.sort(d)[rows - 1], 'split snapshot dropped near crates'
+    print(f'  900 drops near the player, cap 256: {len(st)} crates, the nearest {rows} published in split mode')
+
+
+def bench_ship(frames: int = 200) -> None:
+    """Render: player ship, 4 saws and magnet painted per frame vs atlas frames."""
+    target = pygame.Surface(pygame.display.get_surface().get_size()).convert()
+    ships  = sg._ship_mod
+    atlas  = sg.SHIP_ATLAS
+    body, rim = sg.C_ORBITAL, sg.C_ORBITAL_RIM
+    cx, cy = sg.VIEWPORT_W // 2, sg.VIEWPORT_H // 2
+
+    def painted():
+        for f in range(frames):
+            a = f * 0.05
+            ships._paint_exhaust(target, cx, math.cos(a), math.sin(a), f * 0.576)
+            ships._paint_body(target, cx, math.cos(a), math.sin(a), False, 2)
+            ships._paint_tip(target, cx, f % ships.TIP_LEVELS)
+            for i in range(4):
+                ships._paint_saw(target, cx + 55 * i, 10, f * 0.18 + i, body, rim)
+            ships._paint_magnet(target, cx, a)
+
+    def cached():
+        for f in range(frames):
+            a = f * 0.05
+            seq = []
+            atlas.add_ship(cx, cy, a, f * 0.18, False, 2, seq)
+            for i in range(4):
+                atlas.add_saw(cx + 55 * i, cy, 10, f * 0.18 + i, seq)
+            atlas.add_magnet(cx, cy, a, seq)
+            target.blits(seq, doreturn=False)
+
+    cached()    # build the frames first
+    _report(f'ship, dual guns + 4 saws + magnet ({atlas.frames_built} frames cached)',
+            [('painted every frame', _timeit(painted, 3) / frames),
+             ('ShipAtlas + blits()', _timeit(cached, 3) / frames)])
+
+
+def bench_present(frames: int = 30) -> None:
+    """Present: 1600x900 viewport to 1080p / 1440p displays, old copies vs Presenter modes."""
+    display_mod = _load_mod('Utils.display', 'Utils/display.py')
+    vw, vh = sg.VIEWPORT_W, sg.VIEWPORT_H
+    for dw, dh in ((1920, 1080), (2560, 1440)):
+        disp = pygame.display.set_mode((dw, dh))
+        view = pygame.Surface((vw, vh)).convert()
+        view.fill((40, 60, 80))
+        scale = min(dw / vw, dh / vh)
+        sw, sh = int(vw * scale), int(vh * scale)
+        ox, oy = (dw - sw) // 2, (dh - sh) // 2
+        pre = pygame.Surface((sw, sh)).convert()
+
+        def fresh():
+            for _ in range(frames):
+                disp.fill((0, 0, 0))
+                disp.blit(pygame.transform.scale(view, (sw, sh)), (ox, oy))
+
+        def prealloc():
+            for _ in range(frames):
+                pygame.transform.scale(view, (sw, sh), pre)
+                disp.fill((0, 0, 0))
+                disp.blit(pre, (ox, oy))
+
+        rows = [('fresh scale + fill + blit', _timeit(fresh, 3) / frames),
+                ('preallocated + fill + blit', _timeit(prealloc, 3) / frames)]
+        for mode in display_mod.MODES:
+            pres = display_mod.Presenter(disp, (vw, vh), mode=mode)
+            label = f'Presenter {mode} (x{pres.scale:g})'
+            if pres.mode != mode:
+                label = f'Presenter {mode} (no renderer: {pres.mode})'
+            rows.append((label, _timeit(lambda: [pres.present(view, flip=False)
+                                                for _ in range(frames)], 3) / frames))
+            pres.close()
+        _report(f'present, {vw}x{vh} -> {dw}x{dh}', rows)
+    pygame.display.set_mode((1280, 720))
+
+
+def bench_vignette(frames: int = 30) -> None:
+    """Render: vignette strategies, alone and with the present at 1080p / 1440p."""
+    display_mod = _load_mod('Utils.display', 'Utils/display.py')
+    vig_mod = sg._vignette_mod
+    vw, vh = sg.VIEWPORT_W, sg.VIEWPORT_H
+    ts = 96
+    for dw, dh in ((1920, 1080), (2560, 1440)):
+        disp = pygame.display.set_mode((dw, dh))
+        view = pygame.Surface((vw, vh)).convert()
+        view.fill((60, 54, 48))
+        floor = pygame.Surface((vw + 2 * ts, vh + 2 * ts)).convert()
+        vig  = vig_mod.Vignette(vw, vh)
+        pres = display_mod.Presenter(disp, (vw, vh), mode='fit')
+
+        def run(mode, present):
+            def frame():
+                for _ in range(frames):
+                    if mode is not None:
+                        vig.draw(view, mode)
+                    if present:
+                        pres.present(view, flip=False)
+            return _timeit(frame, 3) / frames
+
+        def bake():
+            for _ in range(frames):
+                vig.bake_into(floor, vw // 2 + ts // 2, vh // 2 + ts // 2)
+
+        rows = [('none, present only', run(None, True))]
+        for mode in ('alpha', 'strips', 'mult'):
+            rows.append((f'{mode}, vignette only', run(mode, False)))
+            rows.append((f'{mode} + present', run(mode, True)))
+        rows.append(('floor, per floor repaint', _timeit(bake, 3) / frames))
+        _report(f'vignette, {vw}x{vh} viewport -> {dw}x{dh} (fit x{pres.scale:g})', rows)
+    pygame.display.set_mode((1280, 720))
+
+
+def bench_backend(frames: int = 30) -> None:
+    """Render: full frames on the software-blit path vs the SDL2 texture canvas."""
+    canvas_mod = _load_mod('Utils.texture_canvas', 'Utils/texture_canvas.py')
+    if not canvas_mod.available():
+        print('\n== backend: pygame._sdl2.video not available, skipped')
+        return
+    keys = sg._sim_module().InputKeys()
+    for dw, dh in ((1920, 1080), (2560, 1440)):
+        disp = pygame.display.set_mode((dw, dh))
+        rows, notes = [], []
+        for backend in ('surface', 'sdl2'):
+            game = sg.ShooterGame(disp, seed='BENCH1', sim_process=False, backend=backend)
+            p = game.player
+            while len(game.enemies) < 40 and game.frame < 900:
+                game.frame += 1
+                game._update(keys)
+                p.health = p.MAX_HEALTH
+
+            def frame():
+                for _ in range(frames):
+                    game._draw()            # ends with the present
+
+            ms = _timeit(frame, 3) / frames
+            canvas = game._canvas
+            if canvas is None:
+                rows.append((f'surface: blits + present (x{game.presenter.scale:g})', ms))
+            else:
+                rows.append((f'sdl2 canvas: {canvas.copies} copies/frame', ms))
+                notes.append(f'{canvas.uploads} texture uploads')
+            game.presenter.close()
+            game._frame_jobs.shutdown()
+        _report(f'backend, {len(game.enemies)} enemies, viewport -> {dw}x{dh} '
+                f'({", ".join(notes)})', rows)
+    pygame.display.set_mode((1280, 720))
+
+
+def bench_drawbuffer(frames: int = 20) -> None:
+    """Render: a horde frame's sprites blitted one by one vs flushed from the draw buffer."""
+    buf_mod = sg._drawbuf_mod
+    canvas_mod = _load_mod('Utils.texture_canvas', 'Utils/texture_canvas.py')
+    screen  = pygame.display.get_surface()
+    target  = pygame.Surface((sg.VIEWPORT_W, sg.VIEWPORT_H)).convert()
+    keys    = sg._sim_module().InputKeys()
+    for n in (300, 1500):
+        game = sg.ShooterGame(screen, seed='BENCH1', sim_process=False, horde=n)
+        p = game.player
+        while game.frame < 500:             # long enough for the crowd to close in
+            game.frame += 1
+            game._update(keys)
+            p.health = p.MAX_HEALTH
+
+        # One real frame's commands, captured at the flush
+        buf, captured = game._draw_buffer, []
+        flush = buf.flush
+        buf.flush = lambda t: (captured.append([list(items) for items in buf._layers]), flush(t))
+        game._draw()
+        buf.flush = flush
+        layers = captured[0]
+        before = buf.submitted
+
+        def one_by_one(dest=target):
+            def run():
+                for _ in range(frames):
+                    for items in layers:
+                        for item in items:
+                            dest.blit(*item)
+                    if dest is not target:
+                        dest.present()
+            return run
+
+        def replay(dest=target):
+            out = buf_mod.DrawBuffer(target.get_size())
+
+            def run():
+                for _ in range(frames):
+                    for layer, items in enumerate(layers):
+                        out.extend(layer, items)
+                    out.flush(dest)
+                    if dest is not target:
+                        dest.present()
+            return run
+
+        rows = [('one blit() per command',                _timeit(one_by_one(), 3) / frames),
+                ('buffer flush',                          _timeit(replay(), 3) / frames)]
+        if canvas_mod.available():
+            canvas = canvas_mod.TextureCanvas(screen, target.get_size())
+            replay(canvas)()                # upload every texture before timing
+            rows += [('sdl2 canvas, one blit() per command', _timeit(one_by_one(canvas), 3) / frames),
+                     ('sdl2 canvas, buffer flush',           _timeit(replay(canvas), 3) / frames)]
+            canvas.close()
+        cmds = sum(map(len, layers))
+        _report(f'draw buffer, {len(game.enemies)} enemies ({cmds} commands, draw calls '
+                f'{before} -> {buf.emitted})', rows)
+        game._frame_jobs.shutdown()
+
+
+CASES = {
+    'homing':     bench_homing,
+    'broadphase': bench_broadphase,
+    'hits':       bench_hits,
+    'bulletdraw': bench_bulletdraw,
+    'jobs':       bench_jobs,
+    'simproc':    bench_simproc,
+    'fixedstep':  bench_fixedstep,
+    'horde':      bench_horde,
+    'separation': bench_separation,
+    'enemyindex': bench_enemyindex,
+    'enemydraw':  bench_enemydraw,
+    'enemycull':  bench_enemycull,
+    'patterns':   bench_patterns,
+    'particles':  bench_particles,
+    'text':       bench_text,
+    'hud':        bench_hud,
+    'items':      bench_items,
+    'crates':     bench_crates,
+    'ship':       bench_ship,
+    'present':    bench_present,
+    'vignette':   bench_vignette,
+    'backend':    bench_backend,
+    'drawbuffer': bench_drawbuffer,
+}
+
+
+def main(argv: list[str]) -> int:
+    if '--list' in argv:
+        for name, fn in CASES.items():
+            print(f'{name:<12} {fn.__doc__}')
+        return 0
+    names = argv or list(CASES)
+    for name in names:
+        if name not in CASES:
+            print(f'unknown case: {name}')
+            return 2
+        CASES[name]()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -474,6 +474,8 @@ def run(screen: pygame.Surface) -> str:
 # Entry point
 # ---------------------------------------------------------------------------
 if __name__ == '__main__':
+    import multiprocessing
+    multiprocessing.freeze_support()   # frozen builds: lets the shooter spawn its sim process
     pygame.init()
     screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN | pygame.HWSURFACE | pygame.DOUBLEBUF)
     pygame.display.set_caption('The Power of 50')
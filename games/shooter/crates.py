@@ -0,0 +1,291 @@
+"""
+Shooter Game - Crate Store (structure of arrays)
+
+Responsibilities
+----------------
+* Hold every power-up crate lying on the floor as one row of parallel arrays:
+  position, type id, bob phase, age, stack count and a uid for split mode.
+* Step all crates at once: magnet pull toward the player, the angle to the
+  nearest pulled crate and pickup detection, all from one distance pass.
+* Cull the crates to the viewport for drawing.
+* Stay under a cap on long runs: once over it, stale crates far from the
+  player fold into one crate per type, whose *stack* counts the drops it
+  stands for.  Picking it up applies the item once per drop.  Crates near
+  the player are never merged, so they alone can hold the store over the
+  cap.
+
+Without NumPy the same API runs on plain lists, one crate at a time.
+
+Usage::
+
+    crates = CrateStore(ITEM_TYPES, cap=256)
+    crates.add(x, y, 'speed')
+    angle, picked = crates.step(px, py, pull_range, pull_speed, reach)
+    for kind, x, y, stack in picked:
+        ...
+"""
+from __future__ import annotations
+
+import math
+import random
+
+try:
+    import numpy as _np
+    _NUMPY = True
+except ImportError:
+    _NUMPY = False
+
+
+STALE_TICKS = 30 * 60       # a crate left this long may be merged ...
+MERGE_RANGE = 900.0         # ... once it is this far from the player
+
+_FLOAT_COLS = ('x', 'y', 'bob')
+_INT_COLS   = ('kind', 'age', 'stack', 'uid')
+COLUMNS     = _FLOAT_COLS + _INT_COLS
+
+
+class CrateStore:
+    """Dense per-column storage for the crates on the floor.
+
+    types   — item type names; a crate's ``kind`` is an index into it
+    cap     — crate count above which distant stale crates are merged
+
+    Columns are attributes holding arrays of length ``capacity``; only the
+    first ``n`` rows are live, so slice with ``[:store.n]`` (or use ``col()``).
+    """
+
+    def __init__(self, types: tuple, cap: int = 256, capacity: int = 64) -> None:
+        self.types    = tuple(types)
+        self.cap      = cap
+        self.n        = 0
+        self.capacity = 0
+        self.merged   = 0           # drops folded into another crate so far
+        self._ids     = {t: i for i, t in enumerate(self.types)}
+        self._uid     = 0
+        self._px = self._py = 0.0   # player position at the last step
+        self._alloc(max(1, capacity))
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _alloc(self, capacity: int) -> None:
+        n = self.n
+        for name in COLUMNS:
+            if _NUMPY:
+                arr = _np.zeros(capacity, dtype=_np.float64 if name in _FLOAT_COLS else _np.int64)
+                if n:
+                    arr[:n] = getattr(self, name)[:n]
+            else:
+                arr = getattr(self, name)[:n] if n else []
+                arr += [0] * (capacity - n)
+            setattr(self, name, arr)
+        self.capacity = capacity
+
+    def col(self, name: str):
+        """Live view of one column."""
+        return getattr(self, name)[:self.n]
+
+    # ------------------------------------------------------------------
+    # Rows
+    # ------------------------------------------------------------------
+
+    def add(self, x: float, y: float, kind: str, stack: int = 1) -> int:
+        """Drop a crate of item type *kind*; returns its uid."""
+        if self.n == self.capacity:
+            self._alloc(self.capacity * 2)
+        row = self.n
+        self._uid += 1
+        self.x[row], self.y[row] = float(x), float(y)
+        self.bob[row]   = random.uniform(0, math.pi*2)
+        self.kind[row]  = self._ids[kind]
+        self.age[row]   = 0
+        self.stack[row] = stack
+        self.uid[row]   = self._uid
+        self.n += 1
+        if self.n > self.cap:
+            self.merge()
+        return self._uid
+
+    def remove(self, dead) -> None:
+        """Drop the rows where *dead* is true, keeping the survivors' order."""
+        n = self.n
+        if _NUMPY:
+            keep = _np.flatnonzero(~_np.asarray(dead, dtype=bool)[:n])
+            k = len(keep)
+            if k == n:
+                return
+            for name in COLUMNS:
+                arr = getattr(self, name)
+                arr[:k] = arr[keep]
+        else:
+            keep = [i for i in range(n) if not dead[i]]
+            k = len(keep)
+            for name in COLUMNS:
+                arr = getattr(self, name)
+                arr[:k] = [arr[i] for i in keep]
+        self.n = k
+
+    def clear(self) -> None:
+        self.n = 0
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+
+    def step(self, px: float, py: float, pull_range: float, pull_speed: float,
+             reach: float) -> tuple:
+        """Advance every crate one tick against a player at (px, py).
+
+        Crates within *pull_range* (0 for no magnet) move *pull_speed* toward
+        the player; crates then within *reach* are picked up and removed.
+        Returns (angle from the player to the nearest pulled crate, or None;
+        [(type name, x, y, stack), ...] for the crates picked up).
+        """
+        self._px, self._py = px, py
+        n = self.n
+        if not n:
+            return None, []
+        if not _NUMPY:
+            return self._step_list(px, py, pull_range, pull_speed, reach)
+        x, y = self.x[:n], self.y[:n]
+        dx, dy = x - px, y - py
+        d = _np.hypot(dx, dy)
+        self.age[:n] += 1
+        angle = None
+        pulled = (d < pull_range) & (d > 0)
+        if pulled.any():
+            near = int(_np.argmin(_np.where(pulled, d, _np.inf)))
+            angle = math.atan2(dy[near], dx[near])
+            k = pull_speed / d[pulled]
+            x[pulled] -= dx[pulled] * k
+            y[pulled] -= dy[pulled] * k
+            d[pulled] = _np.abs(d[pulled] - pull_speed)   # moved straight at the player
+        hit = d < reach
+        if not hit.any():
+            return angle, []
+        rows = _np.flatnonzero(hit)
+        types = self.types
+        picked = [(types[k], cx, cy, s) for k, cx, cy, s in
+                  zip(self.kind[rows].tolist(), x[rows].tolist(), y[rows].tolist(),
+                      self.stack[rows].tolist())]
+        self.remove(hit)
+        return angle, picked
+
+    def _step_list(self, px, py, pull_range, pull_speed, reach) -> tuple:
+        angle, nearest = None, pull_range
+        hit = [False] * self.n
+        picked = []
+        for i in range(self.n):
+            self.age[i] += 1
+            dx, dy = self.x[i] - px, self.y[i] - py
+            d = math.sqrt(dx*dx + dy*dy)
+            if 0 < d < pull_range:
+                if d < nearest:
+                    nearest, angle = d, math.atan2(dy, dx)
+                self.x[i] -= dx / d * pull_speed
+                self.y[i] -= dy / d * pull_speed
+                d = abs(d - pull_speed)
+            if d < reach:
+                hit[i] = True
+                picked.append((self.types[self.kind[i]], self.x[i], self.y[i], self.stack[i]))
+        if picked:
+            self.remove(hit)
+        return angle, picked
+
+    def merge(self) -> None:
+        """Fold crates far from the player into one per type until under the cap.
+
+        Stale crates go first; if that is not enough, any crate beyond
+        MERGE_RANGE.  Each type keeps its newest crate, which takes over the
+        stacks of the rest.  Crates near the player are never touched, so the
+        cap can be exceeded while they alone are over it.
+        """
+        n = self.n
+        if n <= self.cap:
+            return
+        if _NUMPY:
+            for stale_only in (True, False):
+                n = self.n
+                kind, age = self.kind[:n], self.age[:n]
+                pick = _np.hypot(self.x[:n] - self._px, self.y[:n] - self._py) > MERGE_RANGE
+                if stale_only:
+                    pick &= age >= STALE_TICKS
+                dead = _np.zeros(n, dtype=bool)
+                for k in _np.unique(kind[pick]).tolist():
+                    rows = _np.flatnonzero(pick & (kind == k))
+                    if len(rows) < 2:
+                        continue
+                    keep = rows[int(_np.argmin(age[rows]))]
+                    self.stack[keep] = int(self.stack[rows].sum())
+                    dead[rows] = True
+                    dead[keep] = False
+                    self.merged += len(rows) - 1
+                self.remove(dead)
+                if self.n <= self.cap:
+                    return
+            return
+        for stale_only in (True, False):
+            keeper: dict = {}
+            dead = [False] * self.n
+            for i in range(self.n):
+                dx, dy = self.x[i] - self._px, self.y[i] - self._py
+                if dx*dx + dy*dy <= MERGE_RANGE ** 2 or (stale_only and self.age[i] < STALE_TICKS):
+                    continue
+                k = keeper.get(self.kind[i])
+                if k is None:
+                    keeper[self.kind[i]] = i
+                    continue
+                young, old = (i, k) if self.age[i] < self.age[k] else (k, i)
+                self.stack[young] += self.stack[old]
+                dead[old] = True
+                keeper[self.kind[i]] = young
+                self.merged += 1
+            self.remove(dead)
+            if self.n <= self.cap:
+                return
+
+    # ------------------------------------------------------------------
+    # Drawing and split mode
+    # ------------------------------------------------------------------
+
+    def visible(self, cam_x: float, cam_y: float, w: float, h: float, margin: float):
+        """Rows whose centre lies within *margin* of the w × h view at (cam_x, cam_y)."""
+        n = self.n
+        if _NUMPY:
+            sx = self.x[:n] - cam_x
+            sy = self.y[:n] - cam_y
+            return _np.flatnonzero((sx > -margin) & (sx < w + margin) &
+                                   (sy > -margin) & (sy < h + margin))
+        return [i for i in range(n)
+                if -margin < self.x[i] - cam_x < w + margin
+                and -margin < self.y[i] - cam_y < h + margin]
+
+    def snapshot(self, limit: int):
+        """(uid, x, y, kind, stack) rows of at most *limit* crates (NumPy only).
+
+        Over the limit, the crates nearest the player at the last step are the
+        ones kept, in store order.
+        """
+        n = self.n
+        rows = slice(0, n)
+        if n > limit:
+            d = _np.hypot(self.x[:n] - self._px, self.y[:n] - self._py)
+            rows = _np.sort(_np.argpartition(d, limit - 1)[:limit]) if limit > 0 else slice(0, 0)
+        return _np.stack([self.uid[rows], self.x[rows], self.y[rows],
+                          self.kind[rows], self.stack[rows]], axis=1)
+
+    def load(self, rows) -> None:
+        """Replace the contents with snapshot *rows*, keeping the bob phase of
+        crates whose uid was already here (NumPy only)."""
+        old = dict(zip(self.uid[:self.n].tolist(), self.bob[:self.n].tolist()))
+        n = len(rows)
+        if n > self.capacity:
+            self.n = 0
+            self._alloc(max(n, self.capacity * 2))
+        self.uid[:n]   = rows[:, 0]
+        self.x[:n]     = rows[:, 1]
+        self.y[:n]     = rows[:, 2]
+        self.kind[:n]  = rows[:, 3]
+        self.stack[:n] = rows[:, 4]
+        self.bob[:n]   = [old.get(u, random.uniform(0, math.pi*2)) for u in self.uid[:n].tolist()]
+        self.n = n
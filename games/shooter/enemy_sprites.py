@@ -0,0 +1,535 @@
+"""
+Shooter Game - Enemy Sprite Atlas
+
+Responsibilities
+----------------
+* Pre-render every look a regular enemy or mini-boss can take — rotation and
+  animation phase quantised to a fixed number of frames — the first time a
+  (kind, size) pair is drawn.
+* Turn an enemy (or a batch of EnemyStore rows) into (surface, position)
+  pairs, so the game draws the whole crowd with one ``Surface.blits`` call.
+* Bake the small health bar drawn over each regular enemy, one sprite per
+  (bar width, fill width), so the bars batch into a blits call as well.
+* Give the screen-space reach of an enemy's art, for viewport culling.
+
+Frames are colour-keyed surfaces (RLE accelerated), except the mini-boss
+glow layer, which keeps per-pixel alpha.  The painters below are the old
+per-frame ``Enemy._draw_*`` routines, run once per frame of the atlas with
+the quantised angle in place of the live one.
+
+The final boss is not in the atlas: its twelve spikes each pulse on their own
+phase, and there is only ever one of it on screen, so it still draws itself.
+"""
+from __future__ import annotations
+
+import math
+
+import pygame
+
+try:
+    import numpy as _np
+    _NUMPY = True
+except ImportError:
+    _NUMPY = False
+
+
+TAU = 2 * math.pi
+
+COLORKEY = (255, 0, 255)    # never used by an enemy palette
+
+# (period of the animation angle in radians, frames over that period)
+NORMAL_SPIN   = (4 * math.pi / 3, 64)   # hexagon (π/3) and counter-spin triangle (4π/9)
+SHOOTER_SPIN  = (2 * math.pi / 3, 32)   # three-fold ring and turrets
+FAST_TURN     = (TAU, 64)               # arrowhead heading
+TANK_BALL     = (math.pi / 3, 16)       # six-spiked flail ball
+BOSS_SPIN     = 24                      # per symmetry period, for both boss layers
+
+NORMAL_PULSES = (2, 3, 4, 5, 6)         # eye radius: 4 + int(2·sin(t·0.15))
+READY_LEVELS  = 4                       # fast telegraph ring brightness steps
+TANK_LINKS    = 5
+
+# Fast enemy variants: plain, telegraph ring at READY_LEVELS brightnesses, dashing
+FAST_PLAIN = 0
+FAST_DASH  = READY_LEVELS + 1
+
+# Health bar over a regular enemy: max(BAR_MIN_W, size*2 + 10) wide, BAR_H tall
+BAR_MIN_W   = 36
+BAR_H       = 8
+BAR_RAISE   = 14                        # gap from the body top to the bar top
+BAR_BACK    = (30, 30, 40)
+BAR_FRAME   = (150, 150, 180)
+
+# Reach of the art past the body, as size * REACH + REACH_PAD: the tank's flail
+# (chain 2.6·size, ball 0.85·size + 9) is the widest; it also covers the bar.
+REACH     = 3.5
+REACH_PAD = 12
+
+# Level of detail: with more than LOD_CROWD enemies on screen, regular enemies
+# up to LOD_SIZE (all but the tank) are drawn as their plain disc.
+LOD_CROWD = 200
+LOD_SIZE  = 16
+
+
+def reach(size):
+    """How far from its centre an enemy of *size* can paint (scalar or array)."""
+    return size * REACH + REACH_PAD
+
+
+def _frame(period: float, frames: int, angle: float) -> int:
+    return int(angle % period / period * frames) % frames
+
+
+def _frames(period: float, frames: int, angle):
+    return (_np.mod(angle, period) * (frames / period)).astype(_np.int64) % frames
+
+
+def _keyed(half: int) -> pygame.Surface:
+    surf = pygame.Surface((half * 2, half * 2))
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert()
+    surf.fill(COLORKEY)
+    return surf
+
+
+def _finish(surf: pygame.Surface) -> pygame.Surface:
+    surf.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return surf
+
+
+def _alpha(half: int) -> pygame.Surface:
+    surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    return surf.convert_alpha() if pygame.display.get_surface() is not None else surf
+
+
+# ---------------------------------------------------------------------------
+# Painters — one atlas frame each, centred on (c, c)
+# ---------------------------------------------------------------------------
+
+def _paint_normal(surf, c, s, style, angle, pulse):
+    pts = [(c + math.cos(angle + i*math.pi/3)*s,
+            c + math.sin(angle + i*math.pi/3)*s) for i in range(6)]
+    pygame.draw.polygon(surf, style['dark'], pts)
+    inner = [(c + math.cos(angle + i*math.pi/3)*(s-4),
+              c + math.sin(angle + i*math.pi/3)*(s-4)) for i in range(6)]
+    pygame.draw.polygon(surf, style['body'], inner)
+    pygame.draw.polygon(surf, style['rim'],  pts, 2)
+    for i in range(3):
+        a = -angle * 1.5 + i * 2*math.pi/3
+        pygame.draw.line(surf, style['dark'], (c, c),
+                         (int(c + math.cos(a)*(s-6)), int(c + math.sin(a)*(s-6))), 2)
+    pygame.draw.circle(surf, (255, 60, 60), (c, c), pulse)
+    pygame.draw.circle(surf, (255, 200, 200), (c, c), max(1, pulse-2))
+
+
+def _paint_fast(surf, c, s, style, a, variant):
+    pts_outer = [
+        (c + math.cos(a)*s*1.5,           c + math.sin(a)*s*1.5),
+        (c + math.cos(a+2.3)*s,            c + math.sin(a+2.3)*s),
+        (c + math.cos(a+math.pi)*s*0.45,   c + math.sin(a+math.pi)*s*0.45),
+        (c + math.cos(a-2.3)*s,            c + math.sin(a-2.3)*s),
+    ]
+    pts_inner = [
+        (c + math.cos(a)*s*0.9,            c + math.sin(a)*s*0.9),
+        (c + math.cos(a+2.3)*s*0.55,       c + math.sin(a+2.3)*s*0.55),
+        (c + math.cos(a+math.pi)*s*0.3,    c + math.sin(a+math.pi)*s*0.3),
+        (c + math.cos(a-2.3)*s*0.55,       c + math.sin(a-2.3)*s*0.55),
+    ]
+    pygame.draw.polygon(surf, style['dark'], pts_outer)
+    pygame.draw.polygon(surf, style['body'], pts_inner)
+    pygame.draw.polygon(surf, style['rim'],  pts_outer, 2)
+    if variant == FAST_DASH:
+        for i in range(4):
+            la = a + math.pi + (i - 1.5) * 0.22
+            pygame.draw.line(surf, style['rim'],
+                             (int(c + math.cos(la)*4),     int(c + math.sin(la)*4)),
+                             (int(c + math.cos(la)*s*1.4), int(c + math.sin(la)*s*1.4)), 1)
+    elif variant != FAST_PLAIN:
+        # Ring brightness 0.6 + 0.4·sin(t·0.3) spans [0.2, 1]; paint the step's midpoint
+        pulse = 0.2 + 0.8 * (variant - 0.5) / READY_LEVELS
+        rc = (int(255*pulse), int(240*pulse), int(80*pulse))
+        pygame.draw.circle(surf, rc, (c, c), s + 5, 2)
+
+
+def _paint_shooter(surf, c, s, style, angle):
+    for i in range(3):
+        a = angle + i * 2*math.pi/3
+        pygame.draw.circle(surf, style['body'], (int(c + math.cos(a)*s), int(c + math.sin(a)*s)), 5)
+    pygame.draw.circle(surf, style['dark'], (c, c), s, 2)
+    pygame.draw.circle(surf, style['body'], (c, c), s-4)
+    pygame.draw.circle(surf, style['rim'],  (c, c), s-4, 2)
+    for i in range(3):
+        a = angle + i * 2*math.pi/3
+        pygame.draw.line(surf, style['rim'],
+                         (int(c + math.cos(a)*(s-2)), int(c + math.sin(a)*(s-2))),
+                         (int(c + math.cos(a)*(s+8)), int(c + math.sin(a)*(s+8))), 3)
+
+
+def _paint_tank_body(surf, c, s, style):
+    r_outer = pygame.Rect(c-s, c-s, s*2, s*2)
+    pygame.draw.rect(surf, style['dark'], r_outer, border_radius=5)
+    pygame.draw.rect(surf, style['body'], r_outer.inflate(-5, -5), border_radius=4)
+    pygame.draw.line(surf, style['dark'], (c-s+5, c), (c+s-5, c), 2)
+    pygame.draw.line(surf, style['dark'], (c, c-s+5), (c, c+s-5), 2)
+    pygame.draw.rect(surf, style['rim'], r_outer, 2, border_radius=5)
+    for cx2, cy2 in [(-s+5, -s+5), (s-5, -s+5), (-s+5, s-5), (s-5, s-5)]:
+        pygame.draw.circle(surf, style['rim'],  (c+cx2, c+cy2), 4)
+        pygame.draw.circle(surf, style['dark'], (c+cx2, c+cy2), 2)
+
+
+def _paint_tank_ball(surf, c, ball_r, style, fa):
+    pygame.draw.circle(surf, style['dark'], (c, c), ball_r + 3)
+    pygame.draw.circle(surf, style['body'], (c, c), ball_r)
+    pygame.draw.circle(surf, style['rim'],  (c, c), ball_r, 2)
+    for si in range(6):
+        sa = fa + si * math.pi / 3
+        pygame.draw.line(surf, style['rim'],
+                         (int(c + math.cos(sa) * (ball_r - 2)), int(c + math.sin(sa) * (ball_r - 2))),
+                         (int(c + math.cos(sa) * (ball_r + 6)), int(c + math.sin(sa) * (ball_r + 6))), 2)
+
+
+def _paint_tank_link(surf, c, style):
+    pygame.draw.circle(surf, style['dark'], (c, c), 3)
+    pygame.draw.circle(surf, style['rim'],  (c, c), 3, 1)
+
+
+def _paint_simple(surf, c, s, style):
+    pygame.draw.circle(surf, style['body'], (c, c), s)
+    pygame.draw.circle(surf, style['rim'],  (c, c), s, 2)
+
+
+def _paint_boss_petals(surf, c, s, style, petal_n, angle):
+    # Two glow discs of alpha 28 each; where they overlap the screen saw both
+    pygame.draw.circle(surf, (*style['body'], 28), (c, c), s + 20)
+    pygame.draw.circle(surf, (*style['body'], 28 + 28 * (255 - 28) // 255), (c, c), s + 10)
+    for i in range(petal_n):
+        a = angle + i*2*math.pi/petal_n
+        pygame.draw.circle(surf, style['rim'], (int(c + math.cos(a)*s), int(c + math.sin(a)*s)), 6)
+
+
+def _paint_boss_core(surf, c, s, style, angle):
+    pts = [(c+math.cos(angle+i*math.pi/4)*s, c+math.sin(angle+i*math.pi/4)*s) for i in range(8)]
+    pygame.draw.polygon(surf, style['dark'], pts)
+    pygame.draw.polygon(surf, style['body'], [(c+math.cos(angle+i*math.pi/4)*(s-4),
+                                               c+math.sin(angle+i*math.pi/4)*(s-4)) for i in range(8)])
+    pygame.draw.polygon(surf, style['rim'], pts, 3)
+    pygame.draw.circle(surf, style['rim'], (c, c), s//3)
+    pygame.draw.circle(surf, style['body'], (c, c), s//4)
+
+
+def _paint_bar(surf, bw, hw, fill):
+    pygame.draw.rect(surf, BAR_BACK, (0, 0, bw, BAR_H), border_radius=3)
+    if hw > 0:
+        pygame.draw.rect(surf, fill, (0, 0, hw, BAR_H), border_radius=3)
+    pygame.draw.rect(surf, BAR_FRAME, (0, 0, bw, BAR_H), 1, border_radius=3)
+
+
+# ---------------------------------------------------------------------------
+# Atlas
+# ---------------------------------------------------------------------------
+
+class EnemyAtlas:
+    """Lazily built sprite frames for every regular enemy type and mini-boss.
+
+    styles       — ENEMY_STYLES (palette per enemy_type)
+    boss_styles  — BOSS_STYLES (palette per mini-boss id)
+    kinds        — EnemyStore type ids, in order (horde.KINDS)
+    bar_fills    — health bar fill colours: over half, over a quarter, the rest
+
+    Usage::
+
+        atlas = EnemyAtlas(ENEMY_STYLES, BOSS_STYLES, KINDS)
+        seq = []
+        for e in enemies:
+            atlas.add(e, e.x - cam_x, e.y - cam_y, seq)
+        screen.blits(seq, doreturn=False)
+    """
+
+    def __init__(self, styles: dict, boss_styles: dict, kinds: tuple = (),
+                 bar_fills: tuple = ((60, 240, 80), (255, 210, 50), (255, 60, 60))) -> None:
+        self.styles      = styles
+        self.boss_styles = boss_styles
+        self.kinds       = kinds
+        self.bar_fills   = bar_fills
+        self._sets: dict = {}
+        self._trail: dict = {}
+        self._bars: dict = {}
+        self.frames_built = 0
+
+    # ------------------------------------------------------------------
+    # Frame sets, built on first use
+    # ------------------------------------------------------------------
+
+    def _get(self, key: tuple):
+        frames = self._sets.get(key)
+        if frames is None:
+            frames = self._sets[key] = self._build(key)
+        return frames
+
+    def _build(self, key: tuple):
+        kind, s = key[0], int(key[1])
+        if kind == 'boss':
+            bid = key[2]
+            style = self.boss_styles.get(bid, self.boss_styles[1])
+            petal_n = 5 + bid
+            hp, hc = s + 21, s + 4
+            petals, cores = [], []
+            for f in range(BOSS_SPIN):
+                surf = _alpha(hp)
+                _paint_boss_petals(surf, hp, s, style, petal_n, f * TAU / petal_n / BOSS_SPIN)
+                petals.append((surf, hp))
+                surf = _keyed(hc)
+                _paint_boss_core(surf, hc, s, style, f * (math.pi / 4) / BOSS_SPIN)
+                cores.append((_finish(surf), hc))
+            self.frames_built += 2 * BOSS_SPIN
+            return petals, cores
+
+        style = self.styles.get(key[2] if kind == 'simple' else kind, self.styles['normal'])
+        if kind == 'simple':
+            half = s + 2
+            surf = _keyed(half)
+            _paint_simple(surf, half, s, style)
+            self.frames_built += 1
+            return _finish(surf), half
+        if kind == 'normal':
+            period, n = NORMAL_SPIN
+            half = s + 2
+            out = []
+            for f in range(n):
+                row = []
+                for pulse in NORMAL_PULSES:
+                    surf = _keyed(half)
+                    _paint_normal(surf, half, s, style, f * period / n, pulse)
+                    row.append(_finish(surf))
+                out.append(row)
+            self.frames_built += n * len(NORMAL_PULSES)
+            return out, half
+        if kind == 'fast':
+            period, n = FAST_TURN
+            half = int(s * 1.5) + 8
+            out = []
+            for f in range(n):
+                row = []
+                for variant in range(FAST_DASH + 1):
+                    surf = _keyed(half)
+                    _paint_fast(surf, half, s, style, f * period / n, variant)
+                    row.append(_finish(surf))
+                out.append(row)
+            self.frames_built += n * (FAST_DASH + 1)
+            return out, half
+        if kind == 'shooter':
+            period, n = SHOOTER_SPIN
+            half = s + 11
+            out = []
+            for f in range(n):
+                surf = _keyed(half)
+                _paint_shooter(surf, half, s, style, f * period / n)
+                out.append(_finish(surf))
+            self.frames_built += n
+            return out, half
+        if kind == 'tank':
+            period, n = TANK_BALL
+            ball_r = int(s * 0.85)
+            hb, bh = s + 2, ball_r + 9
+            body = _keyed(hb)
+            _paint_tank_body(body, hb, s, style)
+            balls = []
+            for f in range(n):
+                surf = _keyed(bh)
+                _paint_tank_ball(surf, bh, ball_r, style, f * period / n)
+                balls.append(_finish(surf))
+            link = _keyed(4)
+            _paint_tank_link(link, 4, style)
+            self.frames_built += n + 2
+            return (_finish(body), hb), (balls, bh), (_finish(link), 4), int(s * 2.6)
+        return None
+
+    def _trail_dot(self, size: float, i: int, n: int):
+        """Ghost circle i of an n-long dash trail (the fast type's palette)."""
+        key = (int(size), i, n)
+        dot = self._trail.get(key)
+        if dot is None:
+            frac = (i + 1) / n
+            c = self.styles['fast']['body']
+            r = max(1, int(size*frac + 1))
+            surf = _keyed(r + 1)
+            pygame.draw.circle(surf, (int(c[0]*frac*0.4), int(c[1]*frac*0.4), int(c[2]*frac*0.4)),
+                               (r + 1, r + 1), r)
+            dot = self._trail[key] = (_finish(surf), r + 1)
+        return dot
+
+    def _bar(self, key: tuple) -> pygame.Surface:
+        bw, hw, ci = key
+        surf = pygame.Surface((bw, BAR_H))
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        surf.fill(COLORKEY)
+        _paint_bar(surf, bw, hw, self.bar_fills[ci])
+        bar = self._bars[key] = _finish(surf)
+        return bar
+
+    # ------------------------------------------------------------------
+    # One enemy
+    # ------------------------------------------------------------------
+
+    def add(self, e, sx: float, sy: float, out: list, detail: bool = True,
+            cam_x: float = 0.0, cam_y: float = 0.0, lod_size: float = 0) -> bool:
+        """Append e's sprites at screen position (sx, sy) to *out*.
+
+        Returns False for enemies the atlas does not cover (the final boss),
+        which must draw themselves.  cam_x / cam_y place the fast type's
+        dash trail, which is kept in world coordinates.  Regular enemies no
+        bigger than *lod_size* get the plain disc, as with detail off.
+        """
+        sx, sy = int(sx), int(sy)
+        if e.is_boss:
+            if e.is_final:
+                return False
+            petals, cores = self._get(('boss', e.size, e.boss_id))
+            petal_n = 5 + e.boss_id
+            surf, h = petals[_frame(TAU / petal_n, BOSS_SPIN, e.anim_angle * 1.2)]
+            out.append((surf, (sx - h, sy - h)))
+            surf, h = cores[_frame(math.pi / 4, BOSS_SPIN, e.anim_angle)]
+            out.append((surf, (sx - h, sy - h)))
+            return True
+        t = e.enemy_type
+        if not detail or e.size <= lod_size:
+            surf, h = self._get(('simple', e.size, t))
+            out.append((surf, (sx - h, sy - h)))
+            return True
+        if t == 'normal':
+            frames, h = self._get(('normal', e.size))
+            pulse = 4 + int(2 * math.sin(e.anim_timer * 0.15))
+            surf = frames[_frame(*NORMAL_SPIN, e.anim_angle)][pulse - NORMAL_PULSES[0]]
+        elif t == 'fast':
+            frames, h = self._get(('fast', e.size))
+            if e.is_dashing:
+                a = math.atan2(e.dash_dir[1], e.dash_dir[0])
+                variant = FAST_DASH
+                trail = e.dash_trail
+                for i, (tx, ty) in enumerate(trail):
+                    dot, dh = self._trail_dot(e.size, i, len(trail))
+                    out.append((dot, (int(tx - cam_x) - dh, int(ty - cam_y) - dh)))
+            else:
+                a = e.face_angle
+                variant = (1 + _ready_level(e.anim_timer)) if e.dash_cooldown <= 0 else FAST_PLAIN
+            surf = frames[_frame(*FAST_TURN, a)][variant]
+        elif t == 'shooter':
+            frames, h = self._get(('shooter', e.size))
+            surf = frames[_frame(*SHOOTER_SPIN, e.anim_angle)]
+        elif t == 'tank':
+            self._add_tank(self._get(('tank', e.size)), sx, sy, e.anim_angle * 2.2, out)
+            return True
+        else:
+            return True     # no body art for this type (the sniper) — only its health bar
+        out.append((surf, (sx - h, sy - h)))
+        return True
+
+    def add_bar(self, e, sx: float, sy: float, out: list) -> None:
+        """Append the health bar of a regular enemy centred at (sx, sy).
+        Bosses have theirs in the HUD."""
+        if e.is_boss:
+            return
+        s   = e.size
+        bw  = max(BAR_MIN_W, int(s*2 + 10))
+        pct = e.health / max(e.max_health, 1)
+        key = (bw, max(0, min(bw, int(bw * pct))), 0 if pct > 0.5 else 1 if pct > 0.25 else 2)
+        out.append((self._bars.get(key) or self._bar(key),
+                    (int(sx) - bw//2, int(sy - s) - BAR_RAISE)))
+
+    def _add_tank(self, frames, sx: int, sy: int, fa: float, out: list) -> None:
+        (body, hb), (balls, bh), (link, hl), chain_len = frames
+        ca, sa = math.cos(fa), math.sin(fa)
+        for li in range(1, TANK_LINKS + 1):
+            t = li / (TANK_LINKS + 1)
+            out.append((link, (int(sx + ca * chain_len * t) - hl, int(sy + sa * chain_len * t) - hl)))
+        out.append((balls[_frame(*TANK_BALL, fa)],
+                    (sx + int(ca * chain_len) - bh, sy + int(sa * chain_len) - bh)))
+        out.append((body, (sx - hb, sy - hb)))
+
+    # ------------------------------------------------------------------
+    # EnemyStore rows, in bulk
+    # ------------------------------------------------------------------
+
+    def add_rows(self, store, rows, cam_x: float, cam_y: float, out: list,
+                 detail: bool = True, lod_size: float = 0) -> None:
+        """Append the sprites of store rows *rows* (an index array) to *out*,
+        grouped by type.  Frame choice matches add() row for row."""
+        if not len(rows):
+            return
+        kind = store.kind[rows]
+        sxs  = (store.x[rows] - cam_x).astype(_np.int64)
+        sys_ = (store.y[rows] - cam_y).astype(_np.int64)
+        size = store.size[rows]
+        for k in _np.unique(kind).tolist():
+            name = self.kinds[k]
+            sel  = kind == k
+            for s in _np.unique(size[sel]).tolist():
+                part = sel & (size == s)
+                idx  = rows[part]
+                sx, sy = sxs[part], sys_[part]
+                if not detail or s <= lod_size:
+                    surf, h = self._get(('simple', s, name))
+                    out += [(surf, p) for p in zip((sx - h).tolist(), (sy - h).tolist())]
+                elif name == 'normal':
+                    frames, h = self._get(('normal', s))
+                    f = _frames(*NORMAL_SPIN, store.anim_angle[idx])
+                    pulse = 4 + (2 * _np.sin(store.anim_timer[idx] * 0.15)).astype(_np.int64)
+                    out += [(frames[a][p], xy) for a, p, xy in
+                            zip(f.tolist(), (pulse - NORMAL_PULSES[0]).tolist(),
+                                zip((sx - h).tolist(), (sy - h).tolist()))]
+                elif name == 'fast':
+                    self._add_fast_rows(store, idx, sx, sy, s, cam_x, cam_y, out)
+                elif name == 'shooter':
+                    frames, h = self._get(('shooter', s))
+                    f = _frames(*SHOOTER_SPIN, store.anim_angle[idx])
+                    out += [(frames[a], xy) for a, xy in
+                            zip(f.tolist(), zip((sx - h).tolist(), (sy - h).tolist()))]
+                elif name == 'tank':
+                    frames = self._get(('tank', s))
+                    for x, y, fa in zip(sx.tolist(), sy.tolist(),
+                                        (store.anim_angle[idx] * 2.2).tolist()):
+                        self._add_tank(frames, x, y, fa, out)
+
+    def add_bars(self, store, rows, cam_x: float, cam_y: float, out: list) -> None:
+        """Append the health bars of store rows *rows*, matching add_bar()."""
+        if not len(rows):
+            return
+        size = store.size[rows]
+        bw   = _np.maximum(BAR_MIN_W, (size*2 + 10).astype(_np.int64))
+        pct  = store.health[rows] / _np.maximum(store.max_health[rows], 1)
+        hw   = _np.clip((bw * pct).astype(_np.int64), 0, bw)
+        ci   = _np.where(pct > 0.5, 0, _np.where(pct > 0.25, 1, 2))
+        sx   = (store.x[rows] - cam_x).astype(_np.int64)
+        by   = ((store.y[rows] - cam_y).astype(_np.int64) - size).astype(_np.int64) - BAR_RAISE
+        bars, make = self._bars, self._bar
+        for key, xy in zip(zip(bw.tolist(), hw.tolist(), ci.tolist()),
+                           zip((sx - bw//2).tolist(), by.tolist())):
+            out.append((bars.get(key) or make(key), xy))
+
+    def _add_fast_rows(self, store, idx, sx, sy, s, cam_x, cam_y, out) -> None:
+        frames, h = self._get(('fast', s))
+        dashing = store.dashing[idx]
+        a = _np.where(dashing, _np.arctan2(store.dash_dy[idx], store.dash_dx[idx]),
+                      store.face_angle[idx])
+        ready = 1 + _ready_levels(store.anim_timer[idx])
+        variant = _np.where(dashing, FAST_DASH,
+                            _np.where(store.dash_cooldown[idx] <= 0, ready, FAST_PLAIN))
+        handles = store.handles
+        for i in _np.flatnonzero(dashing).tolist():
+            trail = handles[int(idx[i])].dash_trail
+            for j, (tx, ty) in enumerate(trail):
+                dot, dh = self._trail_dot(s, j, len(trail))
+                out.append((dot, (int(tx - cam_x) - dh, int(ty - cam_y) - dh)))
+        out += [(frames[f][v], xy) for f, v, xy in
+                zip(_frames(*FAST_TURN, a).tolist(), variant.tolist(),
+                    zip((sx - h).tolist(), (sy - h).tolist()))]
+
+
+def _ready_level(anim_timer: int) -> int:
+    pulse = 0.6 + 0.4 * math.sin(anim_timer * 0.3)
+    return min(READY_LEVELS - 1, int((pulse - 0.2) / 0.8 * READY_LEVELS))
+
+
+def _ready_levels(anim_timer):
+    pulse = 0.6 + 0.4 * _np.sin(anim_timer * 0.3)
+    return _np.minimum(READY_LEVELS - 1, ((pulse - 0.2) / 0.8 * READY_LEVELS).astype(_np.int64))
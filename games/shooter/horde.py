@@ -0,0 +1,380 @@
+"""
+Shooter Game - Enemy Store (structure of arrays)
+
+Responsibilities
+----------------
+* Hold every regular (non-boss) enemy as one row of parallel NumPy arrays:
+  position, speed, type id, health, size, animation and dash timers.
+* Step all rows at once: chase movement, the fast type's telegraph / dash
+  state machine, and axis-separated wall sliding against the tile bitmap.
+* Refresh line of sight for a rotating tenth of the rows per frame by
+  ray-marching the tile bitmap.
+* Keep the crowd from collapsing into one blob: rows that overlap push each
+  other apart, with neighbours found through a uniform grid rebuilt per step.
+* Keep rows dense: removal compacts the arrays and renumbers the handles.
+
+Each row has a *handle* — the object the rest of the game treats as the enemy
+(ShooterGame wraps rows in HordeEnemy, whose attributes read and write the
+columns).  The store sets ``_store`` / ``_row`` on its handles and appends to
+their ``dash_trail``.  A removed handle is moved to a private snapshot of its
+final row, so references that outlive the enemy still read sane values.
+
+The kernels mirror Enemy.update() / Enemy._move() step for step, so a row
+moves exactly like the object would have; only the order of floating-point
+operations differs.
+"""
+from __future__ import annotations
+
+try:
+    import numpy as _np
+    _NUMPY = True
+except ImportError:
+    _NUMPY = False
+
+
+# Type ids; any other enemy_type stays on the object path
+KINDS = ('normal', 'fast', 'tank', 'shooter', 'sniper')
+FAST  = KINDS.index('fast')
+
+DASH_RANGE_SQ = 450 ** 2
+DASH_FRAMES   = 15
+DASH_COOLDOWN = 160
+DASH_SPEED    = 3.0     # × speed while dashing
+CREEP_SPEED   = 0.3     # × speed while a fast enemy waits for its dash
+TRAIL_LEN     = 12
+
+SEP_GAP   = 1.15        # rows closer than (size_a + size_b) * SEP_GAP push apart
+SEP_PUSH  = 0.9         # push at full overlap, × speed
+SEP_CELL  = 2 * 22 * SEP_GAP  # grid cell: the widest pair of regular enemies
+
+LOS_EVERY = 10          # frames between line-of-sight refreshes per enemy
+LOS_STEP  = 15.0        # ray-march step (px), as helpers.has_line_of_sight
+LOS_PROBE = 5.0         # probe half-size (px)
+
+_FLOAT_COLS = ('x', 'y', 'prev_x', 'prev_y', 'health', 'max_health', 'size', 'speed',
+               'anim_angle', 'face_angle', 'dash_dx', 'dash_dy')
+_INT_COLS   = ('kind', 'anim_timer', 'dash_timer', 'dash_cooldown',
+               'shoot_cooldown', 'shoot_rate', 'frames_far', 'slot')
+_BOOL_COLS  = ('dashing', 'los')
+COLUMNS     = _FLOAT_COLS + _INT_COLS + _BOOL_COLS
+
+
+class EnemyStore:
+    """Dense per-column storage for regular enemies.
+
+    Columns are attributes holding arrays of length ``capacity``; only the
+    first ``n`` rows are live.  Always slice with ``[:store.n]`` (or use
+    ``col()``), since the arrays are reallocated as the store grows.
+
+    Usage::
+
+        store = EnemyStore()
+        store.add(handle, x=..., y=..., kind=..., ...)
+        store.step(px, py, tilemap.check_collision_batch, grid)
+        store.remove(dead_mask)
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.n        = 0
+        self.capacity = 0
+        self.handles: list = []
+        self._alloc(max(1, capacity))
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _alloc(self, capacity: int) -> None:
+        n = self.n
+        for name in COLUMNS:
+            dtype = (_np.float64 if name in _FLOAT_COLS else
+                     _np.int64 if name in _INT_COLS else bool)
+            arr = _np.zeros(capacity, dtype=dtype)
+            if n:
+                arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
+        self.capacity = capacity
+
+    def col(self, name: str):
+        """Live view of one column."""
+        return getattr(self, name)[:self.n]
+
+    # ------------------------------------------------------------------
+    # Rows
+    # ------------------------------------------------------------------
+
+    def add(self, handle, **values) -> int:
+        """Append a row for *handle*; unspecified columns start at zero / False."""
+        if self.n == self.capacity:
+            self._alloc(self.capacity * 2)
+        row = self.n
+        for name in COLUMNS:
+            getattr(self, name)[row] = values.get(name, 0)
+        if 'prev_x' not in values:
+            self.prev_x[row] = self.x[row]
+            self.prev_y[row] = self.y[row]
+        self.n += 1
+        handle._store = self
+        handle._row   = row
+        self.handles.append(handle)
+        return row
+
+    def remove(self, dead) -> list:
+        """Drop the rows where *dead* is True, keeping the survivors' order.
+
+        Returns the removed handles.
+        """
+        n = self.n
+        dead = _np.asarray(dead, dtype=bool)[:n]
+        if not dead.any():
+            return []
+        gone = _np.flatnonzero(dead)
+        keep = _np.flatnonzero(~dead)
+        handles = self.handles
+        removed = [handles[i] for i in gone.tolist()]
+        self._detach(gone, removed)
+        k = len(keep)
+        for name in COLUMNS:
+            arr = getattr(self, name)
+            arr[:k] = arr[keep]
+        self.handles = [handles[i] for i in keep.tolist()]
+        for row, h in enumerate(self.handles):
+            h._row = row
+        self.n = k
+        return removed
+
+    def clear(self) -> list:
+        removed = self.handles
+        self._detach(_np.arange(self.n), removed)
+        self.handles, self.n = [], 0
+        return removed
+
+    def _detach(self, rows, handles: list) -> None:
+        """Point *handles* at a new store holding copies of their rows."""
+        if not handles:
+            return
+        snap = EnemyStore(len(handles))
+        for name in COLUMNS:
+            getattr(snap, name)[:len(handles)] = getattr(self, name)[rows]
+        snap.n = len(handles)
+        snap.handles = list(handles)
+        for row, h in enumerate(handles):
+            h._store = snap
+            h._row   = row
+
+    def save_prev(self) -> None:
+        """Remember this tick's starting positions (render interpolation)."""
+        n = self.n
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+
+    def step(self, px: float, py: float, collide, grid=None) -> None:
+        """One Enemy.update() for every row.
+
+        collide(xs, ys, sizes) -> bool array marks positions overlapping a
+        wall (Tilemap.check_collision_batch).  With a spatial.UniformGrid,
+        the separation push is added to the movement (see separation()).
+        """
+        n = self.n
+        if not n:
+            return
+        x, y = self.x[:n], self.y[:n]
+        self.anim_timer[:n] += 1
+        self.anim_angle[:n] += 0.05
+
+        act = self.los[:n].copy()        # without LOS a regular enemy just idles
+        dx = px - x
+        dy = py - y
+        d2 = dx * dx + dy * dy
+        dist = _np.sqrt(d2)
+        dist[d2 <= 0] = 0.001
+        self.face_angle[:n][act] = _np.arctan2(dy, dx)[act]
+
+        speed   = self.speed[:n]
+        dashing = self.dashing[:n]
+        fast    = act & (self.kind[:n] == FAST)
+        vx = _np.zeros(n)
+        vy = _np.zeros(n)
+        ticks = act.copy()               # rows that reach the shoot-cooldown tick
+
+        # Fast, mid-dash: count down, then either keep dashing or stop
+        dash = fast & dashing
+        if dash.any():
+            for i in _np.flatnonzero(dash).tolist():
+                trail = self.handles[i].dash_trail
+                trail.append((float(x[i]), float(y[i])))
+                if len(trail) > TRAIL_LEN:
+                    trail.pop(0)
+            self.dash_timer[:n][dash] -= 1
+            over = dash & (self.dash_timer[:n] <= 0)
+            go   = dash & ~over
+            dashing[over] = False
+            for i in _np.flatnonzero(over).tolist():
+                self.handles[i].dash_trail.clear()
+            vx[go] = self.dash_dx[:n][go] * speed[go] * DASH_SPEED
+            vy[go] = self.dash_dy[:n][go] * speed[go] * DASH_SPEED
+            ticks &= ~go
+
+        # Fast, waiting: cool down, start a dash in range, otherwise creep
+        wait = fast & ~dash
+        if wait.any():
+            self.dash_cooldown[:n][wait] -= 1
+            start = wait & (self.dash_cooldown[:n] <= 0) & (d2 < DASH_RANGE_SQ)
+            self.dash_dx[:n][start] = (dx / dist)[start]
+            self.dash_dy[:n][start] = (dy / dist)[start]
+            dashing[start] = True
+            self.dash_timer[:n][start]    = DASH_FRAMES
+            self.dash_cooldown[:n][start] = DASH_COOLDOWN
+            creep = wait & ~start
+            vx[creep] = (dx / dist * speed * CREEP_SPEED)[creep]
+            vy[creep] = (dy / dist * speed * CREEP_SPEED)[creep]
+            ticks &= ~start
+
+        # Everyone else chases
+        chase = act & ~fast & (d2 > 0)
+        vx[chase] = (dx / dist * speed)[chase]
+        vy[chase] = (dy / dist * speed)[chase]
+
+        if grid is not None:
+            sx, sy = self.separation(grid)
+            push = ~dashing               # a dash goes straight through the crowd
+            vx[push] += sx[push] * speed[push]
+            vy[push] += sy[push] * speed[push]
+
+        self._slide(vx, vy, collide)
+
+        cd = self.shoot_cooldown[:n]
+        cd[ticks & (cd > 0)] -= 1
+
+    def separation(self, grid):
+        """Per-row push (in units of the row's speed) away from overlapping rows.
+
+        Rebuilds *grid* over the current positions, then sums, for every pair
+        closer than (size_a + size_b) * SEP_GAP, a push along the pair axis that
+        grows linearly with the overlap.  The total is capped at SEP_PUSH, so
+        the crowd spreads out but never outruns a chase.
+        """
+        n = self.n
+        x, y = self.x[:n], self.y[:n]
+        size = self.size[:n]
+        sx = _np.zeros(n)
+        sy = _np.zeros(n)
+        if n < 2:
+            return sx, sy
+        grid.build(x, y)
+        # Each row searches twice its own reach, which finds every close pair
+        # from its larger member's side; the pairs are then made symmetric, so
+        # one big row does not widen the whole crowd's search
+        other, row = grid.query_pairs(x, y, 2.0 * size * SEP_GAP)
+        pair = other != row
+        a, b = _np.minimum(other[pair], row[pair]), _np.maximum(other[pair], row[pair])
+        key  = _np.unique(a * n + b)
+        a, b = key // n, key % n
+        other, row = _np.concatenate((a, b)), _np.concatenate((b, a))
+        dx = x[row] - x[other]
+        dy = y[row] - y[other]
+        d  = _np.sqrt(dx * dx + dy * dy)
+        reach = (size[row] + size[other]) * SEP_GAP
+        near  = d < reach
+        if not near.any():
+            return sx, sy
+        other, row = other[near], row[near]
+        dx, dy, d, reach = dx[near], dy[near], d[near], reach[near]
+        # Stacked exactly on top of each other: split along a per-row angle
+        same = d == 0
+        if same.any():
+            a = row[same] * 2.39996
+            dx[same], dy[same], d[same] = _np.cos(a), _np.sin(a), 1.0
+        w = (reach - d) / (reach * d)           # overlap fraction / distance
+        sx = _np.bincount(row, weights=dx * w, minlength=n)
+        sy = _np.bincount(row, weights=dy * w, minlength=n)
+        mag = _np.sqrt(sx * sx + sy * sy)
+        over = mag > 1.0
+        sx[over] /= mag[over]
+        sy[over] /= mag[over]
+        return sx * SEP_PUSH, sy * SEP_PUSH
+
+    def _slide(self, vx, vy, collide) -> None:
+        """Enemy._move for all rows: try x, then y from the updated x."""
+        n = self.n
+        moving = (vx != 0) | (vy != 0)
+        if not moving.any():
+            return
+        idx  = _np.flatnonzero(moving)
+        x, y = self.x[idx], self.y[idx]
+        size = self.size[idx]
+        nx = x + vx[idx]
+        x  = _np.where(collide(nx, y, size), x, nx)
+        ny = y + vy[idx]
+        y  = _np.where(collide(x, ny, size), y, ny)
+        self.x[idx] = x
+        self.y[idx] = y
+
+    def update_los(self, px: float, py: float, bitmap, tile_size: float,
+                   frame: int, reach: float) -> None:
+        """Refresh LOS for the rows whose slot comes up this frame.
+
+        Each enemy is re-tested every LOS_EVERY frames, staggered by slot so
+        the work is spread evenly.  Only ray samples within *reach* of the
+        ray's midpoint are tested, like ChunkManager.has_los, which only
+        consults walls in the chunks around the midpoint.
+        """
+        n = self.n
+        if not n or bitmap is None:
+            return
+        rows = _np.flatnonzero(self.slot[:n] % LOS_EVERY == frame % LOS_EVERY)
+        if not len(rows):
+            return
+        x1, y1 = self.x[rows], self.y[rows]
+        dx, dy = px - x1, py - y1
+        dist   = _np.sqrt(dx * dx + dy * dy)
+        steps  = _np.maximum((dist / LOS_STEP).astype(_np.int64), 3)
+        steps[dist == 0] = 1                       # zero-length ray: always visible
+        # Samples i = 1 .. steps-1 at t = i / steps, keeping only those with
+        # |t - 0.5| * max(|dx|, |dy|) <= reach
+        span   = _np.maximum(_np.abs(dx), _np.abs(dy))
+        r      = _np.where(span > 0, reach / _np.maximum(span, 1e-9), 1.0)
+        first  = _np.maximum(1, _np.ceil((0.5 - r) * steps)).astype(_np.int64)
+        last   = _np.minimum(steps - 1, _np.floor((0.5 + r) * steps)).astype(_np.int64)
+        counts = _np.maximum(0, last - first + 1)
+        total  = int(counts.sum())
+        clear  = _np.ones(len(rows), dtype=bool)
+        if total:
+            owner = _np.repeat(_np.arange(len(rows)), counts)
+            start = _np.cumsum(counts) - counts
+            i     = _np.arange(total) - _np.repeat(start - first, counts)
+            t     = i / steps[owner]
+            hit   = _probe(bitmap, tile_size, x1[owner] + dx[owner] * t, y1[owner] + dy[owner] * t)
+            clear = _np.bincount(owner[hit], minlength=len(rows)) == 0
+        self.los[rows] = clear
+
+
+def _probe(bitmap, tile_size: float, xs, ys):
+    """True where a LOS_PROBE box around (xs, ys) touches a solid tile.
+
+    The probe is smaller than a tile, so its four corners cover every tile it
+    can overlap.
+    """
+    H, W = bitmap.shape
+    hit = _np.zeros(len(xs), dtype=bool)
+    for ox in (-LOS_PROBE, LOS_PROBE):
+        gx  = _np.floor((xs + ox) / tile_size).astype(_np.int64)
+        okx = (gx >= 0) & (gx < W)
+        gx  = _np.clip(gx, 0, W - 1)
+        for oy in (-LOS_PROBE, LOS_PROBE):
+            gy = _np.floor((ys + oy) / tile_size).astype(_np.int64)
+            ok = okx & (gy >= 0) & (gy < H)
+            hit |= ok & bitmap[_np.clip(gy, 0, H - 1), gx]
+    return hit
+
+
+def kind_id(enemy_type: str) -> int:
+    """Row type id for an enemy_type, or -1 if it must stay an object."""
+    try:
+        return KINDS.index(enemy_type)
+    except ValueError:
+        return -1
+
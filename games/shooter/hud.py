@@ -0,0 +1,78 @@
+"""
+Shooter Game - Retained HUD Layer
+
+Responsibilities
+----------------
+* Keep every HUD widget (power-up panel, kill counter, health bar, boss bar,
+  debug overlay) as its own cached surface.
+* Re-render a widget only when the values it is bound to change, and count
+  the re-renders so the debug overlay can show them.
+* Draw all visible widgets with one ``Surface.blits`` call per frame.
+
+A widget is a pair of callables.  ``bind()`` returns the widget's state — a
+hashable value built from exactly what it shows (player stats, kill count,
+health, boss HP) — or None to hide it.  ``paint(state)`` turns that state into
+``(surface, (x, y))``.  The layer calls paint only when the state differs
+from the one it last painted.
+
+The widgets are blitted one by one rather than composed into one screen-sized
+surface: a full-viewport per-pixel-alpha surface costs more to blit every
+frame than all the widget surfaces together, and an RLE-encoded one is
+re-encoded whenever any widget changes.
+"""
+from __future__ import annotations
+
+import pygame
+
+
+class HudLayer:
+    """Ordered set of cached widgets; later widgets draw on top."""
+
+    def __init__(self) -> None:
+        self._widgets: list[list] = []     # [name, bind, paint, state, (surface, pos) | None]
+        self.rerendered = 0                # widgets painted during the last draw()
+        self.renders    = 0                # total paints since creation
+
+    def add(self, name: str, bind, paint) -> None:
+        self._widgets.append([name, bind, paint, None, None])
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Force a repaint of widget *name* (every widget if None) on the next draw."""
+        for w in self._widgets:
+            if name is None or w[0] == name:
+                w[3] = w[4] = None
+
+    def draw(self, target: pygame.Surface) -> None:
+        seq: list = []
+        painted = 0
+        for w in self._widgets:
+            state = w[1]()
+            if state is None:
+                continue
+            if w[4] is None or state != w[3]:
+                w[3], w[4] = state, w[2](state)
+                painted += 1
+            seq.append(w[4])
+        self.rerendered = painted
+        self.renders   += painted
+        target.blits(seq, doreturn=False)
+
+    def names(self) -> list[str]:
+        return [w[0] for w in self._widgets]
+
+
+def widget_surface(w: int, h: int) -> pygame.Surface:
+    """Transparent per-pixel-alpha surface for a widget to paint into."""
+    surf = pygame.Surface((max(1, w), max(1, h)), pygame.SRCALPHA)
+    return surf.convert_alpha() if pygame.display.get_surface() is not None else surf
+
+
+def put(widget: pygame.Surface, surf: pygame.Surface, pos) -> None:
+    """Copy anti-aliased *surf* onto still-transparent pixels of *widget*.
+
+    A plain blit onto a transparent pixel darkens the anti-aliased edge
+    (it blends toward the pixel's black); taking the channel-wise maximum
+    copies the source pixel as it is.  Over pixels already painted opaque,
+    use a plain blit.
+    """
+    widget.blit(surf, pos, special_flags=pygame.BLEND_RGBA_MAX)
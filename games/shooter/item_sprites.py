@@ -0,0 +1,181 @@
+"""
+Shooter Game - Item Sprite Atlas
+
+Responsibilities
+----------------
+* Bake one complete crate sprite per item type — glow, body, border, accent
+  lines and icon in a single surface — plus a variant without the glow and
+  the name label on its dark backing, shared by every item of that type.
+* Turn crates (CrateStore rows, or single Item objects) into (surface,
+  position) pairs, bob offset included, so the game draws every crate with
+  one ``Surface.blits`` call.  A merged crate's label carries its stack count.
+
+The layers are painted exactly as Item.draw used to paint them onto the
+screen, once over black and once over white; the two results give each
+pixel's colour and coverage, so the baked sprite blits to the same pixels
+the layered drawing produced.  Without NumPy the layers are painted straight
+onto a transparent surface, which differs only in the soft glow's edges.
+"""
+from __future__ import annotations
+
+import math
+
+import pygame
+
+try:
+    import numpy as _np
+    _NUMPY = True
+except ImportError:
+    _NUMPY = False
+
+
+CRATE_BODY  = (20, 22, 38)
+GLOW_PAD    = 10        # glow reaches this far past the crate
+LABEL_GAP   = 4         # label backing top, below the crate
+BOB_STEP    = 0.04      # bob phase advance per drawn frame
+BOB_HEIGHT  = 4
+
+
+def _bake(w: int, h: int, paint) -> pygame.Surface:
+    """Per-pixel-alpha surface holding what paint(surface) draws over any
+    opaque background."""
+    if not _NUMPY:
+        out = pygame.Surface((w, h), pygame.SRCALPHA)
+        paint(out)
+    else:
+        layers = []
+        for bg in ((0, 0, 0), (255, 255, 255)):
+            surf = pygame.Surface((w, h))
+            surf.fill(bg)
+            paint(surf)
+            layers.append(pygame.surfarray.array3d(surf).astype(_np.float64))
+        on_black, on_white = layers
+        # over black: a·C;  over white: a·C + (1 - a)·255
+        a = 1.0 - (on_white - on_black).mean(axis=2) / 255.0
+        rgb = _np.divide(on_black, a[..., None], out=_np.zeros_like(on_black),
+                         where=a[..., None] > 0)
+        out = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.surfarray.pixels3d(out)[...] = _np.clip(rgb + 0.5, 0, 255).astype(_np.uint8)
+        pygame.surfarray.pixels_alpha(out)[...] = _np.clip(a * 255.0 + 0.5, 0, 255).astype(_np.uint8)
+    return out.convert_alpha() if pygame.display.get_surface() is not None else out
+
+
+class ItemAtlas:
+    """Crate and label sprites for every item type.
+
+    config   — ITEM_CONFIG (colour and name per item type)
+    icons    — _ICON_DRAW (icon painter per item type)
+    size     — crate half-size (Item.CRATE_SIZE)
+    font     — callable returning the label font
+    text     — callable (font, text, colour) -> surface, e.g. TEXT_CACHE.render
+
+    Usage::
+
+        atlas = ItemAtlas(ITEM_CONFIG, _ICON_DRAW, 22, _label_font, TEXT_CACHE.render)
+        atlas.bake()
+        seq = []
+        atlas.add_rows(crates, crates.visible(cam_x, cam_y, w, h, 60), cam_x, cam_y, seq)
+        screen.blits(seq, doreturn=False)
+    """
+
+    def __init__(self, config: dict, icons: dict, size: int, font, text) -> None:
+        self.config = config
+        self.icons  = icons
+        self.size   = size
+        self.font   = font
+        self.text   = text
+        self._sprites: dict = {}     # item type -> (glow crate, plain crate, label, label x offset)
+
+    def bake(self) -> None:
+        """Build every configured type now, so the first drop does not hitch."""
+        for kind in self.config:
+            self.sprites(kind)
+
+    def sprites(self, kind: str) -> tuple:
+        entry = self._sprites.get(kind)
+        if entry is None:
+            entry = self._sprites[kind] = self._build(kind)
+        return entry
+
+    def _build(self, kind: str) -> tuple:
+        s = self.size
+        cfg = self.config.get(kind, {'color': (255, 255, 255), 'name': kind})
+        c = cfg['color']
+
+        icon = pygame.Surface((s*2, s*2), pygame.SRCALPHA)
+        fn = self.icons.get(kind)
+        if fn:
+            try:
+                fn(icon, s, s, c, int(s*0.6))
+            except Exception:
+                pass
+        border = pygame.Surface((s*2+4, s*2+4), pygame.SRCALPHA)
+        pygame.draw.rect(border, (*c, 200), border.get_rect(), 2, border_radius=8)
+        g = s + GLOW_PAD
+        glow = pygame.Surface((g*2+4, g*2+4), pygame.SRCALPHA)
+        pygame.draw.rect(glow, (*c, 28), (2, 2, g*2, g*2), border_radius=8)
+
+        def crate(surf, o):
+            # Body, border, accent lines and icon around centre (o, o)
+            pygame.draw.rect(surf, CRATE_BODY, (o-s, o-s, s*2, s*2), border_radius=7)
+            surf.blit(border, (o-s-2, o-s-2))
+            pygame.draw.line(surf, c, (o-s+4, o-s+2), (o+s-4, o-s+2), 1)
+            pygame.draw.line(surf, c, (o-s+2, o-s+4), (o-s+2, o+s-4), 1)
+            surf.blit(icon, (o-s, o-s))
+
+        go = g + 2
+        with_glow = _bake(go*2, go*2, lambda surf: (surf.blit(glow, (0, 0)), crate(surf, go)))
+        plain     = _bake(s*2+4, s*2+4, lambda surf: crate(surf, s+2))
+
+        lbl = self.text(self.font(), cfg['name'], c)
+        lw, lh = lbl.get_width() + 6, lbl.get_height() + 2
+
+        def label(surf):
+            back = pygame.Surface((lw, lh), pygame.SRCALPHA)
+            pygame.draw.rect(back, (0, 0, 0, 160), back.get_rect(), border_radius=3)
+            surf.blit(back, (0, 0))
+            surf.blit(lbl, (3, 1))
+
+        return (with_glow, go), (plain, s + 2), _bake(lw, lh, label), lw // 2
+
+    def add(self, item, cam_x: float, cam_y: float, out: list,
+            glow: bool = True, label: bool = True) -> None:
+        """Append item's crate (and label) at its bobbing screen position to *out*."""
+        item.bob += BOB_STEP
+        sx = int(item.x - cam_x)
+        sy = int(item.y - cam_y + math.sin(item.bob) * BOB_HEIGHT)
+        crate_glow, crate_plain, lbl, lx = self._sprites.get(item.type) or self.sprites(item.type)
+        surf, o = crate_glow if glow else crate_plain
+        out.append((surf, (sx - o, sy - o)))
+        if label:
+            out.append((lbl, (sx - lx, sy + self.size + LABEL_GAP)))
+
+    def add_rows(self, store, rows, cam_x: float, cam_y: float, out: list,
+                 glow: bool = True, label: bool = True) -> None:
+        """Append the crates in CrateStore *rows* to *out*, advancing their bob."""
+        if not len(rows):
+            return
+        types, size = store.types, self.size
+        if _NUMPY:
+            store.bob[rows] += BOB_STEP
+            xs = (store.x[rows] - cam_x).astype(_np.int64).tolist()
+            ys = (store.y[rows] - cam_y + _np.sin(store.bob[rows]) * BOB_HEIGHT).astype(_np.int64).tolist()
+            kinds, stacks = store.kind[rows].tolist(), store.stack[rows].tolist()
+        else:
+            for i in rows:
+                store.bob[i] += BOB_STEP
+            xs = [int(store.x[i] - cam_x) for i in rows]
+            ys = [int(store.y[i] - cam_y + math.sin(store.bob[i]) * BOB_HEIGHT) for i in rows]
+            kinds, stacks = [store.kind[i] for i in rows], [store.stack[i] for i in rows]
+        sprites = self._sprites
+        for sx, sy, k, stack in zip(xs, ys, kinds, stacks):
+            kind = types[k]
+            crate_glow, crate_plain, lbl, lx = sprites.get(kind) or self.sprites(kind)
+            surf, o = crate_glow if glow else crate_plain
+            out.append((surf, (sx - o, sy - o)))
+            if label:
+                ly = sy + size + LABEL_GAP
+                out.append((lbl, (sx - lx, ly)))
+                if stack > 1:
+                    cnt = self.text(self.font(), f'x{stack}', self.config[kind]['color'])
+                    out.append((cnt, (sx - lx + lbl.get_width() + 2, ly + 1)))
@@ -0,0 +1,177 @@
+"""
+Shooter Game - Bullet Patterns
+
+Responsibilities
+----------------
+* Describe every enemy and boss attack as data: a pattern is a tuple of
+  emitters, each a ring around the shooter or a spread aimed at the player,
+  with a bullet count, spread width, phase and bullet type.
+* Compile each emitter once into a table of unit directions, shared between
+  emitters through a cache keyed by (count, spread).
+* Fire a pattern: turn each table by its angle (the aim, or the ring's phase
+  at this point of the attack) with one rotation, and hand the whole volley
+  to a bulk emitter.
+
+Compiled emitters are plain tuples ``(table, aimed, phase, rate, type, cannon)``;
+a ring's angle is ``phase + pattern_timer * rate``.  The directions match
+helpers.ring_directions / spread_directions to the last few bits.
+"""
+from __future__ import annotations
+
+import math
+
+
+TAU = 2 * math.pi
+
+_TABLES: dict = {}
+
+
+# ---------------------------------------------------------------------------
+# Emitters
+# ---------------------------------------------------------------------------
+
+def ring(count: int, kind: str = 'normal', phase: float = 0.0, rate: float = 0.0) -> tuple:
+    """count bullets evenly around the shooter, turning by *rate* per pattern frame."""
+    return ('ring', count, None, phase, rate, kind)
+
+
+def spread(count: int, width: float, kind: str = 'normal') -> tuple:
+    """count bullets fanned over *width* radians, centred on the player."""
+    return ('spread', count, width, 0.0, 0.0, kind)
+
+
+def aimed(kind: str = 'normal') -> tuple:
+    """One bullet straight at the player."""
+    return spread(1, 0.0, kind)
+
+
+# ---------------------------------------------------------------------------
+# Attack tables
+# ---------------------------------------------------------------------------
+
+# Regular shooting types, by enemy_type
+ENEMY_PATTERNS: dict[str, tuple] = {
+    'shooter': (spread(3, 0.25),),                              # triple burst
+    'tank':    (aimed('cannon'), spread(2, 1.0, 'mortar')),     # cannon ball + flanking mortars
+}
+
+# OMEGA PRIME, cycled by attack_pattern
+FINAL_PATTERNS: tuple = (
+    (spread(14, 1.8), ring(6, 'homing', rate=0.05)),                      # massive spread + homing ring
+    (ring(8, rate=0.1), ring(8, phase=math.pi/8, rate=0.1)),              # rotating double ring
+    (ring(4, 'snipe'), spread(18, 1.9)),                                  # snipe burst + spread
+    (ring(10, 'homing', rate=0.08), ring(5, 'mortar')),                   # homing swarm + mortar ring
+    (ring(4, 'laser'), spread(20, 2.0)),                                  # laser cross + spread
+)
+
+# Mini-bosses, by boss_id, cycled by attack_pattern
+MINI_PATTERNS: dict[int, tuple] = {
+    1: (  # VOIDCALLER — homing + ring
+        (ring(6, 'homing', rate=0.06),),
+        (spread(7, 1.4),),
+        (ring(4, 'homing'), ring(4, phase=math.pi/4)),
+        (ring(10, rate=0.08),),
+    ),
+    2: (  # INFERNAX — mortar + laser
+        (ring(6, 'mortar'),),
+        (spread(5, 1.0, 'laser'),),
+        (ring(4, 'mortar', rate=0.05), aimed('laser')),
+        (ring(8, 'laser', rate=0.1),),
+    ),
+    3: (  # GLACIUS — sniper beams
+        (spread(3, 0.6, 'snipe'),),
+        (ring(4, 'snipe', rate=0.07),),
+        (ring(12), ring(4, 'snipe', phase=math.pi/4)),
+        (ring(6, 'snipe', rate=0.04),),
+    ),
+    4: (  # SOLARCH — cannon + spread
+        (ring(4, 'cannon'),),
+        (spread(10, 1.6),),
+        (spread(4, 1.0, 'cannon'),),
+        (ring(14, rate=0.09),),
+    ),
+    5: (  # NECRAXIS — homing swarm
+        (ring(8, 'homing', rate=0.07),),
+        (spread(12, 1.7, 'homing'),),
+        (ring(6, 'mortar'), ring(4, 'homing', phase=math.pi/6)),
+        (ring(10, 'homing', rate=0.05),),
+    ),
+    6: (  # ABYSSTIDE — deep-water slow death waves
+        (ring(16, rate=0.04),),
+        (ring(8, 'mortar', rate=0.06), ring(4, 'homing')),
+        (spread(8, 1.8, 'laser'),),
+        (ring(12), ring(6, 'mortar', phase=math.pi/6)),
+    ),
+    7: (  # WRATHBORN — rage-fueled spread
+        (spread(16, 2.0),),
+        (ring(6, 'laser', rate=0.08), ring(6, phase=math.pi/6)),
+        (spread(4, 0.5, 'snipe'), ring(8, 'homing')),
+        (ring(20, rate=0.06),),
+    ),
+    8: (  # VIRULEX — infectious spread clusters
+        (ring(12, 'homing', rate=0.05),),
+        (spread(6, 1.2, 'mortar'), ring(4, 'snipe')),
+        (ring(18, rate=0.07),),
+        (ring(8, 'laser', rate=0.1), spread(6, 1.0, 'homing')),
+    ),
+}
+
+
+# ---------------------------------------------------------------------------
+# Compilation
+# ---------------------------------------------------------------------------
+
+def direction_table(count: int, width: float | None = None) -> tuple:
+    """Unit directions for *count* bullets, cached: a ring starting at angle 0
+    when *width* is None, otherwise a fan of *width* radians centred on 0."""
+    key = (count, width)
+    table = _TABLES.get(key)
+    if table is None:
+        if width is None:
+            step = TAU / count
+            angles = [i * step for i in range(count)]
+        else:
+            step = width / max(count - 1, 1)
+            angles = [(i - (count - 1) / 2) * step for i in range(count)]
+        table = _TABLES[key] = tuple((math.cos(a), math.sin(a)) for a in angles)
+    return table
+
+
+def compile_pattern(emitters: tuple) -> tuple:
+    """Emitter descriptions -> compiled emitters for fire()."""
+    out = []
+    for shape, count, width, phase, rate, kind in emitters:
+        cannon = kind == 'cannon'
+        out.append((direction_table(count, width), shape == 'spread', phase, rate,
+                    'normal' if cannon else kind, cannon))
+    return tuple(out)
+
+
+COMPILED_ENEMY = {t: compile_pattern(p) for t, p in ENEMY_PATTERNS.items()}
+COMPILED_FINAL = tuple(compile_pattern(p) for p in FINAL_PATTERNS)
+COMPILED_MINI  = {bid: tuple(compile_pattern(p) for p in pats)
+                  for bid, pats in MINI_PATTERNS.items()}
+
+
+# ---------------------------------------------------------------------------
+# Firing
+# ---------------------------------------------------------------------------
+
+def rotate(table: tuple, angle: float) -> list:
+    """The directions of *table* turned by *angle*."""
+    ca, sa = math.cos(angle), math.sin(angle)
+    return [(c*ca - s*sa, s*ca + c*sa) for c, s in table]
+
+
+def fire(pattern: tuple, x: float, y: float, aim: float, timer: int,
+         emit, out: list) -> list:
+    """Fire compiled *pattern* from (x, y), spreads centred on angle *aim*,
+    rings at their phase for pattern frame *timer*.
+
+    emit(out, x, y, directions, bullet_type, is_cannon) appends one volley.
+    Returns *out*.
+    """
+    for table, is_aimed, phase, rate, kind, cannon in pattern:
+        angle = aim if is_aimed else phase + timer * rate
+        emit(out, x, y, rotate(table, angle) if angle else table, kind, cannon)
+    return out
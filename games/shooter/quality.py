@@ -0,0 +1,127 @@
+"""
+Shooter Game - Adaptive Quality Governor
+
+Responsibilities
+----------------
+* Define the render quality levels, from full detail (level 0) down to the
+  cheapest look the game still reads well at.
+* Track a rolling percentile of measured frame cost and step between levels
+  to hold a frame-time target.
+* Record the average frame cost seen at each level, so the debug overlay can
+  show what every step actually saved on this machine.
+
+The governor only measures and decides; the game reads ``governor.settings``
+each frame and skips whatever the current level turns off.
+
+Hysteresis keeps it from flickering between two levels: it drops a level as
+soon as the percentile is over target, but only climbs back when the
+percentile sits well under target (``UP_RATIO``) for a whole hold period.
+Each time a climb is followed straight away by a drop, the hold doubles.
+"""
+from __future__ import annotations
+
+from collections import deque
+
+
+# ---------------------------------------------------------------------------
+# Levels — every key is read by ShooterGame._draw and friends.  'vignette'
+# names a drawing strategy from vignette.py, or None for no vignette.
+# ---------------------------------------------------------------------------
+
+QUALITY_LEVELS: tuple[dict, ...] = (
+    {'name': 'ULTRA',  'particles': 4000, 'floor_cracks': True,  'wall_edges': True,
+     'item_labels': True,  'vignette': 'strips', 'bullet_fade': True,  'item_glow': True,  'enemy_detail': True},
+    {'name': 'HIGH',   'particles': 2500, 'floor_cracks': False, 'wall_edges': True,
+     'item_labels': True,  'vignette': 'mult',   'bullet_fade': True,  'item_glow': True,  'enemy_detail': True},
+    {'name': 'MEDIUM', 'particles': 1500, 'floor_cracks': False, 'wall_edges': False,
+     'item_labels': False, 'vignette': 'mult',   'bullet_fade': True,  'item_glow': True,  'enemy_detail': True},
+    {'name': 'LOW',    'particles': 800,  'floor_cracks': False, 'wall_edges': False,
+     'item_labels': False, 'vignette': 'floor',  'bullet_fade': False, 'item_glow': True,  'enemy_detail': True},
+    {'name': 'MIN',    'particles': 250,  'floor_cracks': False, 'wall_edges': False,
+     'item_labels': False, 'vignette': None,     'bullet_fade': False, 'item_glow': False, 'enemy_detail': False},
+)
+
+
+class QualityGovernor:
+    """Chooses a quality level from measured frame times.
+
+    target_ms  — frame cost to stay under; None or 0 pins the level.
+    percentile — which percentile of the window is compared to the target
+                 (0.9 reacts to regular spikes without chasing single hitches).
+    """
+
+    WINDOW      = 120    # frames in the rolling window
+    CHECK_EVERY = 30     # frames between decisions
+    UP_RATIO    = 0.7    # climb only when the percentile is under target * UP_RATIO
+    HOLD        = 180    # frames a level is held before climbing back up
+    MAX_HOLD    = 1800
+    EMA         = 0.05   # smoothing for the per-level averages
+
+    def __init__(self, target_ms: float | None = 1000.0 / 60.0, percentile: float = 0.9,
+                 levels: tuple[dict, ...] = QUALITY_LEVELS, level: int = 0) -> None:
+        self.target_ms  = target_ms or None
+        self.percentile = percentile
+        self.levels     = levels
+        self.level      = max(0, min(level, len(levels) - 1))
+        self.level_ms: list[float | None] = [None] * len(levels)
+        self.changes    = 0
+        self._samples: deque[float] = deque(maxlen=self.WINDOW)
+        self._since     = 0        # frames since the last level change / decision
+        self._hold      = self.HOLD
+        self._climbed   = False    # last change was a climb
+
+    @property
+    def settings(self) -> dict:
+        return self.levels[self.level]
+
+    @property
+    def adaptive(self) -> bool:
+        return self.target_ms is not None
+
+    def current_ms(self) -> float:
+        """The rolling percentile the next decision will use (0 with no samples)."""
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * self.percentile))]
+
+    def savings(self) -> list[tuple[int, float, float | None]]:
+        """(level, average ms, ms saved vs level 0) for every level measured so far."""
+        base = self.level_ms[0]
+        return [(i, ms, None if base is None else base - ms)
+                for i, ms in enumerate(self.level_ms) if ms is not None]
+
+    def set_level(self, level: int) -> None:
+        level = max(0, min(level, len(self.levels) - 1))
+        if level != self.level:
+            self.level   = level
+            self.changes += 1
+        self._samples.clear()
+        self._since = 0
+
+    def sample(self, frame_ms: float) -> None:
+        """Record one frame's cost (update + draw, not the frame-cap sleep)."""
+        avg = self.level_ms[self.level]
+        self.level_ms[self.level] = frame_ms if avg is None else avg + (frame_ms - avg) * self.EMA
+        self._samples.append(frame_ms)
+        self._since += 1
+        if self.target_ms is None or self._since % self.CHECK_EVERY:
+            return
+        if len(self._samples) < self.CHECK_EVERY:
+            return
+
+        p = self.current_ms()
+        if p > self.target_ms and self.level < len(self.levels) - 1:
+            # A drop right after a climb means the higher level cannot be held: wait longer next time
+            if self._climbed:
+                self._hold = min(self.MAX_HOLD, self._hold * 2)
+            self._climbed = False
+            self.set_level(self.level + 1)
+        elif (p < self.target_ms * self.UP_RATIO and self.level > 0
+              and self._since >= self._hold):
+            self._climbed = True
+            self.set_level(self.level - 1)
+        elif self._climbed and self._since >= self._hold:
+            # Held the climb for a full period: it stuck, relax the hold again
+            self._climbed = False
+            self._hold    = self.HOLD
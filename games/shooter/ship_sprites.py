@@ -0,0 +1,272 @@
+"""
+Shooter Game - Ship Sprite Atlas
+
+Responsibilities
+----------------
+* Pre-render the player ship with its aim quantised to ANGLE_STEPS
+  directions: the body (per dual-gun count, plus an all-white variant for
+  the invincibility flash), the engine exhaust at THRUST_FRAMES points of its
+  pulse, and the cannon tip glow at TIP_LEVELS brightnesses.
+* Pre-render an orbital saw per saw size at SAW_FRAMES points of its spin,
+  and the magnet at ANGLE_STEPS points of its orbit.
+* Hand every piece back as a (surface, position) pair, so each one is a
+  single blit.
+
+Frames are built on first use, painted by the old per-frame Player.draw /
+draw_orbital / draw_magnet routines with the quantised angle in place of the
+live one.  Each is painted around an integer centre and cropped to what was
+drawn, so it lands on exactly the pixels the direct drawing produced at that
+angle.  Ship and saw frames are colour-keyed (RLE accelerated); the magnet
+keeps per-pixel alpha for its glow.
+"""
+from __future__ import annotations
+
+import math
+
+import pygame
+
+
+TAU = 2 * math.pi
+
+COLORKEY = (255, 0, 255)    # never used by the ship palette
+
+ANGLE_STEPS   = 64          # aim / magnet orbit directions
+THRUST_FRAMES = 16          # over one exhaust pulse, 2π / 3.2 of thruster_anim
+TIP_LEVELS    = 8           # cannon tip brightness steps
+SAW_FRAMES    = 16          # over one sixth of a turn (the teeth are six-fold)
+
+MAGNET_ORBIT  = 38
+MAGNET_COLOR  = (100, 200, 255)
+
+_CANVAS = 96                # half-size of the scratch canvas frames are painted on
+
+
+def angle_step(angle: float, steps: int = ANGLE_STEPS) -> int:
+    """Nearest of *steps* directions to *angle*."""
+    return int(round(angle / TAU * steps)) % steps
+
+
+def _crop(canvas: pygame.Surface, c: int) -> tuple:
+    """(colour-keyed frame, (dx, dy) of its top-left from the centre)."""
+    rect = canvas.get_bounding_rect()
+    surf = pygame.Surface(rect.size)
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert()
+    surf.fill(COLORKEY)
+    surf.blit(canvas, (0, 0), rect)
+    surf.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return surf, (rect.x - c, rect.y - c)
+
+
+def _canvas() -> pygame.Surface:
+    surf = pygame.Surface((_CANVAS * 2, _CANVAS * 2))
+    surf.fill(COLORKEY)
+    surf.set_colorkey(COLORKEY)
+    return surf
+
+
+# ---------------------------------------------------------------------------
+# Painters — centred on (c, c), aim direction (ca, sa)
+# ---------------------------------------------------------------------------
+
+def _rotor(c, ca, sa):
+    def rot(lx, ly):
+        return (int(c + lx*ca - ly*sa), int(c + lx*sa + ly*ca))
+    return rot
+
+
+def _paint_exhaust(surf, c, ca, sa, phase):
+    """Engine nozzles and flames; phase = thruster_anim · 3.2."""
+    rot = _rotor(c, ca, sa)
+    for ny in (-5, 0, 5):
+        pulse = 0.45 + 0.55 * math.sin(phase + ny * 0.28)
+        pygame.draw.circle(surf, (38, 44, 60), rot(-20, ny), 4)
+        for fi in range(1, 4):
+            fl = int(fi * 5 * pulse)
+            fc = (max(8, 25 - fi*6), max(55, 95 - fi*14), min(255, 175 + fi*22))
+            pygame.draw.circle(surf, fc, rot(-20 - fl, ny), max(1, 4 - fi))
+
+
+def _paint_body(surf, c, ca, sa, flash, dual):
+    rot = _rotor(c, ca, sa)
+
+    def rpts(*pts):
+        return [rot(lx, ly) for lx, ly in pts]
+
+    # ── Left shoulder plate ──
+    lsh = rpts((-10, 12), (-4, 19), (6, 18), (8, 12), (2, 10))
+    pygame.draw.polygon(surf, (56, 48, 38) if not flash else (255,255,255), lsh)
+    pygame.draw.polygon(surf, (102, 88, 66), lsh, 2)
+    # shoulder bolt detail
+    pygame.draw.circle(surf, (80, 70, 54), rot(2, 15), 2)
+
+    # ── Right shoulder plate ──
+    rsh = rpts((-10,-12), (-4,-19), (6,-18), (8,-12), (2,-10))
+    pygame.draw.polygon(surf, (56, 48, 38) if not flash else (255,255,255), rsh)
+    pygame.draw.polygon(surf, (102, 88, 66), rsh, 2)
+    pygame.draw.circle(surf, (80, 70, 54), rot(2, -15), 2)
+
+    # ── Main hull ──
+    hull = rpts((-18,0), (-15,-9), (-4,-13), (6,-11), (6,11), (-4,13), (-15,9))
+    pygame.draw.polygon(surf, (48, 56, 80) if not flash else (220,230,255), hull)
+    pygame.draw.polygon(surf, (92, 108, 152), hull, 2)
+    # armor panel etch lines
+    if not flash:
+        pygame.draw.line(surf, (36, 42, 60), rot(-13,-5), rot(3,-8), 1)
+        pygame.draw.line(surf, (36, 42, 60), rot(-13, 5), rot(3,  8), 1)
+        pygame.draw.line(surf, (36, 42, 60), rot(-8,  0), rot(-2, 0), 1)
+
+    # ── Front chest plate ──
+    chest = rpts((4,-10), (4,10), (14,6), (16,0), (14,-6))
+    pygame.draw.polygon(surf, (65, 88, 136) if not flash else (255,255,255), chest)
+    pygame.draw.polygon(surf, (108, 140, 200), chest, 2)
+
+    # ── Cockpit lens ──
+    cock = rot(5, 0)
+    pygame.draw.circle(surf, (18, 175, 228) if not flash else (255,255,255), cock, 6)
+    pygame.draw.circle(surf, (120, 225, 255), cock, 4)
+    pygame.draw.circle(surf, (210, 248, 255), cock, 2)
+
+    # ── Main cannon ──
+    barrel = rpts((14,-4), (14,4), (27,3), (27,-3))
+    pygame.draw.polygon(surf, (60, 54, 46) if not flash else (255,255,255), barrel)
+    pygame.draw.polygon(surf, (105, 96, 80), barrel, 1)
+    # segment rings
+    for cx_l in (18, 22):
+        pygame.draw.line(surf, (88, 80, 68), rot(cx_l, -3), rot(cx_l, 3), 1)
+    # muzzle ring
+    pygame.draw.circle(surf, (78, 70, 58), rot(27, 0), 4)
+
+    # ── Dual side guns (one pair per stack) ──
+    for gn in range(dual):
+        off = 10 + gn * 10
+        for sign in (-1, 1):
+            sy2 = sign * off
+            side = rpts((8,sy2-2),(8,sy2+2),(22,sy2+1),(22,sy2-1))
+            pygame.draw.polygon(surf, (60, 54, 46) if not flash else (255,255,255), side)
+            pygame.draw.polygon(surf, (95, 86, 72), side, 1)
+            pygame.draw.circle(surf, (255, 170, 30), rot(22, sy2), 3)
+
+
+def _paint_tip(surf, c, level):
+    tip_pulse = 0.7 + 0.3 * (2 * level / (TIP_LEVELS - 1) - 1)
+    pygame.draw.circle(surf, (255, int(190 + 50*tip_pulse), 40), (c, c), 3)
+    pygame.draw.circle(surf, (255, 240, 160), (c, c), 1)
+
+
+def _paint_saw(surf, c, size, spin, body, rim):
+    ti = max(2, int(size * 0.65))     # inner tooth radius
+    pygame.draw.circle(surf, body, (c, c), size)
+    pygame.draw.circle(surf, rim, (c, c), size, 2)
+    for j in range(6):
+        ba = spin + j * math.pi / 3
+        pygame.draw.line(surf, (255, 240, 100),
+                         (int(c + math.cos(ba)*ti), int(c + math.sin(ba)*ti)),
+                         (int(c + math.cos(ba)*size), int(c + math.sin(ba)*size)), 2)
+
+
+def _paint_magnet(surf, c, magnet_angle):
+    pygame.draw.circle(surf, (*MAGNET_COLOR, 50), (c, c), 14)
+    # U-shape oriented so its opening faces away from the player
+    face_angle = magnet_angle + math.pi
+    arm_len = 7
+    gap     = 5
+    for sign, pole_col in ((-1, (255, 80, 80)), (1, (80, 160, 255))):
+        perp = face_angle + sign * math.pi / 2
+        ax = c + math.cos(perp) * gap
+        ay = c + math.sin(perp) * gap
+        ex = ax + math.cos(face_angle) * arm_len
+        ey = ay + math.sin(face_angle) * arm_len
+        pygame.draw.line(surf, MAGNET_COLOR, (int(ax), int(ay)), (int(ex), int(ey)), 3)
+        pygame.draw.circle(surf, pole_col, (int(ex), int(ey)), 3)
+    # Bridge (closed end)
+    b_angle = face_angle + math.pi
+    b1x = c + math.cos(face_angle - math.pi/2) * gap + math.cos(b_angle) * 1
+    b1y = c + math.sin(face_angle - math.pi/2) * gap + math.sin(b_angle) * 1
+    b2x = c + math.cos(face_angle + math.pi/2) * gap + math.cos(b_angle) * 1
+    b2y = c + math.sin(face_angle + math.pi/2) * gap + math.sin(b_angle) * 1
+    pygame.draw.line(surf, MAGNET_COLOR, (int(b1x), int(b1y)), (int(b2x), int(b2y)), 3)
+
+
+# ---------------------------------------------------------------------------
+# Atlas
+# ---------------------------------------------------------------------------
+
+class ShipAtlas:
+    """Lazily built frames for the player ship, its orbital saws and magnet.
+
+    saw_colors — (body, rim) of the orbital saw
+
+    Usage::
+
+        atlas = ShipAtlas((C_ORBITAL, C_ORBITAL_RIM))
+        seq = []
+        atlas.add_ship(sx, sy, aim, thruster_anim, flash, dual_guns, seq)
+        screen.blits(seq, doreturn=False)
+    """
+
+    def __init__(self, saw_colors: tuple) -> None:
+        self.saw_colors = saw_colors
+        self._frames: dict = {}
+        self.frames_built = 0
+
+    def _get(self, key: tuple):
+        frame = self._frames.get(key)
+        if frame is None:
+            frame = self._frames[key] = self._build(key)
+            self.frames_built += 1
+        return frame
+
+    def _build(self, key: tuple):
+        kind = key[0]
+        c = _CANVAS
+        if kind == 'magnet':
+            surf = pygame.Surface((32, 32), pygame.SRCALPHA)
+            _paint_magnet(surf, 16, key[1] * TAU / ANGLE_STEPS)
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert_alpha()
+            return surf, (-16, -16)
+        canvas = _canvas()
+        if kind == 'tip':
+            _paint_tip(canvas, c, key[1])
+        elif kind == 'saw':
+            _, size, f = key
+            _paint_saw(canvas, c, size, f * (math.pi / 3) / SAW_FRAMES, *self.saw_colors)
+        else:
+            a = key[1] * TAU / ANGLE_STEPS
+            ca, sa = math.cos(a), math.sin(a)
+            if kind == 'exhaust':
+                _paint_exhaust(canvas, c, ca, sa, key[2] * TAU / THRUST_FRAMES)
+            else:
+                _paint_body(canvas, c, ca, sa, key[2], key[3])
+        return _crop(canvas, c)
+
+    def _put(self, key: tuple, x: int, y: int, out: list) -> None:
+        surf, (dx, dy) = self._frames.get(key) or self._get(key)
+        out.append((surf, (x + dx, y + dy)))
+
+    # ------------------------------------------------------------------
+    # Pieces
+    # ------------------------------------------------------------------
+
+    def add_ship(self, sx: int, sy: int, aim: float, thruster_anim: float,
+                 flash: bool, dual: int, out: list) -> None:
+        """Exhaust, body and cannon tip of a ship centred at (sx, sy)."""
+        step = angle_step(aim)
+        thrust = int((thruster_anim * 3.2) % TAU / TAU * THRUST_FRAMES) % THRUST_FRAMES
+        self._put(('exhaust', step, thrust), sx, sy, out)
+        self._put(('body', step, flash, dual), sx, sy, out)
+        a = step * TAU / ANGLE_STEPS
+        tip = round((math.sin(thruster_anim * 4.0) + 1) / 2 * (TIP_LEVELS - 1))
+        self._put(('tip', tip), int(sx + 27 * math.cos(a)), int(sy + 27 * math.sin(a)), out)
+
+    def add_saw(self, ox: int, oy: int, size: int, spin: float, out: list) -> None:
+        """One orbital saw of radius *size* centred at (ox, oy), teeth at *spin*."""
+        f = int(spin % (math.pi / 3) / (math.pi / 3) * SAW_FRAMES) % SAW_FRAMES
+        self._put(('saw', size, f), ox, oy, out)
+
+    def add_magnet(self, sx: int, sy: int, magnet_angle: float, out: list) -> None:
+        """The magnet orbiting a ship centred at (sx, sy)."""
+        mx = int(sx + math.cos(magnet_angle) * MAGNET_ORBIT)
+        my = int(sy + math.sin(magnet_angle) * MAGNET_ORBIT)
+        self._put(('magnet', angle_step(magnet_angle)), mx, my, out)
@@ -15,10 +15,12 @@ Improvements:
 """
 from __future__ import annotations
 
+import heapq
 import math
 import random
 import os
-import concurrent.futures
+import time
+from functools import partial
 
 import pygame
 
@@ -41,21 +43,68 @@ def _pkg_import(name: str):
     spec.loader.exec_module(mod)
     return mod
 
+def _root_import(dotted: str):
+    """Import a module by dotted name from the repository root (Utils.*, games.*).
+
+    The root is put on sys.path the same way the launcher does.
+    """
+    import importlib
+    import sys
+    root = os.path.dirname(os.path.dirname(_PKG_DIR))
+    if root not in sys.path:
+        sys.path.append(root)
+    return importlib.import_module(dotted)
+
+
+def _sim_module():
+    """The simulation-process module.  Spawned children locate their entry
+    point by module name, so it cannot go through _pkg_import."""
+    return _root_import("games.shooter.sim_process")
+
 _tilemap_mod      = _pkg_import("tilemap")
 _wall_renderer_mod = _pkg_import("wall_renderer")
 _helpers_mod      = _pkg_import("helpers")
 _save_mod         = _pkg_import("shooter_save")
+_spatial_mod      = _pkg_import("spatial")
+_jobs_mod         = _pkg_import("jobs")
+_quality_mod      = _pkg_import("quality")
+_horde_mod        = _pkg_import("horde")
+_sprites_mod      = _pkg_import("enemy_sprites")
+_patterns_mod     = _pkg_import("patterns")
+_hud_mod          = _pkg_import("hud")
+_items_mod        = _pkg_import("item_sprites")
+_crates_mod       = _pkg_import("crates")
+_ship_mod         = _pkg_import("ship_sprites")
+_vignette_mod     = _pkg_import("vignette")
+_drawbuf_mod      = _pkg_import("draw_buffer")
 
 Tilemap      = _tilemap_mod.Tilemap
 MapGenerator = _tilemap_mod.MapGenerator
 WallRenderer = _wall_renderer_mod.WallRenderer
+UniformGrid  = _spatial_mod.UniformGrid
+CircleIndex  = _spatial_mod.CircleIndex
+JobGraph     = _jobs_mod.JobGraph
+QualityGovernor = _quality_mod.QualityGovernor
+EnemyStore   = _horde_mod.EnemyStore
+EnemyAtlas   = _sprites_mod.EnemyAtlas
+ItemAtlas    = _items_mod.ItemAtlas
+CrateStore   = _crates_mod.CrateStore
+ShipAtlas    = _ship_mod.ShipAtlas
+Vignette     = _vignette_mod.Vignette
+DrawBuffer   = _drawbuf_mod.DrawBuffer
+HudLayer     = _hud_mod.HudLayer
+widget_surface = _hud_mod.widget_surface
+put          = _hud_mod.put
+FixedStep    = _root_import("Utils.fixed_step").FixedStep
+ParticleSystem = _root_import("Utils.particles").ParticleSystem
+TEXT_CACHE   = _root_import("Utils.text_cache").TEXT_CACHE
+Presenter    = _root_import("Utils.display").Presenter
+_canvas_mod  = _root_import("Utils.texture_canvas")
 
 distance_sq        = _helpers_mod.distance_sq
 normalize          = _helpers_mod.normalize
 angle_lerp         = _helpers_mod.angle_lerp
 angle_of           = _helpers_mod.angle_of
-spread_directions  = _helpers_mod.spread_directions
-ring_directions    = _helpers_mod.ring_directions
 circles_overlap    = _helpers_mod.circles_overlap
 rect_plane_overlap = _helpers_mod.rect_plane_overlap
 has_line_of_sight  = _helpers_mod.has_line_of_sight
@@ -75,6 +124,18 @@ CHUNK_SIZE       = 500
 WIN_KILLS        = 9999   # effectively endless survival
 
 MAX_ENEMIES      = 30
+
+# Horde mode: thousands of regular enemies, streamed in around the player and
+# no bosses.  SHOOTER_HORDE=1 uses HORDE_ENEMIES; any larger number is the cap.
+HORDE_ENV          = 'SHOOTER_HORDE'
+HORDE_ENEMIES      = 3000
+HORDE_SPAWN_BATCH  = 40     # enemies spawned per tick while under the cap
+
+# Timing — the simulation runs at TICK_HZ regardless of render rate; all
+# speeds, cooldowns and timers are per tick
+TICK_HZ          = 60
+MAX_CATCH_UP     = 5     # ticks run at most per rendered frame
+MAX_RENDER_FPS   = 120
 SPAWN_DELAY_BASE = 150
 SPAWN_DELAY_MIN  = 20
 SPAWN_KILLS_STEP = 3
@@ -84,6 +145,33 @@ MEGA_BOSS_INTERVAL = 50
 # Mini-boss spawns every this many kills
 MINI_BOSS_INTERVAL = 10
 
+# Set to 1 to run the simulation in a separate process (needs NumPy)
+SIM_PROCESS_ENV    = 'SHOOTER_SIM_PROCESS'
+
+# Adaptive quality: frame cost (update + draw) the governor tries to stay
+# under.  The environment variable overrides it in ms; 0 pins full quality.
+QUALITY_TARGET_MS  = 1000.0 / 60.0
+QUALITY_TARGET_ENV = 'SHOOTER_FRAME_TARGET_MS'
+
+# Player bullets fade out over their last BULLET_FADE frames, drawn from a
+# pre-baked ramp of BULLET_FADE_LEVELS brightness steps per colour
+BULLET_FADE        = 120
+BULLET_FADE_LEVELS = 16
+
+# Crates on the floor (crates.py): past this many, stale ones far from the
+# player merge into stacks.  The environment variable overrides it.
+ITEM_CAP           = 256
+ITEM_CAP_ENV       = 'SHOOTER_ITEM_CAP'
+
+# Drawing backend: 'surface' (software blits, the default) or 'sdl2', which
+# draws with textures on an SDL2 Renderer (Utils/texture_canvas.py)
+BACKEND_ENV        = 'SHOOTER_BACKEND'
+
+# Particle pool (Utils.particles); the quality level caps how many are kept
+PARTICLE_CAP       = 4096
+PARTICLE_DRAG      = 0.88
+PARTICLE_FADE      = 0.45   # brightness = life_frac ** FADE: vivid, then a sharp fade
+
 # Palette
 C_BG           = (18,  18,  32)
 C_GRID         = (28,  28,  48)
@@ -106,6 +194,8 @@ C_HEALTH_GREEN = (60,  240,  80)
 C_HEALTH_YEL   = (255, 210,  50)
 C_HEALTH_RED   = (255,  60,  60)
 
+BOSS_BAR_W     = 640
+
 # Enemy palettes
 ENEMY_STYLES = {
     'normal':  {'body': (220, 55, 55),   'rim': (255, 120, 120), 'dark': (140, 20, 20)},
@@ -125,6 +215,16 @@ BOSS_STYLES = {
 }
 BOSS_FINAL_STYLE = {'body': (220, 0, 80), 'rim': (255, 80, 180), 'dark': (100, 0, 40), 'name': 'OMEGA PRIME'}
 
+# Player damage from touching an enemy, by type; anything not listed deals 1
+CONTACT_DAMAGE = {'tank': 3}
+
+# Pre-rendered enemy frames, built per (type, size) on first draw
+ENEMY_ATLAS = EnemyAtlas(ENEMY_STYLES, BOSS_STYLES, _horde_mod.KINDS,
+                         (C_HEALTH_GREEN, C_HEALTH_YEL, C_HEALTH_RED))
+
+# Pre-rendered player ship, orbital saw and magnet frames, built on first draw
+SHIP_ATLAS = ShipAtlas((C_ORBITAL, C_ORBITAL_RIM))
+
 # Item visual config
 ITEM_CONFIG = {
     # Standard drops
@@ -140,6 +240,8 @@ ITEM_CONFIG = {
     'dual_gun':  {'color': (255, 100, 100), 'name': 'DUAL GUN',      'desc': 'DUAL',     'icon': 'dual_gun'},
     'magnet':    {'color': (100, 200, 255), 'name': 'MAGNET',        'desc': 'PULL',     'icon': 'magnet'},
 }
+# Stable item-type order, used as the type code in split-mode snapshots
+_ITEM_TYPES = tuple(ITEM_CONFIG)
 
 
 # ---------------------------------------------------------------------------
@@ -448,96 +550,15 @@ class Player:
         return True
 
     def draw(self, screen: pygame.Surface, cam_x, cam_y, frame: int = 0):
-        sx = int(self.x - cam_x)
-        sy = int(self.y - cam_y)
-        angle = angle_of(self.shoot_dir[0], self.shoot_dir[1])
-
         # Always tick thruster so idle engine pulses too
         self.thruster_anim += 0.18
-
-        ca = math.cos(angle)
-        sa = math.sin(angle)
-
-        def rot(lx, ly):
-            return (int(sx + lx*ca - ly*sa), int(sy + lx*sa + ly*ca))
-
-        def rpts(*pts):
-            return [rot(lx, ly) for lx, ly in pts]
-
         flash = self.invincible > 0 and (frame // 3) % 2 == 0
-
-        # ── Engine exhaust flames (drawn first, behind everything) ──
-        for ny in (-5, 0, 5):
-            pulse = 0.45 + 0.55 * math.sin(self.thruster_anim * 3.2 + ny * 0.28)
-            nozzle = rot(-20, ny)
-            pygame.draw.circle(screen, (38, 44, 60), nozzle, 4)
-            for fi in range(1, 4):
-                fl = int(fi * 5 * pulse)
-                fp = rot(-20 - fl, ny)
-                fc = (max(8, 25 - fi*6), max(55, 95 - fi*14), min(255, 175 + fi*22))
-                pygame.draw.circle(screen, fc, fp, max(1, 4 - fi))
-
-        # ── Left shoulder plate ──
-        lsh = rpts((-10, 12), (-4, 19), (6, 18), (8, 12), (2, 10))
-        pygame.draw.polygon(screen, (56, 48, 38) if not flash else (255,255,255), lsh)
-        pygame.draw.polygon(screen, (102, 88, 66), lsh, 2)
-        # shoulder bolt detail
-        pygame.draw.circle(screen, (80, 70, 54), rot(2, 15), 2)
-
-        # ── Right shoulder plate ──
-        rsh = rpts((-10,-12), (-4,-19), (6,-18), (8,-12), (2,-10))
-        pygame.draw.polygon(screen, (56, 48, 38) if not flash else (255,255,255), rsh)
-        pygame.draw.polygon(screen, (102, 88, 66), rsh, 2)
-        pygame.draw.circle(screen, (80, 70, 54), rot(2, -15), 2)
-
-        # ── Main hull ──
-        hull = rpts((-18,0), (-15,-9), (-4,-13), (6,-11), (6,11), (-4,13), (-15,9))
-        pygame.draw.polygon(screen, (48, 56, 80) if not flash else (220,230,255), hull)
-        pygame.draw.polygon(screen, (92, 108, 152), hull, 2)
-        # armor panel etch lines
-        if not flash:
-            pygame.draw.line(screen, (36, 42, 60), rot(-13,-5), rot(3,-8), 1)
-            pygame.draw.line(screen, (36, 42, 60), rot(-13, 5), rot(3,  8), 1)
-            pygame.draw.line(screen, (36, 42, 60), rot(-8,  0), rot(-2, 0), 1)
-
-        # ── Front chest plate ──
-        chest = rpts((4,-10), (4,10), (14,6), (16,0), (14,-6))
-        pygame.draw.polygon(screen, (65, 88, 136) if not flash else (255,255,255), chest)
-        pygame.draw.polygon(screen, (108, 140, 200), chest, 2)
-
-        # ── Cockpit lens ──
-        cock = rot(5, 0)
-        pygame.draw.circle(screen, (18, 175, 228) if not flash else (255,255,255), cock, 6)
-        pygame.draw.circle(screen, (120, 225, 255), cock, 4)
-        pygame.draw.circle(screen, (210, 248, 255), cock, 2)
-
-        # ── Main cannon ──
-        barrel = rpts((14,-4), (14,4), (27,3), (27,-3))
-        pygame.draw.polygon(screen, (60, 54, 46) if not flash else (255,255,255), barrel)
-        pygame.draw.polygon(screen, (105, 96, 80), barrel, 1)
-        # segment rings
-        for cx_l in (18, 22):
-            pygame.draw.line(screen, (88, 80, 68), rot(cx_l, -3), rot(cx_l, 3), 1)
-        # muzzle ring
-        pygame.draw.circle(screen, (78, 70, 58), rot(27, 0), 4)
-        # glowing tip
-        tip_pulse = 0.7 + 0.3 * math.sin(self.thruster_anim * 4.0)
-        tip = rot(27, 0)
-        pygame.draw.circle(screen, (255, int(190 + 50*tip_pulse), 40), tip, 3)
-        pygame.draw.circle(screen, (255, 240, 160), tip, 1)
-
-        # ── Dual side guns (one pair per stack) ──
-        if self.has_dual_gun:
-            for gn in range(self.dual_gun_count):
-                off = 10 + gn * 10
-                for sign in (-1, 1):
-                    sy2 = sign * off
-                    side = rpts((8,sy2-2),(8,sy2+2),(22,sy2+1),(22,sy2-1))
-                    pygame.draw.polygon(screen, (60, 54, 46) if not flash else (255,255,255), side)
-                    pygame.draw.polygon(screen, (95, 86, 72), side, 1)
-                    stip = rot(22, sy2)
-                    pygame.draw.circle(screen, (255, 170, 30), stip, 3)
-
+        seq: list = []
+        SHIP_ATLAS.add_ship(int(self.x - cam_x), int(self.y - cam_y),
+                            angle_of(self.shoot_dir[0], self.shoot_dir[1]),
+                            self.thruster_anim, flash,
+                            self.dual_gun_count if self.has_dual_gun else 0, seq)
+        screen.blits(seq, doreturn=False)
 
     def draw_orbital(self, screen: pygame.Surface, cam_x, cam_y, frame: int = 0):
         if not self.has_orbital:
@@ -545,41 +566,25 @@ class Player:
         sx, sy = int(self.x - cam_x), int(self.y - cam_y)
         count = self.orbital_count
         size  = max(4, 14 - count)          # shrinks by 1 per extra saw, floor at 4
-        ti    = max(2, int(size * 0.65))     # inner tooth radius
+        seq: list = []
         for i in range(count):
             a = self.orbital_angle + i * 2 * math.pi / count
             ox = int(sx + math.cos(a) * 55)
             oy = int(sy + math.sin(a) * 55)
-            # Saw body
-            pygame.draw.circle(screen, C_ORBITAL, (ox, oy), size)
-            pygame.draw.circle(screen, C_ORBITAL_RIM, (ox, oy), size, 2)
-            # Spinning teeth
-            spin = frame * 0.18 + i
-            for j in range(6):
-                ba = spin + j * math.pi / 3
-                pygame.draw.line(screen, (255, 240, 100),
-                                 (int(ox + math.cos(ba)*ti), int(oy + math.sin(ba)*ti)),
-                                 (int(ox + math.cos(ba)*size), int(oy + math.sin(ba)*size)), 2)
-
-    def update_magnet(self, items: list):
+            SHIP_ATLAS.add_saw(ox, oy, size, frame * 0.18 + i, seq)   # spinning teeth
+        screen.blits(seq, doreturn=False)
+
+    def magnet_pull(self) -> tuple[float, float]:
+        """(pull range, pull speed) of the magnet; (0, 0) without one."""
+        if not self.magnet_count:
+            return 0.0, 0.0
+        return 200.0 + self.magnet_count * 250.0, 3.5 + self.magnet_count * 0.5
+
+    def update_magnet(self, nearest_angle: float | None):
+        """Orbit slowly, but snap toward the nearest pulled crate when there is one."""
         if not self.magnet_count:
             return
-        PULL_RANGE = 200.0 + self.magnet_count * 250.0
-        PULL_SPEED = 3.5 + self.magnet_count * 0.5
-        nearest_dist = float('inf')
-        nearest_angle = self.magnet_angle
-        for item in items:
-            dx, dy = item.x - self.x, item.y - self.y
-            dist = math.sqrt(dx*dx + dy*dy)
-            if dist < PULL_RANGE and dist > 0:
-                # Pull crate toward player
-                item.x -= dx / dist * PULL_SPEED
-                item.y -= dy / dist * PULL_SPEED
-                if dist < nearest_dist:
-                    nearest_dist = dist
-                    nearest_angle = math.atan2(dy, dx)
-        # Orbit slowly, but snap toward nearest crate when one is in range
-        if nearest_dist < PULL_RANGE:
+        if nearest_angle is not None:
             self.magnet_angle = angle_lerp(self.magnet_angle, nearest_angle, 0.12)
         else:
             self.magnet_angle += 0.04
@@ -587,40 +592,9 @@ class Player:
     def draw_magnet(self, screen: pygame.Surface, cam_x, cam_y):
         if not self.magnet_count:
             return
-        sx, sy = int(self.x - cam_x), int(self.y - cam_y)
-        ORBIT_R = 38
-        mx = int(sx + math.cos(self.magnet_angle) * ORBIT_R)
-        my = int(sy + math.sin(self.magnet_angle) * ORBIT_R)
-
-        # Glow (cached)
-        if not hasattr(self, '_magnet_glow'):
-            self._magnet_glow = pygame.Surface((32, 32), pygame.SRCALPHA)
-            pygame.draw.circle(self._magnet_glow, (100, 200, 255, 50), (16, 16), 14)
-        screen.blit(self._magnet_glow, (mx - 16, my - 16))
-
-        # U-shape magnet body — oriented so the opening faces outward from player
-        # Rotate the U so its opening points away from centre
-        face_angle = self.magnet_angle + math.pi  # opening faces away from player
-        arm_len = 7
-        gap     = 5
-        for sign, pole_col in ((-1, (255, 80, 80)), (1, (80, 160, 255))):
-            # Perpendicular offset for each arm
-            perp = face_angle + sign * math.pi / 2
-            ax = mx + math.cos(perp) * gap
-            ay = my + math.sin(perp) * gap
-            # Arm end (opening)
-            ex = ax + math.cos(face_angle) * arm_len
-            ey = ay + math.sin(face_angle) * arm_len
-            pygame.draw.line(screen, (100, 200, 255), (int(ax), int(ay)), (int(ex), int(ey)), 3)
-            # Pole tip colour
-            pygame.draw.circle(screen, pole_col, (int(ex), int(ey)), 3)
-        # Bridge (closed end)
-        b_angle = face_angle + math.pi
-        b1x = mx + math.cos(face_angle - math.pi/2) * gap + math.cos(b_angle) * 1
-        b1y = my + math.sin(face_angle - math.pi/2) * gap + math.sin(b_angle) * 1
-        b2x = mx + math.cos(face_angle + math.pi/2) * gap + math.cos(b_angle) * 1
-        b2y = my + math.sin(face_angle + math.pi/2) * gap + math.sin(b_angle) * 1
-        pygame.draw.line(screen, (100, 200, 255), (int(b1x), int(b1y)), (int(b2x), int(b2y)), 3)
+        seq: list = []
+        SHIP_ATLAS.add_magnet(int(self.x - cam_x), int(self.y - cam_y), self.magnet_angle, seq)
+        screen.blits(seq, doreturn=False)
 
     def get_fire_rate_pct(self) -> int:
         stacks = round((self.BASE_FIRE_RATE - self.fire_rate) / 1.5)
@@ -634,7 +608,7 @@ class Player:
 class Bullet:
     __slots__ = ('x', 'y', 'dir', 'speed', 'size', 'damage',
                  'bounces_left', 'max_bounces', 'pierce_left', 'max_pierce',
-                 'lifetime', 'last_bounce_frame', 'hit_enemies')
+                 'lifetime', 'last_bounce_frame', 'hit_mask', 'ramp_base')
 
     SPEED    = 10
     SIZE     = 5
@@ -657,7 +631,9 @@ class Bullet:
         self.max_pierce   = pierce
         self.lifetime     = self.LIFETIME
         self.last_bounce_frame = -1
-        self.hit_enemies: set[int] = set()
+        self.hit_mask     = 0   # bit n set → already pierced the enemy in slot n
+        # First surface of this bullet's colour class in ShooterGame._bullet_ramp
+        self.ramp_base    = BULLET_FADE_LEVELS * (2 if pierce > 0 else (1 if bounces > 0 else 0))
 
     def update(self):
         self.x += self.dir[0] * self.speed
@@ -697,6 +673,14 @@ class Bullet:
 # Enemy Bullet
 # ---------------------------------------------------------------------------
 
+# Per-frame lerp factor pulling a homing bullet's heading toward the player
+HOMING_TURN = 0.04
+
+# (speed, size) by bullet_type; a cannon ball is a 'normal' bullet with is_cannon set
+EBULLET_STATS = {'laser': (14, 6), 'mortar': (3, 14), 'homing': (5, 7), 'snipe': (18, 6),
+                 'cannon': (4, 12), 'normal': (6, 6)}
+
+
 class EnemyBullet:
     __slots__ = ('x', 'y', 'dir', 'speed', 'size', 'is_cannon', 'bullet_type',
                  'lifetime', '_homing_target')
@@ -707,14 +691,26 @@ class EnemyBullet:
         self.is_cannon   = is_cannon
         self.bullet_type = bullet_type
         self.lifetime    = lifetime
-        if   bullet_type == 'laser':    self.speed, self.size = 14, 6
-        elif bullet_type == 'mortar':   self.speed, self.size = 3, 14
-        elif bullet_type == 'homing':   self.speed, self.size = 5, 7
-        elif bullet_type == 'snipe':    self.speed, self.size = 18, 6
-        elif is_cannon:                 self.speed, self.size = 4, 12
-        else:                           self.speed, self.size = 6, 6
+        self.speed, self.size = EBULLET_STATS.get(
+            'cannon' if is_cannon and bullet_type == 'normal' else bullet_type, EBULLET_STATS['normal'])
         self._homing_target = None
 
+    @classmethod
+    def volley(cls, out: list, x, y, directions, bullet_type='normal', is_cannon=False,
+               lifetime=220) -> None:
+        """Append one bullet per (dx, dy) in *directions*, all of one type, to *out*.
+        The bulk emitter behind patterns.fire: the type is resolved once."""
+        speed, size = EBULLET_STATS.get(
+            'cannon' if is_cannon and bullet_type == 'normal' else bullet_type, EBULLET_STATS['normal'])
+        x, y = float(x), float(y)
+        new  = cls.__new__
+        for dx, dy in directions:
+            b = new(cls)
+            b.x, b.y, b.dir = x, y, [dx, dy]
+            b.is_cannon, b.bullet_type, b.lifetime = is_cannon, bullet_type, lifetime
+            b.speed, b.size, b._homing_target = speed, size, None
+            out.append(b)
+
     def update(self, px: float = 0, py: float = 0):
         self.lifetime -= 1
         if self.bullet_type == 'homing':
@@ -723,8 +719,8 @@ class EnemyBullet:
             dist = math.sqrt(tdx*tdx + tdy*tdy)
             if dist > 0:
                 tdx /= dist; tdy /= dist
-                self.dir[0] = lerp(self.dir[0], tdx, 0.04)
-                self.dir[1] = lerp(self.dir[1], tdy, 0.04)
+                self.dir[0] = lerp(self.dir[0], tdx, HOMING_TURN)
+                self.dir[1] = lerp(self.dir[1], tdy, HOMING_TURN)
                 self.dir[0], self.dir[1] = normalize(self.dir[0], self.dir[1])
         self.x += self.dir[0] * self.speed
         self.y += self.dir[1] * self.speed
@@ -744,48 +740,40 @@ def lerp(a, b, t):
     return a + (b-a)*t
 
 
-# ---------------------------------------------------------------------------
-# Particle
-# ---------------------------------------------------------------------------
-
-class Particle:
-    __slots__ = ('x', 'y', 'vx', 'vy', 'life', 'max_life', 'color', 'size')
-
-    def __init__(self, x, y, vx, vy, color, size=3, life=30):
-        self.x, self.y   = float(x), float(y)
-        self.vx, self.vy = float(vx), float(vy)
-        self.color       = color
-        self.size        = size
-        self.life        = life
-        self.max_life    = life
-
-    def update(self):
-        self.x  += self.vx
-        self.y  += self.vy
-        self.vx *= 0.88
-        self.vy *= 0.88
-        self.life -= 1
-
-    def draw(self, screen: pygame.Surface, cam_x, cam_y):
-        frac = self.life / self.max_life
-        bright = frac ** 0.45   # stays vivid longer, then fades sharply at end
-        r = int(self.color[0] * bright)
-        g = int(self.color[1] * bright)
-        b = int(self.color[2] * bright)
-        sx = int(self.x - cam_x)
-        sy = int(self.y - cam_y)
-        r2 = max(1, int(self.size * frac))
-        pygame.draw.circle(screen, (r, g, b), (sx, sy), r2)
-
-
-def _spawn_particles(x, y, color, count=14, speed=4.0, size=4, life=35) -> list[Particle]:
-    """Burst of particles at (x, y) in random directions."""
-    out = []
-    for _ in range(count):
-        a  = random.uniform(0, math.pi * 2)
-        sp = random.uniform(speed * 0.4, speed)
-        out.append(Particle(x, y, math.cos(a)*sp, math.sin(a)*sp, color, size, life))
-    return out
+def _rank_in_runs(ids):
+    """For a sorted id array, the 0-based position of each element within its run."""
+    n = len(ids)
+    if n == 0:
+        return _np.empty(0, dtype=_np.int64)
+    idx    = _np.arange(n, dtype=_np.int64)
+    starts = _np.r_[True, ids[1:] != ids[:-1]]
+    return idx - _np.maximum.accumulate(_np.where(starts, idx, 0))
+
+
+def steer_homing_batch(xs, ys, dxs, dys, px: float, py: float, turn: float = HOMING_TURN):
+    """Vectorised EnemyBullet.update steering for arrays of homing bullets.
+
+    Lerps each (dxs, dys) heading toward the unit vector pointing at (px, py)
+    and renormalises, in place.  Matches the scalar path exactly: bullets
+    sitting on the player keep their heading, and a heading that lerps to
+    zero length collapses to (0, 0) like helpers.normalize.
+    """
+    tdx = px - xs
+    tdy = py - ys
+    dist = _np.sqrt(tdx * tdx + tdy * tdy)
+    steer = dist > 0
+    if not _np.any(steer):
+        return
+    inv = _np.zeros_like(dist)
+    inv[steer] = 1.0 / dist[steer]
+    ndx = dxs + (tdx * inv - dxs) * turn
+    ndy = dys + (tdy * inv - dys) * turn
+    ln  = _np.sqrt(ndx * ndx + ndy * ndy)
+    ok  = ln > 0
+    inv_ln = _np.zeros_like(ln)
+    inv_ln[ok] = 1.0 / ln[ok]
+    dxs[steer] = (ndx * inv_ln)[steer]
+    dys[steer] = (ndy * inv_ln)[steer]
 
 
 # ---------------------------------------------------------------------------
@@ -794,6 +782,7 @@ def _spawn_particles(x, y, color, count=14, speed=4.0, size=4, life=35) -> list[
 
 class Popup:
     FONT: pygame.font.Font | None = None
+    RISE = 1.2      # pixels per tick
 
     def __init__(self, text, x, y, color):
         self.text = text
@@ -810,20 +799,16 @@ class Popup:
 
     def update(self):
         self.lifetime -= 1
-        self.y -= 1.2
+        self.y -= self.RISE
         self.alpha = int(255 * max(0, self.lifetime / 70))
 
-    def draw(self, screen, cam_x, cam_y):
-        font = self.get_font()
-        sx = int(self.x - cam_x)
-        sy = int(self.y - cam_y)
-        s = font.render(self.text, True, self.color)
-        s.set_alpha(self.alpha)
-        sh = font.render(self.text, True, (0,0,0))
-        sh.set_alpha(self.alpha//2)
-        cx = sx - s.get_width()//2
-        screen.blit(sh, (cx+2, sy+2))
-        screen.blit(s,  (cx,   sy))
+    def draw(self, screen, cam_x, cam_y, back: float = 0.0):
+        """back: fraction of a tick to draw it below its current height."""
+        # Cached per text, colour and fade step, shadow at half strength baked in
+        s = TEXT_CACHE.render(self.get_font(), self.text, self.color, shadow=(0, 0, 0, 128),
+                              alpha=self.alpha)
+        screen.blit(s, (int(self.x - cam_x) - (s.get_width() - 2)//2,
+                        int(self.y + self.RISE * back - cam_y)))
 
 
 # ---------------------------------------------------------------------------
@@ -967,81 +952,12 @@ class Item:
         self.desc  = cfg['desc']
         self.size  = self.CRATE_SIZE
         self.bob   = random.uniform(0, math.pi*2)   # phase for bob animation
-        self._icon_surf: pygame.Surface | None = None
-        self._border_surf: pygame.Surface | None = None
-        self._glow_surf: pygame.Surface | None = None
-        self._label_surf: pygame.Surface | None = None
-        self._label_bg_surf: pygame.Surface | None = None
-
-    def _get_icon_surf(self) -> pygame.Surface:
-        if self._icon_surf is None:
-            s = self.size
-            surf = pygame.Surface((s*2, s*2), pygame.SRCALPHA)
-            fn = _ICON_DRAW.get(self.type)
-            if fn:
-                try:
-                    fn(surf, s, s, self.color, int(s*0.6))
-                except Exception:
-                    pass
-            self._icon_surf = surf
-        return self._icon_surf
-
-    def _build_crate_surfs(self):
-        s = self.size
-        c = self.color
-        # Border glow (SRCALPHA, built once)
-        bs = pygame.Surface((s*2+4, s*2+4), pygame.SRCALPHA)
-        pygame.draw.rect(bs, (*c, 200), bs.get_rect(), 2, border_radius=8)
-        self._border_surf = bs
-        # Glow (SRCALPHA, fixed alpha, built once)
-        gsize = s + 10
-        gs = pygame.Surface((gsize*2+4, gsize*2+4), pygame.SRCALPHA)
-        pygame.draw.rect(gs, (*c, 28), (2, 2, gsize*2, gsize*2), border_radius=8)
-        self._glow_surf = gs
-        self._glow_off  = gsize
-        # Label
-        font = _label_font()
-        lbl = font.render(self.name, True, c)
-        self._label_surf = lbl
-        bg_w, bg_h = lbl.get_width()+6, lbl.get_height()+2
-        lbg = pygame.Surface((bg_w, bg_h), pygame.SRCALPHA)
-        pygame.draw.rect(lbg, (0, 0, 0, 160), lbg.get_rect(), border_radius=3)
-        self._label_bg_surf = lbg
 
-    def draw(self, screen: pygame.Surface, cam_x, cam_y):
-        self.bob += 0.04
-        bob_y = math.sin(self.bob) * 4
-        sx = int(self.x - cam_x)
-        sy = int(self.y - cam_y + bob_y)
-        s  = self.size
-        c  = self.color
-
-        # Build cached surfaces on first draw
-        if self._border_surf is None:
-            self._build_crate_surfs()
-
-        # Glow (fixed alpha cached surf)
-        go = self._glow_off
-        screen.blit(self._glow_surf, (sx-go-2, sy-go-2))
-
-        # Crate body — rounded square
-        crate_rect = pygame.Rect(sx-s, sy-s, s*2, s*2)
-        pygame.draw.rect(screen, (20, 22, 38), crate_rect, border_radius=7)
-        # Colored border glow (cached)
-        screen.blit(self._border_surf, (sx-s-2, sy-s-2))
-        # Inner accent lines
-        pygame.draw.line(screen, (*c, 80), (sx-s+4, sy-s+2), (sx+s-4, sy-s+2), 1)
-        pygame.draw.line(screen, (*c, 80), (sx-s+2, sy-s+4), (sx-s+2, sy+s-4), 1)
-
-        # Icon
-        icon = self._get_icon_surf()
-        screen.blit(icon, (sx - s, sy - s))
-
-        # Label (cached)
-        lbl = self._label_surf
-        lbg = self._label_bg_surf
-        screen.blit(lbg, (sx - lbg.get_width()//2, sy+s+4))
-        screen.blit(lbl, (sx - lbl.get_width()//2,  sy+s+5))
+    def draw(self, screen: pygame.Surface, cam_x, cam_y, glow: bool = True, label: bool = True):
+        """Draw this crate alone; the game batches all of them through ITEM_ATLAS."""
+        seq: list = []
+        ITEM_ATLAS.add(self, cam_x, cam_y, seq, glow, label)
+        screen.blits(seq, doreturn=False)
 
     def apply_to(self, player: Player) -> None:
         if   self.type == 'firerate':  player.fire_rate       = max(0.0, player.fire_rate - 1.5)
@@ -1055,6 +971,58 @@ class Item:
         elif self.type == 'health':    player.health = min(player.MAX_HEALTH, player.health + 1)
 
 
+# One baked crate sprite (and label) per item type, shared by every Item;
+# ShooterGame bakes them all up front
+ITEM_ATLAS = ItemAtlas(ITEM_CONFIG, _ICON_DRAW, Item.CRATE_SIZE, _label_font, TEXT_CACHE.render)
+
+
+# ---------------------------------------------------------------------------
+# Enemy slots — small stable ids for per-bullet pierce bitmasks
+# ---------------------------------------------------------------------------
+
+class SlotAllocator:
+    """Hands out the lowest free small integer to each live enemy.
+
+    Slots stay fixed for an enemy's lifetime and are recycled once it is gone,
+    so they stay small enough for a 64-bit mask in normal play.  Unlike id(),
+    a freed slot is never silently reused while a bullet still remembers it —
+    retain() reports the freed bits so callers can clear them first.
+    """
+
+    def __init__(self) -> None:
+        self._used: set[int] = set()
+        self._free: list[int] = []   # min-heap of recycled slots below _next
+        self._next = 0
+
+    def acquire(self) -> int:
+        if self._free:
+            slot = heapq.heappop(self._free)
+        else:
+            slot = self._next
+            self._next += 1
+        self._used.add(slot)
+        return slot
+
+    def retain(self, live: set[int]) -> int:
+        """Free every slot not in *live*; return the freed slots as a bitmask."""
+        freed = 0
+        for slot in self._used - live:
+            freed |= 1 << slot
+            self._used.discard(slot)
+            heapq.heappush(self._free, slot)
+        # Lower the high-water mark so fits_u64() recovers once a crowd thins out
+        top = self._next
+        while self._next > 0 and (self._next - 1) not in self._used:
+            self._next -= 1
+        if self._next != top:
+            self._free = [slot for slot in self._free if slot < self._next]
+            heapq.heapify(self._free)
+        return freed
+
+    def fits_u64(self) -> bool:
+        return self._next <= 64
+
+
 # ---------------------------------------------------------------------------
 # Enemy — distinct graphics per type + unique attack sets
 # ---------------------------------------------------------------------------
@@ -1119,6 +1087,9 @@ class Enemy:
         # Fast: track angle toward player (updated in update())
         self.face_angle = random.uniform(0, math.pi * 2)
 
+        # Small stable integer id, assigned by ShooterGame while the enemy is live
+        self.slot = -1
+
     def update(self, px, py, chunk_manager: ChunkManager, has_los: bool):
         self.anim_timer += 1
         self.anim_angle += 0.05
@@ -1184,298 +1155,43 @@ class Enemy:
         return (self.is_boss or self.enemy_type in ('shooter', 'tank')) \
                and self.shoot_cooldown == 0
 
-    def shoot(self, px, py) -> list[EnemyBullet]:
+    def shoot(self, px, py, out: list | None = None) -> list[EnemyBullet]:
+        """Fire this enemy's current attack at (px, py), appending the bullets
+        to *out* (a new list if None), which is returned."""
         self.shoot_cooldown = self.shoot_rate
+        if out is None:
+            out = []
         dx, dy = px - self.x, py - self.y
-        dist = math.sqrt(dx*dx + dy*dy)
-        if dist == 0: return []
-        base = [dx/dist, dy/dist]
-        base_angle = angle_of(dx, dy)
-        pt = self.pattern_timer
-        bullets = []
-
-        def B(direction, btype='normal', is_cannon=False, lifetime=220):
-            return EnemyBullet(self.x, self.y, list(direction),
-                               is_cannon=is_cannon, bullet_type=btype, lifetime=lifetime)
-
-        # ---- Non-boss typed attacks ----
+        if dx == 0 and dy == 0:
+            return out
         if not self.is_boss:
-            if self.enemy_type == 'shooter':
-                # Triple burst with slight spread
-                for d in spread_directions(*base, 3, 0.25):
-                    bullets.append(B(d))
-            elif self.enemy_type == 'tank':
-                # Cannon ball + two flanking mortars
-                bullets.append(B(base, is_cannon=True))
-                for sign in (-1, 1):
-                    a = base_angle + sign*0.5
-                    bullets.append(B((math.cos(a), math.sin(a)), btype='mortar'))
-            return bullets
-
-        # ---- Per-boss attack sets ----
-        if self.is_final:
-            FINAL = [
-                # Pattern 0: massive spread + homing ring
-                lambda: [B(d) for d in spread_directions(*base, 14, 1.8)]
-                       + [B(d, 'homing') for d in ring_directions(6, pt*0.05)],
-                # Pattern 1: rotating double ring
-                lambda: [B(d) for d in ring_directions(8, pt*0.1)]
-                       + [B(d) for d in ring_directions(8, pt*0.1+math.pi/8)],
-                # Pattern 2: snipe burst + ring
-                lambda: [B(d,'snipe') for d in ring_directions(4)]
-                       + [B(d) for d in spread_directions(*base, 18, 1.9)],
-                # Pattern 3: homing swarm + mortar ring
-                lambda: [B(d,'homing') for d in ring_directions(10, pt*0.08)]
-                       + [B(d,'mortar') for d in ring_directions(5)],
-                # Pattern 4: laser cross + spread
-                lambda: [B(d,'laser') for d in ring_directions(4)]
-                       + [B(d) for d in spread_directions(*base, 20, 2.0)],
-            ]
-            idx = self.attack_pattern % len(FINAL)
-            return FINAL[idx]()
-
-        # Mini bosses with per-boss-id flavour
-        MINI = {
-            1: [  # VOIDCALLER — homing + ring
-                lambda: [B(d,'homing') for d in ring_directions(6, pt*0.06)],
-                lambda: [B(d) for d in spread_directions(*base, 7, 1.4)],
-                lambda: [B(d,'homing') for d in ring_directions(4)] + [B(d) for d in ring_directions(4, math.pi/4)],
-                lambda: [B(d) for d in ring_directions(10, pt*0.08)],
-            ],
-            2: [  # INFERNAX — mortar + laser
-                lambda: [B(d,'mortar') for d in ring_directions(6)],
-                lambda: [B(d,'laser')  for d in spread_directions(*base, 5, 1.0)],
-                lambda: [B(d,'mortar') for d in ring_directions(4, pt*0.05)] + [B(base,'laser')],
-                lambda: [B(d,'laser')  for d in ring_directions(8, pt*0.1)],
-            ],
-            3: [  # GLACIUS — sniper beams
-                lambda: [B(d,'snipe') for d in spread_directions(*base, 3, 0.6)],
-                lambda: [B(d,'snipe') for d in ring_directions(4, pt*0.07)],
-                lambda: [B(d) for d in ring_directions(12)] + [B(d,'snipe') for d in ring_directions(4, math.pi/4)],
-                lambda: [B(d,'snipe') for d in ring_directions(6, pt*0.04)],
-            ],
-            4: [  # SOLARCH — cannon + spread
-                lambda: [B(d, is_cannon=True) for d in ring_directions(4)],
-                lambda: [B(d) for d in spread_directions(*base, 10, 1.6)],
-                lambda: [B(d, is_cannon=True) for d in spread_directions(*base, 4, 1.0)],
-                lambda: [B(d) for d in ring_directions(14, pt*0.09)],
-            ],
-            5: [  # NECRAXIS — homing swarm
-                lambda: [B(d,'homing') for d in ring_directions(8, pt*0.07)],
-                lambda: [B(d,'homing') for d in spread_directions(*base, 12, 1.7)],
-                lambda: [B(d,'mortar') for d in ring_directions(6)] + [B(d,'homing') for d in ring_directions(4, math.pi/6)],
-                lambda: [B(d,'homing') for d in ring_directions(10, pt*0.05)],
-            ],
-            6: [  # ABYSSTIDE — deep-water slow death waves
-                lambda: [B(d) for d in ring_directions(16, pt*0.04)],
-                lambda: [B(d,'mortar') for d in ring_directions(8, pt*0.06)] + [B(d,'homing') for d in ring_directions(4)],
-                lambda: [B(d,'laser') for d in spread_directions(*base, 8, 1.8)],
-                lambda: [B(d) for d in ring_directions(12)] + [B(d,'mortar') for d in ring_directions(6, math.pi/6)],
-            ],
-            7: [  # WRATHBORN — rage-fueled spread
-                lambda: [B(d) for d in spread_directions(*base, 16, 2.0)],
-                lambda: [B(d,'laser') for d in ring_directions(6, pt*0.08)] + [B(d) for d in ring_directions(6, math.pi/6)],
-                lambda: [B(d,'snipe') for d in spread_directions(*base, 4, 0.5)] + [B(d,'homing') for d in ring_directions(8)],
-                lambda: [B(d) for d in ring_directions(20, pt*0.06)],
-            ],
-            8: [  # VIRULEX — infectious spread clusters
-                lambda: [B(d,'homing') for d in ring_directions(12, pt*0.05)],
-                lambda: [B(d,'mortar') for d in spread_directions(*base, 6, 1.2)] + [B(d,'snipe') for d in ring_directions(4)],
-                lambda: [B(d) for d in ring_directions(18, pt*0.07)],
-                lambda: [B(d,'laser') for d in ring_directions(8, pt*0.1)] + [B(d,'homing') for d in spread_directions(*base, 6, 1.0)],
-            ],
-        }
-        fns = MINI.get(self.boss_id, MINI[1])
-        idx = self.attack_pattern % len(fns)
-        return fns[idx]()
+            pattern = _patterns_mod.COMPILED_ENEMY.get(self.enemy_type)
+            if pattern is None:
+                return out
+        elif self.is_final:
+            pats = _patterns_mod.COMPILED_FINAL
+            pattern = pats[self.attack_pattern % len(pats)]
+        else:
+            mini = _patterns_mod.COMPILED_MINI
+            pats = mini.get(self.boss_id, mini[1])
+            pattern = pats[self.attack_pattern % len(pats)]
+        return _patterns_mod.fire(pattern, self.x, self.y, angle_of(dx, dy), self.pattern_timer,
+                                  EnemyBullet.volley, out)
 
     # ------------------------------------------------------------------
     # Drawing — distinct visuals per enemy type
     # ------------------------------------------------------------------
 
-    def draw(self, screen: pygame.Surface, cam_x, cam_y):
+    def draw(self, screen: pygame.Surface, cam_x, cam_y, detail: bool = True):
         sx = int(self.x - cam_x)
         sy = int(self.y - cam_y)
-        t = self.enemy_type
-
-        if self.is_final:
+        seq: list = []
+        if ENEMY_ATLAS.add(self, sx, sy, seq, detail, cam_x, cam_y):
+            screen.blits(seq, doreturn=False)
+        else:
             self._draw_final_boss(screen, sx, sy)
-        elif self.is_boss:
-            self._draw_mini_boss(screen, sx, sy)
-        elif t == 'normal':
-            self._draw_normal(screen, sx, sy)
-        elif t == 'fast':
-            self._draw_fast(screen, sx, sy)
-        elif t == 'tank':
-            self._draw_tank(screen, sx, sy)
-        elif t == 'shooter':
-            self._draw_shooter(screen, sx, sy)
-
         self._draw_healthbar(screen, sx, sy)
 
-    def _draw_normal(self, screen, sx, sy):
-        style = ENEMY_STYLES['normal']
-        s = self.size
-        # Outer hexagon
-        pts = [(sx + math.cos(self.anim_angle + i*math.pi/3)*s,
-                sy + math.sin(self.anim_angle + i*math.pi/3)*s) for i in range(6)]
-        pygame.draw.polygon(screen, style['dark'], pts)
-        # Inner filled hex (slightly smaller)
-        inner = [(sx + math.cos(self.anim_angle + i*math.pi/3)*(s-4),
-                  sy + math.sin(self.anim_angle + i*math.pi/3)*(s-4)) for i in range(6)]
-        pygame.draw.polygon(screen, style['body'], inner)
-        pygame.draw.polygon(screen, style['rim'],  pts, 2)
-        # Inner triangle counter-rotating
-        for i in range(3):
-            a = -self.anim_angle * 1.5 + i * 2*math.pi/3
-            pygame.draw.line(screen, style['dark'],
-                             (sx, sy),
-                             (int(sx + math.cos(a)*(s-6)), int(sy + math.sin(a)*(s-6))), 2)
-        # Pulsing eye
-        pulse = 4 + int(2 * math.sin(self.anim_timer * 0.15))
-        pygame.draw.circle(screen, (255, 60, 60), (sx, sy), pulse)
-        pygame.draw.circle(screen, (255, 200, 200), (sx, sy), max(1, pulse-2))
-
-    def _draw_fast(self, screen, sx, sy):
-        style = ENEMY_STYLES['fast']
-        s = self.size
-        # Always face the player; during dash use locked dash direction
-        a = math.atan2(self.dash_dir[1], self.dash_dir[0]) if self.is_dashing else self.face_angle
-        # Pre-dash telegraph: tighten/brighten slightly when dash is ready
-        ready = (not self.is_dashing and self.dash_cooldown <= 0)
-        # Motion-blur ghost trails (only while dashing)
-        trail_pts = self.dash_trail if self.is_dashing else []
-        for i, (tx, ty) in enumerate(trail_pts):
-            frac = (i + 1) / max(len(trail_pts), 1)
-            c = style['body']
-            tc = (int(c[0]*frac*0.4), int(c[1]*frac*0.4), int(c[2]*frac*0.4))
-            pygame.draw.circle(screen, tc, (int(tx), int(ty)), max(1, int(s*frac+1)))
-        # Arrowhead body — sharper, two-tone
-        pts_outer = [
-            (sx + math.cos(a)*s*1.5,           sy + math.sin(a)*s*1.5),
-            (sx + math.cos(a+2.3)*s,            sy + math.sin(a+2.3)*s),
-            (sx + math.cos(a+math.pi)*s*0.45,   sy + math.sin(a+math.pi)*s*0.45),
-            (sx + math.cos(a-2.3)*s,            sy + math.sin(a-2.3)*s),
-        ]
-        pts_inner = [
-            (sx + math.cos(a)*s*0.9,            sy + math.sin(a)*s*0.9),
-            (sx + math.cos(a+2.3)*s*0.55,       sy + math.sin(a+2.3)*s*0.55),
-            (sx + math.cos(a+math.pi)*s*0.3,    sy + math.sin(a+math.pi)*s*0.3),
-            (sx + math.cos(a-2.3)*s*0.55,       sy + math.sin(a-2.3)*s*0.55),
-        ]
-        pygame.draw.polygon(screen, style['dark'], pts_outer)
-        pygame.draw.polygon(screen, style['body'], pts_inner)
-        pygame.draw.polygon(screen, style['rim'],  pts_outer, 2)
-        # Speed lines behind (only while dashing)
-        if self.is_dashing:
-            for i in range(4):
-                la = a + math.pi + (i - 1.5) * 0.22
-                pygame.draw.line(screen, style['rim'],
-                                 (int(sx + math.cos(la)*4),     int(sy + math.sin(la)*4)),
-                                 (int(sx + math.cos(la)*s*1.4), int(sy + math.sin(la)*s*1.4)), 1)
-        # Telegraph ring when dash is charged
-        if ready:
-            pulse = 0.6 + 0.4 * math.sin(self.anim_timer * 0.3)
-            rc = (int(255*pulse), int(240*pulse), int(80*pulse))
-            pygame.draw.circle(screen, rc, (sx, sy), s + 5, 2)
-
-    def _draw_tank(self, screen, sx, sy):
-        style = ENEMY_STYLES['tank']
-        s = self.size
-
-        # Spinning flail — drawn BEHIND body
-        chain_len = int(s * 2.6)
-        ball_r    = int(s * 0.85)
-        fa  = self.anim_angle * 2.2  # faster spin than body
-        fx  = sx + int(math.cos(fa) * chain_len)
-        fy  = sy + int(math.sin(fa) * chain_len)
-        # Chain links
-        link_count = 5
-        for li in range(1, link_count + 1):
-            t = li / (link_count + 1)
-            lx = int(sx + math.cos(fa) * chain_len * t)
-            ly = int(sy + math.sin(fa) * chain_len * t)
-            pygame.draw.circle(screen, style['dark'], (lx, ly), 3)
-            pygame.draw.circle(screen, style['rim'],  (lx, ly), 3, 1)
-        # Flail ball — spiked
-        pygame.draw.circle(screen, style['dark'], (fx, fy), ball_r + 3)
-        pygame.draw.circle(screen, style['body'], (fx, fy), ball_r)
-        pygame.draw.circle(screen, style['rim'],  (fx, fy), ball_r, 2)
-        spike_n = 6
-        for si in range(spike_n):
-            sa = fa + si * math.pi / 3
-            pygame.draw.line(screen, style['rim'],
-                             (int(fx + math.cos(sa) * (ball_r - 2)), int(fy + math.sin(sa) * (ball_r - 2))),
-                             (int(fx + math.cos(sa) * (ball_r + 6)), int(fy + math.sin(sa) * (ball_r + 6))), 2)
-
-        # Armour body (square)
-        r_outer = pygame.Rect(sx-s, sy-s, s*2, s*2)
-        pygame.draw.rect(screen, style['dark'], r_outer, border_radius=5)
-        r_inner = r_outer.inflate(-5, -5)
-        pygame.draw.rect(screen, style['body'], r_inner, border_radius=4)
-        pygame.draw.line(screen, style['dark'], (sx-s+5, sy), (sx+s-5, sy), 2)
-        pygame.draw.line(screen, style['dark'], (sx, sy-s+5), (sx, sy+s-5), 2)
-        pygame.draw.rect(screen, style['rim'], r_outer, 2, border_radius=5)
-        for cx2, cy2 in [(-s+5,-s+5),(s-5,-s+5),(-s+5,s-5),(s-5,s-5)]:
-            pygame.draw.circle(screen, style['rim'],  (sx+cx2, sy+cy2), 4)
-            pygame.draw.circle(screen, style['dark'], (sx+cx2, sy+cy2), 2)
-
-    def _draw_shooter(self, screen, sx, sy):
-        style = ENEMY_STYLES['shooter']
-        s = self.size
-        # Rotating ring + core
-        for i in range(3):
-            a = self.anim_angle + i * 2*math.pi/3
-            rx = sx + math.cos(a)*s
-            ry = sy + math.sin(a)*s
-            pygame.draw.circle(screen, style['body'], (int(rx), int(ry)), 5)
-        pygame.draw.circle(screen, style['dark'], (sx, sy), s, 2)
-        pygame.draw.circle(screen, style['body'], (sx, sy), s-4)
-        pygame.draw.circle(screen, style['rim'],  (sx, sy), s-4, 2)
-        # Turrets
-        for i in range(3):
-            a = self.anim_angle + i * 2*math.pi/3
-            tx = sx + math.cos(a)*(s-2)
-            ty = sy + math.sin(a)*(s-2)
-            tx2 = sx + math.cos(a)*(s+8)
-            ty2 = sy + math.sin(a)*(s+8)
-            pygame.draw.line(screen, style['rim'], (int(tx),int(ty)), (int(tx2),int(ty2)), 3)
-
-    def _draw_mini_boss(self, screen, sx, sy):
-        bid = self.boss_id
-        style = BOSS_STYLES.get(bid, BOSS_STYLES[1])
-        s = self.size
-
-        # Glow layers (2 only, cached)
-        if not hasattr(self, '_glow_surfs'):
-            self._glow_surfs = []
-            for i in range(2):
-                gr = s + (2-i)*10
-                gs2 = pygame.Surface((gr*2+2, gr*2+2), pygame.SRCALPHA)
-                pygame.draw.circle(gs2, (*style['body'], 28), (gr+1, gr+1), gr)
-                self._glow_surfs.append((gs2, gr))
-        for gs2, gr in self._glow_surfs:
-            screen.blit(gs2, (sx-gr-1, sy-gr-1))
-
-        # Outer rotating petals
-        petal_n = 5 + bid  # 6-13 petals for bosses 1-8
-        for i in range(petal_n):
-            a = self.anim_angle*1.2 + i*2*math.pi/petal_n
-            px2 = sx + math.cos(a)*s
-            py2 = sy + math.sin(a)*s
-            pygame.draw.circle(screen, style['rim'], (int(px2), int(py2)), 6)
-
-        # Core body — octagon
-        pts = [(sx+math.cos(self.anim_angle+i*math.pi/4)*s,
-                sy+math.sin(self.anim_angle+i*math.pi/4)*s) for i in range(8)]
-        pygame.draw.polygon(screen, style['dark'], pts)
-        pygame.draw.polygon(screen, style['body'], [(sx+math.cos(self.anim_angle+i*math.pi/4)*(s-4),
-                                                     sy+math.sin(self.anim_angle+i*math.pi/4)*(s-4)) for i in range(8)])
-        pygame.draw.polygon(screen, style['rim'], pts, 3)
-        pygame.draw.circle(screen, style['rim'], (sx, sy), s//3)
-        # Eye
-        pygame.draw.circle(screen, style['body'], (sx, sy), s//4)
-
     def _draw_final_boss(self, screen, sx, sy):
         style = BOSS_FINAL_STYLE
         s = self.size
@@ -1521,19 +1237,92 @@ class Enemy:
         pygame.draw.circle(screen, style['dark'], (sx, sy), pulse_r)
 
     def _draw_healthbar(self, screen, sx, sy):
-        if self.is_boss:
-            return   # boss bar is in HUD
-        bw = max(36, self.size*2+10)
-        bh = 8
-        bx = sx - bw//2
-        by = sy - self.size - 14
-        pygame.draw.rect(screen, (30, 30, 40), (bx, by, bw, bh), border_radius=3)
-        pct = self.health / max(self.max_health, 1)
-        hw  = int(bw * pct)
-        hc  = C_HEALTH_GREEN if pct > 0.5 else (C_HEALTH_YEL if pct > 0.25 else C_HEALTH_RED)
-        if hw > 0:
-            pygame.draw.rect(screen, hc, (bx, by, hw, bh), border_radius=3)
-        pygame.draw.rect(screen, (150, 150, 180), (bx, by, bw, bh), 1, border_radius=3)
+        seq: list = []
+        ENEMY_ATLAS.add_bar(self, sx, sy, seq)   # boss bar is in HUD
+        screen.blits(seq, doreturn=False)
+
+
+def _row_attr(col: str, cast=None):
+    """Property reading / writing one EnemyStore column for a HordeEnemy."""
+    def get(self):
+        v = getattr(self._store, col).item(self._row)
+        return v if cast is None else cast(v)
+
+    def set_(self, v):
+        getattr(self._store, col)[self._row] = v
+    return property(get, set_)
+
+
+class HordeEnemy(Enemy):
+    """A regular enemy whose state lives in a row of an EnemyStore.
+
+    Reads and writes the same attributes as Enemy, so drawing, bullet hits,
+    kill bookkeeping and split-mode packing treat it like any other enemy;
+    ShooterGame._update_enemies steps all rows at once instead of calling
+    update().
+
+    Enemy.__init__ never runs for a HordeEnemy.  Every attribute it sets
+    must be provided here instead: a store column (_row_attr), a property,
+    an instance attribute set in __init__, or — only for immutable values
+    regular enemies never change — a class attribute.  An attribute added
+    to Enemy.__init__ and forgotten here is an AttributeError on store rows;
+    ``python dev/bench_shooter.py horde`` checks the two stay in step.
+    """
+
+    is_boss            = False
+    is_final           = False
+    boss_id            = 1
+    attack_pattern     = 0
+    pattern_timer      = 0
+    phase_len          = 300
+    minion_spawn_timer = 0
+
+    x              = _row_attr('x')
+    y              = _row_attr('y')
+    health         = _row_attr('health')
+    max_health     = _row_attr('max_health')
+    size           = _row_attr('size')
+    speed          = _row_attr('speed')
+    anim_angle     = _row_attr('anim_angle')
+    anim_timer     = _row_attr('anim_timer')
+    face_angle     = _row_attr('face_angle')
+    is_dashing     = _row_attr('dashing')
+    dash_timer     = _row_attr('dash_timer')
+    dash_cooldown  = _row_attr('dash_cooldown')
+    shoot_cooldown = _row_attr('shoot_cooldown')
+    shoot_rate     = _row_attr('shoot_rate')
+    frames_far     = _row_attr('frames_far')
+    cached_los     = _row_attr('los')
+    slot           = _row_attr('slot')
+
+    @property
+    def enemy_type(self) -> str:
+        return _horde_mod.KINDS[self._store.kind.item(self._row)]
+
+    @property
+    def dash_dir(self) -> list[float]:
+        return [self._store.dash_dx.item(self._row), self._store.dash_dy.item(self._row)]
+
+    @dash_dir.setter
+    def dash_dir(self, d) -> None:
+        self._store.dash_dx[self._row] = d[0]
+        self._store.dash_dy[self._row] = d[1]
+
+    def __init__(self, store: EnemyStore, e: Enemy) -> None:
+        """Move a freshly built regular Enemy into a new row of *store*."""
+        self.dash_trail = list(e.dash_trail)
+        store.add(self, x=e.x, y=e.y, health=e.health, max_health=e.max_health,
+                  size=e.size, speed=e.speed, anim_angle=e.anim_angle, face_angle=e.face_angle,
+                  dash_dx=e.dash_dir[0], dash_dy=e.dash_dir[1],
+                  kind=_horde_mod.kind_id(e.enemy_type), anim_timer=e.anim_timer,
+                  dash_timer=e.dash_timer, dash_cooldown=e.dash_cooldown,
+                  shoot_cooldown=e.shoot_cooldown, shoot_rate=e.shoot_rate,
+                  frames_far=e.frames_far, slot=e.slot,
+                  dashing=e.is_dashing, los=e.cached_los)
+
+    @staticmethod
+    def can_adopt(e: Enemy) -> bool:
+        return not e.is_boss and _horde_mod.kind_id(e.enemy_type) >= 0
 
 
 # ---------------------------------------------------------------------------
@@ -1543,19 +1332,46 @@ class Enemy:
 class ShooterGame:
     def __init__(self, screen: pygame.Surface,
                  seed: str | None = None,
-                 save_data: dict | None = None):
+                 save_data: dict | None = None,
+                 sim_process: bool | None = None,
+                 quality_target_ms: float | None = None,
+                 horde: int | None = None,
+                 item_cap: int | None = None,
+                 backend: str | None = None):
         self.display_screen = screen
-        disp_w, disp_h = screen.get_size()
-        # Use .convert() so pixel format matches the display — faster blitting every frame
-        self.screen = pygame.Surface((VIEWPORT_W, VIEWPORT_H)).convert()
-        scale = min(disp_w/VIEWPORT_W, disp_h/VIEWPORT_H)
-        self.scale    = scale
-        self.offset_x = int((disp_w - VIEWPORT_W*scale)//2)
-        self.offset_y = int((disp_h - VIEWPORT_H*scale)//2)
-        # Pre-allocate the scaled output surface so _flip() never allocates one per frame
-        _sw = int(VIEWPORT_W * scale)
-        _sh = int(VIEWPORT_H * scale)
-        self._scaled_surf = pygame.Surface((_sw, _sh)).convert()
+        # Split mode: _update runs in a child process, this one only renders.
+        # Defaults to the SHOOTER_SIM_PROCESS environment variable.
+        if sim_process is None:
+            sim_process = os.environ.get(SIM_PROCESS_ENV) == '1'
+        self._sim_process = bool(sim_process) and _NUMPY
+        self._save_data   = save_data
+        # Render quality steps down when frames run over budget, and back up
+        # when there is headroom again (see quality.py)
+        if quality_target_ms is None:
+            quality_target_ms = float(os.environ.get(QUALITY_TARGET_ENV, QUALITY_TARGET_MS))
+        self._quality = QualityGovernor(quality_target_ms)
+        # Horde mode (0 = off); defaults to the SHOOTER_HORDE environment variable
+        if horde is None:
+            horde = int(os.environ.get(HORDE_ENV, '0') or 0)
+        if horde == 1:
+            horde = HORDE_ENEMIES
+        self._horde_cap = horde if _NUMPY else 0
+        if item_cap is None:
+            item_cap = int(os.environ.get(ITEM_CAP_ENV, ITEM_CAP) or ITEM_CAP)
+        if backend is None:
+            backend = os.environ.get(BACKEND_ENV, 'surface')
+        if backend == 'sdl2' and _canvas_mod.available():
+            # The canvas is both the viewport target and the presenter
+            self._canvas = _canvas_mod.TextureCanvas(screen, (VIEWPORT_W, VIEWPORT_H))
+            self.presenter = self._canvas
+            self.screen    = self._canvas
+        else:
+            # Viewport-to-display mapping and per-frame scaling (Utils/display.py);
+            # the viewport surface matches the display format for fast blitting
+            self._canvas   = None
+            self.presenter = Presenter(screen, (VIEWPORT_W, VIEWPORT_H))
+            self.screen    = self.presenter.surface()
+        self.display_screen = self.presenter.display
         self.clock    = pygame.time.Clock()
         self.font     = pygame.font.SysFont('segoeui', 26, bold=True)
 
@@ -1576,13 +1392,16 @@ class ShooterGame:
 
         self.cam_x = 0.0
         self.cam_y = 0.0
+        self._prev_cam    = (0.0, 0.0)      # set for real once the player is placed
+        self._prev_player = (self.player.x, self.player.y)
+        self._prev_enemy: dict[int, tuple[float, float]] = {}
 
         self.bullets:       list[Bullet]      = []
         self.enemy_bullets: list[EnemyBullet] = []
         self.enemies:       list[Enemy]       = []
-        self.items:         list[Item]        = []
+        self.items          = CrateStore(_ITEM_TYPES, cap=item_cap)
         self.popups:        list[Popup]       = []
-        self.particles:     list[Particle]   = []
+        self.particles      = ParticleSystem(PARTICLE_CAP, drag=PARTICLE_DRAG, fade=PARTICLE_FADE)
         self.kills          = 0
         self.shoot_cd       = 0
         self.spawn_timer    = 0
@@ -1597,8 +1416,13 @@ class ShooterGame:
         # Precompute seamless floor pattern
         self._floor_surf: pygame.Surface | None = None
 
-        # Precompute vignette overlay (dark edges, transparent centre)
-        self._vignette = self._build_vignette()
+        # Precompute vignette overlay (dark edges, transparent centre); the
+        # quality level picks how it is drawn (see vignette.py)
+        self._vignette = Vignette(VIEWPORT_W, VIEWPORT_H)
+
+        # Sprites above the floor and walls are submitted per layer and drawn
+        # in as few blits() calls as possible at the end of the frame
+        self._draw_buffer = DrawBuffer((VIEWPORT_W, VIEWPORT_H))
 
         # Pre-render bullet circle surfaces for batch blitting.
         # pygame.draw.circle × 5000 is the main draw bottleneck; blits() with
@@ -1609,9 +1433,15 @@ class ShooterGame:
             pygame.draw.circle(s, color, (radius + 1, radius + 1), radius)
             return s.convert_alpha()
 
-        self._bsurf_normal = _circle_surf(C_BULLET,        Bullet.SIZE)
-        self._bsurf_bounce = _circle_surf(C_BULLET_BOUNCE, Bullet.SIZE)
-        self._bsurf_pierce = _circle_surf(C_BULLET_PIERCE, Bullet.SIZE)
+        # Player bullets: one pre-baked fade ramp per colour class, so bullets in
+        # their fade window stay in the blits() batch.  Ramp index is
+        # class * BULLET_FADE_LEVELS + level; the top level is full brightness.
+        self._bullet_ramp: list[pygame.Surface] = []
+        for col in (C_BULLET, C_BULLET_BOUNCE, C_BULLET_PIERCE):
+            for lvl in range(BULLET_FADE_LEVELS):
+                f = (lvl + 1) / BULLET_FADE_LEVELS
+                self._bullet_ramp.append(_circle_surf(
+                    (int(col[0]*f), int(col[1]*f), int(col[2]*f)), Bullet.SIZE))
         self._bsurf_half   = Bullet.SIZE + 1   # blit offset = surface centre
 
         # Enemy bullet surfaces — keyed by (bullet_type, is_cannon)
@@ -1628,16 +1458,41 @@ class ShooterGame:
             key = 'cannon' if cannon else bt
             self._eb_surfs[key] = (_circle_surf(col, sz), sz + 1)
 
-        # Single background worker reused every frame — avoids thread-creation
-        # overhead.  Used to run _update_enemy_bullets concurrently with
-        # _update_player_bullets (both release the GIL during numpy ops, so
-        # they run in parallel on separate CPU cores).
-        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        # Per-frame simulation stages, run on a worker pool sized to the cores
+        # (serially on a single-core machine)
+        self._frame_jobs = self._build_frame_jobs()
+        self._hud        = self._build_hud()
+        ITEM_ATLAS.bake()   # every crate sprite now, not on the first drop of each type
+
+        # Player-bullet broad-phase grid, rebuilt in place every frame
+        self._bullet_grid = UniformGrid(cell=80)
+        # Stable small ids for live enemies (pierce bitmasks index by slot)
+        self._enemy_slots = SlotAllocator()
+        # Regular enemies live in NumPy columns and are stepped in one batch;
+        # bosses (and every enemy without NumPy) stay plain Enemy objects
+        self._horde = EnemyStore() if _NUMPY else None
+        # Enemy separation grid, rebuilt over the store rows every tick
+        self._enemy_grid = UniformGrid(cell=_horde_mod.SEP_CELL)
+        # Every enemy's position at the start of the tick, for aiming, contact,
+        # orbital saws and spawn placement (see _index_enemies)
+        self._enemy_index = CircleIndex(cell=64)
+        self._enemies_drawn  = 0     # last frame's viewport cull, for the debug overlay
+        self._enemies_culled = 0
+        self._enemies_lod    = False
+
+        # Split mode: render-side mirror keyed by enemy slot
+        self._mirror_enemies: dict[int, Enemy] = {}
 
         # Restore a saved run if provided
         if save_data:
             self._restore_state(save_data)
 
+        # Start on the player, with nothing to interpolate from: the first
+        # frame is drawn before any tick has run
+        self._follow_player()
+        self._prev_cam    = (self.cam_x, self.cam_y)
+        self._prev_player = (self.player.x, self.player.y)
+
     # ------------------------------------------------------------------
     # Save / restore
     # ------------------------------------------------------------------
@@ -1718,11 +1573,19 @@ class ShooterGame:
 
     def _flip(self):
         """Composite viewport surface to display and flip."""
-        # 3-arg scale writes into the pre-allocated surface — no allocation per frame
-        pygame.transform.scale(self.screen, self._scaled_surf.get_size(), self._scaled_surf)
-        self.display_screen.fill((0, 0, 0))
-        self.display_screen.blit(self._scaled_surf, (self.offset_x, self.offset_y))
-        pygame.display.flip()
+        self.presenter.present(self.screen)
+
+    def _hand_drawn(self, x, y, r: int, paint) -> None:
+        """Run paint(surface, x, y) for art drawn with pygame.draw within *r*
+        of viewport point (x, y).  On a TextureCanvas it paints into a
+        scratch surface that is uploaded and copied into place."""
+        if self._canvas is None:
+            paint(self.screen, x, y)
+            return
+        ix, iy = int(x), int(y)
+        surf = self._canvas.scratch(r * 2, r * 2)
+        paint(surf, r + (x - ix), r + (y - iy))
+        self._canvas.blit(surf, (ix - r, iy - r))
 
     # ------------------------------------------------------------------
     # Pause menu
@@ -1730,7 +1593,9 @@ class ShooterGame:
 
     def _pause_menu(self) -> str:
         """Overlay pause menu. Returns 'resume', 'save_quit', or 'quit'."""
-        snapshot = self.display_screen.copy()
+        # The overlay covers the letterbox too; have the next frame refill it
+        self.presenter.invalidate()
+        snapshot = self.presenter.snapshot()
         dark = pygame.Surface(self.display_screen.get_size(), pygame.SRCALPHA)
         dark.fill((0, 0, 0, 160))
 
@@ -1789,7 +1654,7 @@ class ShooterGame:
                 txt = f_btn.render(label, True, (220, 210, 180))
                 self.display_screen.blit(txt, txt.get_rect(center=rect.center))
 
-            pygame.display.flip()
+            self.presenter.flip()
             clock.tick(60)
 
     # ------------------------------------------------------------------
@@ -1810,20 +1675,6 @@ class ShooterGame:
         self._floor_rows = rows
         self._floor_surf = surf   # will be filled per-frame cheaply via _draw_floor
 
-    def _build_vignette(self) -> pygame.Surface:
-        """Pre-render dark-edge vignette once; blit each frame at zero GC cost."""
-        surf = pygame.Surface((VIEWPORT_W, VIEWPORT_H), pygame.SRCALPHA)
-        cx, cy = VIEWPORT_W // 2, VIEWPORT_H // 2
-        max_r = int(math.sqrt(cx * cx + cy * cy)) + 30
-        steps = 20
-        for i in range(steps):
-            frac = i / (steps - 1)          # 0 = innermost ring, 1 = outermost
-            r = int(max_r * (0.38 + frac * 0.62))
-            alpha = int(115 * frac ** 2.4)  # stays clear in centre, dark at edges
-            ring_w = max(5, max_r // steps + 3)
-            pygame.draw.circle(surf, (0, 0, 0, alpha), (cx, cy), r, ring_w)
-        return surf
-
     def _draw_floor(self):
         """Scroll the stone floor. Only redraws tile content when the camera crosses a tile boundary;
         smooth sub-tile scrolling is free (just a blit offset)."""
@@ -1842,10 +1693,17 @@ class ShooterGame:
         ox = cam_x % ts
         oy = cam_y % ts
 
-        # Only rebuild tile content when the grid origin changes (roughly every 24 frames at walking speed)
-        if start_gx != getattr(self, '_floor_gx', -9999) or start_gy != getattr(self, '_floor_gy', -9999):
+        # Only rebuild tile content when the grid origin changes (roughly every 24 frames
+        # at walking speed) or the quality level toggles the cracks or the folded vignette
+        cracks = self._quality.settings['floor_cracks']
+        fold   = self._quality.settings['vignette'] == 'floor'
+        if (start_gx != getattr(self, '_floor_gx', -9999) or start_gy != getattr(self, '_floor_gy', -9999)
+                or cracks != getattr(self, '_floor_cracks', cracks)
+                or fold != getattr(self, '_floor_vignette', fold)):
             self._floor_gx = start_gx
             self._floor_gy = start_gy
+            self._floor_cracks = cracks
+            self._floor_vignette = fold
             for row in range(rows):
                 for col in range(cols):
                     gx = start_gx + col
@@ -1860,14 +1718,19 @@ class ShooterGame:
                     rect = pygame.Rect(rx, ry, ts, ts)
                     pygame.draw.rect(surf, (base_r, base_g, base_b), rect)
                     crack_c = (max(0, base_r-8), max(0, base_g-7), max(0, base_b-6))
-                    if n1 < 0.30:
+                    if cracks and n1 < 0.30:
                         mid = int(ts * 0.4 + n1 * ts * 0.5)
                         pygame.draw.line(surf, crack_c, (rx+mid, ry+6), (rx+mid, ry+ts-6), 1)
-                    elif n1 < 0.55:
+                    elif cracks and n1 < 0.55:
                         mid = int(ts * 0.4 + (n1-0.3) * ts * 0.6)
                         pygame.draw.line(surf, crack_c, (rx+6, ry+mid), (rx+ts-6, ry+mid), 1)
                     grout = (max(0, base_r-14), max(0, base_g-12), max(0, base_b-10))
                     pygame.draw.rect(surf, grout, rect, 2)
+            if fold:
+                # Centred for a half-slab scroll offset: off by at most ts/2 either way
+                self._vignette.bake_into(surf, VIEWPORT_W // 2 + ts // 2, VIEWPORT_H // 2 + ts // 2)
+            if self._canvas is not None:
+                self._canvas.refresh(surf)
 
         self.screen.blit(surf, (-ox, -oy))
 
@@ -1878,9 +1741,6 @@ class ShooterGame:
     def _spawn_enemy(self):
         if self.boss_active:
             return
-        # HP scales aggressively with kills
-        tier = self.kills // 10
-        base_hp = 60 + tier * 80
         is_mega = self.kills > 0 and self.kills % MEGA_BOSS_INTERVAL == 0
         is_mini = self.kills > 0 and self.kills % MINI_BOSS_INTERVAL == 0 and not is_mega
 
@@ -1923,7 +1783,24 @@ class ShooterGame:
             self.boss_active  = True
             return
 
-        # Regular enemy — 4 types, weights shift with kills
+        etype, hp = self._roll_enemy()
+        _size_map = {'normal': 15, 'fast': 11, 'tank': 22, 'shooter': 14}
+        check_r = _size_map.get(etype, 16) + 14
+        for _ in range(400):
+            ex, ey = self.chunk_manager.get_safe_pos_near_room()
+            if not is_off_screen(ex-self.cam_x, ey-self.cam_y, VIEWPORT_W, VIEWPORT_H, margin=80):
+                continue
+            if not self._spawn_clear(ex, ey, check_r):
+                continue
+            e = Enemy(ex, ey, hp, enemy_type=etype)
+            self.enemies.append(e)
+            break
+
+    def _roll_enemy(self) -> tuple[str, int]:
+        """Regular enemy — 4 types, weights shift with kills.  Returns (type, hp)."""
+        # HP scales aggressively with kills
+        tier = self.kills // 10
+        base_hp = 60 + tier * 80
         rand = random.random()
         if self.kills < 20:
             if   rand < 0.40: etype, hp = 'normal',  base_hp
@@ -1935,18 +1812,22 @@ class ShooterGame:
             elif rand < 0.45: etype, hp = 'fast',    int(base_hp*0.5)
             elif rand < 0.70: etype, hp = 'tank',    int(base_hp*2.2)
             else:             etype, hp = 'shooter', int(base_hp*0.7)
+        return etype, hp
 
-        _size_map = {'normal': 15, 'fast': 11, 'tank': 22, 'shooter': 14}
-        check_r = _size_map.get(etype, 16) + 14
-        for _ in range(400):
-            ex, ey = self.chunk_manager.get_safe_pos_near_room()
-            if not is_off_screen(ex-self.cam_x, ey-self.cam_y, VIEWPORT_W, VIEWPORT_H, margin=80):
-                continue
-            if not self.chunk_manager.is_pos_safe(ex, ey, check_r):
-                continue
-            e = Enemy(ex, ey, hp, enemy_type=etype)
-            self.enemies.append(e)
-            break
+    def _spawn_horde(self) -> None:
+        """Horde mode: top the crowd up by up to HORDE_SPAWN_BATCH enemies, in a
+        ring just off screen so they arrive from every side."""
+        p  = self.player
+        r0 = math.hypot(VIEWPORT_W, VIEWPORT_H) * 0.5 + 60
+        for _ in range(min(HORDE_SPAWN_BATCH, self._horde_cap - len(self.enemies))):
+            etype, hp = self._roll_enemy()
+            for _ in range(8):
+                a = random.uniform(0, math.tau)
+                r = random.uniform(r0, r0 + 700)
+                ex, ey = p.x + math.cos(a) * r, p.y + math.sin(a) * r
+                if 0 < ex < WORLD_SIZE and 0 < ey < WORLD_SIZE and self._spawn_clear(ex, ey, 30):
+                    self.enemies.append(Enemy(ex, ey, hp, enemy_type=etype))
+                    break
 
     # ------------------------------------------------------------------
     # Main loop
@@ -1954,13 +1835,16 @@ class ShooterGame:
 
     def run(self) -> str:
         try:
+            if self._sim_process:
+                return self._run_split_loop()
             return self._run_loop()
         finally:
-            self._executor.shutdown(wait=False)
+            self._frame_jobs.shutdown()
+            self.presenter.close()
 
     def _run_loop(self) -> str:
+        stepper = FixedStep(TICK_HZ, MAX_CATCH_UP)
         while True:
-            self.frame += 1
             keys = pygame.key.get_pressed()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -1977,56 +1861,20 @@ class ShooterGame:
                             _save_mod.update_best_kills(self.kills)
                             return 'menu'
                         # 'resume' → fall through
-                    # ── Debug: Ctrl+F1–F5 spawn bosses ───────────────────
-                    _ctrl = pygame.key.get_mods() & pygame.KMOD_CTRL
-                    if _ctrl and event.key in (pygame.K_F1, pygame.K_F2, pygame.K_F3,
-                                               pygame.K_F4, pygame.K_F5):
-                        _dbg_bid = {pygame.K_F1: 1, pygame.K_F2: 2,
-                                    pygame.K_F3: 3, pygame.K_F4: 4}.get(event.key)
-                        bx, by = self.chunk_manager.get_safe_pos_near_room()
-                        self.enemies.clear()
-                        self.bullets.clear()
-                        self.enemy_bullets.clear()
-                        if event.key == pygame.K_F5:
-                            _dbg_boss = Enemy(bx, by, 35_000, is_boss=True, is_final=True)
-                            _dbg_boss.speed = 1.2; _dbg_boss.shoot_rate = 60; _dbg_boss.phase_len = 150
-                            _dbg_name = 'MEGA BOSS'
-                        else:
-                            _dbg_boss = Enemy(bx, by, 2_000, is_boss=True, boss_id=_dbg_bid)
-                            _dbg_boss.speed = 1.0; _dbg_boss.shoot_rate = 90; _dbg_boss.phase_len = 250
-                            _dbg_name = BOSS_STYLES.get(_dbg_bid, BOSS_STYLES[1])['name']
-                        self.enemies.append(_dbg_boss)
-                        self.current_boss = _dbg_boss
-                        self.boss_active  = True
-                        self._init_spawns_left = 0
-                        self.popups.append(Popup(f'[DBG] Spawned {_dbg_name}',
-                            self.player.x, self.player.y - 40, (255, 200, 60)))
-
-                    # ── Debug: F1–F12 grant one of each powerup ──────────
-                    _DEBUG_ITEMS = {
-                        pygame.K_F1:  'firerate',
-                        pygame.K_F2:  'multishot',
-                        pygame.K_F3:  'damage',
-                        pygame.K_F4:  'pierce',
-                        pygame.K_F5:  'speed',
-                        pygame.K_F6:  'health',
-                        pygame.K_F8:  'orbital',
-                        pygame.K_F9:  'dual_gun',
-                        pygame.K_F10: 'magnet',
-                    }
-                    if not _ctrl and event.key in _DEBUG_ITEMS:
-                        itype = _DEBUG_ITEMS[event.key]
-                        item  = Item(self.player.x, self.player.y, itype)
-                        item.apply_to(self.player)
-                        cfg = ITEM_CONFIG.get(itype, {})
-                        self.popups.append(Popup(
-                            '[DBG] ' + cfg.get('name', itype),
-                            self.player.x, self.player.y - 30,
-                            cfg.get('color', C_WHITE)
-                        ))
-
-            self._update(keys)
-            self._draw()
+                        stepper.reset()
+                    _ctrl = bool(pygame.key.get_mods() & pygame.KMOD_CTRL)
+                    self._handle_debug_key(event.key, _ctrl)
+
+            # Fixed-rate simulation; a slow render frame is absorbed by
+            # running up to MAX_CATCH_UP ticks before the next draw
+            t0 = time.perf_counter()
+            for _ in range(stepper.advance()):
+                self.frame += 1
+                self._update(keys)
+                if self.kills >= WIN_KILLS or self.player.health <= 0:
+                    break
+            self._draw(stepper.alpha)
+            self._quality.sample((time.perf_counter() - t0) * 1000.0)
 
             if self.kills >= WIN_KILLS:
                 _save_mod.delete()
@@ -2037,28 +1885,361 @@ class ShooterGame:
                 _save_mod.update_best_kills(self.kills)
                 return self._end_screen("GAME OVER", f"Kills: {self.kills}", (255,80,80), (30,10,12))
 
-            self.clock.tick(60)
+            self.clock.tick(MAX_RENDER_FPS)
+
+    def _run_split_loop(self) -> str:
+        """Render loop for split mode; the simulation runs in a child process.
+
+        This instance generates the same map from the same seed, so tiles and
+        floor draw locally.  Entities come from the simulation's shared-memory
+        snapshots and are interpolated between the last two of them.
+        """
+        sim    = _sim_module()
+        client = sim.SimClient(self.seed, self._save_data,
+                               game_args={'horde': self._horde_cap, 'item_cap': self.items.cap})
+        prev = cur = None
+        cur_t = 0.0
+        clipped = False
+        try:
+            while True:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        _save_mod.update_best_kills(self.kills)
+                        return 'quit'
+                    if event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_ESCAPE:
+                            client.set_paused(True)
+                            result = self._pause_menu()
+                            if result == 'save_quit':
+                                state = client.request('save')
+                                if state is not None:
+                                    _save_mod.save(state)
+                                _save_mod.update_best_kills(self.kills)
+                                return 'menu'
+                            elif result == 'quit':
+                                _save_mod.update_best_kills(self.kills)
+                                return 'menu'
+                            client.set_paused(False)
+                        else:
+                            _ctrl = bool(pygame.key.get_mods() & pygame.KMOD_CTRL)
+                            client.send('key', event.key, _ctrl)
+                client.set_input(sim.encode_keys(pygame.key.get_pressed()))
+
+                snap = client.state.read(cur.frame if cur is not None else -1)
+                if snap is not None:
+                    prev, cur = (cur if cur is not None else snap), snap
+                    cur_t = time.perf_counter()
+                    self._step_mirror(prev, cur)
+                    if not clipped and (snap.enemies_total > len(snap.enemies) or
+                                        snap.items_total > len(snap.items)):
+                        clipped = True
+                        print(f'[shooter] split mode: {snap.enemies_total} enemies and '
+                              f'{snap.items_total} crates, only the {len(snap.enemies)} and '
+                              f'{len(snap.items)} nearest fit the shared block')
+
+                for evt in client.events():
+                    if evt[0] == 'popup':
+                        _, text, x, y, color, life = evt
+                        pop = Popup(text, x, y, color)
+                        pop.lifetime = life
+                        self.popups.append(pop)
+                    elif evt[0] == 'end':
+                        self.kills = evt[2]
+                        _save_mod.delete()
+                        _save_mod.update_best_kills(self.kills)
+                        if evt[1] == 'win':
+                            return self._end_screen("VICTORY!", "You conquered the dungeon!", (100,255,120), (12,30,18))
+                        return self._end_screen("GAME OVER", f"Kills: {self.kills}", (255,80,80), (30,10,12))
+
+                t0 = time.perf_counter()
+                if cur is not None:
+                    alpha = min(1.0, (time.perf_counter() - cur_t) * sim.SIM_HZ)
+                    self._apply_snapshot(prev, cur, alpha)
+                self._draw()
+                self._quality.sample((time.perf_counter() - t0) * 1000.0)
+                client.set_quality(self._quality.level)
+                self.clock.tick(60)
+        finally:
+            client.stop()
+
+    # ------------------------------------------------------------------
+    # Split mode: snapshot packing (simulation side) and mirroring (render side)
+    # ------------------------------------------------------------------
+
+    def _pack_snapshot(self, state) -> None:
+        """Write the current entity state into the shared block's back buffer."""
+        sim = _sim_module()
+        buf = state.begin_write()
+        hdr = buf['hdr']
+        p   = self.player
+        buf['player'][:] = ([p.x, p.y, p.shoot_dir[0], p.shoot_dir[1]] +
+                            [getattr(p, name) for name, _ in sim.PLAYER_STATS])
+
+        bullets = self.bullets[:sim.BULLET_CAP]
+        n = len(bullets)
+        if n:
+            buf['bullets'][:n] = [(b.x, b.y, b.dir[0] * b.speed, b.dir[1] * b.speed,
+                                   b.lifetime, b.ramp_base) for b in bullets]
+        hdr[sim.H_BULLETS] = n
+
+        kinds = sim.EBULLET_KINDS
+        ebs = self.enemy_bullets[:sim.EBULLET_CAP]
+        n = len(ebs)
+        if n:
+            buf['ebullets'][:n] = [(b.x, b.y, b.dir[0] * b.speed, b.dir[1] * b.speed,
+                                    5 if b.is_cannon else kinds.index(b.bullet_type))
+                                   for b in ebs]
+        hdr[sim.H_EBULLETS] = n
+
+        ekinds = sim.ENEMY_KIND_IDS
+        enemies = self.enemies
+        rows = len(buf['enemies'])
+        if len(enemies) > rows:
+            # Too many for the block: bosses first, then the nearest
+            px, py = p.x, p.y
+            enemies = sorted(enemies, key=lambda e: -1.0 if e.is_boss else
+                             (e.x - px) * (e.x - px) + (e.y - py) * (e.y - py))[:rows]
+        for e in enemies:
+            if e.slot < 0:
+                e.slot = self._enemy_slots.acquire()
+        n = len(enemies)
+        if n:
+            buf['enemies'][:n] = [
+                (e.slot, e.x, e.y, ekinds[e.enemy_type],
+                 2 if e.is_final else (1 if e.is_boss else 0), e.boss_id,
+                 e.health, e.max_health, e.size, e.anim_angle, e.anim_timer,
+                 e.is_dashing, e.dash_dir[0], e.dash_dir[1], e.dash_cooldown, e.face_angle)
+                for e in enemies]
+        hdr[sim.H_ENEMIES] = n
+        hdr[sim.H_ENEMIES_TOTAL] = len(self.enemies)
+
+        items = self.items.snapshot(len(buf['items']))
+        n = len(items)
+        buf['items'][:n] = items
+        hdr[sim.H_ITEMS] = n
+        hdr[sim.H_ITEMS_TOTAL] = len(self.items)
+
+        parts = self.particles.snapshot(sim.PARTICLE_CAP)
+        n = len(parts)
+        buf['particles'][:n] = parts
+        hdr[sim.H_PARTICLES] = n
+
+        boss = self.current_boss
+        hdr[sim.H_FRAME]       = self.frame
+        hdr[sim.H_KILLS]       = self.kills
+        hdr[sim.H_BOSS_ACTIVE] = 1 if self.boss_active else 0
+        hdr[sim.H_BOSS_SLOT]   = boss.slot if boss is not None and boss in enemies else -1
+        state.end_write()
+
+    def _step_mirror(self, prev, cur) -> None:
+        """Per-simulation-step render state: mirrored objects, trails, particles, popups."""
+        sim = _sim_module()
+        self.frame = cur.frame
+        self.kills = cur.kills
+        steps = max(1, cur.frame - prev.frame)
+
+        p = self.player
+        for (name, typ), v in zip(sim.PLAYER_STATS, cur.player[4:].tolist()):
+            setattr(p, name, typ(v))
+        p.shoot_dir = [float(cur.player[2]), float(cur.player[3])]
+        p.has_target = True
+
+        # Enemies — one persistent Enemy per slot, rebuilt if the slot was reused
+        mirror = self._mirror_enemies
+        live: dict[int, Enemy] = {}
+        ekinds = sim.ENEMY_KINDS
+        for row in cur.enemies.tolist():
+            slot = int(row[sim.E_SLOT])
+            kind = ekinds[int(row[sim.E_KIND])]
+            boss = int(row[sim.E_BOSS])
+            bid  = int(row[sim.E_BOSS_ID])
+            e = mirror.get(slot)
+            if (e is None or e.enemy_type != kind or e.is_boss != (boss > 0)
+                    or e.is_final != (boss == 2) or e.boss_id != bid):
+                e = Enemy(row[sim.E_X], row[sim.E_Y], int(row[sim.E_MAX_HP]),
+                          is_boss=boss > 0, is_final=boss == 2, boss_id=bid, enemy_type=kind)
+            e.slot          = slot
+            e.health        = int(row[sim.E_HP])
+            e.max_health    = int(row[sim.E_MAX_HP])
+            e.size          = row[sim.E_SIZE]
+            e.anim_angle    = row[sim.E_ANIM_ANGLE]
+            e.anim_timer    = int(row[sim.E_ANIM_TIMER])
+            e.is_dashing    = bool(row[sim.E_DASHING])
+            e.dash_dir      = [row[sim.E_DASH_X], row[sim.E_DASH_Y]]
+            e.dash_cooldown = int(row[sim.E_DASH_CD])
+            e.face_angle    = row[sim.E_FACE]
+            if e.is_dashing:
+                e.dash_trail.append((row[sim.E_X], row[sim.E_Y]))
+                if len(e.dash_trail) > 12: e.dash_trail.pop(0)
+            else:
+                e.dash_trail.clear()
+            live[slot] = e
+        self._mirror_enemies = live
+        self.enemies = list(live.values())
+        self.boss_active  = cur.boss_active
+        self.current_boss = live.get(cur.boss_slot)
+
+        # Items — the store keeps each crate's bob phase by uid
+        self.items.load(cur.items)
+
+        self.particles.load(cur.particles)
+
+        for _ in range(steps):
+            self._update_popups()
+
+    def _apply_snapshot(self, prev, cur, alpha: float) -> None:
+        """Place mirrored entities between the previous and current simulation step."""
+        sim = _sim_module()
+        p = self.player
+        p.x = float(prev.player[0] + (cur.player[0] - prev.player[0]) * alpha)
+        p.y = float(prev.player[1] + (cur.player[1] - prev.player[1]) * alpha)
+        self._follow_player()
+        self.chunk_manager.load_chunks_around(p.x, p.y)
+
+        for e in self.enemies:
+            row = cur.enemy_row(e.slot)
+            old = prev.enemy_row(e.slot)
+            x, y = cur.enemies[row, sim.E_X], cur.enemies[row, sim.E_Y]
+            if old >= 0:
+                x0, y0 = prev.enemies[old, sim.E_X], prev.enemies[old, sim.E_Y]
+                x, y = x0 + (x - x0) * alpha, y0 + (y - y0) * alpha
+            e.x, e.y = float(x), float(y)
+
+        # Bullets move in straight lines: back off the last step's velocity
+        back = 1.0 - alpha
+        b = cur.bullets
+        xs = (b[:, sim.B_X] - b[:, sim.B_VX] * back).tolist()
+        ys = (b[:, sim.B_Y] - b[:, sim.B_VY] * back).tolist()
+        self.bullets = list(map(sim.BulletView, xs, ys,
+                                b[:, sim.B_LIFE].astype(_np.int64).tolist(),
+                                b[:, sim.B_RAMP].astype(_np.int64).tolist()))
+        eb = cur.ebullets
+        xs = (eb[:, sim.EB_X] - eb[:, sim.EB_VX] * back).tolist()
+        ys = (eb[:, sim.EB_Y] - eb[:, sim.EB_VY] * back).tolist()
+        self.enemy_bullets = list(map(sim.EnemyBulletView, xs, ys,
+                                      eb[:, sim.EB_KIND].astype(_np.int64).tolist()))
+
+    def _handle_debug_key(self, key: int, ctrl: bool) -> None:
+        """Ctrl+F1–F5 spawn a boss, F1–F10 grant a powerup."""
+        # ── Debug: Ctrl+F1–F5 spawn bosses ───────────────────
+        if ctrl and key in (pygame.K_F1, pygame.K_F2, pygame.K_F3,
+                            pygame.K_F4, pygame.K_F5):
+            _dbg_bid = {pygame.K_F1: 1, pygame.K_F2: 2,
+                        pygame.K_F3: 3, pygame.K_F4: 4}.get(key)
+            bx, by = self.chunk_manager.get_safe_pos_near_room()
+            self.enemies.clear()
+            self.bullets.clear()
+            self.enemy_bullets.clear()
+            if key == pygame.K_F5:
+                _dbg_boss = Enemy(bx, by, 35_000, is_boss=True, is_final=True)
+                _dbg_boss.speed = 1.2; _dbg_boss.shoot_rate = 60; _dbg_boss.phase_len = 150
+                _dbg_name = 'MEGA BOSS'
+            else:
+                _dbg_boss = Enemy(bx, by, 2_000, is_boss=True, boss_id=_dbg_bid)
+                _dbg_boss.speed = 1.0; _dbg_boss.shoot_rate = 90; _dbg_boss.phase_len = 250
+                _dbg_name = BOSS_STYLES.get(_dbg_bid, BOSS_STYLES[1])['name']
+            self.enemies.append(_dbg_boss)
+            self.current_boss = _dbg_boss
+            self.boss_active  = True
+            self._init_spawns_left = 0
+            self.popups.append(Popup(f'[DBG] Spawned {_dbg_name}',
+                self.player.x, self.player.y - 40, (255, 200, 60)))
+
+        # ── Debug: F1–F12 grant one of each powerup ──────────
+        _DEBUG_ITEMS = {
+            pygame.K_F1:  'firerate',
+            pygame.K_F2:  'multishot',
+            pygame.K_F3:  'damage',
+            pygame.K_F4:  'pierce',
+            pygame.K_F5:  'speed',
+            pygame.K_F6:  'health',
+            pygame.K_F8:  'orbital',
+            pygame.K_F9:  'dual_gun',
+            pygame.K_F10: 'magnet',
+        }
+        if not ctrl and key in _DEBUG_ITEMS:
+            itype = _DEBUG_ITEMS[key]
+            item  = Item(self.player.x, self.player.y, itype)
+            item.apply_to(self.player)
+            cfg = ITEM_CONFIG.get(itype, {})
+            self.popups.append(Popup(
+                '[DBG] ' + cfg.get('name', itype),
+                self.player.x, self.player.y - 30,
+                cfg.get('color', C_WHITE)
+            ))
 
     # ------------------------------------------------------------------
     # Update
     # ------------------------------------------------------------------
 
+    def _follow_player(self) -> None:
+        """Centre the camera on the player, clamped to the world."""
+        p = self.player
+        self.cam_x = clamp(p.x - VIEWPORT_W//2, 0, WORLD_SIZE - VIEWPORT_W)
+        self.cam_y = clamp(p.y - VIEWPORT_H//2, 0, WORLD_SIZE - VIEWPORT_H)
+
     def _update(self, keys):
         p  = self.player
         cm = self.chunk_manager
 
-        self.cam_x = clamp(p.x - VIEWPORT_W//2, 0, WORLD_SIZE - VIEWPORT_W)
-        self.cam_y = clamp(p.y - VIEWPORT_H//2, 0, WORLD_SIZE - VIEWPORT_H)
+        # Positions at the start of the tick, for render interpolation
+        self._prev_cam    = (self.cam_x, self.cam_y)
+        self._prev_player = (p.x, p.y)
+        self._sync_horde()
+        self._prev_enemy  = {id(e): (e.x, e.y) for e in self.enemies
+                             if e.__class__ is not HordeEnemy}
+        if self._horde is not None:
+            self._horde.save_prev()
+        self._index_enemies()
+
+        self._follow_player()
 
         cm.load_chunks_around(p.x, p.y)
         cm.unload_distant(p.x, p.y)
 
         p.move(keys, cm)
-        p.update_aim(self.enemies)
-        p.update_orbital()
-        p.update_magnet(self.items)
-
-        # Auto-shoot
+        self._frame_jobs.run()
+
+    def _build_frame_jobs(self) -> JobGraph:
+        """Declare the per-frame simulation stages and the state each one touches.
+
+        Resources are symbolic names; a stage that writes a resource is ordered
+        after every earlier stage that reads or writes it, and everything else
+        may run concurrently.  'rng' stands for the shared random module, so
+        every stage that draws random numbers stays in declaration order.
+        """
+        g = JobGraph()
+        g.add('aim',      lambda: self.player.update_aim(self._aim_candidates()),
+              reads=('player.pos', 'enemies'), writes=('player.aim',))
+        g.add('orbital',  lambda: self.player.update_orbital(), writes=('player.orbital',))
+        g.add('shoot',    self._auto_shoot,
+              reads=('player.pos', 'player.aim', 'player.stats'),
+              writes=('bullets', 'shoot_cd', 'rng'))
+        # A boss spawn clears both bullet lists
+        g.add('spawn',    self._update_spawns,
+              reads=('player.pos', 'camera', 'tiles', 'kills'),
+              writes=('enemies', 'bullets', 'enemy_bullets', 'boss', 'player.health', 'rng'))
+        g.add('player_bullets', self._update_player_bullets,
+              reads=('camera', 'tiles', 'frame'), writes=('bullets',))
+        g.add('enemy_bullets',  self._update_enemy_bullets,
+              reads=('camera', 'tiles', 'player.pos'), writes=('enemy_bullets',),
+              merge=self._apply_enemy_bullet_hits)
+        # _update_enemies needs both bullet lists fully updated and the
+        # enemy-bullet damage applied, so it starts a new phase.
+        g.barrier()
+        g.add('enemies',  self._update_enemies,
+              reads=('player.pos', 'camera', 'tiles', 'frame'),
+              writes=('enemies', 'bullets', 'enemy_bullets', 'items', 'popups',
+                      'particles', 'player.health', 'kills', 'boss', 'rng'))
+        g.add('items',    self._update_items,
+              reads=('player.pos',),
+              writes=('items', 'popups', 'player.magnet', 'player.stats', 'player.health'))
+        g.add('popups',   self._update_popups,    writes=('popups',))
+        g.add('particles', self._update_particles, writes=('particles',))
+        return g
+
+    def _auto_shoot(self):
+        p = self.player
         if self.shoot_cd <= 0 and p.has_target:
             ba = math.atan2(p.shoot_dir[1], p.shoot_dir[0])
             tip_x = p.x + math.cos(ba) * 27
@@ -2095,11 +2276,17 @@ class ShooterGame:
         if self.shoot_cd > 0:
             self.shoot_cd -= 1
 
+    def _update_spawns(self):
+        p = self.player
         if self.boss_active and self.current_boss not in self.enemies:
             self.boss_active  = False
             self.current_boss = None
             p.health = min(p.MAX_HEALTH, p.health + 3)
 
+        if self._horde_cap:
+            self._spawn_horde()
+            return
+
         if self._init_spawns_left > 0:
             self._init_spawn_timer += 1
             if self._init_spawn_timer >= 12:
@@ -2113,26 +2300,14 @@ class ShooterGame:
                 self._spawn_enemy()
                 self.spawn_timer = 0
 
-        # Dispatch enemy-bullet update to the background worker while the main
-        # thread runs the player-bullet update.  Both methods release Python's
-        # GIL during their numpy array operations, so they run in true parallel
-        # on separate CPU cores.  _update_enemies must wait for both because it
-        # reads the updated self.bullets list and appends to self.enemy_bullets.
-        _fut = self._executor.submit(self._update_enemy_bullets)
-        self._update_player_bullets()
-        _fut.result()           # wait for enemy-bullet update to finish
-        self._update_enemies()  # sequential: needs both lists fully updated
-        self._pickup_items()
-
+    def _update_popups(self):
         for popup in self.popups:
             popup.update()
         self.popups = [pop for pop in self.popups if pop.lifetime > 0]
 
-        for p in self.particles:
-            p.update()
-        self.particles = [p for p in self.particles if p.life > 0]
-        if len(self.particles) > 120:
-            self.particles = self.particles[-120:]
+    def _update_particles(self):
+        self.particles.update()
+        self.particles.trim(self._quality.settings['particles'])
 
     # ------------------------------------------------------------------
     # Player bullet update
@@ -2319,33 +2494,71 @@ class ShooterGame:
     # Enemy update
     # ------------------------------------------------------------------
 
+    def _sync_horde(self) -> None:
+        """Move regular Enemy objects added since the last tick into the store,
+        and drop rows whose handles were taken out of self.enemies."""
+        store = self._horde
+        if store is None:
+            return
+        enemies = self.enemies
+        objs = [e for e in enemies if e.__class__ is not HordeEnemy]
+        if len(enemies) - len(objs) != store.n:
+            present = {id(e) for e in enemies}
+            store.remove(_np.fromiter((id(h) not in present for h in store.handles),
+                                      dtype=bool, count=store.n))
+        keep = []
+        for e in objs:
+            if HordeEnemy.can_adopt(e):
+                if e.slot < 0:
+                    e.slot = self._enemy_slots.acquire()
+                HordeEnemy(store, e)
+            else:
+                keep.append(e)
+        if len(keep) != len(objs) or len(enemies) - len(objs) != store.n:
+            self.enemies = keep + store.handles
+
+    def _index_enemies(self) -> None:
+        """Rebuild the per-tick enemy index: objects first, then the store rows."""
+        objs  = [e for e in self.enemies if e.__class__ is not HordeEnemy]
+        store = self._horde
+        if store is None:
+            self._enemy_index.build(objs, [e.x for e in objs], [e.y for e in objs],
+                                   [e.size for e in objs])
+            return
+        self._enemy_index.build(
+            objs + store.handles,
+            _np.concatenate(([e.x for e in objs], store.col('x'))),
+            _np.concatenate(([e.y for e in objs], store.col('y'))),
+            _np.concatenate(([e.size for e in objs], store.col('size'))))
+
+    def _aim_candidates(self) -> list:
+        """Enemies the player may lock on to: just the nearest one."""
+        p = self.player
+        nearest = self._enemy_index.nearest(p.x, p.y)
+        return [] if nearest is None else [nearest]
+
+    def _spawn_clear(self, x: float, y: float, r: float) -> bool:
+        """True if a circle at (x, y) touches neither a wall nor an enemy."""
+        return self.chunk_manager.is_pos_safe(x, y, r) and not self._enemy_index.overlaps(x, y, r)
+
     def _update_enemies(self):
         p = self.player
         px, py = p.x, p.y
-        bullets_to_remove: set[int] = set()
         still_alive: list[Enemy] = []
-
-        # Pre-build bullet position arrays for numpy per-enemy distance queries.
-        # Replaces the Python dict spatial grid: list-comps + numpy broadcasts
-        # are ~5× faster than the equivalent dict-of-lists approach at high counts.
-        _nb = len(self.bullets)
-        if _nb > 0 and _NUMPY:
-            _bxv = _np.array([b.x for b in self.bullets], dtype=_np.float32)
-            _byv = _np.array([b.y for b in self.bullets], dtype=_np.float32)
-            _use_np_bullets = True
-        else:
-            _bxv = _byv = None
-            _use_np_bullets = False
-            _BCELL = 80
-            bullet_grid: dict = {}
-            for _b in self.bullets:
-                _k = (int(_b.x) // _BCELL, int(_b.y) // _BCELL)
-                if _k not in bullet_grid:
-                    bullet_grid[_k] = []
-                bullet_grid[_k].append(_b)
-
+        # Enemies that survive movement / contact this frame and still need
+        # bullet-hit resolution (minions spawned this frame skip it).
+        hittable: list[Enemy] = []
+
+        self._sync_horde()
+        store = self._horde
+        # Enemies touching the player at the start of the tick
+        touching = self._enemy_index.overlapping(px, py, p.SIZE)
+        touch_ids = {id(e) for e in touching}
         for enemy in self.enemies:
-            eid = id(enemy)
+            if enemy.__class__ is HordeEnemy:
+                continue
+            if enemy.slot < 0:
+                enemy.slot = self._enemy_slots.acquire()
             dx, dy = enemy.x-px, enemy.y-py
             dist_sq = dx*dx + dy*dy
 
@@ -2365,7 +2578,7 @@ class ShooterGame:
             if enemy.can_shoot() and enemy.cached_los and not is_off_screen(
                     enemy.x - self.cam_x, enemy.y - self.cam_y,
                     VIEWPORT_W, VIEWPORT_H, margin=200):
-                self.enemy_bullets.extend(enemy.shoot(px, py))
+                enemy.shoot(px, py, self.enemy_bullets)
 
             # Final boss minion spawn
             if enemy.is_final and len(self.enemies) < 12:
@@ -2376,62 +2589,325 @@ class ShooterGame:
                         a = random.random()*2*math.pi
                         mx = enemy.x + math.cos(a)*120
                         my = enemy.y + math.sin(a)*120
-                        if self.chunk_manager.is_pos_safe(mx, my, 16):
+                        if self._spawn_clear(mx, my, 16):
                             mtype = random.choice(['fast','shooter','sniper'])
                             minion = Enemy(mx, my, 100, enemy_type=mtype)
                             still_alive.append(minion)
                             break
 
-            # Contact damage
-            cdist = p.SIZE + enemy.size
-            if dist_sq < cdist*cdist:
-                contact_dmg = {'tank': 3, 'fast': 1, 'normal': 1, 'shooter': 1}.get(enemy.enemy_type, 1)
-                p.take_damage(contact_dmg)
-                if not enemy.is_boss:
-                    self.kills += 1
-                    style = ENEMY_STYLES.get(enemy.enemy_type, {'rim': (255, 100, 60)})
-                    self.particles += _spawn_particles(enemy.x, enemy.y, style['rim'],
-                                                       count=14, speed=4.5, size=4, life=35)
-                    self.items.append(Item(enemy.x, enemy.y, self._random_item_type()))
-                    continue
+            # Contact damage — regular enemies die on impact
+            if id(enemy) in touch_ids and self._contact_hit(enemy):
+                continue
+
+            hittable.append(enemy)
+
+        n_obj = len(hittable)
+        rows  = self._update_horde(touching) if store is not None else None
+        if p.has_orbital and self.frame % 3 == 0:
+            self._orbital_hits(touch_ids)
+        cols  = None
+        if rows is not None and len(rows):
+            hittable += [store.handles[i] for i in rows.tolist()]
+            if self.bullets:
+                cols = self._enemy_columns(hittable[:n_obj], rows)
+
+        if self.bullets and hittable:
+            if _NUMPY:
+                killed = self._resolve_bullet_hits_np(hittable, cols)
+            else:
+                killed = self._resolve_bullet_hits_py(hittable)
+        else:
+            killed = set()
 
-            # Orbital damage
-            if p.has_orbital and dist_sq < 7000 and self.frame % 3 == 0:
-                count = p.orbital_count
-                size  = max(4, 14 - count)
-                for i in range(count):
-                    a = p.orbital_angle + i*2*math.pi/count
-                    sdx = px + math.cos(a)*55 - enemy.x
-                    sdy = py + math.sin(a)*55 - enemy.y
-                    if sdx*sdx + sdy*sdy < (size+enemy.size)**2:
-                        enemy.health -= 3
-
-            # Bullet hits — numpy broad-phase then per-hit Python for game logic
-            killed = False
-            if _use_np_bullets:
-                # Broad-phase: find bullets within (enemy.size + max_bullet_size + slack)
-                _er  = float(enemy.size + 20)
-                _dx2 = _bxv - _np.float32(enemy.x)
-                _dy2 = _byv - _np.float32(enemy.y)
-                _nearby = [self.bullets[int(_i)]
-                           for _i in _np.where(_dx2*_dx2 + _dy2*_dy2 < _er*_er)[0]]
+        for ei in range(n_obj):
+            if ei in killed:
+                self._on_enemy_killed(hittable[ei])
             else:
-                _ecx = int(enemy.x) // _BCELL
-                _ecy = int(enemy.y) // _BCELL
-                _nearby = []
-                for _ddx in range(-1, 2):
-                    for _ddy in range(-1, 2):
-                        _nearby.extend(bullet_grid.get((_ecx+_ddx, _ecy+_ddy), []))
+                still_alive.append(hittable[ei])
+        if store is not None:
+            dead_rows = _np.zeros(store.n, dtype=bool)
+            for ei in sorted(e for e in killed if e >= n_obj):
+                self._on_enemy_killed(hittable[ei])
+                dead_rows[rows[ei - n_obj]] = True
+            store.remove(dead_rows)
+            still_alive += store.handles
+        self.enemies = still_alive
+        self._recycle_enemy_slots()
+
+    def _update_horde(self, touching: list):
+        """The per-enemy steps of _update_enemies for every store row at once.
+
+        Unloads far rows, refreshes LOS, moves, fires, applies contact damage
+        for the handles in *touching*, and removes rows that left play or died
+        on contact.  Returns the indices of the surviving rows, for bullet-hit
+        resolution.
+        """
+        store = self._horde
+        if not store.n:
+            return None
+        p = self.player
+        px, py = p.x, p.y
+        cm = self.chunk_manager
+
+        # Distances are taken before moving, as the object path does
+        dx = store.col('x') - px
+        dy = store.col('y') - py
+        d2 = dx * dx + dy * dy
+        far = d2 > Enemy.UNLOAD_DIST_SQ
+        ff = store.col('frames_far')
+        ff[far] += 1
+        ff[~far] = 0
+        gone = ff > Enemy.UNLOAD_DELAY
+
+        tm = cm.tilemap
+        store.update_los(px, py, tm._tile_bitmap, tm.tile_size, self.frame, cm.chunk_size)
+        store.step(px, py, tm.check_collision_batch, self._enemy_grid)
+
+        # Shooters and tanks with a clear line and a ready gun, near the screen
+        x, y = store.col('x'), store.col('y')
+        kind = store.col('kind')
+        sx, sy = x - self.cam_x, y - self.cam_y
+        fire = (~gone & store.col('los') & (store.col('shoot_cooldown') == 0)
+                & ((kind == _horde_mod.KINDS.index('shooter')) | (kind == _horde_mod.KINDS.index('tank')))
+                & (sx >= -200) & (sx <= VIEWPORT_W + 200) & (sy >= -200) & (sy <= VIEWPORT_H + 200))
+        for i in _np.flatnonzero(fire).tolist():
+            store.handles[i].shoot(px, py, self.enemy_bullets)
+
+        # Contact damage — the enemy dies on impact
+        contact = _np.zeros(store.n, dtype=bool)
+        for enemy in touching:
+            if enemy.__class__ is HordeEnemy and enemy._store is store:
+                contact[enemy._row] = True
+        contact &= ~gone
+        for i in _np.flatnonzero(contact).tolist():
+            self._contact_hit(store.handles[i])
+
+        store.remove(gone | contact)
+        return _np.arange(store.n)
+
+    def _contact_hit(self, enemy: Enemy) -> bool:
+        """The player touched *enemy*: take its contact damage, and unless it
+        is a boss it dies on impact (kill, burst, drop).  True if it died;
+        removing it is the caller's job."""
+        self.player.take_damage(CONTACT_DAMAGE.get(enemy.enemy_type, 1))
+        if enemy.is_boss:
+            return False
+        self.kills += 1
+        style = ENEMY_STYLES.get(enemy.enemy_type, {'rim': (255, 100, 60)})
+        self.particles.burst(enemy.x, enemy.y, 14, speed=(1.8, 4.5),
+                             color=style['rim'], size=4, life=35)
+        self.items.add(enemy.x, enemy.y, self._random_item_type())
+        return True
+
+    def _enemy_columns(self, objs: list, rows) -> tuple:
+        """(x, y, size, health, slot) arrays for objs followed by store rows."""
+        store = self._horde
+        def cat(name, attr, dtype):
+            head = _np.fromiter((getattr(e, attr) for e in objs), dtype=dtype, count=len(objs))
+            return _np.concatenate((head, getattr(store, name)[rows].astype(dtype)))
+        return (cat('x', 'x', _np.float64), cat('y', 'y', _np.float64),
+                cat('size', 'size', _np.float64), cat('health', 'health', _np.float64),
+                cat('slot', 'slot', _np.int64))
+
+    def _orbital_hits(self, touch_ids: set) -> None:
+        """Orbital saw damage against the enemies each saw overlaps at the start
+        of the tick (enemies that died on contact are skipped)."""
+        p = self.player
+        count = p.orbital_count
+        size  = max(4, 14 - count)
+        for i in range(count):
+            a = p.orbital_angle + i*2*math.pi/count
+            for enemy in self._enemy_index.overlapping(p.x + math.cos(a)*55, p.y + math.sin(a)*55, size):
+                if id(enemy) not in touch_ids or enemy.is_boss:
+                    enemy.health -= 3
+
+    def _recycle_enemy_slots(self) -> None:
+        """Free slots of enemies that left play and scrub them from bullet hit masks."""
+        live = {e.slot for e in self.enemies if e.__class__ is not HordeEnemy and e.slot >= 0}
+        if self._horde is not None:
+            live.update(self._horde.col('slot').tolist())
+        freed = self._enemy_slots.retain(live)
+        if freed:
+            keep = ~freed
+            for b in self.bullets:
+                if b.hit_mask:
+                    b.hit_mask &= keep
+
+    def _on_enemy_killed(self, enemy: Enemy) -> None:
+        """Kill bookkeeping for an enemy destroyed by bullets: drop, popup, particles."""
+        self.kills += 1
+        itype = self._boss_item_type() if enemy.is_boss else self._random_item_type()
+        self.items.add(enemy.x, enemy.y, itype)
+        self.popups.append(Popup(
+            '+1 KILL', enemy.x, enemy.y-30, (255,220,60)
+        ))
+        # Death particles
+        style = ENEMY_STYLES.get(enemy.enemy_type, {'rim': (255,120,60)})
+        pcol = style['rim'] if enemy.enemy_type in ENEMY_STYLES else (255,140,60)
+        self.particles.burst(enemy.x, enemy.y, 18, speed=(2.0, 5.0), color=pcol, size=5, life=40)
+        if enemy.is_boss:
+            self.particles.burst(enemy.x, enemy.y, 30, speed=(2.8, 7.0),
+                                 color=(255, 255, 100), size=7, life=55)
+
+    def _resolve_bullet_hits_np(self, hittable: list[Enemy], cols: tuple | None = None) -> set[int]:
+        """Resolve every player-bullet hit this frame in array form.
+
+        Broad-phase: bullets are bucketed once into a sorted uniform grid and
+        all enemies are queried in one call, giving (bullet, enemy) candidate
+        pairs in bulk.  Narrow-phase, per-bullet hit budgets (1 + pierce_left),
+        per-enemy kill cut-off and damage sums (np.add.at) are all vectorised;
+        Python only touches the bullets that actually hit something and the
+        enemies that died.  Returns the indices into *hittable* that were killed.
+
+        cols, if given, is (x, y, size, health, slot) for *hittable* already
+        in array form (see _enemy_columns).
+        """
+        bullets = self.bullets
+        ne = len(hittable)
+        if cols is None:
+            e_x  = _np.array([e.x      for e in hittable], dtype=_np.float64)
+            e_y  = _np.array([e.y      for e in hittable], dtype=_np.float64)
+            e_sz = _np.array([e.size   for e in hittable], dtype=_np.float64)
+            e_hp = _np.array([e.health for e in hittable], dtype=_np.float64)
+            e_slot = _np.array([e.slot for e in hittable], dtype=_np.int64)
+        else:
+            e_x, e_y, e_sz, e_hp, e_slot = cols
+
+        grid = self._bullet_grid
+        grid.build(_np.array([b.x for b in bullets], dtype=_np.float64),
+                   _np.array([b.y for b in bullets], dtype=_np.float64))
+        pair_b, pair_e = grid.query_pairs(e_x, e_y, e_sz + 20.0)
+        if len(pair_b) == 0:
+            return set()
+
+        # Gather per-bullet state only for bullets that are near some enemy
+        ub, lb = _np.unique(pair_b, return_inverse=True)
+        objs   = [bullets[i] for i in ub.tolist()]
+        b_x    = grid.xs[ub]
+        b_y    = grid.ys[ub]
+        b_sz   = _np.array([b.size         for b in objs], dtype=_np.float64)
+        b_dmg  = _np.array([b.damage       for b in objs], dtype=_np.float64)
+        b_prc  = _np.array([b.pierce_left  for b in objs], dtype=_np.int64)
+        b_bnc  = _np.array([b.bounces_left for b in objs], dtype=_np.int64)
+        le     = pair_e
+
+        # Narrow-phase: exact circle overlap
+        dx = b_x[lb] - e_x[le]
+        dy = b_y[lb] - e_y[le]
+        rr = b_sz[lb] + e_sz[le]
+        ov = dx * dx + dy * dy < rr * rr
+        lb, le = lb[ov], le[ov]
+        if len(lb) == 0:
+            return set()
+
+        # Skip enemies a piercing bullet already passed through (slot bitmask test)
+        masks  = [b.hit_mask for b in objs]
+        if self._enemy_slots.fits_u64():
+            bit   = _np.left_shift(_np.uint64(1), e_slot[le].astype(_np.uint64))
+            fresh = (_np.array(masks, dtype=_np.uint64)[lb] & bit) == 0
+        else:
+            fresh = _np.fromiter(((masks[b] >> s) & 1 == 0
+                                  for b, s in zip(lb.tolist(), e_slot[le].tolist())),
+                                 dtype=bool, count=len(lb))
+        lb, le = lb[fresh], le[fresh]
+        if len(lb) == 0:
+            return set()
+
+        # Per-bullet budget: a bullet hits at most 1 + pierce_left enemies,
+        # taken in enemy order (the order the scalar loop visited them).
+        # Per-enemy kill cut-off: once an enemy's health is spent, later
+        # bullets in its run are not consumed.  The first hit always lands.
+        # A hit the cut-off drops does not use up the bullet's budget, so the
+        # candidates it rejects are removed and the budget re-ranked until
+        # nothing more is cut; each pass only removes pairs.
+        order  = _np.lexsort((le, lb))
+        lb, le = lb[order], le[order]
+        while True:
+            keep   = _rank_in_runs(lb) <= b_prc[lb]
+            hb, he = lb[keep], le[keep]
+            order  = _np.lexsort((hb, he))
+            hb, he = hb[order], he[order]
+            dmg    = b_dmg[hb]
+            cum    = _np.cumsum(dmg)
+            run_start = _np.r_[True, he[1:] != he[:-1]]
+            base   = _np.maximum.accumulate(_np.where(run_start, cum - dmg, 0.0))
+            used   = run_start | (cum - dmg - base < e_hp[he])
+            if used.all():
+                break
+            cut    = hb[~used] * ne + he[~used]
+            alive  = ~_np.isin(lb * ne + le, cut)
+            lb, le = lb[alive], le[alive]
+        lb, le = hb, he
+
+        # Damage accumulation
+        e_dmg = _np.zeros(ne, dtype=_np.float64)
+        _np.add.at(e_dmg, le, dmg)
+
+        # Bullet bookkeeping: pierce decrement, then bounce or removal once spent
+        hits      = _np.bincount(lb, minlength=len(ub))
+        hit_b     = _np.where(hits > 0)[0]
+        spent     = hits > b_prc
+        bounce    = spent & (b_bnc > 0)
+        remove    = spent & ~bounce
+        last_e    = _np.full(len(ub), -1, dtype=_np.int64)
+        last_e[lb] = le
+        for i in hit_b.tolist():
+            b = objs[i]
+            b.pierce_left = max(0, b.pierce_left - int(hits[i]))
+        for b_i, s in zip(lb.tolist(), e_slot[le].tolist()):
+            objs[b_i].hit_mask |= 1 << s
+        for i in _np.where(bounce)[0].tolist():
+            b = objs[i]
+            e = hittable[int(last_e[i])]
+            bdx, bdy = b.x - e.x, b.y - e.y
+            dist2 = math.sqrt(bdx*bdx + bdy*bdy)
+            if dist2 > 0: b.dir = [bdx/dist2, bdy/dist2]
+            b.bounces_left -= 1
+            b.lifetime = min(b.lifetime, 60)
+            b.x += b.dir[0]*b.speed*2
+            b.y += b.dir[1]*b.speed*2
+        if _np.any(remove):
+            gone = _np.zeros(len(bullets), dtype=bool)
+            gone[ub[remove]] = True
+            self.bullets = [bullets[i] for i in _np.where(~gone)[0].tolist()]
+
+        # Apply damage; only enemies that took a hit this frame can die here
+        killed: set[int] = set()
+        for ei in _np.where(e_dmg > 0)[0].tolist():
+            enemy = hittable[ei]
+            enemy.health -= float(e_dmg[ei])
+            if enemy.health <= 0:
+                killed.add(ei)
+        return killed
+
+    def _resolve_bullet_hits_py(self, hittable: list[Enemy]) -> set[int]:
+        """Pure-Python hit resolution (no NumPy): dict grid + per-hit loop."""
+        bullets_to_remove: set[int] = set()
+        killed_idx: set[int] = set()
+        _BCELL = 80
+        bullet_grid: dict = {}
+        for _b in self.bullets:
+            _k = (int(_b.x) // _BCELL, int(_b.y) // _BCELL)
+            if _k not in bullet_grid:
+                bullet_grid[_k] = []
+            bullet_grid[_k].append(_b)
+
+        for ei, enemy in enumerate(hittable):
+            ebit = 1 << enemy.slot
+            _ecx = int(enemy.x) // _BCELL
+            _ecy = int(enemy.y) // _BCELL
+            _nearby = []
+            for _ddx in range(-1, 2):
+                for _ddy in range(-1, 2):
+                    _nearby.extend(bullet_grid.get((_ecx+_ddx, _ecy+_ddy), []))
             for b in _nearby:
                 if id(b) in bullets_to_remove: continue
-                if killed: break
-                if id(enemy) in b.hit_enemies: continue
+                if b.hit_mask & ebit: continue
                 bdx, bdy = b.x-enemy.x, b.y-enemy.y
                 if bdx*bdx+bdy*bdy < (b.size+enemy.size)**2:
-                    b.hit_enemies.add(eid)
+                    b.hit_mask |= ebit
                     enemy.health -= b.damage
 
-
                     if b.pierce_left > 0:
                         b.pierce_left -= 1
                     elif b.bounces_left > 0:
@@ -2445,27 +2921,11 @@ class ShooterGame:
                         bullets_to_remove.add(id(b))
 
                     if enemy.health <= 0:
-                        self.kills += 1
-                        killed = True
-                        itype = self._boss_item_type() if enemy.is_boss else self._random_item_type()
-                        self.items.append(Item(enemy.x, enemy.y, itype))
-                        self.popups.append(Popup(
-                            '+1 KILL', enemy.x, enemy.y-30, (255,220,60)
-                        ))
-                        # Death particles
-                        style = ENEMY_STYLES.get(enemy.enemy_type, {'rim': (255,120,60)})
-                        pcol = style['rim'] if enemy.enemy_type in ENEMY_STYLES else (255,140,60)
-                        self.particles += _spawn_particles(enemy.x, enemy.y, pcol,
-                                                           count=18, speed=5.0, size=5, life=40)
-                        if enemy.is_boss:
-                            self.particles += _spawn_particles(enemy.x, enemy.y, (255,255,100),
-                                                               count=30, speed=7.0, size=7, life=55)
-
-            if not killed:
-                still_alive.append(enemy)
+                        killed_idx.add(ei)
+                        break
 
         self.bullets = [b for b in self.bullets if id(b) not in bullets_to_remove]
-        self.enemies = still_alive
+        return killed_idx
 
     def _random_item_type(self) -> str:
         p = self.player
@@ -2493,8 +2953,15 @@ class ShooterGame:
     # Enemy bullet update
     # ------------------------------------------------------------------
 
-    def _update_enemy_bullets(self):
+    def _update_enemy_bullets(self) -> list[int]:
+        """Move, collide and expire enemy bullets.
+
+        Runs as a frame job, so it never touches the player directly: the
+        damage of every bullet that reached the player is returned and applied
+        by _apply_enemy_bullet_hits at the next barrier.
+        """
         p  = self.player
+        player_hits: list[int] = []
         ws = WORLD_SIZE
         cdist_sq = float((p.SIZE + 7) ** 2)
         _cx, _cy = self.cam_x, self.cam_y
@@ -2503,37 +2970,13 @@ class ShooterGame:
         if len(self.enemy_bullets) > 1500:
             self.enemy_bullets = self.enemy_bullets[-1500:]
 
-        # --- Partition: homing needs per-frame steering, rest go numpy ---
-        simple_eb: list = []
-        homing_eb: list = []
-        for b in self.enemy_bullets:
-            if b.bullet_type == 'homing':
-                homing_eb.append(b)
-            else:
-                simple_eb.append(b)
-
-        # --- Python path for homing bullets ---
-        homing_keep: list = []
-        for b in homing_eb:
-            b.update(p.x, p.y)
-            if b.lifetime <= 0 or b.x < 0 or b.x > ws or b.y < 0 or b.y > ws:
-                continue
-            dx, dy = b.x - p.x, b.y - p.y
-            if dx * dx + dy * dy < cdist_sq:
-                p.take_damage(2)
-                continue
-            if self.chunk_manager.tilemap.check_collision(b.x, b.y, b.size):
-                continue
-            homing_keep.append(b)
-
-        if not simple_eb:
-            self.enemy_bullets = homing_keep
-            return
+        if not self.enemy_bullets:
+            return player_hits
 
         if not _NUMPY:
-            # Pure-Python fallback
-            keep = list(homing_keep)
-            for b in simple_eb:
+            # Pure-Python fallback (EnemyBullet.update handles homing steering)
+            keep = []
+            for b in self.enemy_bullets:
                 b.update(p.x, p.y)
                 if b.lifetime <= 0 or b.x < 0 or b.x > ws or b.y < 0 or b.y > ws:
                     continue
@@ -2543,25 +2986,36 @@ class ShooterGame:
                     elif b.bullet_type == 'mortar':  dmg = 2
                     elif b.bullet_type == 'laser':   dmg = 2
                     elif b.bullet_type == 'snipe':   dmg = 2
+                    elif b.bullet_type == 'homing':  dmg = 2
                     else:                            dmg = 1
-                    p.take_damage(dmg)
+                    player_hits.append(dmg)
                     continue
                 if self.chunk_manager.tilemap.check_collision(b.x, b.y, b.size):
                     continue
                 keep.append(b)
             self.enemy_bullets = keep
-            return
-
-        # --- numpy vectorised path for all non-homing enemy bullets ---
-        xs   = _np.array([b.x        for b in simple_eb], dtype=_np.float64)
-        ys   = _np.array([b.y        for b in simple_eb], dtype=_np.float64)
-        dxs  = _np.array([b.dir[0]   for b in simple_eb], dtype=_np.float64)
-        dys  = _np.array([b.dir[1]   for b in simple_eb], dtype=_np.float64)
-        spds = _np.array([b.speed    for b in simple_eb], dtype=_np.float64)
-        szs  = _np.array([b.size     for b in simple_eb], dtype=_np.float64)
-        lts  = _np.array([b.lifetime for b in simple_eb], dtype=_np.int32)
-
-        # Move + lifetime decrement (replaces b.update() for non-homing bullets)
+            return player_hits
+
+        # --- numpy vectorised path for all enemy bullets, homing included ---
+        ebs  = self.enemy_bullets
+        xs   = _np.array([b.x        for b in ebs], dtype=_np.float64)
+        ys   = _np.array([b.y        for b in ebs], dtype=_np.float64)
+        dxs  = _np.array([b.dir[0]   for b in ebs], dtype=_np.float64)
+        dys  = _np.array([b.dir[1]   for b in ebs], dtype=_np.float64)
+        spds = _np.array([b.speed    for b in ebs], dtype=_np.float64)
+        szs  = _np.array([b.size     for b in ebs], dtype=_np.float64)
+        lts  = _np.array([b.lifetime for b in ebs], dtype=_np.int32)
+        homing = _np.array([b.bullet_type == 'homing' for b in ebs], dtype=bool)
+
+        # Homing steering — lerp toward the player and renormalise in one batch
+        h_idx = _np.where(homing)[0]
+        if len(h_idx) > 0:
+            hdx, hdy = dxs[h_idx], dys[h_idx]
+            steer_homing_batch(xs[h_idx], ys[h_idx], hdx, hdy, p.x, p.y)
+            dxs[h_idx] = hdx
+            dys[h_idx] = hdy
+
+        # Move + lifetime decrement (replaces b.update())
         lts -= 1
         xs  += dxs * spds
         ys  += dys * spds
@@ -2569,352 +3023,503 @@ class ShooterGame:
         # Kill expired or out-of-bounds
         dead = (lts <= 0) | (xs < 0) | (xs > ws) | (ys < 0) | (ys > ws)
 
-        # Tile collision (vectorised via bitmap)
-        alive_idx = _np.where(~dead)[0]
+        # Player reach (vectorised)
+        dx_p = xs - p.x
+        dy_p = ys - p.y
+        near = (~dead) & (dx_p * dx_p + dy_p * dy_p < cdist_sq)
+
+        # Tile collision (vectorised via bitmap).  Homing bullets test the
+        # player before walls, so one that reaches both this tick still hits.
+        alive_idx = _np.where(~dead & ~(near & homing))[0]
         if len(alive_idx) > 0:
             tile_hit = self.chunk_manager.tilemap.check_collision_batch(
                 xs[alive_idx], ys[alive_idx], szs[alive_idx]
             )
             dead[alive_idx] |= tile_hit
 
-        # Player collision (vectorised)
-        dx_p = xs - p.x
-        dy_p = ys - p.y
-        hits_player = (~dead) & (dx_p * dx_p + dy_p * dy_p < cdist_sq)
+        # Player collision
+        hits_player = near & ~dead
         hit_p_idx = _np.where(hits_player)[0]
         for i in hit_p_idx:
-            b = simple_eb[int(i)]
+            b = ebs[int(i)]
             if b.is_cannon:                 dmg = 3
             elif b.bullet_type == 'mortar':  dmg = 2
             elif b.bullet_type == 'laser':   dmg = 2
             elif b.bullet_type == 'snipe':   dmg = 1
+            elif b.bullet_type == 'homing':  dmg = 2
             else:                            dmg = 1
-            p.take_damage(dmg)
+            player_hits.append(dmg)
         dead[hit_p_idx] = True
 
-        # Write back survivors
+        # Write back survivors (homing bullets also carry their new heading)
         surv_idx = _np.where(~dead)[0]
         for i in surv_idx:
-            b          = simple_eb[int(i)]
+            b          = ebs[int(i)]
             b.x        = float(xs[i])
             b.y        = float(ys[i])
             b.lifetime = int(lts[i])
+        for i in _np.where(homing & ~dead)[0]:
+            b = ebs[int(i)]
+            b.dir[0] = float(dxs[i])
+            b.dir[1] = float(dys[i])
+
+        self.enemy_bullets = [ebs[int(i)] for i in surv_idx]
+        return player_hits
 
-        self.enemy_bullets = [simple_eb[int(i)] for i in surv_idx] + homing_keep
+    def _apply_enemy_bullet_hits(self, player_hits: list[int]) -> None:
+        for dmg in player_hits:
+            self.player.take_damage(dmg)
 
     # ------------------------------------------------------------------
     # Item pickup
     # ------------------------------------------------------------------
 
-    def _pickup_items(self):
+    def _update_items(self):
+        """Magnet pull and pickups for every crate, in one pass over the store."""
         p = self.player
-        keep = []
-        for item in self.items:
-            dx, dy = item.x-p.x, item.y-p.y
-            if dx*dx+dy*dy < (item.size+p.SIZE+8)**2:
-                cfg = ITEM_CONFIG.get(item.type, {})
-                self.popups.append(Popup(
-                    cfg.get('name', item.type), item.x, item.y-25,
-                    cfg.get('color', C_WHITE)
-                ))
+        pull_range, pull_speed = p.magnet_pull()
+        angle, picked = self.items.step(p.x, p.y, pull_range, pull_speed,
+                                        Item.CRATE_SIZE + p.SIZE + 8)
+        p.update_magnet(angle)
+        for itype, x, y, stack in picked:
+            cfg  = ITEM_CONFIG.get(itype, {})
+            name = cfg.get('name', itype)
+            self.popups.append(Popup(
+                name if stack == 1 else f'{name} x{stack}', x, y-25,
+                cfg.get('color', C_WHITE)
+            ))
+            item = Item(x, y, itype)
+            for _ in range(stack):
                 item.apply_to(p)
-            else:
-                keep.append(item)
-        self.items = keep
 
     # ------------------------------------------------------------------
     # Draw
     # ------------------------------------------------------------------
 
-    def _draw(self):
+    def _draw(self, alpha: float = 1.0):
+        """Render the world; alpha < 1 draws moving things that fraction of
+        the way from their previous tick's position to the current one."""
+        back  = 1.0 - alpha
+        saved = self._interpolate(back) if back > 0.0 else None
+
         scr = self.screen
+        buf = self._draw_buffer
+        L   = _drawbuf_mod
         cx, cy = self.cam_x, self.cam_y
         p = self.player
         VW, VH = VIEWPORT_W, VIEWPORT_H
+        q = self._quality.settings
 
         # Frustum helper — True if world-space (wx, wy) is within the viewport + margin
         def vis(wx, wy, m=24):
             sx = wx - cx; sy = wy - cy
             return -m < sx < VW + m and -m < sy < VH + m
 
-        # Seamless floor
+        # Seamless floor and tiles, straight onto the viewport under everything else
         self._draw_floor()
-
-        # Tiles
-        self.wall_renderer.draw_tiles(scr, cx, cy, VW, VH, self.frame)
+        self.wall_renderer.draw_tiles(scr, cx, cy, VW, VH, self.frame, edges=q['wall_edges'])
 
         # Orbital + Player
-        p.draw_orbital(scr, cx, cy, self.frame)
-        p.draw_magnet(scr, cx, cy)
-        p.draw(scr, cx, cy, self.frame)
-
-        # Player bullets — batch blit via pre-rendered surfaces (no per-call draw overhead)
-        # Bullets with lifetime <= _BFADE frames fade toward black (drawn individually).
-        _bn = self._bsurf_normal
-        _bb = self._bsurf_bounce
-        _bp = self._bsurf_pierce
+        p.draw_orbital(buf.layer(L.ORBITAL), cx, cy, self.frame)
+        p.draw_magnet(buf.layer(L.MAGNET), cx, cy)
+        p.draw(buf.layer(L.PLAYER), cx, cy, self.frame)
+
+        # Player bullets — culled to the viewport.  Bullets in their last
+        # BULLET_FADE frames pick a darker surface from the fade ramp.
         _bh = self._bsurf_half
-        _BFADE = 120   # 2-second fade window
-        _batch_n: list = []
-        _batch_b: list = []
-        _batch_p: list = []
-        for b in self.bullets:
-            sx = int(b.x - cx)
-            sy = int(b.y - cy)
-            if -_bh < sx < VW + _bh and -_bh < sy < VH + _bh:
-                if b.lifetime <= _BFADE:
-                    frac = b.lifetime / _BFADE
-                    if b.max_pierce > 0:   _bc = C_BULLET_PIERCE
-                    elif b.max_bounces > 0: _bc = C_BULLET_BOUNCE
-                    else:                   _bc = C_BULLET
-                    pygame.draw.circle(scr,
-                        (int(_bc[0]*frac), int(_bc[1]*frac), int(_bc[2]*frac)),
-                        (sx, sy), Bullet.SIZE)
-                else:
-                    pos = (sx - _bh, sy - _bh)
-                    if b.max_pierce > 0:
-                        _batch_p.append((_bp, pos))
-                    elif b.max_bounces > 0:
-                        _batch_b.append((_bb, pos))
-                    else:
-                        _batch_n.append((_bn, pos))
-        if _batch_n: scr.blits(_batch_n)
-        if _batch_b: scr.blits(_batch_b)
-        if _batch_p: scr.blits(_batch_p)
+        _bullet_blits = self._player_bullet_blits(cx, cy, VW, VH, _bh, back, q['bullet_fade'])
+        if _bullet_blits:
+            buf.extend(L.PLAYER_BULLETS, _bullet_blits)
 
-        # Enemy bullets — same batch approach, grouped by type for one blits() call
+        # Enemy bullets — one pre-rendered surface per type
         _eb_blit: list = []
         for b in self.enemy_bullets:
-            sx = int(b.x - cx)
-            sy = int(b.y - cy)
+            if back:
+                sx = int(b.x - b.dir[0] * b.speed * back - cx)
+                sy = int(b.y - b.dir[1] * b.speed * back - cy)
+            else:
+                sx = int(b.x - cx)
+                sy = int(b.y - cy)
             key  = 'cannon' if b.is_cannon else b.bullet_type
             sdat = self._eb_surfs.get(key) or self._eb_surfs['normal']
             ebs, ebh = sdat
             if -ebh < sx < VW + ebh and -ebh < sy < VH + ebh:
                 _eb_blit.append((ebs, (sx - ebh, sy - ebh)))
         if _eb_blit:
-            scr.blits(_eb_blit)
-
-        # Enemies and bosses — always drawn (no culling)
-        for e in self.enemies:
-            e.draw(scr, cx, cy)
+            buf.extend(L.ENEMY_BULLETS, _eb_blit)
+
+        # Enemies and bosses — culled to the viewport by the reach of their art,
+        # atlas sprites, then the final boss (drawn by hand), then health bars.
+        # In a big on-screen crowd the small types drop to their plain disc.
+        detail = q['enemy_detail']
+        store  = self._horde
+        objs = [e for e in self.enemies
+                if e.__class__ is not HordeEnemy and vis(e.x, e.y, m=_sprites_mod.reach(e.size))]
+        rows = ()
+        if store is not None and store.n:
+            sx = store.col('x') - cx
+            sy = store.col('y') - cy
+            m  = _sprites_mod.reach(store.col('size'))
+            rows = _np.flatnonzero((sx > -m) & (sx < VW + m) & (sy > -m) & (sy < VH + m))
+        drawn = len(objs) + len(rows)
+        lod   = _sprites_mod.LOD_SIZE if drawn > _sprites_mod.LOD_CROWD else 0
+        seq: list = []
+        bars: list = []
+        hand: list = []
+        for e in objs:
+            sx, sy = int(e.x - cx), int(e.y - cy)
+            if not ENEMY_ATLAS.add(e, sx, sy, seq, detail, cx, cy, lod):
+                hand.append(e)
+            ENEMY_ATLAS.add_bar(e, sx, sy, bars)
+        if len(rows):
+            ENEMY_ATLAS.add_rows(store, rows, cx, cy, seq, detail, lod)
+            ENEMY_ATLAS.add_bars(store, rows, cx, cy, bars)
+        buf.extend(L.ENEMIES, seq)
+        for e in hand:
+            buf.call(L.ENEMIES, partial(self._hand_drawn, int(e.x - cx), int(e.y - cy),
+                                        int(_sprites_mod.reach(e.size)), e._draw_final_boss))
+        buf.extend(L.ENEMY_BARS, bars)
+        self._enemies_drawn  = drawn
+        self._enemies_culled = len(self.enemies) - drawn
+        self._enemies_lod    = lod > 0
 
         # Items — cull with a larger margin so magnetised items just off-screen still appear smoothly
-        for item in self.items:
-            if vis(item.x, item.y, m=60):
-                item.draw(scr, cx, cy)
+        glow, label = q['item_glow'], q['item_labels']
+        seq = []
+        ITEM_ATLAS.add_rows(self.items, self.items.visible(cx, cy, VW, VH, 60),
+                            cx, cy, seq, glow, label)
+        buf.extend(L.ITEMS, seq)
 
-        # Particles — tight cull, they're tiny
-        for part in self.particles:
-            if vis(part.x, part.y, m=8):
-                part.draw(scr, cx, cy)
+        # Particles — newest under the quality cap, culled by the engine, and
+        # backed off along their last step like everything else
+        self.particles.draw(buf.layer(L.PARTICLES), cx, cy, t=-back, limit=q['particles'])
 
         # Popups — generous margin so text isn't clipped mid-float
+        popups = buf.layer(L.POPUPS)
         for popup in self.popups:
             if vis(popup.x, popup.y, m=80):
-                popup.draw(scr, cx, cy)
+                popup.draw(popups, cx, cy, back)
 
-        # Vignette (dark-edge overlay, pre-cached)
-        scr.blit(self._vignette, (0, 0))
+        # Vignette (dark-edge overlay, pre-cached; 'floor' is baked into the floor)
+        if q['vignette']:
+            self._vignette.draw(buf.layer(L.VIGNETTE), q['vignette'])
+
+        buf.flush(scr)
 
         # HUD
         self._draw_hud()
 
+        if saved is not None:
+            self._restore_positions(saved)
+
         # Composite
         self._flip()
 
+    def _interpolate(self, back: float) -> tuple:
+        """Move camera, player and enemies `back` of a tick toward the positions
+        they had at the start of the last tick.  Returns what _restore_positions needs."""
+        p = self.player
+        objs  = [e for e in self.enemies if e.__class__ is not HordeEnemy]
+        store = self._horde
+        rows  = None
+        if store is not None and store.n:
+            rows = (store.col('x').copy(), store.col('y').copy())
+            store.col('x')[:] += (store.col('prev_x') - rows[0]) * back
+            store.col('y')[:] += (store.col('prev_y') - rows[1]) * back
+        saved = (self.cam_x, self.cam_y, p.x, p.y, [(e, e.x, e.y) for e in objs], rows)
+        pcx, pcy = self._prev_cam
+        self.cam_x += (pcx - self.cam_x) * back
+        self.cam_y += (pcy - self.cam_y) * back
+        ppx, ppy = self._prev_player
+        p.x += (ppx - p.x) * back
+        p.y += (ppy - p.y) * back
+        prev = self._prev_enemy
+        for e in objs:
+            old = prev.get(id(e))
+            if old is not None:
+                e.x += (old[0] - e.x) * back
+                e.y += (old[1] - e.y) * back
+        return saved
+
+    def _restore_positions(self, saved: tuple) -> None:
+        self.cam_x, self.cam_y, self.player.x, self.player.y, enemies, rows = saved
+        for e, x, y in enemies:
+            e.x, e.y = x, y
+        if rows is not None:
+            n = len(rows[0])
+            self._horde.x[:n] = rows[0]
+            self._horde.y[:n] = rows[1]
+
+    def _player_bullet_blits(self, cx: float, cy: float, vw: int, vh: int, half: int,
+                             back: float = 0.0, fade: bool = True) -> list:
+        """(surface, pos) tuples for every visible player bullet, fade ramp applied.
+
+        back > 0 draws each bullet that fraction of its last tick's travel behind
+        its current position (render interpolation).  fade=False draws every
+        bullet at full brightness."""
+        bullets = self.bullets
+        if not bullets:
+            return []
+        ramp = self._bullet_ramp
+        top  = BULLET_FADE_LEVELS - 1
+        if not _NUMPY:
+            out = []
+            for b in bullets:
+                sx = int(b.x - b.dir[0] * b.speed * back - cx)
+                sy = int(b.y - b.dir[1] * b.speed * back - cy)
+                if -half < sx < vw + half and -half < sy < vh + half:
+                    lvl = min(top, b.lifetime * BULLET_FADE_LEVELS // BULLET_FADE) if fade else top
+                    out.append((ramp[b.ramp_base + lvl], (sx - half, sy - half)))
+            return out
+
+        n   = len(bullets)
+        xs  = _np.fromiter([b.x for b in bullets], dtype=_np.float64, count=n) - cx
+        ys  = _np.fromiter([b.y for b in bullets], dtype=_np.float64, count=n) - cy
+        if back:
+            step = _np.fromiter([b.speed for b in bullets], dtype=_np.float64, count=n) * back
+            xs  -= _np.fromiter([b.dir[0] for b in bullets], dtype=_np.float64, count=n) * step
+            ys  -= _np.fromiter([b.dir[1] for b in bullets], dtype=_np.float64, count=n) * step
+        sx  = xs.astype(_np.int32)
+        sy  = ys.astype(_np.int32)
+        vis = (sx > -half) & (sx < vw + half) & (sy > -half) & (sy < vh + half)
+        idx = _np.flatnonzero(vis)
+        if len(idx) == 0:
+            return []
+        vb  = [bullets[i] for i in idx.tolist()] if len(idx) < n else bullets
+        k   = _np.fromiter([b.ramp_base for b in vb], dtype=_np.int64, count=len(vb))
+        if fade:
+            lvl = _np.fromiter([b.lifetime for b in vb], dtype=_np.int64, count=len(vb))
+            k  += _np.minimum(top, lvl * BULLET_FADE_LEVELS // BULLET_FADE)
+        else:
+            k  += top
+        return list(zip(map(ramp.__getitem__, k.tolist()),
+                        zip((sx[idx] - half).tolist(), (sy[idx] - half).tolist())))
+
     # ------------------------------------------------------------------
     # HUD
     # ------------------------------------------------------------------
 
+    def _build_hud(self) -> HudLayer:
+        """The HUD widgets, each bound to the values it shows (see hud.py)."""
+        hud = HudLayer()
+        hud.add('powerups', self._powerup_state, self._paint_powerup_panel)
+        hud.add('kills',    self._kill_state,    self._paint_kill_counter)
+        hud.add('health',   self._health_state,  self._paint_health_bar)
+        hud.add('boss',     self._boss_state,    self._paint_boss_bar)
+        hud.add('debug',    self._debug_state,   self._paint_debug_overlay)
+        return hud
+
     def _draw_hud(self):
-        self._draw_powerup_panel()
-        self._draw_kill_counter()
-        self._draw_health_bar()
+        self._hud.draw(self.screen)
         if self.boss_active and self.current_boss:
-            self._draw_boss_bar()
-            self._draw_boss_pointer()
-        self._draw_debug_overlay()
-
-    def _draw_debug_overlay(self):
-        """Top-right corner: FPS counter and bullet counts."""
-        scr  = self.screen
-        f    = _get_font(13)
+            self._draw_boss_pointer()   # moves and pulses every frame: drawn directly
+
+    # -- debug overlay ---------------------------------------------------
+
+    def _debug_state(self):
+        """Top-right corner: FPS counter, bullet counts and frame-job timings."""
         fps  = self.clock.get_fps()
         pb   = len(self.bullets)
         eb   = len(self.enemy_bullets)
+        jobs = self._frame_jobs
+        times = jobs.timings()
+        slow_name, slow_ms = max(times, key=lambda t: t[1])
         lines = [
             (f'FPS  {fps:5.1f}', (120, 220, 120) if fps >= 55 else (255, 200, 60) if fps >= 30 else (255, 80, 80)),
             (f'PBUL {pb:5d}',    (180, 180, 255)),
             (f'EBUL {eb:5d}',    (255, 160, 160)),
+            (f'ENEM {self._enemies_drawn:5d} drawn {self._enemies_culled:5d} culled'
+             + (' LOD' if self._enemies_lod else ''), (255, 200, 140)),
+            (f'JOBS {sum(ms for _, ms in times):5.2f}ms x{jobs.workers}', (200, 200, 200)),
+            (f'{slow_name} {slow_ms:5.2f}ms', (160, 160, 160)),
         ]
-        x = VIEWPORT_W - 4
-        y = 36   # below the health bar (bar ends at y≈28)
+        gov = self._quality
+        target = f'/{gov.target_ms:.1f}' if gov.adaptive else ' fixed'
+        lines.append((f'QUAL {gov.settings["name"]} p{int(gov.percentile * 100)} '
+                      f'{gov.current_ms():5.2f}{target}ms', (220, 200, 140)))
+        for lvl, ms, saved in gov.savings():
+            tag = '' if saved is None or lvl == 0 else f' {-saved:+5.2f}'
+            lines.append((f'L{lvl} {gov.levels[lvl]["name"]:<6} {ms:5.2f}ms{tag}',
+                          (230, 230, 160) if lvl == gov.level else (150, 150, 130)))
+        hits, misses, held = TEXT_CACHE.stats()
+        lines.append((f'TEXT {hits} hit {misses} miss {held} held', (170, 190, 210)))
+        hud = self._hud
+        lines.append((f'HUD  {hud.rerendered} of {len(hud.names())} widgets re-rendered',
+                      (170, 190, 210)))
+        buf = self._draw_buffer
+        lines.append((f'DRAW {buf.commands} cmds {buf.submitted} calls -> {buf.emitted}',
+                      (170, 190, 210)))
+        return tuple(lines)
+
+    def _paint_debug_overlay(self, lines):
+        f  = _get_font(13)
         lh = f.get_linesize() + 2
-        for text, col in lines:
-            surf = f.render(text, True, col)
-            scr.blit(surf, (x - surf.get_width(), y))
-            y += lh
+        surfs = [TEXT_CACHE.render(f, text, col) for text, col in lines]
+        w = max(s.get_width() for s in surfs)
+        out = widget_surface(w, lh * len(surfs))
+        for i, surf in enumerate(surfs):
+            put(out, surf, (w - surf.get_width(), i * lh))
+        return out, (VIEWPORT_W - 4 - w, 36)   # below the health bar (bar ends at y≈28)
 
-    def _draw_powerup_panel(self):
-        scr = self.screen
-        p   = self.player
+    # -- power-up panel --------------------------------------------------
 
-        px, py = 12, 12
-        pw  = 190   # column width for right-aligning values
-        sf  = _get_font(14)
-        hf  = _get_font(12)
-        y   = py
-        lh  = 20
-        sh  = 16   # section header height
-
-        def _txt(text, color, bx, by):
-            shadow = sf.render(text, True, (0, 0, 0))
-            scr.blit(shadow, (bx+1, by+1))
-            scr.blit(sf.render(text, True, color), (bx, by))
-
-        def section(label):
-            nonlocal y
-            y += 4
-            lbl = hf.render(label, True, (110, 105, 90))
-            scr.blit(lbl, (px + 2, y))
-            pygame.draw.line(scr, (70, 65, 52),
-                             (px + 2, y + sh - 2), (px + pw - 2, y + sh - 2), 1)
-            y += sh
+    def _powerup_state(self):
+        """('section', label) and ('row', label, value text, colour, active) entries."""
+        p = self.player
+        speed_pct = int((p.speed / Player.BASE_SPEED) * 100)
+        mag_range = int(200 + p.magnet_count * 250) if p.magnet_count else 0
 
         def row(label, val, col):
-            nonlocal y
             # val is a number or string; active when non-zero / non-default
             if isinstance(val, str):
                 active = val not in ('0', '100%', 'NO')
             else:
                 active = val != 0
+            return ('row', label, str(val), col, active)
+
+        return (
+            ('section', '— BULLET —'),
+            row('Fire Rate',   f'{p.get_fire_rate_pct()}%',  (255, 100, 255)),
+            row('Multi-Shot',  p.multi_shot,                  (100, 200, 255)),
+            row('Damage',      p.damage,                      (255, 150,  50)),
+            row('Pierce',      p.bullet_pierce,               (220,  60, 255)),
+            ('section', '— BODY —'),
+            row('Speed',       f'{speed_pct}%',               (100, 255, 100)),
+            ('section', '— SPECIAL —'),
+            row('Orbital Saws', p.orbital_count,              (255, 210,   0)),
+            row('Dual Guns',   p.dual_gun_count,              (255, 100, 100)),
+            row('Magnet Range', mag_range,                    (100, 200, 255)),
+        )
+
+    def _paint_powerup_panel(self, entries):
+        pw  = 190   # column width for right-aligning values
+        sf  = _get_font(14)
+        hf  = _get_font(12)
+        lh  = 20
+        sh  = 16   # section header height
+        out = widget_surface(pw + 2, sum(4 + sh if e[0] == 'section' else lh for e in entries) + 4)
+        y   = 0
+
+        def _txt(text, color, bx, by):
+            put(out, TEXT_CACHE.render(sf, text, color, shadow=(0, 0, 0), offset=1), (bx, by))
+
+        for entry in entries:
+            if entry[0] == 'section':
+                y += 4
+                put(out, TEXT_CACHE.render(hf, entry[1], (110, 105, 90)), (2, y))
+                pygame.draw.line(out, (70, 65, 52), (2, y + sh - 2), (pw - 2, y + sh - 2), 1)
+                y += sh
+                continue
+            _, label, vs, col, active = entry
             dot_c = col if active else (50, 48, 42)
-            pygame.draw.circle(scr, dot_c, (px + 6, y + 8), 4)
+            pygame.draw.circle(out, dot_c, (6, y + 8), 4)
             lbl_c = (200, 195, 185) if active else (95, 90, 82)
             val_c = col if active else (85, 82, 75)
-            _txt(label, lbl_c, px + 16, y)
-            vs  = str(val)
-            vw  = sf.size(vs)[0]
-            _txt(vs, val_c, px + pw - vw, y)
+            _txt(label, lbl_c, 16, y)
+            _txt(vs, val_c, pw - sf.size(vs)[0], y)
             y += lh
+        return out, (12, 12)
 
-        speed_pct = int((p.speed / Player.BASE_SPEED) * 100)
-        mag_range = int(200 + p.magnet_count * 250) if p.magnet_count else 0
-
-        section('— BULLET —')
-        row('Fire Rate',   f'{p.get_fire_rate_pct()}%',  (255, 100, 255))
-        row('Multi-Shot',  p.multi_shot,                  (100, 200, 255))
-        row('Damage',      p.damage,                      (255, 150,  50))
-        row('Pierce',      p.bullet_pierce,               (220,  60, 255))
-
-        section('— BODY —')
-        row('Speed',       f'{speed_pct}%',               (100, 255, 100))
-        section('— SPECIAL —')
-        row('Orbital Saws',p.orbital_count,               (255, 210,   0))
-        row('Dual Guns',   p.dual_gun_count,              (255, 100, 100))
-        row('Magnet Range',mag_range if p.magnet_count else 0, (100, 200, 255))
+    # -- kill counter ----------------------------------------------------
 
-    def _draw_kill_counter(self):
-        scr = self.screen
-        kf  = _get_font(22)
-        kills_txt = f'{self.kills}  KILLS'
-        cx = VIEWPORT_W // 2
-        # Drop shadow then text
-        sh = kf.render(kills_txt, True, (0, 0, 0))
-        tx = kf.render(kills_txt, True, (255, 230, 80))
-        scr.blit(sh, (cx - sh.get_width()//2 + 2, 14))
-        scr.blit(tx, (cx - tx.get_width()//2,     12))
-        # Next boss indicator
+    def _kill_state(self):
         next_boss = MINI_BOSS_INTERVAL - (self.kills % MINI_BOSS_INTERVAL)
         if next_boss == MINI_BOSS_INTERVAL:
-            next_boss = 0  # just spawned one
-        hint_f = _get_font(13)
+            return self.kills, None   # just spawned one
         is_next_mega = ((self.kills // MINI_BOSS_INTERVAL + 1) * MINI_BOSS_INTERVAL) % MEGA_BOSS_INTERVAL == 0
         boss_label = 'MEGA BOSS' if is_next_mega else 'BOSS'
-        if next_boss > 0:
-            hint = hint_f.render(f'{boss_label} IN {next_boss}', True, (200, 100, 60))
-            scr.blit(hint, hint.get_rect(center=(cx, 12 + tx.get_height() + 5)))
-
-    def _draw_health_bar(self):
-        scr = self.screen
-        p   = self.player
+        return self.kills, f'{boss_label} IN {next_boss}'
+
+    def _paint_kill_counter(self, state):
+        kills, hint_txt = state
+        # Text with its drop shadow, 2 px wider and taller than the text
+        tx = TEXT_CACHE.render(_get_font(22), f'{kills}  KILLS', (255, 230, 80), shadow=(0, 0, 0))
+        tw, th = tx.get_width() - 2, tx.get_height() - 2
+        hint = TEXT_CACHE.render(_get_font(13), hint_txt, (200, 100, 60)) if hint_txt else None
+        # Both centred on the viewport as before, with 2 px of slack for rounding
+        w  = max(tx.get_width(), hint.get_width() if hint else 0) + 2
+        ox = (w - tw) // 2
+        h  = th + 5 + (hint.get_height() + 1) // 2 if hint else 0
+        out = widget_surface(w, max(h, tx.get_height()))
+        put(out, tx, (ox, 0))
+        if hint:
+            put(out, hint, hint.get_rect(center=(tw // 2 + ox, th + 5)))
+        return out, (VIEWPORT_W // 2 - tw // 2 - ox, 12)
+
+    # -- health bar ------------------------------------------------------
+
+    def _health_state(self):
+        return self.player.health, self.player.MAX_HEALTH
+
+    def _paint_health_bar(self, state):
+        health, seg_count = state
         bw  = 320
-        bx  = VIEWPORT_W - bw - 10
-        by  = 10
-        seg_count = p.MAX_HEALTH
         seg_w = bw // seg_count - 1
         seg_h = 18
+        out = widget_surface(bw, seg_h)
+        pct = health / seg_count
+        hc  = C_HEALTH_GREEN if pct > 0.5 else (C_HEALTH_YEL if pct > 0.25 else C_HEALTH_RED)
         for i in range(seg_count):
-            sx = bx + i * (seg_w + 1)
-            pygame.draw.rect(scr, (30, 35, 50), (sx, by, seg_w, seg_h), border_radius=2)
-            if i < p.health:
-                pct = p.health / p.MAX_HEALTH
-                hc  = C_HEALTH_GREEN if pct > 0.5 else (C_HEALTH_YEL if pct > 0.25 else C_HEALTH_RED)
-                pygame.draw.rect(scr, hc, (sx, by, seg_w, seg_h), border_radius=2)
-                pygame.draw.rect(scr, (*hc, 80), (sx, by, seg_w, seg_h // 2), border_radius=2)
+            sx = i * (seg_w + 1)
+            pygame.draw.rect(out, hc if i < health else (30, 35, 50), (sx, 0, seg_w, seg_h),
+                             border_radius=2)
+        return out, (VIEWPORT_W - bw - 10, 10)
 
+    # -- boss bar --------------------------------------------------------
 
-    def _draw_boss_bar(self):
-        scr  = self.screen
+    def _boss_state(self):
         boss = self.current_boss
-        if boss is None: return
-
-        if boss.is_final:
-            style = BOSS_FINAL_STYLE
-        else:
-            style = BOSS_STYLES.get(boss.boss_id, BOSS_STYLES[1])
-
-        body_col = style['body']
-        rim_col  = style['rim']
-        name     = style['name']
-
-        bw, bh = 640, 36
-        bx = (VIEWPORT_W - bw) // 2
-        by = 14
+        if not (self.boss_active and boss):
+            return None
+        style = BOSS_FINAL_STYLE if boss.is_final else BOSS_STYLES.get(boss.boss_id, BOSS_STYLES[1])
+        pct = boss.health / max(boss.max_health, 1)
+        fw  = int(BOSS_BAR_W * pct)
+        hc  = style['body'] if pct > 0.5 else ((200, 80, 30) if pct > 0.25 else C_HEALTH_RED)
+        flash = pct < 0.25 and (self.frame // 6) % 2 == 0   # pulse flicker when low
+        return (style['name'], style['rim'], hc, fw, flash,
+                f'{max(0, int(boss.health))} / {boss.max_health}')
+
+    def _paint_boss_bar(self, state):
+        name, rim_col, hc, fw, flash, hp_txt = state
+        bw, bh = BOSS_BAR_W, 36
+        out = widget_surface(bw + 16, bh + 40)
+        bx, by = 8, 20      # bar origin within the widget
 
         # Backing panel (solid, no SRCALPHA)
-        pygame.draw.rect(scr, (8, 8, 18), (bx-8, by-20, bw+16, bh+40), border_radius=12)
-        pygame.draw.rect(scr, rim_col,    (bx-8, by-20, bw+16, bh+40), 1, border_radius=12)
+        pygame.draw.rect(out, (8, 8, 18), (0, 0, bw+16, bh+40), border_radius=12)
+        pygame.draw.rect(out, rim_col,    (0, 0, bw+16, bh+40), 1, border_radius=12)
 
         # Boss name
-        nf = _get_font(15)
-        nlbl = nf.render(f'⟨ {name} ⟩', True, rim_col)
-        scr.blit(nlbl, ((VIEWPORT_W - nlbl.get_width())//2, by - 16))
+        nlbl = TEXT_CACHE.render(_get_font(15), f'⟨ {name} ⟩', rim_col)
+        out.blit(nlbl, ((bw + 16 - nlbl.get_width())//2, by - 16))
 
         # Main bar track
-        pygame.draw.rect(scr, (20, 10, 30), (bx, by, bw, bh), border_radius=6)
-
-        pct = boss.health / max(boss.max_health, 1)
-        fw  = int(bw * pct)
+        pygame.draw.rect(out, (20, 10, 30), (bx, by, bw, bh), border_radius=6)
 
         # Segment markers (every 25%)
         for seg in [0.25, 0.5, 0.75]:
             mx = bx + int(bw * seg)
-            pygame.draw.line(scr, (30, 20, 40), (mx, by), (mx, by+bh), 2)
+            pygame.draw.line(out, (30, 20, 40), (mx, by), (mx, by+bh), 2)
 
         # Health fill gradient simulation (3 layers)
         if fw > 0:
-            hc  = body_col if pct > 0.5 else ((200, 80, 30) if pct > 0.25 else C_HEALTH_RED)
-            pygame.draw.rect(scr, hc, (bx, by, fw, bh), border_radius=6)
+            pygame.draw.rect(out, hc, (bx, by, fw, bh), border_radius=6)
             # Bright top highlight (solid lighter rect, no SRCALPHA)
             hl_c = tuple(min(255, ch + 40) for ch in hc)
-            pygame.draw.rect(scr, hl_c, (bx, by, fw, bh//3), border_radius=4)
-            # Pulse flicker when low
-            if pct < 0.25 and (self.frame // 6) % 2 == 0:
-                pygame.draw.rect(scr, (255, 60, 60), (bx, by, fw, bh), 2, border_radius=6)
+            pygame.draw.rect(out, hl_c, (bx, by, fw, bh//3), border_radius=4)
+            if flash:
+                pygame.draw.rect(out, (255, 60, 60), (bx, by, fw, bh), 2, border_radius=6)
 
         # Rim
-        pygame.draw.rect(scr, rim_col, (bx, by, bw, bh), 2, border_radius=6)
+        pygame.draw.rect(out, rim_col, (bx, by, bw, bh), 2, border_radius=6)
 
         # HP text
-        hpf = _get_font(17)
-        hp_lbl = hpf.render(f'{max(0, int(boss.health))} / {boss.max_health}', True, C_WHITE)
-        scr.blit(hp_lbl, hp_lbl.get_rect(center=(VIEWPORT_W//2, by+bh//2)))
+        hp_lbl = TEXT_CACHE.render(_get_font(17), hp_txt, C_WHITE)
+        out.blit(hp_lbl, hp_lbl.get_rect(center=((bw + 16)//2, by + bh//2)))
+        return out, ((VIEWPORT_W - bw)//2 - 8, 14 - 20)
 
     def _draw_boss_pointer(self):
         if not self.current_boss: return
-        scr  = self.screen
         boss = self.current_boss
         bsx  = boss.x - self.cam_x
         bsy  = boss.y - self.cam_y
@@ -2945,8 +3550,11 @@ class ShooterGame:
             (px_p + math.cos(angle+2.4)*sz*0.6, py_p + math.sin(angle+2.4)*sz*0.6),
             (px_p + math.cos(angle-2.4)*sz*0.6, py_p + math.sin(angle-2.4)*sz*0.6),
         ]
-        pygame.draw.polygon(scr, col, pts)
-        pygame.draw.polygon(scr, C_WHITE, pts, 2)
+        def paint(surf, x, y):
+            tri = [(x + px - px_p, y + py - py_p) for px, py in pts]
+            pygame.draw.polygon(surf, col, tri)
+            pygame.draw.polygon(surf, C_WHITE, tri, 2)
+        self._hand_drawn(px_p, py_p, sz + 2, paint)
 
     # ------------------------------------------------------------------
     # End screens
@@ -2968,11 +3576,7 @@ class ShooterGame:
             self.screen.blit(t1, t1.get_rect(center=(VIEWPORT_W//2, VIEWPORT_H//2 - 60)))
             self.screen.blit(t2, t2.get_rect(center=(VIEWPORT_W//2, VIEWPORT_H//2 + 20)))
             self.screen.blit(t3, t3.get_rect(center=(VIEWPORT_W//2, VIEWPORT_H//2 + 70)))
-            self.display_screen.fill((0,0,0))
-            scaled = pygame.transform.scale(self.screen,
-                (int(VIEWPORT_W*self.scale), int(VIEWPORT_H*self.scale)))
-            self.display_screen.blit(scaled, (self.offset_x, self.offset_y))
-            pygame.display.flip()
+            self.presenter.present(self.screen)
             self.clock.tick(60)
 
 
@@ -0,0 +1,456 @@
+"""
+Shooter Game - Simulation Process
+
+Responsibilities
+----------------
+* Run ShooterGame._update in a child process at a fixed SIM_HZ while the
+  main process only handles input and rendering.
+* Publish entity state (player, enemies, bullets, items, particles) through
+  a double-buffered ``multiprocessing.shared_memory`` block.
+* Carry movement input and the render side's quality level to the child,
+  and low-volume events (popups, game end, save data) back through queues.
+
+Shared block layout::
+
+    ctrl   int64[CTRL_LEN]        front index, input bits, pause/quit flags
+    buf0   hdr + entity arrays    one complete simulation state
+    buf1   hdr + entity arrays    the other one
+
+The enemy and item arrays are sized per game from its horde and crate caps
+(block_caps); each header also carries the simulation's own counts, so a
+reader can tell when rows did not fit.  The writer fills the back buffer and then flips
+``ctrl[C_FRONT]``.  Each
+buffer's ``hdr[H_SEQ]`` is odd while it is being written (a seqlock), so a
+reader that copies a buffer and sees the same even sequence number before
+and after got a consistent state.  Game-specific packing lives in
+ShooterGame._pack_snapshot / _apply_snapshot; this module only knows the
+column layouts.
+
+This module is imported as ``games.shooter.sim_process`` rather than through
+_pkg_import, because the spawned child has to find sim_main by name.
+"""
+from __future__ import annotations
+
+import importlib.util
+import multiprocessing
+import os
+import queue
+import sys
+import time
+from multiprocessing import shared_memory
+
+import numpy as _np
+import pygame
+
+from .horde import KINDS as _ENEMY_KINDS
+
+
+SIM_HZ = 60
+
+# Capacities — the simulation already caps its bullet and particle lists at
+# or below these.  Enemy and item rows are the minimum per block; block_caps
+# adds the game's horde and crate caps on top.
+BULLET_CAP   = 2000
+EBULLET_CAP  = 1500
+ENEMY_CAP    = 256
+ITEM_CAP     = 256
+PARTICLE_CAP = 4096
+
+# Player row: position and aim first, then (attribute, type) pairs
+PLAYER_STATS = (
+    ('health', int), ('invincible', int), ('speed', float), ('fire_rate', int),
+    ('damage', int), ('multi_shot', int), ('bullet_pierce', int),
+    ('has_orbital', bool), ('orbital_angle', float), ('orbital_count', int),
+    ('has_dual_gun', bool), ('dual_gun_count', int),
+    ('magnet_count', int), ('magnet_angle', float),
+    ('vel_x', float), ('vel_y', float),
+)
+PLAYER_LEN = 4 + len(PLAYER_STATS)
+
+# Column indices per entity array
+E_SLOT, E_X, E_Y, E_KIND, E_BOSS, E_BOSS_ID, E_HP, E_MAX_HP, E_SIZE, \
+    E_ANIM_ANGLE, E_ANIM_TIMER, E_DASHING, E_DASH_X, E_DASH_Y, E_DASH_CD, \
+    E_FACE = range(16)
+ENEMY_COLS = 16
+ENEMY_KINDS = _ENEMY_KINDS      # E_KIND indexes this: every type horde.py knows
+ENEMY_KIND_IDS = {kind: i for i, kind in enumerate(ENEMY_KINDS)}   # unknown types raise KeyError
+
+B_X, B_Y, B_VX, B_VY, B_LIFE, B_RAMP = range(6)
+BULLET_COLS = 6
+
+EB_X, EB_Y, EB_VX, EB_VY, EB_KIND = range(5)
+EBULLET_COLS = 5
+EBULLET_KINDS = ('normal', 'laser', 'mortar', 'homing', 'snipe', 'cannon')
+
+I_UID, I_X, I_Y, I_KIND, I_STACK = range(5)
+ITEM_COLS = 5
+
+P_X, P_Y, P_VX, P_VY, P_LIFE, P_MAX_LIFE, P_R, P_G, P_B, P_SIZE = range(10)
+PARTICLE_COLS = 10
+
+# Per-buffer header; the *_TOTAL slots hold the simulation's own counts,
+# over H_ENEMIES / H_ITEMS when the block is too small
+H_SEQ, H_FRAME, H_KILLS, H_BOSS_SLOT, H_BOSS_ACTIVE, \
+    H_BULLETS, H_EBULLETS, H_ENEMIES, H_ITEMS, H_PARTICLES, \
+    H_ENEMIES_TOTAL, H_ITEMS_TOTAL = range(12)
+HDR_LEN = 12
+
+# Control block
+C_FRONT, C_INPUT, C_PAUSED, C_QUIT, C_STEPS, C_QUALITY = range(6)
+CTRL_LEN = 8
+
+
+def block_caps(horde: int = 0, item_cap: int = ITEM_CAP) -> tuple[int, int]:
+    """(enemy rows, item rows) of a block for a game with these caps.
+
+    The crate store merges only stale crates far from the player (crates.py),
+    so crates near the player can hold it above its cap; the extra ITEM_CAP
+    rows are headroom for those.
+    """
+    return ENEMY_CAP + max(0, horde), ITEM_CAP + max(0, item_cap)
+
+
+def _layout(enemies: int, items: int) -> tuple:
+    return (
+        ('hdr',       (HDR_LEN,),                     _np.int64),
+        ('player',    (PLAYER_LEN,),                  _np.float64),
+        ('bullets',   (BULLET_CAP, BULLET_COLS),      _np.float64),
+        ('ebullets',  (EBULLET_CAP, EBULLET_COLS),    _np.float64),
+        ('enemies',   (enemies, ENEMY_COLS),          _np.float64),
+        ('items',     (items, ITEM_COLS),             _np.float64),
+        ('particles', (PARTICLE_CAP, PARTICLE_COLS),  _np.float64),
+    )
+
+
+# Entity arrays and the header slot holding their live row count
+_COUNTED = (('bullets', H_BULLETS), ('ebullets', H_EBULLETS), ('enemies', H_ENEMIES),
+            ('items', H_ITEMS), ('particles', H_PARTICLES))
+
+
+def _nbytes(shape, dtype) -> int:
+    n = 1
+    for d in shape:
+        n *= d
+    return n * _np.dtype(dtype).itemsize
+
+
+_CTRL_BYTES = CTRL_LEN * 8
+
+# Movement keys forwarded to the simulation (Player.move reads only these)
+MOVE_KEYS = (pygame.K_w, pygame.K_UP, pygame.K_s, pygame.K_DOWN,
+             pygame.K_a, pygame.K_LEFT, pygame.K_d, pygame.K_RIGHT)
+_KEY_BIT = {k: i for i, k in enumerate(MOVE_KEYS)}
+
+
+def encode_keys(pressed) -> int:
+    """Pack the movement keys of a pygame.key.get_pressed() result into an int."""
+    bits = 0
+    for k, i in _KEY_BIT.items():
+        if pressed[k]:
+            bits |= 1 << i
+    return bits
+
+
+class InputKeys:
+    """Stand-in for pygame.key.get_pressed() built from shared input bits."""
+    __slots__ = ('bits',)
+
+    def __init__(self, bits: int = 0) -> None:
+        self.bits = bits
+
+    def __getitem__(self, key) -> bool:
+        i = _KEY_BIT.get(key)
+        return i is not None and bool(self.bits >> i & 1)
+
+
+class BulletView:
+    """What the renderer needs of a player bullet (see ShooterGame._player_bullet_blits)."""
+    __slots__ = ('x', 'y', 'lifetime', 'ramp_base')
+
+    def __init__(self, x, y, lifetime, ramp_base) -> None:
+        self.x, self.y = x, y
+        self.lifetime  = lifetime
+        self.ramp_base = ramp_base
+
+
+class EnemyBulletView:
+    """What the renderer needs of an enemy bullet."""
+    __slots__ = ('x', 'y', 'bullet_type', 'is_cannon')
+
+    def __init__(self, x, y, kind) -> None:
+        self.x, self.y   = x, y
+        self.bullet_type = EBULLET_KINDS[kind]
+        self.is_cannon   = self.bullet_type == 'cannon'
+
+
+class Snapshot:
+    """Private copy of one published simulation state (arrays trimmed to their counts)."""
+    __slots__ = ('frame', 'kills', 'boss_slot', 'boss_active', 'player',
+                 'bullets', 'ebullets', 'enemies', 'items', 'particles',
+                 'enemies_total', 'items_total', '_slot_rows')
+
+    def __init__(self, arrays: dict) -> None:
+        hdr = arrays['hdr']
+        self.frame       = int(hdr[H_FRAME])
+        self.kills       = int(hdr[H_KILLS])
+        self.boss_slot   = int(hdr[H_BOSS_SLOT])
+        self.boss_active = bool(hdr[H_BOSS_ACTIVE])
+        self.enemies_total = int(hdr[H_ENEMIES_TOTAL])
+        self.items_total   = int(hdr[H_ITEMS_TOTAL])
+        self.player      = arrays['player'].copy()
+        for name, h in _COUNTED:
+            setattr(self, name, arrays[name][:int(hdr[h])].copy())
+        self._slot_rows: dict[int, int] | None = None
+
+    def enemy_row(self, slot: int) -> int:
+        """Row index of the enemy in the given slot, or -1."""
+        if self._slot_rows is None:
+            self._slot_rows = {int(s): i for i, s in enumerate(self.enemies[:, E_SLOT])}
+        return self._slot_rows.get(slot, -1)
+
+
+class SharedState:
+    """The double-buffered shared block.  Pass name to attach to an existing
+    one; caps (enemy rows, item rows, see block_caps) must match its creator's."""
+
+    def __init__(self, name: str | None = None,
+                 caps: tuple[int, int] = (ENEMY_CAP, ITEM_CAP)) -> None:
+        self.owner  = name is None
+        self.caps   = (int(caps[0]), int(caps[1]))
+        self._shape = _layout(*self.caps)
+        buf_bytes   = sum(_nbytes(shape, dt) for _, shape, dt in self._shape)
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=_CTRL_BYTES + 2 * buf_bytes)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        buf = self.shm.buf
+        self.ctrl = _np.ndarray((CTRL_LEN,), dtype=_np.int64, buffer=buf, offset=0)
+        self.bufs = [self._views(_CTRL_BYTES + i * buf_bytes) for i in (0, 1)]
+        if self.owner:
+            self.ctrl[:] = 0
+            for b in self.bufs:
+                b['hdr'][:] = 0
+                b['hdr'][H_FRAME] = -1
+        self._back: dict | None = None
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def _views(self, offset: int) -> dict:
+        out = {}
+        for name, shape, dt in self._shape:
+            out[name] = _np.ndarray(shape, dtype=dt, buffer=self.shm.buf, offset=offset)
+            offset += _nbytes(shape, dt)
+        return out
+
+    # ------------------------------------------------------------------
+    # Writer (simulation process)
+    # ------------------------------------------------------------------
+
+    def begin_write(self) -> dict:
+        """Return the back buffer's arrays, marked as being written."""
+        self._back = self.bufs[1 - int(self.ctrl[C_FRONT])]
+        self._back['hdr'][H_SEQ] += 1
+        return self._back
+
+    def end_write(self) -> None:
+        back = self._back
+        back['hdr'][H_SEQ] += 1
+        self.ctrl[C_FRONT] = 0 if back is self.bufs[0] else 1
+        self._back = None
+
+    # ------------------------------------------------------------------
+    # Reader (render process)
+    # ------------------------------------------------------------------
+
+    def read(self, last_frame: int = -1) -> Snapshot | None:
+        """Copy the front buffer if it holds a newer frame than last_frame."""
+        for _ in range(4):
+            b   = self.bufs[int(self.ctrl[C_FRONT])]
+            seq = int(b['hdr'][H_SEQ])
+            if seq & 1:
+                continue
+            if int(b['hdr'][H_FRAME]) <= last_frame:
+                return None
+            snap = Snapshot(b)
+            if int(b['hdr'][H_SEQ]) == seq:
+                return snap
+        return None
+
+    def close(self) -> None:
+        self.ctrl = None
+        self.bufs = []
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+# ---------------------------------------------------------------------------
+# Child process
+# ---------------------------------------------------------------------------
+
+def _load_game_module():
+    if 'shooter_game' in sys.modules:
+        return sys.modules['shooter_game']
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'shooter_game.py')
+    spec = importlib.util.spec_from_file_location('shooter_game', path)
+    mod  = importlib.util.module_from_spec(spec)
+    sys.modules['shooter_game'] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def sim_main(shm_name: str, seed: str, save_data: dict | None,
+             cmd_q, evt_q, throttle: bool = True, on_step=None,
+             game_args: dict | None = None, caps: tuple[int, int] = (ENEMY_CAP, ITEM_CAP)) -> None:
+    """Entry point of the simulation process.
+
+    game_args are extra ShooterGame keyword arguments (horde, item_cap); the
+    quality level is not measured here but follows ctrl[C_QUALITY], which
+    the render side sets from its own governor.
+    """
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    pygame.init()
+    sg     = _load_game_module()
+    screen = pygame.display.set_mode((sg.VIEWPORT_W, sg.VIEWPORT_H))
+    game   = sg.ShooterGame(screen, seed=seed, save_data=save_data, sim_process=False,
+                            backend='surface', quality_target_ms=0, **(game_args or {}))
+    state  = SharedState(shm_name, caps)
+    ctrl   = state.ctrl
+    keys   = InputKeys()
+    step   = 1.0 / SIM_HZ
+    ended  = False
+    next_t = time.perf_counter()
+    try:
+        while not ctrl[C_QUIT]:
+            try:
+                while True:
+                    cmd = cmd_q.get_nowait()
+                    if cmd[0] == 'quit':
+                        return
+                    if cmd[0] == 'save':
+                        evt_q.put(('save', game._save_state()))
+                    elif cmd[0] == 'key':
+                        game._handle_debug_key(cmd[1], cmd[2])
+            except queue.Empty:
+                pass
+
+            if ctrl[C_PAUSED] or ended:
+                time.sleep(step)
+                next_t = time.perf_counter()
+                continue
+
+            keys.bits = int(ctrl[C_INPUT])
+            if ctrl[C_QUALITY] != game._quality.level:
+                game._quality.set_level(int(ctrl[C_QUALITY]))
+            game.popups = []
+            game.frame += 1
+            game._update(keys)
+            if on_step is not None:
+                on_step(game)
+            game._pack_snapshot(state)
+            ctrl[C_STEPS] += 1
+            for pop in game.popups:
+                evt_q.put(('popup', pop.text, pop.x, pop.y, pop.color, pop.lifetime))
+
+            if game.kills >= sg.WIN_KILLS:
+                evt_q.put(('end', 'win', game.kills))
+                ended = True
+            elif game.player.health <= 0:
+                evt_q.put(('end', 'lose', game.kills))
+                ended = True
+
+            if throttle:
+                next_t += step
+                delay = next_t - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                elif delay < -5 * step:
+                    next_t = time.perf_counter()   # too far behind — don't try to catch up
+    finally:
+        ctrl = None   # drop the view so the shared block can be closed
+        game._frame_jobs.shutdown()
+        state.close()
+        pygame.quit()
+
+
+# ---------------------------------------------------------------------------
+# Parent side
+# ---------------------------------------------------------------------------
+
+class SimClient:
+    """Owns the shared block, the queues and the simulation process.
+
+    game_args are passed on to the child's ShooterGame; 'horde' and
+    'item_cap' also size the block's enemy and item rows.
+    """
+
+    def __init__(self, seed: str, save_data: dict | None = None,
+                 throttle: bool = True, on_step=None, game_args: dict | None = None) -> None:
+        ctx = multiprocessing.get_context('spawn')
+        game_args   = dict(game_args or {})
+        caps        = block_caps(game_args.get('horde', 0), game_args.get('item_cap', ITEM_CAP))
+        self.state  = SharedState(caps=caps)
+        self.cmd_q  = ctx.Queue()
+        self.evt_q  = ctx.Queue()
+        self._held: list[tuple] = []
+        self.proc   = ctx.Process(
+            target=sim_main, name='shooter-sim', daemon=True,
+            args=(self.state.name, seed, save_data, self.cmd_q, self.evt_q, throttle, on_step,
+                  game_args, caps))
+        self.proc.start()
+
+    @property
+    def steps(self) -> int:
+        return int(self.state.ctrl[C_STEPS])
+
+    def set_input(self, bits: int) -> None:
+        self.state.ctrl[C_INPUT] = bits
+
+    def set_paused(self, paused: bool) -> None:
+        self.state.ctrl[C_PAUSED] = 1 if paused else 0
+
+    def set_quality(self, level: int) -> None:
+        self.state.ctrl[C_QUALITY] = level
+
+    def send(self, *cmd) -> None:
+        self.cmd_q.put(cmd)
+
+    def events(self) -> list[tuple]:
+        out, self._held = self._held, []
+        try:
+            while True:
+                out.append(self.evt_q.get_nowait())
+        except queue.Empty:
+            pass
+        if not out and not self.proc.is_alive():
+            raise RuntimeError(f'simulation process exited (code {self.proc.exitcode})')
+        return out
+
+    def request(self, kind: str, timeout: float = 5.0):
+        """Send a command and block until the event of the same kind comes back."""
+        self.send(kind)
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            try:
+                evt = self.evt_q.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            if evt[0] == kind:
+                return evt[1]
+            self._held.append(evt)
+        return None
+
+    def stop(self) -> None:
+        if self.state.ctrl is not None:
+            self.state.ctrl[C_QUIT] = 1
+        self.send('quit')
+        self.proc.join(timeout=2.0)
+        if self.proc.is_alive():
+            self.proc.terminate()
+            self.proc.join()
+        self.cmd_q.close()
+        self.evt_q.close()
+        self.state.close()
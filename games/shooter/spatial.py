@@ -0,0 +1,348 @@
+"""
+Shooter Game - Spatial Index
+
+Responsibilities
+----------------
+* Bucket a set of points into a uniform grid once per frame.
+* Answer bulk "which points are near these circles?" queries in array form.
+* Find the nearest point to a position by searching rings of cells outward.
+* CircleIndex: a per-frame index over objects with a position and a radius
+  (the enemies), answering nearest, radius and circle-overlap queries.
+
+The grid is never materialised as a dict of lists: points are sorted by their
+integer cell key (``argsort``) and every cell is a contiguous run of that
+ordering, found with ``searchsorted``.  Building is O(N log N) in C, and a
+query touches only the (2·span+1)² cells around each circle, span being
+that circle's own radius in cells.
+
+When the points' bounding box spans few enough cells, build() also lays out a
+dense per-cell (start, count) table over that box, and queries index it
+directly instead of binary-searching the sorted keys.  Crowds of enemies and
+clouds of bullets around the player almost always qualify.
+"""
+from __future__ import annotations
+
+import math
+
+try:
+    import numpy as _np
+    _NUMPY = True
+except ImportError:
+    _NUMPY = False
+
+
+# Cell coordinates are offset so that slightly negative positions still map to
+# non-negative keys, then packed as  (kx + _KEY_OFF) * _KEY_STRIDE + (ky + _KEY_OFF).
+_KEY_OFF    = 1 << 20
+_KEY_STRIDE = 1 << 21
+
+# The dense table is used while the bounding box has at most
+# max(DENSE_MIN_CELLS, DENSE_PER_POINT * N) cells.
+DENSE_MIN_CELLS = 1 << 16
+DENSE_PER_POINT = 16
+
+# nearest() scans every point below this count, and falls back to a scan when
+# NEAREST_RINGS rings of cells turn up no answer (sparse or distant points)
+NEAREST_SCAN  = 64
+NEAREST_RINGS = 8
+
+
+class UniformGrid:
+    """Static uniform grid over a batch of 2-D points.
+
+    Usage::
+
+        grid = UniformGrid(cell=80)
+        grid.build(bullet_xs, bullet_ys)
+        b_idx, e_idx = grid.query_pairs(enemy_xs, enemy_ys, enemy_radii)
+    """
+
+    def __init__(self, cell: float = 80.0) -> None:
+        self.cell = float(cell)
+        self.xs = None
+        self.ys = None
+        self._order = None        # point indices sorted by cell key
+        self._sorted_keys = None  # cell keys in that order
+        self._dense = None        # (kx0, ky0, w, h, start, count) or None
+
+    def __len__(self) -> int:
+        return 0 if self._order is None else len(self._order)
+
+    # ------------------------------------------------------------------
+    # Build
+    # ------------------------------------------------------------------
+
+    def _keys(self, kx, ky):
+        return (kx + _KEY_OFF) * _KEY_STRIDE + (ky + _KEY_OFF)
+
+    def build(self, xs, ys) -> None:
+        """Bucket the points (xs[i], ys[i]).  Arrays are kept by reference."""
+        self.xs = xs
+        self.ys = ys
+        kx = _np.floor(xs / self.cell).astype(_np.int64)
+        ky = _np.floor(ys / self.cell).astype(_np.int64)
+        self._dense = None
+        if len(kx):
+            kx0, ky0 = int(kx.min()), int(ky.min())
+            w, h = int(kx.max()) - kx0 + 1, int(ky.max()) - ky0 + 1
+            if w * h <= max(DENSE_MIN_CELLS, DENSE_PER_POINT * len(kx)):
+                cid = (kx - kx0) * h + (ky - ky0)
+                self._order = _np.argsort(cid, kind='stable')
+                count = _np.bincount(cid, minlength=w * h)
+                self._dense = (kx0, ky0, w, h, _np.cumsum(count) - count, count)
+                self._sorted_keys = None
+                return
+        keys = self._keys(kx, ky)
+        self._order = _np.argsort(keys, kind='stable')
+        self._sorted_keys = keys[self._order]
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+
+    def query_pairs(self, qx, qy, qr):
+        """Return (point_idx, query_idx) for every point within qr[j] of query j.
+
+        qx, qy, qr: float arrays of shape (Q,).  The result is two int64
+        arrays of equal length, grouped by query index in ascending order,
+        so each query's candidates form one contiguous run.
+        """
+        empty = _np.empty(0, dtype=_np.int64)
+        if self._order is None or len(self._order) == 0 or len(qx) == 0:
+            return empty, empty
+
+        # Each query scans only the cells its own radius needs: queries are
+        # bucketed by span, so one large circle does not widen everyone's block
+        spans = _np.maximum(1, _np.ceil(qr / self.cell).astype(_np.int64))
+        kinds = _np.unique(spans)
+        if len(kinds) == 1:
+            return self._pairs_span(qx, qy, qr, int(kinds[0]))
+        ps, qs = [], []
+        for span in kinds.tolist():
+            sel = _np.flatnonzero(spans == span)
+            p, q = self._pairs_span(qx[sel], qy[sel], qr[sel], span)
+            ps.append(p)
+            qs.append(sel[q])
+        pair_p = _np.concatenate(ps)
+        pair_q = _np.concatenate(qs)
+        order  = _np.argsort(pair_q, kind='stable')
+        return pair_p[order], pair_q[order]
+
+    def _pairs_span(self, qx, qy, qr, span: int):
+        """query_pairs() for queries that all scan (2·span+1)² cells."""
+        empty = _np.empty(0, dtype=_np.int64)
+        cell = self.cell
+        offs = _np.arange(-span, span + 1, dtype=_np.int64)
+        # (C,) neighbour offsets covering the square of cells around each query
+        ox = _np.repeat(offs, len(offs))
+        oy = _np.tile(offs, len(offs))
+
+        qkx = _np.floor(qx / cell).astype(_np.int64)
+        qky = _np.floor(qy / cell).astype(_np.int64)
+        lo, counts = self._runs((qkx[:, None] + ox[None, :]).ravel(),
+                                (qky[:, None] + oy[None, :]).ravel())
+        total = int(counts.sum())
+        if total == 0:
+            return empty, empty
+
+        # Expand every [lo, hi) run into explicit (point, query) pairs
+        q_ids  = _np.repeat(_np.arange(len(qx), dtype=_np.int64), len(ox))
+        pair_q = _np.repeat(q_ids, counts)
+        pair_p = self._expand(lo, counts, total)
+
+        # Narrow-phase radius filter
+        dx = self.xs[pair_p] - qx[pair_q]
+        dy = self.ys[pair_p] - qy[pair_q]
+        r  = qr[pair_q]
+        keep = dx * dx + dy * dy < r * r
+        return pair_p[keep], pair_q[keep]
+
+    def nearest(self, x: float, y: float) -> int:
+        """Index of the point closest to (x, y), or -1 when the grid is empty.
+
+        Walks square rings of cells outward from the query's cell and stops
+        once the best distance found is no more than the inner radius of the
+        next ring, so the cost depends on the local density, not on N.  Small,
+        sparse or far-away point sets fall back to a full scan.
+        """
+        n = len(self)
+        if n == 0:
+            return -1
+        if n > NEAREST_SCAN and self._dense is not None:
+            cell = self.cell
+            qkx, qky = math.floor(x / cell), math.floor(y / cell)
+            kx0, ky0, w, h, start, count = self._dense
+            kx1, ky1 = kx0 + w - 1, ky0 + h - 1
+            first = max(0, kx0 - qkx, qkx - kx1, ky0 - qky, qky - ky1)
+            last  = max(abs(qkx - kx0), abs(qkx - kx1), abs(qky - ky0), abs(qky - ky1))
+            order, xs, ys = self._order, self.xs, self.ys
+            best, best_d2 = -1, math.inf
+            for k in range(first, min(last, first + NEAREST_RINGS - 1) + 1):
+                for cx, cy in _ring_cells(qkx, qky, k):
+                    cx -= kx0
+                    cy -= ky0
+                    if 0 <= cx < w and 0 <= cy < h:
+                        c = cx * h + cy
+                        lo = int(start[c])
+                        for i in order[lo:lo + int(count[c])].tolist():
+                            dx = float(xs[i]) - x
+                            dy = float(ys[i]) - y
+                            d2 = dx * dx + dy * dy
+                            if d2 < best_d2:
+                                best, best_d2 = i, d2
+                # Every point beyond ring k is at least k cells away
+                if best >= 0 and best_d2 <= (k * cell) ** 2:
+                    return best
+        dx = self.xs - x
+        dy = self.ys - y
+        return int(_np.argmin(dx * dx + dy * dy))
+
+    def within(self, x: float, y: float, r: float) -> list:
+        """Indices of the points within r of (x, y), for a single query.
+
+        Walks the covered cells of the dense table in Python, which beats the
+        array machinery of query_pairs() for one small circle.
+        """
+        if len(self) == 0:
+            return []
+        if self._dense is None:
+            idx, _ = self.query_pairs(_np.array([x], dtype=float), _np.array([y], dtype=float),
+                                      _np.array([r], dtype=float))
+            return idx.tolist()
+        cell = self.cell
+        kx0, ky0, w, h, start, count = self._dense
+        cx0 = max(0, math.floor((x - r) / cell) - kx0)
+        cx1 = min(w - 1, math.floor((x + r) / cell) - kx0)
+        cy0 = max(0, math.floor((y - r) / cell) - ky0)
+        cy1 = min(h - 1, math.floor((y + r) / cell) - ky0)
+        order, xs, ys = self._order, self.xs, self.ys
+        r2  = r * r
+        out = []
+        for cx in range(cx0, cx1 + 1):
+            base = cx * h
+            for cy in range(cy0, cy1 + 1):
+                n = int(count[base + cy])
+                if n:
+                    lo = int(start[base + cy])
+                    for i in order[lo:lo + n].tolist():
+                        dx = float(xs[i]) - x
+                        dy = float(ys[i]) - y
+                        if dx * dx + dy * dy < r2:
+                            out.append(i)
+        return out
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _runs(self, kx, ky):
+        """(start, count) into the sorted order for each cell (kx[i], ky[i])."""
+        if self._dense is not None:
+            kx0, ky0, w, h, start, count = self._dense
+            cx = kx - kx0
+            cy = ky - ky0
+            inside = (cx >= 0) & (cx < w) & (cy >= 0) & (cy < h)
+            cid = _np.where(inside, cx * h + cy, 0)
+            return start[cid], _np.where(inside, count[cid], 0)
+        keys = self._keys(kx, ky)
+        lo = _np.searchsorted(self._sorted_keys, keys, side='left')
+        hi = _np.searchsorted(self._sorted_keys, keys, side='right')
+        return lo, hi - lo
+
+    def _expand(self, lo, counts, total: int):
+        """Point indices of every run [lo[i], lo[i] + counts[i]), concatenated."""
+        run_start = _np.repeat(lo - (_np.cumsum(counts) - counts), counts)
+        return self._order[run_start + _np.arange(total, dtype=_np.int64)]
+
+
+def _ring_cells(qkx: int, qky: int, k: int):
+    """Cells of the square ring at Chebyshev distance k around (qkx, qky)."""
+    if k == 0:
+        yield qkx, qky
+        return
+    for dx in range(-k, k + 1):
+        yield qkx + dx, qky - k
+        yield qkx + dx, qky + k
+    for dy in range(-k + 1, k):
+        yield qkx - k, qky + dy
+        yield qkx + k, qky + dy
+
+
+class CircleIndex:
+    """Per-frame index over objects that have a position and a radius.
+
+    Built once per tick over the enemies and shared by everything that asks
+    "which enemy is nearest / near here / touching this circle?".  Queries
+    return the indexed objects themselves.  Without NumPy the same API is
+    answered by a linear scan.
+
+    Usage::
+
+        index = CircleIndex(cell=64)
+        index.build(enemies, xs, ys, sizes)
+        target = index.nearest(player.x, player.y)
+        touching = index.overlapping(player.x, player.y, player.SIZE)
+    """
+
+    def __init__(self, cell: float = 64.0) -> None:
+        self.grid  = UniformGrid(cell) if _NUMPY else None
+        self.items: list = []
+        self.xs = self.ys = self.rs = ()
+        self.max_r = 0.0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def build(self, items: list, xs, ys, rs) -> None:
+        """Index items[i] as a circle at (xs[i], ys[i]) with radius rs[i]."""
+        self.items = items
+        if self.grid is not None:
+            xs = _np.asarray(xs, dtype=float)
+            ys = _np.asarray(ys, dtype=float)
+            rs = _np.asarray(rs, dtype=float)
+            self.grid.build(xs, ys)
+        self.xs, self.ys, self.rs = xs, ys, rs
+        self.max_r = float(max(rs)) if len(rs) else 0.0
+
+    def nearest(self, x: float, y: float):
+        """The item whose centre is closest to (x, y), or None."""
+        if not self.items:
+            return None
+        if self.grid is not None:
+            return self.items[self.grid.nearest(x, y)]
+        xs, ys = self.xs, self.ys
+        i = min(range(len(xs)), key=lambda i: (xs[i] - x) ** 2 + (ys[i] - y) ** 2)
+        return self.items[i]
+
+    def within(self, x: float, y: float, r: float) -> list:
+        """Items whose centre lies within r of (x, y)."""
+        return [self.items[i] for i in self._query(x, y, r, False)]
+
+    def overlapping(self, x: float, y: float, r: float) -> list:
+        """Items whose circle overlaps the circle (x, y, r)."""
+        return [self.items[i] for i in self._query(x, y, r, True)]
+
+    def overlaps(self, x: float, y: float, r: float) -> bool:
+        """True if any indexed circle overlaps the circle (x, y, r)."""
+        return len(self._query(x, y, r, True)) > 0
+
+    def _query(self, x: float, y: float, r: float, add_radius: bool) -> list:
+        if not self.items:
+            return []
+        if self.grid is None:
+            xs, ys, rs = self.xs, self.ys, self.rs
+            return [i for i in range(len(xs))
+                    if (xs[i] - x) ** 2 + (ys[i] - y) ** 2 < (r + (rs[i] if add_radius else 0)) ** 2]
+        idx = self.grid.within(x, y, r + self.max_r if add_radius else r)
+        if add_radius:
+            xs, ys, rs = self.xs, self.ys, self.rs
+            idx = [i for i in idx
+                   if (float(xs[i]) - x) ** 2 + (float(ys[i]) - y) ** 2 < (r + float(rs[i])) ** 2]
+        return idx
+
+
+def group_bounds(sorted_ids, n: int):
+    """For an ascending id array, return (lo, hi) so that group j is [lo[j], hi[j])."""
+    ids = _np.arange(n, dtype=_np.int64)
+    return (_np.searchsorted(sorted_ids, ids, side='left'),
+            _np.searchsorted(sorted_ids, ids, side='right'))
@@ -121,30 +121,24 @@ class Tilemap:
         bmp = self._tile_bitmap
         if bmp is None or not _NUMPY:
             return _np.zeros(len(xs), dtype=bool)
-        ts  = self.tile_size
-        gxs = (xs // ts).astype(_np.int32)
-        gys = (ys // ts).astype(_np.int32)
+        ts = self.tile_size
         H, W = bmp.shape
+
+        # Per axis: the first and last cell the box [v - size, v + size]
+        # overlaps (strictly, as in check_collision), clamped to the 3-cell
+        # neighbourhood around the centre cell that check_collision scans.
+        def span(vs):
+            c  = _np.floor(vs / ts)
+            lo = _np.maximum(_np.floor((vs - szs) / ts), c - 1)
+            hi = _np.minimum(_np.ceil((vs + szs) / ts) - 1, c + 1)
+            return [a.astype(_np.int64) for a in (lo, c, hi)]
+
+        cols = [((c >= 0) & (c < W), _np.clip(c, 0, W - 1)) for c in span(xs)]
+        rows = [((c >= 0) & (c < H), _np.clip(c, 0, H - 1)) for c in span(ys)]
         hit = _np.zeros(len(xs), dtype=bool)
-        for dgx in (-1, 0, 1):
-            for dgy in (-1, 0, 1):
-                cx = gxs + dgx
-                cy = gys + dgy
-                valid = (cx >= 0) & (cx < W) & (cy >= 0) & (cy < H)
-                vi = _np.where(valid)[0]
-                if len(vi) == 0:
-                    continue
-                solid = bmp[cy[vi], cx[vi]]
-                tx = cx[vi].astype(_np.float64) * ts
-                ty = cy[vi].astype(_np.float64) * ts
-                overlap = (
-                    solid
-                    & (xs[vi] + szs[vi] > tx)
-                    & (xs[vi] - szs[vi] < tx + ts)
-                    & (ys[vi] + szs[vi] > ty)
-                    & (ys[vi] - szs[vi] < ty + ts)
-                )
-                hit[vi] |= overlap
+        for okx, cx in cols:
+            for oky, cy in rows:
+                hit |= okx & oky & bmp[cy, cx]
         return hit
 
 
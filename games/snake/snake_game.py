@@ -13,6 +13,14 @@ import math
 import random
 
 sys.path.insert(0, os.path.dirname(__file__))
+# games/snake/snake_game.py -> repository root, for the shared Utils package
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+from Utils.fixed_step import FixedStep
+from Utils.particles import ParticleSystem
+from Utils.text_cache import TEXT_CACHE
+from Utils.display import Presenter
 from helpers import (
     generate_random_position,
     is_out_of_bounds,
@@ -35,6 +43,11 @@ WALLS_PER_APPLE   = 2
 MOVE_DELAY_START  = 7    # frames between steps at score 0  (was 10 — faster default)
 MOVE_DELAY_MIN    = 2    # fastest the snake can get        (was 3)
 
+# Timing — logic runs at TICK_HZ regardless of render rate (delays above are in ticks)
+TICK_HZ        = 60
+MAX_CATCH_UP   = 5      # ticks run at most per rendered frame
+MAX_RENDER_FPS = 120
+
 # Palette
 C_BG         = ( 8,  10,  16)
 C_GRID       = (14,  17,  26)
@@ -49,34 +62,13 @@ C_WALL_LT    = ( 48,  60,  80)
 C_WALL_DK    = ( 14,  18,  26)
 C_HUD        = (225, 230, 240)
 
-
-# ---------------------------------------------------------------------------
-# Particle
-# ---------------------------------------------------------------------------
-class Particle:
-    __slots__ = ('x', 'y', 'vx', 'vy', 'life', 'max_life', 'r', 'g', 'b', 'size')
-
-    def __init__(self, x, y, vx, vy, life, color, size=3):
-        self.x, self.y   = float(x), float(y)
-        self.vx, self.vy = float(vx), float(vy)
-        self.life        = int(life)
-        self.max_life    = int(life)
-        self.r, self.g, self.b = color
-        self.size        = size
-
-    def update(self) -> bool:
-        self.x  += self.vx
-        self.y  += self.vy
-        self.vy += 0.12
-        self.vx *= 0.94
-        self.life -= 1
-        return self.life > 0
-
-    def draw(self, screen: pygame.Surface) -> None:
-        alpha  = self.life / self.max_life
-        radius = max(1, int(self.size * alpha))
-        c = (int(self.r * alpha), int(self.g * alpha), int(self.b * alpha))
-        pygame.draw.circle(screen, c, (int(self.x), int(self.y)), radius)
+# Particles — the pool holds a few full-screen bursts; colours are drawn per particle
+PARTICLE_CAP      = 4096
+PARTICLE_GRAVITY  = 0.12
+PARTICLE_DRAG     = (0.94, 1.0)     # x, y per tick
+C_DEATH_SPARKS    = [(255, g, b) for g in (30, 55, 80) for b in (20, 40, 60)]
+C_APPLE_SPARKS    = [(255, 80, 50), (255, 170, 60), (80, 255, 110), (255, 230, 60)]
+C_CONFETTI        = [(r, g, b) for r in (80, 168, 255) for g in (80, 168, 255) for b in (80, 168, 255)]
 
 
 # ---------------------------------------------------------------------------
@@ -104,11 +96,12 @@ class Popup:
         self.life -= 1
         return self.life > 0
 
-    def draw(self, screen: pygame.Surface) -> None:
-        alpha = min(1.0, self.life / 20.0)
-        c = tuple(int(ch * alpha) for ch in self.color)
-        surf = self._get_font().render(self.text, True, c)
-        screen.blit(surf, (int(self.x) - surf.get_width() // 2, int(self.y)))
+    def draw(self, screen: pygame.Surface, t: float = 1.0) -> None:
+        """t: fraction of the way from the previous tick's height to this one's."""
+        # Cached per text, colour and fade step
+        surf = TEXT_CACHE.render(self._get_font(), self.text, self.color,
+                                 alpha=int(255 * min(1.0, self.life / 20.0)))
+        screen.blit(surf, (int(self.x) - surf.get_width() // 2, int(self.y + 0.9 * (1.0 - t))))
 
 
 # ---------------------------------------------------------------------------
@@ -123,13 +116,9 @@ class SnakeGame:
     def __init__(self, screen: pygame.Surface,
                  seed: str | None = None,
                  save_data: dict | None = None):
-        self.display_screen = screen
-        dw, dh = screen.get_size()
-        self.screen   = pygame.Surface((GAME_WIDTH, GAME_HEIGHT))
-        scale         = min(dw / GAME_WIDTH, dh / GAME_HEIGHT)
-        self.scale    = scale
-        self.offset_x = int((dw - GAME_WIDTH  * scale) // 2)
-        self.offset_y = int((dh - GAME_HEIGHT * scale) // 2)
+        self.presenter      = Presenter(screen, (GAME_WIDTH, GAME_HEIGHT))
+        self.display_screen = self.presenter.display
+        self.screen   = self.presenter.surface()
         self.clock    = pygame.time.Clock()
 
         # Fonts (cached)
@@ -138,7 +127,7 @@ class SnakeGame:
         self._f_hint  = pygame.font.SysFont('segoeui', 22)
 
         # Effects
-        self.particles: list[Particle] = []
+        self.particles = ParticleSystem(PARTICLE_CAP, gravity=PARTICLE_GRAVITY, drag=PARTICLE_DRAG)
         self.popups:    list[Popup]    = []
         self._glow_cache: dict[int, pygame.Surface] = {}
 
@@ -164,6 +153,7 @@ class SnakeGame:
         sx = (GRID_TILES_X // 2) * TILE_W
         sy = (GRID_TILES_Y // 2) * TILE_H
         self.snake          = [(sx, sy), (sx - TILE_W, sy), (sx - 2*TILE_W, sy)]
+        self._prev_snake    = list(self.snake)
         self.direction      = (1, 0)
         self.next_direction = (1, 0)
         self.walls:         list[tuple] = []
@@ -190,6 +180,7 @@ class SnakeGame:
 
     def _restore_state(self, d: dict) -> None:
         self.snake          = [tuple(p) for p in d['snake']]
+        self._prev_snake    = list(self.snake)
         self.direction      = tuple(d['direction'])
         self.next_direction = tuple(d['next_direction'])
         self.apple_pos      = tuple(d['apple_pos'])
@@ -289,16 +280,8 @@ class SnakeGame:
                 new_head in self.walls):
             self.game_over = True
             cx, cy = hx + TILE_W // 2, hy + TILE_H // 2
-            for _ in range(22):
-                angle = random.uniform(0, math.pi * 2)
-                spd   = random.uniform(1.5, 6.0)
-                self.particles.append(Particle(
-                    cx, cy,
-                    math.cos(angle) * spd, math.sin(angle) * spd,
-                    random.randint(25, 55),
-                    (255, random.randint(30, 80), random.randint(20, 60)),
-                    random.randint(3, 7),
-                ))
+            self.particles.burst(cx, cy, 22, speed=(1.5, 6.0), color=C_DEATH_SPARKS,
+                                 size=(3, 7), life=(25, 55))
             return
 
         self.snake.insert(0, new_head)
@@ -309,34 +292,16 @@ class SnakeGame:
             self.score += 1
             ax = self.apple_pos[0] + TILE_W // 2
             ay = self.apple_pos[1] + TILE_H // 2
-            for _ in range(16):
-                angle = random.uniform(0, math.pi * 2)
-                spd   = random.uniform(1.5, 5.5)
-                col   = random.choice([
-                    (255, 80, 50), (255, 170, 60), (80, 255, 110), (255, 230, 60),
-                ])
-                self.particles.append(Particle(
-                    ax, ay,
-                    math.cos(angle) * spd, math.sin(angle) * spd,
-                    random.randint(18, 38), col, random.randint(2, 5),
-                ))
+            self.particles.burst(ax, ay, 16, speed=(1.5, 5.5), color=C_APPLE_SPARKS,
+                                 size=(2, 5), life=(18, 38))
             self.popups.append(Popup('+1', ax, ay - 12))
 
             if self.score >= WIN_SCORE:
                 self.won = True
-                for _ in range(80):
-                    px = random.randint(TILE_W, GAME_WIDTH - TILE_W)
-                    py = random.randint(TILE_H, GAME_HEIGHT // 2)
-                    spd  = random.uniform(2.0, 7.0)
-                    ang  = random.uniform(0, math.pi * 2)
-                    col  = (random.randint(80, 255),
-                            random.randint(80, 255),
-                            random.randint(80, 255))
-                    self.particles.append(Particle(
-                        px, py,
-                        math.cos(ang) * spd, math.sin(ang) * spd,
-                        random.randint(45, 90), col, random.randint(3, 6),
-                    ))
+                xs = [random.randint(TILE_W, GAME_WIDTH - TILE_W) for _ in range(80)]
+                ys = [random.randint(TILE_H, GAME_HEIGHT // 2) for _ in range(80)]
+                self.particles.burst(xs, ys, 80, speed=(2.0, 7.0), color=C_CONFETTI,
+                                     size=(3, 6), life=(45, 90))
             else:
                 self._spawn_walls()
                 self.apple_pos = self._new_apple()
@@ -404,46 +369,61 @@ class SnakeGame:
             (cx + 5, ay + 3),
         ])
 
-    def _draw_snake(self) -> None:
+    def _snake_points(self, t: float) -> list[tuple[int, int]]:
+        """Segment positions t of the way from the previous tick to this one.
+
+        A step moves segment i from _prev_snake[i] into the cell ahead of it;
+        a segment grown this tick has no previous cell and holds the tail's.
+        """
+        prev, back = self._prev_snake, 1.0 - t
+        if not back or not prev:
+            return self.snake
+        last = len(prev) - 1
+        return [(int(x + (prev[min(i, last)][0] - x) * back),
+                 int(y + (prev[min(i, last)][1] - y) * back))
+                for i, (x, y) in enumerate(self.snake)]
+
+    def _draw_snake(self, t: float = 1.0) -> None:
         if not self.snake:
             return
         rad = TILE_W // 2 - 1
+        snake = self._snake_points(t)
 
-        for i in range(len(self.snake) - 1):
-            ax, ay = self.snake[i]
-            bx, by = self.snake[i + 1]
+        for i in range(len(snake) - 1):
+            ax, ay = snake[i]
+            bx, by = snake[i + 1]
             gc = tuple(min(80, ch // 4) for ch in self._body_color(i))
             pygame.draw.line(self.screen, gc,
                              (ax + TILE_W//2, ay + TILE_H//2),
                              (bx + TILE_W//2, by + TILE_H//2),
                              (rad + 3) * 2)
-        for i in range(len(self.snake) - 1, -1, -1):
-            sx, sy = self.snake[i]
+        for i in range(len(snake) - 1, -1, -1):
+            sx, sy = snake[i]
             gc = tuple(min(80, ch // 4) for ch in self._body_color(i))
             pygame.draw.circle(self.screen, gc,
                                (sx + TILE_W//2, sy + TILE_H//2), rad + 3)
 
-        for i in range(len(self.snake) - 1):
-            ax, ay = self.snake[i]
-            bx, by = self.snake[i + 1]
+        for i in range(len(snake) - 1):
+            ax, ay = snake[i]
+            bx, by = snake[i + 1]
             pygame.draw.line(self.screen, self._body_color(i),
                              (ax + TILE_W//2, ay + TILE_H//2),
                              (bx + TILE_W//2, by + TILE_H//2),
                              rad * 2)
-        for i in range(len(self.snake) - 1, -1, -1):
-            sx, sy = self.snake[i]
+        for i in range(len(snake) - 1, -1, -1):
+            sx, sy = snake[i]
             pygame.draw.circle(self.screen, self._body_color(i),
                                (sx + TILE_W//2, sy + TILE_H//2), rad)
 
-        half = max(1, len(self.snake) // 2)
+        half = max(1, len(snake) // 2)
         for i in range(half):
-            sx, sy = self.snake[i]
+            sx, sy = snake[i]
             cx2, cy2 = sx + TILE_W//2, sy + TILE_H//2
             c  = self._body_color(i)
             hl = tuple(min(255, ch + 35) for ch in c)
             pygame.draw.circle(self.screen, hl, (cx2 - 2, cy2 - 2), max(1, rad // 2 - 1))
 
-        hx, hy = self.snake[0]
+        hx, hy = snake[0]
         hcx, hcy = hx + TILE_W//2, hy + TILE_H//2
         dx, dy   = self.direction
         px, pe   = -dy, dx
@@ -470,26 +450,23 @@ class SnakeGame:
                 tip_y = int(base_y + dy * 5 + pe * sign * 3)
                 pygame.draw.line(self.screen, C_TONGUE, (base_x, base_y), (tip_x, tip_y), 2)
 
-    def _draw_particles(self) -> None:
-        self.particles = [p for p in self.particles if p.update()]
-        for p in self.particles:
-            p.draw(self.screen)
+    def _draw_particles(self, t: float = 1.0) -> None:
+        self.particles.draw(self.screen, t=t - 1.0)
 
-    def _draw_popups(self) -> None:
-        self.popups = [p for p in self.popups if p.update()]
+    def _draw_popups(self, t: float = 1.0) -> None:
         for p in self.popups:
-            p.draw(self.screen)
+            p.draw(self.screen, t)
 
     # ------------------------------------------------------------------
     # Draw: HUD
     # ------------------------------------------------------------------
 
     def _draw_hud(self) -> None:
-        lbl = self._f_hud.render(f'{self.score} / {WIN_SCORE}', True, C_HUD)
+        lbl = TEXT_CACHE.render(self._f_hud, f'{self.score} / {WIN_SCORE}', C_HUD)
         self.screen.blit(lbl, lbl.get_rect(center=(GAME_WIDTH // 2, 18)))
 
         # Seed display — top-right corner
-        seed_lbl = self._f_hud.render(f'#{self.seed}', True, (55, 75, 55))
+        seed_lbl = TEXT_CACHE.render(self._f_hud, f'#{self.seed}', (55, 75, 55))
         self.screen.blit(seed_lbl, (GAME_WIDTH - seed_lbl.get_width() - 8, 6))
 
     def _draw_overlay(self) -> None:
@@ -544,8 +521,7 @@ class SnakeGame:
                     if event.key == pygame.K_ESCAPE:
                         return 'resume'
                 if event.type == pygame.MOUSEBUTTONDOWN:
-                    mx = (event.pos[0] - self.offset_x) / self.scale
-                    my = (event.pos[1] - self.offset_y) / self.scale
+                    mx, my = self.presenter.to_viewport(event.pos)
                     for b in buttons:
                         if b['rect'].collidepoint(mx, my):
                             return b['action']
@@ -556,9 +532,7 @@ class SnakeGame:
             title = f_title.render('PAUSED', True, (210, 220, 255))
             self.screen.blit(title, title.get_rect(center=(cx, cy - 140)))
 
-            raw_mx, raw_my = pygame.mouse.get_pos()
-            hov_mx = (raw_mx - self.offset_x) / self.scale
-            hov_my = (raw_my - self.offset_y) / self.scale
+            hov_mx, hov_my = self.presenter.to_viewport(pygame.mouse.get_pos())
             for b in buttons:
                 hov   = b['rect'].collidepoint(hov_mx, hov_my)
                 bg_c  = (38, 48, 72) if hov else (16, 20, 34)
@@ -577,21 +551,46 @@ class SnakeGame:
     # ------------------------------------------------------------------
 
     def _present(self) -> None:
-        self.display_screen.fill((0, 0, 0))
-        scaled = pygame.transform.scale(
-            self.screen,
-            (int(GAME_WIDTH * self.scale), int(GAME_HEIGHT * self.scale)),
-        )
-        self.display_screen.blit(scaled, (self.offset_x, self.offset_y))
-        pygame.display.flip()
+        self.presenter.present(self.screen)
 
     # ------------------------------------------------------------------
     # Main loop
     # ------------------------------------------------------------------
 
+    def _tick(self) -> None:
+        """One fixed logic tick: movement timer, snake step, effects."""
+        self.frame += 1
+        self._prev_snake = list(self.snake)
+        if not (self.game_over or self.won):
+            self.move_timer += 1
+            if self.move_timer >= self._move_delay():
+                self.move_timer = 0
+                self._step()
+        self.particles.update()
+        self.popups    = [p for p in self.popups if p.update()]
+
+    def _draw(self, t: float = 1.0) -> None:
+        """Render the state t of the way from the previous tick to the current
+        one (FixedStep.alpha), for the snake and its effects alike."""
+        self.screen.blit(self._bg, (0, 0))
+        self._draw_walls()
+        self._draw_apple()
+        self._draw_snake(t)
+        self._draw_particles(t)
+        self._draw_popups(t)
+        self._draw_hud()
+        self._draw_overlay()
+        self._present()
+
     def run(self) -> str:
+        try:
+            return self._run_loop()
+        finally:
+            self.presenter.close()
+
+    def _run_loop(self) -> str:
+        stepper = FixedStep(TICK_HZ, MAX_CATCH_UP)
         while True:
-            self.frame += 1
             action = None
 
             for event in pygame.event.get():
@@ -611,27 +610,16 @@ class SnakeGame:
                     _ss.delete()
                     return 'menu'
                 # 'resume' → continue
+                stepper.reset()
             elif action:
                 return action
 
-            if not (self.game_over or self.won):
-                self.move_timer += 1
-                if self.move_timer >= self._move_delay():
-                    self.move_timer = 0
-                    self._step()
-
-            # ── Draw ──
-            self.screen.blit(self._bg, (0, 0))
-            self._draw_walls()
-            self._draw_apple()
-            self._draw_snake()
-            self._draw_particles()
-            self._draw_popups()
-            self._draw_hud()
-            self._draw_overlay()
-            self._present()
+            # Logic at a fixed TICK_HZ; a slow frame runs several ticks
+            for _ in range(stepper.advance()):
+                self._tick()
+            self._draw(stepper.alpha)
 
-            self.clock.tick(60)
+            self.clock.tick(MAX_RENDER_FPS)
 
 
 # ---------------------------------------------------------------------------
@@ -642,11 +630,15 @@ def _snake_menu(screen: pygame.Surface) -> tuple[str, str, dict | None]:
     """Returns (action, seed, save_data).
     action is 'play', 'continue', 'quit', or 'menu'.
     """
-    dw, dh  = screen.get_size()
-    scale   = min(dw / GAME_WIDTH, dh / GAME_HEIGHT)
-    off_x   = int((dw - GAME_WIDTH  * scale) // 2)
-    off_y   = int((dh - GAME_HEIGHT * scale) // 2)
-    surf    = pygame.Surface((GAME_WIDTH, GAME_HEIGHT))
+    presenter = Presenter(screen, (GAME_WIDTH, GAME_HEIGHT))
+    try:
+        return _snake_menu_loop(presenter)
+    finally:
+        presenter.close()
+
+
+def _snake_menu_loop(presenter: Presenter) -> tuple[str, str, dict | None]:
+    surf    = presenter.surface()
 
     f_title  = pygame.font.SysFont('segoeui', 96, bold=True)
     f_btn    = pygame.font.SysFont('segoeui', 38, bold=True)
@@ -726,8 +718,7 @@ def _snake_menu(screen: pygame.Surface) -> tuple[str, str, dict | None]:
                     if event.key in (pygame.K_RETURN, pygame.K_SPACE):
                         return ('play', seed_str, None)
             if event.type == pygame.MOUSEBUTTONDOWN:
-                mx = (event.pos[0] - off_x) / scale
-                my = (event.pos[1] - off_y) / scale
+                mx, my = presenter.to_viewport(event.pos)
                 if seed_rect.collidepoint(mx, my):
                     seed_active = True
                     cursor_vis  = True
@@ -765,9 +756,7 @@ def _snake_menu(screen: pygame.Surface) -> tuple[str, str, dict | None]:
         surf.blit(seed_surf, seed_surf.get_rect(center=seed_rect.center))
 
         # Buttons
-        raw_mx, raw_my = pygame.mouse.get_pos()
-        hov_mx = (raw_mx - off_x) / scale
-        hov_my = (raw_my - off_y) / scale
+        hov_mx, hov_my = presenter.to_viewport(pygame.mouse.get_pos())
         for b in buttons:
             hov   = b['rect'].collidepoint(hov_mx, hov_my)
             is_cont = b['action'] == 'continue'
@@ -785,12 +774,7 @@ def _snake_menu(screen: pygame.Surface) -> tuple[str, str, dict | None]:
         hint = f_sub.render('Arrow keys / WASD   ·   ESC to exit', True, (38, 55, 40))
         surf.blit(hint, hint.get_rect(center=(cx, GAME_HEIGHT - 28)))
 
-        screen.fill((0, 0, 0))
-        scaled = pygame.transform.scale(
-            surf, (int(GAME_WIDTH * scale), int(GAME_HEIGHT * scale))
-        )
-        screen.blit(scaled, (off_x, off_y))
-        pygame.display.flip()
+        presenter.present(surf)
         clock.tick(60)
 
 